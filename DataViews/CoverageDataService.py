@@ -0,0 +1,481 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+
+"""
+Module implementing a service providing the analysis of code coverage data
+shared by the editors and the code coverage dialog.
+"""
+
+import concurrent.futures
+import contextlib
+import os
+import threading
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal, pyqtSlot
+
+
+class CoverageDataService(QObject):
+    """
+    Class implementing a service providing the analysis of code coverage data.
+
+    Each coverage data file is loaded once per exclude pattern. The analyses
+    of the source files are cached together with the modification time and
+    size of the data file and are discarded, as soon as the data file
+    changes. Analyses requested by the editors are performed by a background
+    thread in order to not block the user interface.
+
+    The used data files are watched. If one of them is changed (e.g. by a
+    coverage run), the cached data are discarded and the 'dataChanged' signal
+    is emitted to let the editors update their annotations.
+
+    The editors and dialogs using the data of a data file register themselves
+    by addUser() and removeUser(). The cached data of a data file are released
+    as soon as it has no users anymore. The database connections of the loaded
+    data files are closed, if no analysis was performed for some time, so that
+    the data files may be erased (e.g. on Windows).
+
+    An analysis is a tuple containing the lists of the executable, the
+    excluded and the missing line numbers and the missing lines formatted as
+    a string (see 'coverage.Coverage.analysis2()').
+
+    @signal analysisAvailable(coverageFile:str, filename:str, analysis:tuple)
+        emitted with the result of an analysis requested by requestAnalysis()
+        (analysis is None, if the file could not be analyzed)
+    @signal dataChanged(coverageFile:str) emitted to indicate a change of a
+        watched coverage data file
+    """
+
+    analysisAvailable = pyqtSignal(str, str, object)
+    dataChanged = pyqtSignal(str)
+
+    __analysisDone = pyqtSignal(str, str, object)
+
+    DefaultExcludePattern = "# *pragma[: ]*[nN][oO] *[cC][oO][vV][eE][rR]"
+    ChangeDelay = 500  # delay in milliseconds to settle changes of a data file
+    IdleTimeout = 10000  # delay in milliseconds to close the idle data files
+
+    def __init__(self, parent=None):
+        """
+        Constructor
+
+        @param parent reference to the parent object (defaults to None)
+        @type QObject (optional)
+        """
+        super().__init__(parent)
+
+        self.__lock = threading.RLock()
+        # dictionary with the coverage data file as key and a dictionary with
+        # the keys "key" (tuple of modification time and size of the data
+        # file), "coverages" (dictionary with the exclude pattern as key and
+        # the loaded coverage object as value), "analyses" (dictionary with
+        # a tuple of file name and exclude pattern as key and the analysis as
+        # value), "lock" (lock serializing the use of the coverage objects) and
+        # "released" (flag indicating a discarded entry) as value
+        # Note: An entry lock must not be acquired while holding self.__lock.
+        self.__entries = {}
+        # dictionary with the coverage data file as key and the set of its
+        # users as value
+        self.__users = {}
+
+        self.__executor = None
+
+        self.__watcher = QFileSystemWatcher(self)
+        self.__watcher.fileChanged.connect(self.__fileChanged)
+        self.__changedFiles = set()
+        self.__changeTimer = QTimer(self)
+        self.__changeTimer.setSingleShot(True)
+        self.__changeTimer.setInterval(CoverageDataService.ChangeDelay)
+        self.__changeTimer.timeout.connect(self.__checkChangedFiles)
+
+        self.__idleTimer = QTimer(self)
+        self.__idleTimer.setSingleShot(True)
+        self.__idleTimer.setInterval(CoverageDataService.IdleTimeout)
+        self.__idleTimer.timeout.connect(self.__closeDataFiles)
+
+        self.__analysisDone.connect(self.__analysisFinished)
+
+    def __dataKey(self, coverageFile):
+        """
+        Private method to determine the validation key of a coverage data
+        file.
+
+        @param coverageFile path of the coverage data file
+        @type str
+        @return tuple containing the modification time and size of the data
+            file or None, if it does not exist
+        @rtype tuple of (int, int) or None
+        """
+        try:
+            fileStat = os.stat(coverageFile)
+        except OSError:
+            return None
+
+        return (fileStat.st_mtime_ns, fileStat.st_size)
+
+    def __entry(self, coverageFile):
+        """
+        Private method to get the valid entry for a coverage data file.
+
+        @param coverageFile path of the coverage data file
+        @type str
+        @return dictionary containing the cached data of the data file or
+            None, if it does not exist
+        @rtype dict or None
+        """
+        key = self.__dataKey(coverageFile)
+        with self.__lock:
+            entry = outdated = self.__entries.get(coverageFile)
+            if entry is None or entry["key"] != key:
+                if key is None:
+                    self.__entries.pop(coverageFile, None)
+                    entry = None
+                else:
+                    entry = {
+                        "key": key,
+                        "coverages": {},
+                        "analyses": {},
+                        "lock": threading.Lock(),
+                        "released": False,
+                    }
+                    self.__entries[coverageFile] = entry
+                    if coverageFile not in self.__watcher.files():
+                        self.__watcher.addPath(coverageFile)
+            else:
+                outdated = None
+
+        if outdated is not None:
+            self.__releaseEntry(outdated)
+        return entry
+
+    def __releaseEntry(self, entry):
+        """
+        Private method to release the coverage objects of a discarded entry.
+
+        @param entry dictionary containing the cached data of the data file
+        @type dict
+        """
+        with entry["lock"]:
+            entry["released"] = True
+            for cover in entry["coverages"].values():
+                cover.get_data().close()
+            entry["coverages"].clear()
+
+    def __coverage(self, coverageFile, entry, excludePattern):
+        """
+        Private method to get the loaded coverage object for a data file.
+
+        @param coverageFile path of the coverage data file
+        @type str
+        @param entry dictionary containing the cached data of the data file
+        @type dict
+        @param excludePattern pattern for lines to be excluded
+        @type str
+        @return loaded coverage object
+        @rtype coverage.Coverage
+        """
+        from coverage import Coverage  # __IGNORE_WARNING_I102__
+
+        # Note: The lock of the entry is held by the caller.
+        with contextlib.suppress(KeyError):
+            return entry["coverages"][excludePattern]
+
+        cover = Coverage(data_file=coverageFile)
+        cover.load()
+        if excludePattern:
+            cover.exclude(excludePattern)
+        entry["coverages"][excludePattern] = cover
+        return cover
+
+    def __analyze(self, coverageFile, entry, filename, excludePattern):
+        """
+        Private method to analyze a file.
+
+        @param coverageFile path of the coverage data file
+        @type str
+        @param entry dictionary containing the cached data of the data file
+        @type dict
+        @param filename name of the file to be analyzed
+        @type str
+        @param excludePattern pattern for lines to be excluded
+        @type str
+        @return analysis of the file or None, if it could not be analyzed
+        @rtype tuple of (list of int, list of int, list of int, str) or None
+        """
+        from coverage.misc import CoverageException  # __IGNORE_WARNING_I102__
+
+        with contextlib.suppress(KeyError):
+            return entry["analyses"][(filename, excludePattern)]
+
+        # The coverage objects are not thread safe. The analyses of the editors
+        # (background thread) and the dialogs (main thread) are serialized.
+        with entry["lock"]:
+            if not entry["released"]:
+                with contextlib.suppress(KeyError):
+                    # analyzed by another thread meanwhile
+                    return entry["analyses"][(filename, excludePattern)]
+
+                try:
+                    cover = self.__coverage(coverageFile, entry, excludePattern)
+                    analysis = tuple(cover.analysis2(filename)[1:])
+                except (CoverageException, OSError, SyntaxError, ValueError):
+                    analysis = None
+
+                with self.__lock:
+                    entry["analyses"][(filename, excludePattern)] = analysis
+                return analysis
+
+        # the entry was discarded meanwhile (e.g. the data file was changed)
+        entry = self.__entry(coverageFile)
+        if entry is None:
+            return None
+        return self.__analyze(coverageFile, entry, filename, excludePattern)
+
+    def __getExecutor(self):
+        """
+        Private method to get the executor of the background analyses.
+
+        Note: A single thread is used because the analysis is CPU bound. More
+        threads would not analyze the files any faster.
+
+        @return executor of the background analyses
+        @rtype concurrent.futures.ThreadPoolExecutor
+        """
+        if self.__executor is None:
+            self.__executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="CoverageAnalysis"
+            )
+        return self.__executor
+
+    def analysis(self, coverageFile, filename, excludePattern=DefaultExcludePattern):
+        """
+        Public method to get the analysis of a file.
+
+        @param coverageFile path of the coverage data file
+        @type str
+        @param filename name of the file to be analyzed
+        @type str
+        @param excludePattern pattern for lines to be excluded (defaults to
+            DefaultExcludePattern)
+        @type str (optional)
+        @return analysis of the file or None, if it could not be analyzed
+        @rtype tuple of (list of int, list of int, list of int, str) or None
+        """
+        entry = self.__entry(coverageFile)
+        if entry is None:
+            return None
+
+        analysis = self.__analyze(coverageFile, entry, filename, excludePattern)
+        self.__idleTimer.start()
+        return analysis
+
+    def analyzeFiles(
+        self, coverageFile, filenames, excludePattern=DefaultExcludePattern
+    ):
+        """
+        Public generator to analyze a list of files.
+
+        The files are analyzed one by one in the order given, when the next
+        result is requested. Cached analyses are reused.
+
+        @param coverageFile path of the coverage data file
+        @type str
+        @param filenames list of names of the files to be analyzed
+        @type list of str
+        @param excludePattern pattern for lines to be excluded (defaults to
+            DefaultExcludePattern)
+        @type str (optional)
+        @yield tuple containing the file name and its analysis (None, if it
+            could not be analyzed)
+        @ytype tuple of (str, tuple of (list of int, list of int, list of int,
+            str) or None)
+        """
+        entry = self.__entry(coverageFile)
+        try:
+            for filename in filenames:
+                yield filename, (
+                    None
+                    if entry is None
+                    else self.__analyze(coverageFile, entry, filename, excludePattern)
+                )
+        finally:
+            self.__idleTimer.start()
+
+    def requestAnalysis(
+        self, coverageFile, filename, excludePattern=DefaultExcludePattern
+    ):
+        """
+        Public method to request the analysis of a file in the background.
+
+        The result is delivered by the 'analysisAvailable' signal. A cached
+        result is delivered immediately.
+
+        @param coverageFile path of the coverage data file
+        @type str
+        @param filename name of the file to be analyzed
+        @type str
+        @param excludePattern pattern for lines to be excluded (defaults to
+            DefaultExcludePattern)
+        @type str (optional)
+        """
+        entry = self.__entry(coverageFile)
+        if entry is None:
+            self.analysisAvailable.emit(coverageFile, filename, None)
+            return
+
+        with self.__lock:
+            cached = (filename, excludePattern) in entry["analyses"]
+        if cached:
+            self.analysisAvailable.emit(
+                coverageFile, filename, entry["analyses"][(filename, excludePattern)]
+            )
+        else:
+            future = self.__getExecutor().submit(
+                self.__analyze, coverageFile, entry, filename, excludePattern
+            )
+            # the signal is delivered to the main thread by a queued connection
+            future.add_done_callback(
+                lambda f: self.__analysisDone.emit(coverageFile, filename, f.result())
+            )
+
+    @pyqtSlot(str, str, object)
+    def __analysisFinished(self, coverageFile, filename, analysis):
+        """
+        Private slot handling the result of a background analysis.
+
+        @param coverageFile path of the coverage data file
+        @type str
+        @param filename name of the analyzed file
+        @type str
+        @param analysis analysis of the file (None, if it could not be
+            analyzed)
+        @type tuple of (list of int, list of int, list of int, str) or None
+        """
+        self.__idleTimer.start()
+        self.analysisAvailable.emit(coverageFile, filename, analysis)
+
+    def addUser(self, coverageFile, user):
+        """
+        Public method to register a user of the data of a coverage data file.
+
+        @param coverageFile path of the coverage data file
+        @type str
+        @param user reference to the object using the data (e.g. an editor
+            showing coverage annotations)
+        @type QObject
+        """
+        self.__users.setdefault(coverageFile, set()).add(user)
+
+    def removeUser(self, coverageFile, user):
+        """
+        Public method to unregister a user of the data of a coverage data file.
+
+        The cached data of the data file are discarded, if it has no users
+        anymore.
+
+        @param coverageFile path of the coverage data file
+        @type str
+        @param user reference to the object using the data
+        @type QObject
+        """
+        users = self.__users.get(coverageFile, set())
+        users.discard(user)
+        if not users:
+            self.__users.pop(coverageFile, None)
+            self.forget(coverageFile)
+
+    def forget(self, coverageFile):
+        """
+        Public method to discard the cached data of a coverage data file.
+
+        Note: This closes the data file, so that it may be erased.
+
+        @param coverageFile path of the coverage data file
+        @type str
+        """
+        with self.__lock:
+            entry = self.__entries.pop(coverageFile, None)
+        if entry is not None:
+            self.__releaseEntry(entry)
+        if coverageFile in self.__watcher.files():
+            self.__watcher.removePath(coverageFile)
+
+    @pyqtSlot()
+    def __closeDataFiles(self):
+        """
+        Private slot to close the database connections of the loaded coverage
+        data files after no analysis was performed for some time.
+
+        Note: The connections are opened again by the next analysis.
+        """
+        with self.__lock:
+            entries = list(self.__entries.values())
+
+        for entry in entries:
+            if not entry["lock"].acquire(blocking=False):
+                # an analysis is running, try again later
+                self.__idleTimer.start()
+                continue
+
+            try:
+                for cover in entry["coverages"].values():
+                    cover.get_data().close()
+            finally:
+                entry["lock"].release()
+
+    @pyqtSlot(str)
+    def __fileChanged(self, path):
+        """
+        Private slot handling a change of a watched coverage data file.
+
+        @param path path of the changed file
+        @type str
+        """
+        self.__changedFiles.add(path)
+        self.__changeTimer.start()
+
+    @pyqtSlot()
+    def __checkChangedFiles(self):
+        """
+        Private slot to check the changed coverage data files after the
+        changes have settled.
+        """
+        changedFiles = self.__changedFiles
+        self.__changedFiles = set()
+
+        for coverageFile in changedFiles:
+            with self.__lock:
+                entry = self.__entries.get(coverageFile)
+            if entry is None:
+                continue
+
+            key = self.__dataKey(coverageFile)
+            if key is not None and coverageFile not in self.__watcher.files():
+                # the file was replaced
+                self.__watcher.addPath(coverageFile)
+            if key != entry["key"]:
+                with self.__lock:
+                    if self.__entries.get(coverageFile) is entry:
+                        del self.__entries[coverageFile]
+                self.__releaseEntry(entry)
+                self.dataChanged.emit(coverageFile)
+
+
+_coverageDataService = None
+
+
+def getCoverageDataService():
+    """
+    Function to get the coverage data service shared by the editors and the
+    code coverage dialogs.
+
+    @return reference to the coverage data service
+    @rtype CoverageDataService
+    """
+    global _coverageDataService
+
+    if _coverageDataService is None:
+        _coverageDataService = CoverageDataService()
+
+    return _coverageDataService
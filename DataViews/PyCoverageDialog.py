@@ -11,7 +11,6 @@ import os
 import time
 
 from coverage import Coverage
-from coverage.misc import CoverageException
 from PyQt6.QtCore import Qt, QUrl, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QDesktopServices
 from PyQt6.QtWidgets import (
@@ -30,6 +29,7 @@ from eric7.RemoteServerInterface.EricServerCoverageInterface import (
 )
 from eric7.SystemUtilities import FileSystemUtilities
 
+from .CoverageDataService import CoverageDataService, getCoverageDataService
 from .Ui_PyCoverageDialog import Ui_PyCoverageDialog
 
 
@@ -62,7 +62,8 @@ class PyCoverageDialog(QDialog, Ui_PyCoverageDialog):
         self.cancelled = False
         self.reload = False
 
-        self.excludeList = ["# *pragma[: ]*[nN][oO] *[cC][oO][vV][eE][rR]"]
+        self.excludeList = [CoverageDataService.DefaultExcludePattern]
+        self.__coverageDataUsed = ""
 
         self.__reportsMenu = QMenu(self.tr("Create Report"), self)
         self.__reportsMenu.addAction(self.tr("HTML Report"), self.__htmlReport)
@@ -238,10 +239,12 @@ class PyCoverageDialog(QDialog, Ui_PyCoverageDialog):
                         " <b>{0}</b>.</p><p>Reason: {1}</p>"
                     ).format(self.cfn, error),
                 )
+            analyses = self.__analyzeRemoteFiles(files)
         else:
-            cover = Coverage(data_file=self.cfn)
-            cover.load()
-            cover.exclude(self.excludeList[0])
+            self.__useCoverageData(self.cfn)
+            analyses = getCoverageDataService().analyzeFiles(
+                self.cfn, files, self.excludeList[0]
+            )
 
         try:
             # disable updates of the list for speed
@@ -250,23 +253,14 @@ class PyCoverageDialog(QDialog, Ui_PyCoverageDialog):
 
             # now go through all the files
             now = time.monotonic()
-            for progress, file in enumerate(files, start=1):
+            for progress, (file, analysis) in enumerate(analyses, start=1):
                 if self.cancelled:
                     return
 
-                try:
-                    if FileSystemUtilities.isRemoteFileName(self.cfn):
-                        (
-                            file,
-                            statements,
-                            excluded,
-                            missing,
-                            readable,
-                        ) = self.__serverCoverageInterface.analyzeFile(file)
-                    else:
-                        statements, excluded, missing, readable = cover.analysis2(file)[
-                            1:
-                        ]
+                if analysis is None:
+                    total_exceptions += 1
+                else:
+                    statements, excluded, missing, readable = analysis
                     n = len(statements)
                     m = n - len(missing)
                     pc = 100.0 * m / n if n > 0 else 100.0
@@ -276,14 +270,15 @@ class PyCoverageDialog(QDialog, Ui_PyCoverageDialog):
 
                     total_statements += n
                     total_executed += m
-                except (CoverageException, EricServerCoverageError):
-                    total_exceptions += 1
 
                 self.checkProgress.setValue(progress)
                 if time.monotonic() - now > 0.01:
                     QApplication.processEvents()
                     now = time.monotonic()
         finally:
+            # cancel the analyses not needed anymore
+            analyses.close()
+
             # reenable updates of the list
             self.resultList.setSortingEnabled(True)
             self.resultList.setUpdatesEnabled(True)
@@ -318,6 +313,31 @@ class PyCoverageDialog(QDialog, Ui_PyCoverageDialog):
 
         self.__finish()
 
+    def __analyzeRemoteFiles(self, files):
+        """
+        Private generator to analyze a list of files via the eric-ide server.
+
+        @param files list of files to be analyzed
+        @type list of str
+        @yield tuple containing the file name and its analysis (None, if it
+            could not be analyzed)
+        @ytype tuple of (str, tuple of (list of int, list of int, list of int,
+            str) or None)
+        """
+        for file in files:
+            try:
+                (
+                    file,
+                    statements,
+                    excluded,
+                    missing,
+                    readable,
+                ) = self.__serverCoverageInterface.analyzeFile(file)
+                analysis = (statements, excluded, missing, readable)
+            except EricServerCoverageError:
+                analysis = None
+            yield file, analysis
+
     def __finish(self):
         """
         Private slot called when the action finished or the user pressed the
@@ -345,6 +365,26 @@ class PyCoverageDialog(QDialog, Ui_PyCoverageDialog):
         self.cancelled = True
         # The rest is done by the start() method.
 
+        # release the cached coverage data, if no editor uses them
+        self.__useCoverageData("")
+
+    def __useCoverageData(self, coverageFile):
+        """
+        Private method to register the dialog as a user of the data of a
+        coverage data file with the coverage data service.
+
+        @param coverageFile path of the coverage data file (empty to use
+            none)
+        @type str
+        """
+        if coverageFile != self.__coverageDataUsed:
+            coverageDataService = getCoverageDataService()
+            if self.__coverageDataUsed:
+                coverageDataService.removeUser(self.__coverageDataUsed, self)
+            if coverageFile:
+                coverageDataService.addUser(coverageFile, self)
+            self.__coverageDataUsed = coverageFile
+
     def on_buttonBox_clicked(self, button):
         """
         Private slot called by a button of the button box clicked.
@@ -483,6 +523,9 @@ class PyCoverageDialog(QDialog, Ui_PyCoverageDialog):
         This method erases the collected coverage data that is
         stored in the .coverage file.
         """
+        # close the data file loaded by the coverage data service
+        getCoverageDataService().forget(self.cfn)
+
         cover = Coverage(data_file=self.cfn)
         cover.load()
         cover.erase()
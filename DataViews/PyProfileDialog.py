@@ -372,17 +372,23 @@ class PyProfileDialog(QDialog, Ui_PyProfileDialog):
         """
         Private slot to handle the Erase Profile context menu action.
         """
-        fname = "{0}.profile".format(self.basename)
-        if os.path.exists(fname):
-            os.remove(fname)
+        for fname in (
+            "{0}.profile".format(self.basename),
+            "{0}.collapsed".format(self.basename),
+        ):
+            if os.path.exists(fname):
+                os.remove(fname)
 
     def __eraseTiming(self):
         """
         Private slot to handle the Erase Timing context menu action.
         """
-        fname = "{0}.timings".format(self.basename)
-        if os.path.exists(fname):
-            os.remove(fname)
+        for fname in (
+            "{0}.timings".format(self.basename),
+            "{0}.samples".format(self.basename),
+        ):
+            if os.path.exists(fname):
+                os.remove(fname)
 
     def __eraseAll(self):
         """
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+
+"""
+Module implementing a breakpoint monitor based on sys.monitoring (PEP 669).
+"""
+
+import _thread
+import sys
+
+from BreakpointWatch import Breakpoint
+
+
+class BreakpointMonitor:
+    """
+    Class implementing the process wide breakpoint monitor.
+
+    It is used for threads running to the next breakpoint instead of the
+    trace function. Only the start (and resume) of code objects is monitored
+    globally. Code objects containing a breakpoint get line events enabled
+    locally. All other locations are disabled after their first event, so that
+    code without breakpoints runs at full speed.
+    """
+
+    ToolName = "eric7 debugger"
+
+    __instance = None
+
+    @staticmethod
+    def isSupported():
+        """
+        Static method to check, if the running interpreter supports
+        sys.monitoring.
+
+        @return flag indicating support for sys.monitoring
+        @rtype bool
+        """
+        return sys.version_info >= (3, 12) and hasattr(sys, "monitoring")
+
+    @classmethod
+    def instance(cls):
+        """
+        Class method to get the breakpoint monitor of the process.
+
+        @return reference to the breakpoint monitor
+        @rtype BreakpointMonitor
+        """
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__monitoring = sys.monitoring
+        self.__toolId = self.__monitoring.DEBUGGER_ID
+        self.__events = (
+            self.__monitoring.events.PY_START | self.__monitoring.events.PY_RESUME
+        )
+
+        # dictionary with the thread id as key and the monitored DebugBase
+        # object as value
+        self.__debuggers = {}
+        self.__fixFilename = None
+
+        # code objects with locally enabled line events
+        self.__lineCodes = set()
+        self.__generation = -1
+
+        self.__pollRequested = False
+
+        # number of monitoring events handled
+        self.eventsCount = 0
+
+    def attach(self, debugBase):
+        """
+        Public method to monitor the current thread.
+
+        @param debugBase reference to the debugger object of the current thread
+        @type DebugBase
+        @return flag indicating a successful attach
+        @rtype bool
+        """
+        if not self.__debuggers:
+            try:
+                self.__monitoring.use_tool_id(self.__toolId, BreakpointMonitor.ToolName)
+            except ValueError:
+                # tool is in use by someone else
+                return False
+
+            self.__fixFilename = debugBase.fix_frame_filename
+            events = self.__monitoring.events
+            self.__monitoring.register_callback(
+                self.__toolId, events.PY_START, self.__startEvent
+            )
+            self.__monitoring.register_callback(
+                self.__toolId, events.PY_RESUME, self.__startEvent
+            )
+            self.__monitoring.register_callback(
+                self.__toolId, events.LINE, self.__lineEvent
+            )
+            self.__monitoring.set_events(self.__toolId, self.__events)
+
+        self.__debuggers[_thread.get_ident()] = debugBase
+        self.__refresh()
+        return True
+
+    def detach(self):
+        """
+        Public method to stop monitoring the current thread.
+        """
+        if self.__debuggers.pop(_thread.get_ident(), None) is None:
+            return
+
+        if not self.__debuggers:
+            events = self.__monitoring.events
+            self.__monitoring.set_events(self.__toolId, events.NO_EVENTS)
+            self.__resetLineEvents()
+            for event in (events.PY_START, events.PY_RESUME, events.LINE):
+                self.__monitoring.register_callback(self.__toolId, event, None)
+            self.__monitoring.free_tool_id(self.__toolId)
+            self.__pollRequested = False
+
+    def requestPoll(self):
+        """
+        Public method to request a check for client interactions at the next
+        line executed by a monitored thread.
+
+        Note: This method is called by the poll timer threads.
+        """
+        if self.__debuggers:
+            self.__pollRequested = True
+            self.__monitoring.set_events(
+                self.__toolId, self.__events | self.__monitoring.events.LINE
+            )
+            self.__monitoring.restart_events()
+
+    def __resetLineEvents(self):
+        """
+        Private method to disable the locally enabled line events.
+        """
+        for code in self.__lineCodes:
+            self.__monitoring.set_local_events(
+                self.__toolId, code, self.__monitoring.events.NO_EVENTS
+            )
+        self.__lineCodes.clear()
+
+    def __refresh(self):
+        """
+        Private method to update the monitored code objects after the
+        breakpoints have been changed.
+        """
+        self.__generation = Breakpoint.generation
+        self.__resetLineEvents()
+
+        # code objects already executing don't get a start event anymore
+        for frame in sys._current_frames().values():
+            while frame is not None:
+                if self.__breakLines(frame.f_code, frame):
+                    self.__enableLineEvents(frame.f_code)
+                frame = frame.f_back
+
+        self.__monitoring.restart_events()
+
+    def __breakLines(self, code, frame):
+        """
+        Private method to get the line numbers of a code object, where
+        breakpoints are.
+
+        @param code reference to the code object
+        @type code
+        @param frame reference to a frame executing the code object
+        @type frame object
+        @return line numbers with a breakpoint
+        @rtype frozenset of int
+        """
+        try:
+            return Breakpoint.breakInCodeCache[id(code)][1]
+        except KeyError:
+            return Breakpoint.codeBreakLines(code, self.__fixFilename(frame))
+
+    def __enableLineEvents(self, code):
+        """
+        Private method to enable line events for a code object.
+
+        @param code reference to the code object
+        @type code
+        """
+        if code not in self.__lineCodes:
+            self.__monitoring.set_local_events(
+                self.__toolId, code, self.__monitoring.events.LINE
+            )
+            self.__lineCodes.add(code)
+
+    def __startEvent(self, code, _offset):
+        """
+        Private method handling the start or resume of a code object.
+
+        @param code reference to the code object
+        @type code
+        @param _offset instruction offset (unused)
+        @type int
+        @return DISABLE to disable further events for this location
+        @rtype object
+        """
+        self.eventsCount += 1
+        if Breakpoint.generation != self.__generation:
+            self.__refresh()
+
+        if self.__breakLines(code, sys._getframe(1)):
+            self.__enableLineEvents(code)
+
+        return self.__monitoring.DISABLE
+
+    def __lineEvent(self, code, line):
+        """
+        Private method handling a line event.
+
+        @param code reference to the code object
+        @type code
+        @param line line number
+        @type int
+        @return DISABLE to disable further events for this location or None
+        @rtype object
+        """
+        self.eventsCount += 1
+        frame = sys._getframe(1)
+        debugBase = self.__debuggers.get(_thread.get_ident())
+
+        if debugBase is not None and self.__pollRequested:
+            self.__pollRequested = False
+            self.__monitoring.set_events(self.__toolId, self.__events)
+            if not debugBase.fastContinuePoll(frame):
+                # thread switched back to the trace function
+                return None
+
+        if Breakpoint.generation != self.__generation:
+            self.__refresh()
+
+        if line not in self.__breakLines(code, frame):
+            return self.__monitoring.DISABLE
+
+        if debugBase is not None and debugBase.break_here(frame):
+            debugBase.fastContinueBreak(frame)
+
+        return None
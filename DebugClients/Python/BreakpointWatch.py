@@ -25,11 +25,18 @@ class Breakpoint:
     To test for a specific line in a file there is another dict breakInFile,
     which is indexed only by filename and holds all line numbers where
     breakpoints are.
+
+    The dict breakInCodeCache is indexed by the id of a code object and holds
+    the line numbers of the code object, where breakpoints are. It is built on
+    demand and cleared whenever the breakpoints change. The id is used because
+    hashing a code object is expensive. The code object is stored alongside
+    the line numbers to keep it alive, which keeps its id unique.
     """
 
     breaks = {}  # indexed by (filename, lineno) tuple: Breakpoint
     breakInFile = {}  # indexed by filename: [lineno]
-    breakInFrameCache = {}
+    breakInCodeCache = {}  # indexed by id(code): (code, frozenset of lineno)
+    generation = 0  # incremented whenever the breakpoints change
 
     def __init__(self, filename, lineno, temporary=False, cond=None):
         """
@@ -56,7 +63,8 @@ class Breakpoint:
         lines = Breakpoint.breakInFile.setdefault(filename, [])
         if lineno not in lines:
             lines.append(lineno)
-        Breakpoint.breakInFrameCache.clear()
+        Breakpoint.breakInCodeCache.clear()
+        Breakpoint.generation += 1
 
     def deleteMe(self):
         """
@@ -93,7 +101,8 @@ class Breakpoint:
         bp = Breakpoint.breaks.get((filename, lineno))
         if bp:
             bp.deleteMe()
-        Breakpoint.breakInFrameCache.clear()
+        Breakpoint.breakInCodeCache.clear()
+        Breakpoint.generation += 1
 
     @staticmethod
     def clear_all_breaks():
@@ -102,7 +111,47 @@ class Breakpoint:
         """
         Breakpoint.breaks.clear()
         Breakpoint.breakInFile.clear()
-        Breakpoint.breakInFrameCache.clear()
+        Breakpoint.breakInCodeCache.clear()
+        Breakpoint.generation += 1
+
+    @staticmethod
+    def codeBreakLines(code, filename):
+        """
+        Static method to determine the line numbers of a code object, where
+        breakpoints are.
+
+        The result is stored in the breakInCodeCache dictionary.
+
+        @param code reference to the code object
+        @type code
+        @param filename fixed up file name of the code object
+        @type str
+        @return line numbers with a breakpoint
+        @rtype frozenset of int
+        """
+        breakLines = Breakpoint.breakInFile.get(filename)
+        if breakLines:
+            try:
+                lineNumbers = {line for _, _, line in code.co_lines()}
+            except AttributeError:
+                # backward compatibility code for Python 3.10 and below
+                lineNo = code.co_firstlineno
+                lineNumbers = {lineNo}
+
+                # No need to handle special case if a lot of lines between
+                # (e.g. closure), because the additional lines won't cause a bp
+                for co_lno in code.co_lnotab[1::2]:
+                    if co_lno >= 0x80:
+                        lineNo -= 0x100
+                    lineNo += co_lno
+                    lineNumbers.add(lineNo)
+
+            codeBreakLines = frozenset(lineNumbers.intersection(breakLines))
+        else:
+            codeBreakLines = frozenset()
+
+        Breakpoint.breakInCodeCache[id(code)] = (code, codeBreakLines)
+        return codeBreakLines
 
     @staticmethod
     def get_break(filename, lineno):
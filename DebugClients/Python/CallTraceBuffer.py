@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+
+"""
+Module implementing the buffer collecting the call trace events of the debug
+client.
+"""
+
+import base64
+import collections
+import contextlib
+import itertools
+import json
+import threading
+import time
+import zlib
+
+from DebugConfig import (
+    CallTraceBatchSize,
+    CallTraceBufferSize,
+    CallTraceCompressThreshold,
+    CallTraceFlushInterval,
+    CallTraceMaxPendingBatches,
+)
+
+
+class CallTraceBuffer:
+    """
+    Class implementing the buffer collecting the call trace events.
+
+    The events are kept as tuples of integers in a ring buffer. File and
+    function names are replaced by the index into a string table. Only the
+    strings added since the previous batch are sent with a batch.
+
+    A batch is due, if it is full or the flush interval has passed. The IDE
+    acknowledges each batch after it has been processed. If it falls behind by
+    more than the allowed number of batches, the events are held back in the
+    ring buffer, which drops the oldest ones when it is full. The number of
+    dropped events is reported with the next batch.
+    """
+
+    def __init__(
+        self,
+        size=CallTraceBufferSize,
+        batchSize=CallTraceBatchSize,
+        flushInterval=CallTraceFlushInterval,
+        maxPendingBatches=CallTraceMaxPendingBatches,
+    ):
+        """
+        Constructor
+
+        @param size maximum number of buffered events (defaults to
+            CallTraceBufferSize)
+        @type int (optional)
+        @param batchSize number of events making a batch due (defaults to
+            CallTraceBatchSize)
+        @type int (optional)
+        @param flushInterval time in seconds making a batch due (defaults to
+            CallTraceFlushInterval)
+        @type float (optional)
+        @param maxPendingBatches number of batches that may be sent without
+            an acknowledgement (defaults to CallTraceMaxPendingBatches)
+        @type int (optional)
+        """
+        self.__batchSize = batchSize
+        self.__flushInterval = flushInterval
+        self.__maxPendingBatches = maxPendingBatches
+
+        self.__lock = threading.Lock()
+        self.__events = collections.deque(maxlen=size)
+        self.__dropped = 0
+
+        # dictionary with the string as key and its index as value
+        self.__stringIds = {}
+        self.__strings = []
+        self.__sentStrings = 0
+
+        self.__lastBatchNumber = 0
+        self.__acknowledgedBatchNumber = 0
+        self.__lastFlush = time.monotonic()
+
+    def __stringId(self, string):
+        """
+        Private method to get the index of a string in the string table.
+
+        @param string string to be looked up
+        @type str
+        @return index of the string
+        @rtype int
+        """
+        try:
+            return self.__stringIds[string]
+        except KeyError:
+            with self.__lock:
+                if string not in self.__stringIds:
+                    self.__stringIds[string] = len(self.__strings)
+                    self.__strings.append(string)
+                return self.__stringIds[string]
+
+    def add(self, isCall, fromFile, fromLine, fromFunction, toFile, toLine, toFunction):
+        """
+        Public method to add a call trace event.
+
+        @param isCall flag indicating a 'call' event
+        @type bool
+        @param fromFile name of the originating file
+        @type str
+        @param fromLine line number in the originating file
+        @type int
+        @param fromFunction name of the originating function
+        @type str
+        @param toFile name of the target file
+        @type str
+        @param toLine line number in the target file
+        @type int
+        @param toFunction name of the target function
+        @type str
+        @return flag indicating, that a batch is due
+        @rtype bool
+        """
+        stringId = self.__stringId
+        event = (
+            1 if isCall else 0,
+            stringId(fromFile),
+            fromLine,
+            stringId(fromFunction),
+            stringId(toFile),
+            toLine,
+            stringId(toFunction),
+        )
+        if len(self.__events) == self.__events.maxlen:
+            # the oldest event gets pushed out
+            self.__dropped += 1
+        self.__events.append(event)
+
+        return (
+            len(self.__events) >= self.__batchSize
+            or time.monotonic() - self.__lastFlush >= self.__flushInterval
+        )
+
+    def hasEvents(self):
+        """
+        Public method to check, if there are events to be sent.
+
+        @return flag indicating buffered or dropped events
+        @rtype bool
+        """
+        return bool(self.__events) or self.__dropped > 0
+
+    def isDue(self):
+        """
+        Public method to check, if the flush interval of the buffered events
+        has passed.
+
+        This is used to send the events held back, if no further events arrive
+        (e.g. while the debugged program runs a loop not calling any function).
+
+        @return flag indicating, that a batch is due
+        @rtype bool
+        """
+        return (
+            self.hasEvents()
+            and time.monotonic() - self.__lastFlush >= self.__flushInterval
+        )
+
+    def isThrottled(self):
+        """
+        Public method to check, if the number of unacknowledged batches
+        prohibits sending another one.
+
+        @return flag indicating a throttled buffer
+        @rtype bool
+        """
+        return (
+            self.__lastBatchNumber - self.__acknowledgedBatchNumber
+            >= self.__maxPendingBatches
+        )
+
+    def acknowledge(self, batchNumber):
+        """
+        Public method to record the acknowledgement of a batch by the IDE.
+
+        @param batchNumber number of the acknowledged batch
+        @type int
+        """
+        self.__acknowledgedBatchNumber = max(
+            self.__acknowledgedBatchNumber, min(batchNumber, self.__lastBatchNumber)
+        )
+
+    def takeBatch(self, force=False):
+        """
+        Public method to take the buffered events as a batch to be sent.
+
+        @param force flag indicating to ignore the number of unacknowledged
+            batches (defaults to False)
+        @type bool (optional)
+        @return dictionary containing the parameters of the batch or None, if
+            there is nothing to be sent
+        @rtype dict or None
+        """
+        with self.__lock:
+            if not self.hasEvents() or (not force and self.isThrottled()):
+                return None
+
+            events = []
+            with contextlib.suppress(IndexError):
+                # other threads may push out events while taking them
+                for _ in range(len(self.__events)):
+                    events.append(self.__events.popleft())
+            dropped, self.__dropped = self.__dropped, 0
+            strings = self.__strings[self.__sentStrings :]
+            stringsBase = self.__sentStrings
+            self.__sentStrings += len(strings)
+            self.__lastBatchNumber += 1
+            self.__lastFlush = time.monotonic()
+
+            batch = {
+                "stringsBase": stringsBase,
+                "strings": strings,
+                "events": list(itertools.chain.from_iterable(events)),
+                "dropped": dropped,
+            }
+            params = {"batch": self.__lastBatchNumber}
+            data = json.dumps(batch)
+            if len(data) >= CallTraceCompressThreshold:
+                params["compressed"] = base64.b64encode(
+                    zlib.compress(data.encode("utf-8"))
+                ).decode("ascii")
+            else:
+                params.update(batch)
+
+            return params
@@ -18,6 +18,7 @@ import sys
 import time
 import types
 
+from BreakpointMonitor import BreakpointMonitor
 from BreakpointWatch import Breakpoint, Watch
 from DebugUtilities import formatargvalues, getargvalues
 
@@ -72,6 +73,16 @@ class DebugBase:
     # Stop all timers, when greenlets are used
     pollTimerEnabled = True
 
+    # Run to the next breakpoint with as little tracing as possible and
+    # use sys.monitoring for it, if available
+    fastContinue = True
+    monitorBreakpoints = BreakpointMonitor.isSupported()
+
+    # fast continue modes
+    FastContinueOff = 0
+    FastContinueMonitor = 1
+    FastContinueTrace = 2
+
     def __init__(self, dbgClient):
         """
         Constructor
@@ -113,6 +124,14 @@ class DebugBase:
         self.__recursionDepth = -1
         self.setRecursionDepth(inspect.currentframe())
 
+        # fast continue mode of the thread
+        self.__fastContinue = DebugBase.FastContinueOff
+        # ID of the thread running with the fast continue trace function
+        self.__fastContinueThreadId = None
+
+        # number of trace_dispatch calls of this thread
+        self.traceDispatchCount = 0
+
         # background task to periodicaly check for client interactions
         self.eventPollFlag = False
         self.timer = _thread.start_new_thread(self.__eventPollTimer, ())
@@ -130,6 +149,10 @@ class DebugBase:
         while DebugBase.pollTimerEnabled:
             time.sleep(0.5)
             self.eventPollFlag = True
+            if self.__fastContinue == DebugBase.FastContinueMonitor:
+                BreakpointMonitor.instance().requestPoll()
+            elif self.__fastContinue == DebugBase.FastContinueTrace:
+                self.__requestContinueDispatchPoll()
 
         self.eventPollFlag = False
 
@@ -290,17 +313,15 @@ class DebugBase:
         @type frame object
         """
         if not self.__skipFrame(fromFrame) and not self.__skipFrame(toFrame):
-            fromInfo = {
-                "filename": self._dbgClient.absPath(self.fix_frame_filename(fromFrame)),
-                "linenumber": fromFrame.f_lineno,
-                "codename": fromFrame.f_code.co_name,
-            }
-            toInfo = {
-                "filename": self._dbgClient.absPath(self.fix_frame_filename(toFrame)),
-                "linenumber": toFrame.f_lineno,
-                "codename": toFrame.f_code.co_name,
-            }
-            self._dbgClient.sendCallTrace(event, fromInfo, toInfo)
+            self._dbgClient.sendCallTrace(
+                event == "call",
+                self._dbgClient.absPath(self.fix_frame_filename(fromFrame)),
+                fromFrame.f_lineno,
+                fromFrame.f_code.co_name,
+                self._dbgClient.absPath(self.fix_frame_filename(toFrame)),
+                toFrame.f_lineno,
+                toFrame.f_code.co_name,
+            )
 
     def trace_dispatch(self, frame, event, arg):
         """
@@ -320,6 +341,8 @@ class DebugBase:
         @rtype trace function or None
         @exception SystemExit
         """
+        self.traceDispatchCount += 1
+
         # give the client a chance to push through new break points.
         if self.eventPollFlag:
             self._dbgClient.eventPoll()
@@ -342,6 +365,9 @@ class DebugBase:
                     self._set_stopinfo(None, frame.f_back)
                 else:
                     self.user_line(frame)
+                    # the fast continue mode may have changed the trace
+                    # function of this frame
+                    return frame.f_trace
             return self.trace_dispatch
 
         if event == "call":
@@ -422,6 +448,8 @@ class DebugBase:
         if frame is None:
             frame = sys._getframe().f_back  # Skip set_trace method
 
+        self.stopFastContinue()
+
         stopOnHandleCommand = self._dbgClient.handleJsonCommand.__code__
 
         self.enterframe = frame
@@ -457,13 +485,15 @@ class DebugBase:
         try:
             # Because in the initial run method the "base debug" function is
             # set up, it's also valid for the threads afterwards.
-            sys.settrace(self.trace_dispatch)
+            if not self.startFastContinue():
+                sys.settrace(self.trace_dispatch)
 
             target(*args, **kwargs)
         except Exception:
             excinfo = sys.exc_info()
             self.user_exception(excinfo, True)
         finally:
+            self.stopFastContinue()
             sys.settrace(None)
             sys.setprofile(None)
 
@@ -523,6 +553,7 @@ class DebugBase:
             exitcode = 242
         finally:
             self.quitting = True
+            self.stopFastContinue()
             sys.settrace(None)
         return exitcode
 
@@ -588,6 +619,211 @@ class DebugBase:
         if not self._dbgClient.debugging:
             sys.settrace(None)
             sys.setprofile(None)
+        else:
+            self.startFastContinue()
+
+    def __canContinueFast(self):
+        """
+        Private method to check, if the thread may run to the next breakpoint
+        in fast continue mode.
+
+        This is possible, if the thread has to stop at breakpoints only and
+        neither watch expressions nor the call trace nor the reporting of
+        handled exceptions require to see every line or call.
+
+        @return flag indicating that the fast continue mode is possible
+        @rtype bool
+        """
+        return (
+            DebugBase.fastContinue
+            and self._dbgClient.debugging
+            and not self.stop_everywhere
+            and self.stopframe is None
+            and self.returnframe is None
+            and not Watch.watches
+            and self._dbgClient.callTraceEnabled is None
+            and not self._dbgClient.reportAllExceptions
+        )
+
+    def startFastContinue(self):
+        """
+        Public method to run the current thread to the next breakpoint with
+        the least possible tracing overhead, if possible.
+
+        The breakpoint monitor is used, if the interpreter supports
+        sys.monitoring. Otherwise a light weight trace function is installed,
+        which traces only code objects containing a breakpoint.
+
+        @return flag indicating a thread in fast continue mode
+        @rtype bool
+        """
+        if self.__fastContinue == DebugBase.FastContinueOff:
+            if not self.__canContinueFast():
+                return False
+
+            if DebugBase.monitorBreakpoints and BreakpointMonitor.instance().attach(
+                self
+            ):
+                sys.settrace(None)
+                self.__fastContinue = DebugBase.FastContinueMonitor
+            else:
+                self.__fastContinueThreadId = _thread.get_ident()
+                self.__armContinueDispatch(sys._getframe())
+                sys.settrace(self.__continueDispatch)
+                self.__fastContinue = DebugBase.FastContinueTrace
+
+        return True
+
+    def stopFastContinue(self, frame=None):
+        """
+        Public method to stop the fast continue mode for the current thread.
+
+        @param frame frame to continue tracing with the trace function
+            (defaults to None)
+        @type frame object (optional)
+        """
+        if self.__fastContinue == DebugBase.FastContinueOff:
+            return
+
+        if self.__fastContinue == DebugBase.FastContinueMonitor:
+            BreakpointMonitor.instance().detach()
+        self.__fastContinue = DebugBase.FastContinueOff
+
+        if frame is not None:
+            sys.settrace(self.trace_dispatch)
+            while frame is not None:
+                frame.f_trace = self.trace_dispatch
+                frame = frame.f_back
+
+    def fastContinuePoll(self, frame):
+        """
+        Public method to check for client interactions in fast continue mode.
+
+        @param frame current frame
+        @type frame object
+        @return flag indicating the thread is still in fast continue mode
+        @rtype bool
+        @exception SystemExit raised to stop the program being debugged
+        """
+        self._dbgClient.eventPoll()
+        self.eventPollFlag = False
+
+        if self.quitting:
+            self.stopFastContinue()
+            raise SystemExit
+
+        self._dbgClient.checkExceptionHook()
+
+        if not self.__canContinueFast():
+            # e.g. a watch expression was set
+            self.stopFastContinue(frame)
+            return False
+
+        return True
+
+    def fastContinueBreak(self, frame):
+        """
+        Public method to handle a breakpoint hit in fast continue mode.
+
+        @param frame frame of the breakpoint
+        @type frame object
+        """
+        self.stopFastContinue(frame)
+        self.user_line(frame)
+
+    def __armContinueDispatch(self, frame):
+        """
+        Private method to trace the frames containing a breakpoint with the
+        fast continue trace function.
+
+        @param frame innermost frame to be checked
+        @type frame object
+        """
+        while frame is not None:
+            try:
+                breakLines = Breakpoint.breakInCodeCache[id(frame.f_code)][1]
+            except KeyError:
+                breakLines = Breakpoint.codeBreakLines(
+                    frame.f_code, self.fix_frame_filename(frame)
+                )
+            frame.f_trace = self.__continueDispatch if breakLines else None
+            frame = frame.f_back
+
+    def __requestContinueDispatchPoll(self):
+        """
+        Private method to request a check for client interactions at the next
+        line executed by the thread running with the fast continue trace
+        function.
+
+        All frames on the stack of the thread get traced until the next poll
+        because a frame without a breakpoint (e.g. a loop not calling any
+        function) would never deliver a trace event otherwise. The poll
+        detaches them again.
+
+        Note: This method is called by the poll timer thread.
+        """
+        frame = sys._current_frames().get(self.__fastContinueThreadId)
+        while frame is not None:
+            frame.f_trace = self.__continueDispatch
+            frame = frame.f_back
+
+    def __continueDispatch(self, frame, event, _arg):
+        """
+        Private method implementing the trace function of the fast continue
+        mode, if sys.monitoring is not available.
+
+        Only code objects containing a breakpoint get traced. Everything else
+        needed by the full trace function is done while polling for client
+        interactions. The poll timer traces all frames of the thread for the
+        next poll (see __requestContinueDispatchPoll()).
+
+        @param frame current stack frame
+        @type frame object
+        @param event trace event
+        @type str
+        @param _arg arguments of the event (unused)
+        @type depends on the event
+        @return local trace function
+        @rtype trace function or None
+        """
+        if self.__fastContinue != DebugBase.FastContinueTrace:
+            # frame was prepared by the poll timer after the fast continue
+            # mode was stopped
+            return self.trace_dispatch(frame, event, _arg)
+
+        if self.eventPollFlag:
+            if not self.fastContinuePoll(frame):
+                # switched back to the full trace function
+                return self.trace_dispatch(frame, event, _arg)
+
+            # detach the frames prepared for the poll and trace the frames of
+            # breakpoints set in running code
+            self.__armContinueDispatch(frame)
+
+        self.traceDispatchCount += 1
+
+        try:
+            breakLines = Breakpoint.breakInCodeCache[id(frame.f_code)][1]
+        except KeyError:
+            breakLines = Breakpoint.codeBreakLines(
+                frame.f_code, self.fix_frame_filename(frame)
+            )
+
+        if event == "line":
+            if not breakLines:
+                # frame was prepared for the poll only
+                frame.f_trace = None
+                return None
+
+            if frame.f_lineno in breakLines and self.break_here(frame):
+                self.fastContinueBreak(frame)
+                return frame.f_trace
+            return self.__continueDispatch
+
+        if event == "call" and breakLines:
+            return self.__continueDispatch
+
+        return None
 
     def set_until(self, frame=None, lineno=None):
         """
@@ -715,46 +951,11 @@ class DebugBase:
         @rtype bool
         """
         try:
-            return Breakpoint.breakInFrameCache[
-                frame.f_globals.get("__file__"), frame.f_code.co_firstlineno
-            ]
+            return bool(Breakpoint.breakInCodeCache[id(frame.f_code)][1])
         except KeyError:
-            filename = self.fix_frame_filename(frame)
-            if filename not in Breakpoint.breakInFile:
-                Breakpoint.breakInFrameCache[
-                    frame.f_globals.get("__file__"), frame.f_code.co_firstlineno
-                ] = False
-                return False
-
-            try:
-                lineNumbers = [
-                    line for _, _, line in frame.f_code.co_lines() if line is not None
-                ]
-            except AttributeError:
-                # backward compatibility code for Python 3.10 and below
-                lineNo = frame.f_code.co_firstlineno
-                lineNumbers = [lineNo]
-
-                co_lnotab = frame.f_code.co_lnotab[1::2]
-
-                # No need to handle special case if a lot of lines between
-                # (e.g. closure), because the additional lines won't cause a bp
-                for co_lno in co_lnotab:
-                    if co_lno >= 0x80:
-                        lineNo -= 0x100
-                    lineNo += co_lno
-                    lineNumbers.append(lineNo)
-
-            for bp in Breakpoint.breakInFile[filename]:
-                if bp in lineNumbers:
-                    Breakpoint.breakInFrameCache[
-                        frame.f_globals.get("__file__"), frame.f_code.co_firstlineno
-                    ] = True
-                    return True
-            Breakpoint.breakInFrameCache[
-                frame.f_globals.get("__file__"), frame.f_code.co_firstlineno
-            ] = False
-            return False
+            return bool(
+                Breakpoint.codeBreakLines(frame.f_code, self.fix_frame_filename(frame))
+            )
 
     def break_here(self, frame):
         """
@@ -768,8 +969,15 @@ class DebugBase:
         @return flag indicating the break status
         @rtype bool
         """
-        filename = self.fix_frame_filename(frame)
-        if (filename, frame.f_lineno) in Breakpoint.breaks:
+        try:
+            breakLines = Breakpoint.breakInCodeCache[id(frame.f_code)][1]
+        except KeyError:
+            breakLines = Breakpoint.codeBreakLines(
+                frame.f_code, self.fix_frame_filename(frame)
+            )
+
+        if frame.f_lineno in breakLines:
+            filename = self.fix_frame_filename(frame)
             bp, flag = Breakpoint.effectiveBreak(filename, frame.f_lineno, frame)
             if bp:
                 # flag says ok to delete temp. bp
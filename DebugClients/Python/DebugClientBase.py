@@ -22,6 +22,7 @@ import signal
 import socket
 import sys
 import sysconfig
+import time
 import traceback
 import types
 
@@ -33,9 +34,16 @@ import DebugClientCapabilities
 import DebugVariables
 
 from AsyncFile import AsyncFile, AsyncPendingWrite
+from BreakpointMonitor import BreakpointMonitor
 from BreakpointWatch import Breakpoint, Watch
-from DebugBase import printerr, setRecursionLimit
-from DebugConfig import NonExpandableTypes, SpecialAttributes
+from CallTraceBuffer import CallTraceBuffer
+from DebugBase import DebugBase, printerr, setRecursionLimit
+from DebugConfig import (
+    BatchSize,
+    ElementsBudget,
+    NonExpandableTypes,
+    SpecialAttributes,
+)
 from DebugUtilities import formatargvalues, getargvalues, prepareJsonCommand
 from FlexCompleter import Completer
 from MultiProcessDebugExtension import patchNewProcessFunctions
@@ -193,6 +201,7 @@ class DebugClientBase:
         self.__debuggerId = ""
 
         self.callTraceEnabled = None
+        self.callTraceBuffer = CallTraceBuffer()
 
         self.compile_command = codeop.CommandCompiler()
 
@@ -207,6 +216,9 @@ class DebugClientBase:
 
         self.__debugeeExceptHook = None
 
+        # trace dispatch count and time of the last statistics request
+        self.__traceStatisticsBase = (0, time.monotonic())
+
     def getCoding(self):
         """
         Public method to return the current coding.
@@ -373,6 +385,9 @@ class DebugClientBase:
                 params["frameNumber"],
                 params["scope"],
                 params["filters"],
+                start=params.get("start", -1),
+                count=params.get("count", 0) or BatchSize,
+                budget=params.get("budget", 0) or ElementsBudget,
             )
 
         elif method == "RequestStack":
@@ -415,7 +430,11 @@ class DebugClientBase:
             clientType = "Python3"
             self.sendJsonCommand(
                 "ResponseCapabilities",
-                {"capabilities": self.__clientCapabilities(), "clientType": clientType},
+                {
+                    "capabilities": self.__clientCapabilities(),
+                    "clientType": clientType,
+                    "traceStatistics": self.__traceStatistics(),
+                },
             )
 
         elif method == "RequestBanner":
@@ -433,8 +452,10 @@ class DebugClientBase:
         elif method == "RequestCallTrace":
             if params["enable"]:
                 callTraceEnabled = self.profile
+                self.callTraceBuffer = CallTraceBuffer()
             else:
                 callTraceEnabled = None
+                self.flushCallTrace(force=True)
 
             if self.debugging:
                 sys.setprofile(callTraceEnabled)
@@ -442,6 +463,9 @@ class DebugClientBase:
                 # remember for later
                 self.callTraceEnabled = callTraceEnabled
 
+        elif method == "RequestCallTraceAck":
+            self.callTraceBuffer.acknowledge(params["batch"])
+
         elif method == "RequestEnvironment":
             for key, value in params["environment"].items():
                 if key.endswith("+"):
@@ -621,7 +645,12 @@ class DebugClientBase:
             self.__interceptSignals()
 
             # generate a profile object
-            self.prof = PyProfile.PyProfile(sys.argv[0])
+            if params.get("sampling", False):
+                import PySampleProfile  # __IGNORE_WARNING_I10__
+
+                self.prof = PySampleProfile.PySampleProfile(sys.argv[0])
+            else:
+                self.prof = PyProfile.PyProfile(sys.argv[0])
 
             if params["erase"]:
                 self.prof.erase()
@@ -886,6 +915,10 @@ class DebugClientBase:
             response
         @type dict
         """
+        if method != "CallTraceBatch" and self.callTraceBuffer.hasEvents():
+            # keep the order of the call trace and the other responses
+            self.flushCallTrace(force=True)
+
         # send debugger ID with all responses
         if "debuggerId" not in params:
             params["debuggerId"] = self.__debuggerId
@@ -939,27 +972,49 @@ class DebugClientBase:
             },
         )
 
-    def sendCallTrace(self, event, fromInfo, toInfo):
+    def sendCallTrace(
+        self, isCall, fromFile, fromLine, fromFunction, toFile, toLine, toFunction
+    ):
         """
         Public method to send a call trace entry.
 
-        @param event trace event (call or return)
+        The entries are buffered and sent in batches.
+
+        @param isCall flag indicating a 'call' event
+        @type bool
+        @param fromFile name of the originating file
+        @type str
+        @param fromLine line number in the originating file
+        @type int
+        @param fromFunction name of the originating function
+        @type str
+        @param toFile name of the target file
+        @type str
+        @param toLine line number in the target file
+        @type int
+        @param toFunction name of the target function
         @type str
-        @param fromInfo dictionary containing the origin info
-        @type dict with 'filename', 'linenumber' and 'codename'
-            as keys
-        @param toInfo dictionary containing the target info
-        @type dict with 'filename', 'linenumber' and 'codename'
-            as keys
         """
-        self.sendJsonCommand(
-            "CallTrace",
-            {
-                "event": event[0],
-                "from": fromInfo,
-                "to": toInfo,
-            },
-        )
+        if self.callTraceBuffer.add(
+            isCall, fromFile, fromLine, fromFunction, toFile, toLine, toFunction
+        ):
+            self.flushCallTrace()
+
+    def flushCallTrace(self, force=False):
+        """
+        Public method to send the buffered call trace entries.
+
+        @param force flag indicating to send the entries even if the IDE did
+            not acknowledge the previous batches yet (defaults to False)
+        @type bool (optional)
+        """
+        if not force and self.callTraceBuffer.isThrottled():
+            # give the IDE a chance to acknowledge the sent batches
+            self.eventPoll()
+
+        params = self.callTraceBuffer.takeBatch(force=force)
+        if params is not None:
+            self.sendJsonCommand("CallTraceBatch", params)
 
     def sendException(self, exceptionType, exceptionMessage, stack, threadName):
         """
@@ -1046,6 +1101,37 @@ class DebugClientBase:
         else:
             return self.clientCapabilities
 
+    def __traceStatistics(self):
+        """
+        Private method to determine the trace dispatch statistics.
+
+        The trace dispatch calls are counted for the running threads. The rate
+        is calculated for the period since the last request.
+
+        @return dictionary containing the total number of trace dispatch calls,
+            the number of trace dispatch calls per second and the total number
+            of events handled by the breakpoint monitor
+        @rtype dict
+        """
+        lastCount, lastTime = self.__traceStatisticsBase
+        count = sum(thread.traceDispatchCount for thread in self.threads.values())
+        now = time.monotonic()
+        self.__traceStatisticsBase = (count, now)
+
+        return {
+            "dispatchCalls": count,
+            "dispatchCallsPerSecond": (
+                max(0, round((count - lastCount) / (now - lastTime)))
+                if now > lastTime
+                else 0
+            ),
+            "monitorEvents": (
+                BreakpointMonitor.instance().eventsCount
+                if DebugBase.monitorBreakpoints
+                else 0
+            ),
+        }
+
     def readReady(self, stream):
         """
         Public method called when there is data ready to be read.
@@ -1114,6 +1200,14 @@ class DebugClientBase:
             if self.writestream.nWriteErrors > self.writestream.MAX_TRIES:
                 break
 
+            if (
+                self.callTraceBuffer.hasEvents()
+                and not self.callTraceBuffer.isThrottled()
+            ):
+                # send the buffered call trace events before waiting for the
+                # next command
+                self.flushCallTrace()
+
             if AsyncPendingWrite(self.writestream):
                 wrdy.append(self.writestream)
 
@@ -1180,6 +1274,10 @@ class DebugClientBase:
         if self.errorstream in wrdy:
             self.writeReady(self.errorstream)
 
+        if self.callTraceBuffer.isDue() and not self.callTraceBuffer.isThrottled():
+            # send the call trace events held back because no new ones arrived
+            self.flushCallTrace()
+
     def connectDebugger(self, port, remoteAddress=None, redirect=True, name=""):
         """
         Public method to establish a session with the debugger.
@@ -1461,10 +1559,23 @@ class DebugClientBase:
             },
         )
 
-    def __dumpVariable(self, var, frmnr, scope, filterList):
+    def __dumpVariable(
+        self,
+        var,
+        frmnr,
+        scope,
+        filterList,
+        start=-1,
+        count=BatchSize,
+        budget=ElementsBudget,
+    ):
         """
         Private method to return the variables of a frame to the debug server.
 
+        The child items of the requested variable are reported in windows. The
+        resolver of the variable is kept, so that the next request continuing
+        the previous window is served without resolving the variable again.
+
         @param var list encoded name of the requested variable
         @type list of str and int
         @param frmnr distance of frame reported on. 0 is the current frame
@@ -1473,6 +1584,16 @@ class DebugClientBase:
         @type int
         @param filterList list of variable types to be filtered
         @type list of int
+        @param start index of the first child item to be reported (-1 to
+            continue after the items reported last) (defaults to -1)
+        @type int (optional)
+        @param count number of child items to be reported per window (defaults
+            to BatchSize)
+        @type int (optional)
+        @param budget maximum number of elements to be processed as a whole
+            (e.g. to sort the keys of a dictionary or to calculate the minimum
+            of an array) (defaults to ElementsBudget)
+        @type int (optional)
         """
         if self.currentThread is None:
             return
@@ -1494,10 +1615,17 @@ class DebugClientBase:
 
         varlist = []
 
-        # fast path if variable was looked up before (see elif)
-        if scope != -1 and str(var) in self.resolverCache[scope]:
-            varGen = self.resolverCache[scope][str(var)]
+        # fast path if variable was looked up before and the requested window
+        # continues the previous one (see elif)
+        cacheKey = str(var)
+        cached = self.resolverCache[scope].get(cacheKey) if scope != -1 else None
+        if cached is not None and start in (-1, cached[1]):
+            varGen = cached[0]
             idx, varDict = next(varGen)
+            self.resolverCache[scope][cacheKey] = (
+                varGen,
+                idx + len(varDict) if idx >= 0 else -1,
+            )
             if idx != -2:  # more elements available
                 var.insert(0, idx)
                 varlist = self.__formatVariablesList(
@@ -1521,11 +1649,17 @@ class DebugClientBase:
             if variable is not None:
                 resolver = DebugVariables.getResolver(variable)
                 if resolver:
-                    varGen = resolver.getVariableList(variable)
-                    # cache for next lookup
-                    self.resolverCache[scope][str(var)] = varGen
-
+                    varGen = resolver.getVariableList(
+                        variable, start=max(start, 0), count=count, budget=budget
+                    )
                     idx, varDict = next(varGen)
+                    # cache for next lookup together with the start of the
+                    # next window
+                    self.resolverCache[scope][cacheKey] = (
+                        varGen,
+                        idx + len(varDict) if idx >= 0 else -1,
+                    )
+
                     if idx != -2:  # more elements available
                         varlist = self.__formatVariablesList(
                             varDict, scope, filterList, var
@@ -13,7 +13,14 @@ HasProfiler = 0x0004
 HasCoverage = 0x0008
 HasCompleter = 0x0010
 HasShell = 0x0020
+HasTraceStatistics = 0x0040
 
 HasAll = (
-    HasDebugger | HasInterpreter | HasProfiler | HasCoverage | HasCompleter | HasShell
+    HasDebugger
+    | HasInterpreter
+    | HasProfiler
+    | HasCoverage
+    | HasCompleter
+    | HasShell
+    | HasTraceStatistics
 )
@@ -7,7 +7,6 @@
 Module defining type strings for the different Python types.
 """
 
-
 SpecialAttributes = (
     "__bases__",
     "__class__",
@@ -20,6 +19,22 @@ SpecialAttributes = (
 )
 
 BatchSize = 200
+# maximum number of elements processed by operations over a whole variable
+# (e.g. sorting the keys of a dictionary or calculating the minimum of an array)
+ElementsBudget = 1024 * 1024
+
+# call trace events kept by the client while the IDE is busy (the oldest
+# events are dropped, if this is exceeded)
+CallTraceBufferSize = 100000
+# maximum number of call trace events per batch sent to the IDE
+CallTraceBatchSize = 5000
+# maximum time in seconds call trace events are held back
+CallTraceFlushInterval = 0.25
+# number of batches sent without acknowledgement by the IDE
+CallTraceMaxPendingBatches = 4
+# minimum size in bytes of a call trace batch to be sent compressed
+CallTraceCompressThreshold = 4096
+
 ConfigQtNames = ("PyQt5.", "PyQt6.", "PySide2.", "PySide6.", "Shiboken.EnumType")
 
 ConfigKnownQtTypes = (
@@ -8,6 +8,7 @@ Module implementing classes and functions to dump variable contents.
 """
 
 import contextlib
+import itertools
 import sys
 
 from collections.abc import ItemsView, KeysView, ValuesView
@@ -16,6 +17,7 @@ from DebugConfig import (
     BatchSize,
     ConfigKnownQtTypes,
     ConfigQtNames,
+    ElementsBudget,
     UnknownAttributeValueMarker,
 )
 
@@ -28,6 +30,31 @@ from DebugConfig import (
 ############################################################
 
 
+def _windows(items, start, count):
+    """
+    Protected function to split the items of a container into windows.
+
+    Only the items of the window being generated are materialized.
+
+    @param items iterator over the items starting at the first requested one
+    @type Iterator
+    @param start index of the first requested item
+    @type int
+    @param count number of items per window
+    @type int
+    @yield tuple containing the start index of the window and a list of its
+        items
+    @ytype tuple of (int, list)
+    """
+    count = max(1, count)
+    while True:
+        window = list(itertools.islice(items, count))
+        if not window:
+            return
+        yield start, window
+        start += len(window)
+
+
 class BaseResolver:
     """
     Base class of the resolver class tree.
@@ -80,12 +107,26 @@ class DefaultResolver(BaseResolver):
     Class used to resolve the default way.
     """
 
-    def getVariableList(self, var):
+    def getVariableList(
+        self,
+        var,
+        start=0,  # noqa: U100
+        count=BatchSize,  # noqa: U100
+        budget=ElementsBudget,  # noqa: U100
+    ):
         """
         Public method to get the attributes of a variable as a list.
 
         @param var variable to be converted
         @type Any
+        @param start index of the first item to be reported (defaults to 0)
+        @type int (optional)
+        @param count number of items per batch (defaults to BatchSize)
+        @type int (optional)
+        @param budget maximum number of items an operation over the whole
+            variable may process (e.g. sorting or calculating a summary)
+            (defaults to ElementsBudget)
+        @type int (optional)
         @yield tuple containing the batch start index and a list
             containing the variable attributes
         @ytype tuple of (int, list)
@@ -149,38 +190,42 @@ class DictResolver(BaseResolver):
 
         return key  # __IGNORE_WARNING_M834__
 
-    def getVariableList(self, var):
+    def getVariableList(self, var, start=0, count=BatchSize, budget=ElementsBudget):
         """
         Public method to get the attributes of a variable as a list.
 
         @param var variable to be converted
         @type Any
+        @param start index of the first item to be reported (defaults to 0)
+        @type int (optional)
+        @param count number of items per batch (defaults to BatchSize)
+        @type int (optional)
+        @param budget maximum number of items an operation over the whole
+            variable may process (e.g. sorting or calculating a summary)
+            (defaults to ElementsBudget)
+        @type int (optional)
         @yield tuple containing the batch start index and a list
             containing the variable attributes
         @ytype tuple of (int, list)
         """
-        d = []
-        start = count = 0
-        allItems = list(var.items())
-        try:
-            # Fast path: all items from same type
-            allItems.sort(key=lambda x: x[0])
-        except TypeError:
-            # Slow path: only sort items with same type (Py3 only)
-            allItems.sort(key=lambda x: (str(x[0]), x[0]))
-
-        for key, value in allItems:
-            key = "{0} (ID:{1})".format(self.keyToStr(key), id(key))
-            d.append((key, value))
-            count += 1
-            if count >= BatchSize:
-                yield start, d
-                start += count
-                count = 0
-                d = []
-
-        if d:
-            yield start, d
+        if len(var) <= budget:
+            allItems = list(var.items())
+            try:
+                # Fast path: all items from same type
+                allItems.sort(key=lambda x: x[0])
+            except TypeError:
+                # Slow path: only sort items with same type (Py3 only)
+                allItems.sort(key=lambda x: (str(x[0]), x[0]))
+            items = itertools.islice(allItems, start, None)
+        else:
+            # too many items to be sorted, show them in insertion order
+            items = itertools.islice(var.items(), start, None)
+
+        for windowStart, window in _windows(items, start, count):
+            yield windowStart, [
+                ("{0} (ID:{1})".format(self.keyToStr(key), id(key)), value)
+                for key, value in window
+            ]
 
         # in case it has additional fields
         d = super().getVariableList(var)
@@ -216,29 +261,33 @@ class ListResolver(BaseResolver):
         except Exception:
             return getattr(var, str(attribute), None)
 
-    def getVariableList(self, var):
+    def getVariableList(
+        self,
+        var,
+        start=0,
+        count=BatchSize,
+        budget=ElementsBudget,  # noqa: U100
+    ):
         """
         Public method to get the attributes of a variable as a list.
 
         @param var variable to be converted
         @type Any
+        @param start index of the first item to be reported (defaults to 0)
+        @type int (optional)
+        @param count number of items per batch (defaults to BatchSize)
+        @type int (optional)
+        @param budget maximum number of items an operation over the whole
+            variable may process (e.g. sorting or calculating a summary)
+            (defaults to ElementsBudget)
+        @type int (optional)
         @yield tuple containing the batch start index and a list
             containing the variable attributes
         @ytype tuple of (int, list)
         """
-        d = []
-        start = count = 0
-        for idx, value in enumerate(var):
-            d.append((idx, value))
-            count += 1
-            if count >= BatchSize:
-                yield start, d
-                start = idx + 1
-                count = 0
-                d = []
-
-        if d:
-            yield start, d
+        while start < len(var):
+            yield start, list(enumerate(var[start : start + count], start=start))
+            start += max(1, count)
 
         # in case it has additional fields
         d = super().getVariableList(var)
@@ -269,19 +318,47 @@ class DictViewResolver(ListResolver):
         @return value of the attribute
         @rtype Any
         """
-        return super().resolve(list(var), attribute)
+        try:
+            # get the requested item without materializing the view
+            return next(itertools.islice(var, int(attribute), None))
+        except Exception:
+            return getattr(var, str(attribute), None)
 
-    def getVariableList(self, var):
+    def getVariableList(
+        self,
+        var,
+        start=0,
+        count=BatchSize,
+        budget=ElementsBudget,  # noqa: U100
+    ):
         """
         Public method to get the attributes of a variable as a list.
 
         @param var variable to be converted
         @type Any
+        @param start index of the first item to be reported (defaults to 0)
+        @type int (optional)
+        @param count number of items per batch (defaults to BatchSize)
+        @type int (optional)
+        @param budget maximum number of items an operation over the whole
+            variable may process (e.g. sorting or calculating a summary)
+            (defaults to ElementsBudget)
+        @type int (optional)
         @yield tuple containing the batch start index and a list
             containing the variable attributes
         @ytype tuple of (int, list)
         """
-        yield from super().getVariableList(list(var))
+        for windowStart, window in _windows(
+            itertools.islice(var, start, None), start, count
+        ):
+            yield windowStart, list(enumerate(window, start=windowStart))
+
+        # in case it has additional fields
+        d = BaseResolver.getVariableList(self, var)
+        yield -1, d
+
+        while True:
+            yield -2, []
 
 
 ############################################################
@@ -318,29 +395,36 @@ class SetResolver(BaseResolver):
 
         return None
 
-    def getVariableList(self, var):
+    def getVariableList(
+        self,
+        var,
+        start=0,
+        count=BatchSize,
+        budget=ElementsBudget,  # noqa: U100
+    ):
         """
         Public method to get the attributes of a variable as a list.
 
         @param var variable to be converted
         @type Any
+        @param start index of the first item to be reported (defaults to 0)
+        @type int (optional)
+        @param count number of items per batch (defaults to BatchSize)
+        @type int (optional)
+        @param budget maximum number of items an operation over the whole
+            variable may process (e.g. sorting or calculating a summary)
+            (defaults to ElementsBudget)
+        @type int (optional)
         @yield tuple containing the batch start index and a list
             containing the variable attributes
         @ytype tuple of (int, list)
         """
-        d = []
-        start = count = 0
-        for value in var:
-            count += 1
-            d.append(("'ID: {0}'".format(id(value)), value))
-            if count >= BatchSize:
-                yield start, d
-                start += count
-                count = 0
-                d = []
-
-        if d:
-            yield start, d
+        for windowStart, window in _windows(
+            itertools.islice(var, start, None), start, count
+        ):
+            yield windowStart, [
+                ("'ID: {0}'".format(id(value)), value) for value in window
+            ]
 
         # in case it has additional fields
         d = super().getVariableList(var)
@@ -410,40 +494,43 @@ class NdArrayResolver(BaseResolver):
 
         return None
 
-    def getVariableList(self, var):
+    def getVariableList(self, var, start=0, count=BatchSize, budget=ElementsBudget):
         """
         Public method to get the attributes of a variable as a list.
 
         @param var variable to be converted
         @type Any
+        @param start index of the first item to be reported (defaults to 0)
+        @type int (optional)
+        @param count number of items per batch (defaults to BatchSize)
+        @type int (optional)
+        @param budget maximum number of items an operation over the whole
+            variable may process (e.g. sorting or calculating a summary)
+            (defaults to ElementsBudget)
+        @type int (optional)
         @yield tuple containing the batch start index and a list
             containing the variable attributes
         @ytype tuple of (int, list)
         """
-        d = []
-        start = count = 0
         try:
-            len(var)  # Check if it's an unsized object, e.g. np.ndarray(())
-            allItems = var.tolist()
+            length = len(var)  # Check if it's an unsized object, e.g. np.ndarray(())
         except TypeError:  # TypeError: len() of unsized object
-            allItems = []
-
-        for idx, value in enumerate(allItems):
-            d.append((str(idx), value))
-            count += 1
-            if count >= BatchSize:
-                yield start, d
-                start += count
-                count = 0
-                d = []
-
-        if d:
-            yield start, d
+            length = 0
+
+        # convert the requested window only
+        while start < length:
+            yield start, [
+                (str(idx), value)
+                for idx, value in enumerate(
+                    var[start : start + count].tolist(), start=start
+                )
+            ]
+            start += max(1, count)
 
         # in case it has additional fields
         d = super().getVariableList(var)
 
-        if var.size > 1024 * 1024:
+        if var.size > budget:
             d.append(
                 ("min", "ndarray too big, calculating min would slow down debugging")
             )
@@ -507,38 +594,45 @@ class MultiValueDictResolver(DictResolver):
 
         return None
 
-    def getVariableList(self, var):
+    def getVariableList(self, var, start=0, count=BatchSize, budget=ElementsBudget):
         """
         Public method to get the attributes of a variable as a list.
 
         @param var variable to be converted
         @type Any
+        @param start index of the first item to be reported (defaults to 0)
+        @type int (optional)
+        @param count number of items per batch (defaults to BatchSize)
+        @type int (optional)
+        @param budget maximum number of items an operation over the whole
+            variable may process (e.g. sorting or calculating a summary)
+            (defaults to ElementsBudget)
+        @type int (optional)
         @yield tuple containing the batch start index and a list
             containing the variable attributes
         @ytype tuple of (int, list)
         """
-        d = []
-        start = count = 0
-        allKeys = list(var)
-        try:
-            # Fast path: all items from same type
-            allKeys.sort()
-        except TypeError:
-            # Slow path: only sort items with same type (Py3 only)
-            allKeys.sort(key=lambda x: (str(x), x))
-
-        for key in allKeys:
-            dkey = "{0} (ID:{1})".format(self.keyToStr(key), id(key))
-            d.append((dkey, var.getlist(key)))
-            count += 1
-            if count >= BatchSize:
-                yield start, d
-                start += count
-                count = 0
-                d = []
-
-        if d:
-            yield start, d
+        if len(var) <= budget:
+            allKeys = list(var)
+            try:
+                # Fast path: all items from same type
+                allKeys.sort()
+            except TypeError:
+                # Slow path: only sort items with same type (Py3 only)
+                allKeys.sort(key=lambda x: (str(x), x))
+            keys = itertools.islice(allKeys, start, None)
+        else:
+            # too many keys to be sorted, show them in insertion order
+            keys = itertools.islice(var, start, None)
+
+        for windowStart, window in _windows(keys, start, count):
+            yield windowStart, [
+                (
+                    "{0} (ID:{1})".format(self.keyToStr(key), id(key)),
+                    var.getlist(key),
+                )
+                for key in window
+            ]
 
         # in case it has additional fields
         d = super(DictResolver, self).getVariableList(var)
@@ -592,31 +686,39 @@ class ArrayResolver(BaseResolver):
 
         return None
 
-    def getVariableList(self, var):
+    def getVariableList(
+        self,
+        var,
+        start=0,
+        count=BatchSize,
+        budget=ElementsBudget,  # noqa: U100
+    ):
         """
         Public method to get the attributes of a variable as a list.
 
         @param var variable to be converted
         @type Any
+        @param start index of the first item to be reported (defaults to 0)
+        @type int (optional)
+        @param count number of items per batch (defaults to BatchSize)
+        @type int (optional)
+        @param budget maximum number of items an operation over the whole
+            variable may process (e.g. sorting or calculating a summary)
+            (defaults to ElementsBudget)
+        @type int (optional)
         @yield tuple containing the batch start index and a list
             containing the variable attributes
         @ytype tuple of (int, list)
         """
-        d = []
-        start = count = 0
-        allItems = var.tolist()
-
-        for idx, value in enumerate(allItems):
-            d.append((str(idx), value))
-            count += 1
-            if count >= BatchSize:
-                yield start, d
-                start += count
-                count = 0
-                d = []
-
-        if d:
-            yield start, d
+        # convert the requested window only
+        while start < len(var):
+            yield start, [
+                (str(idx), value)
+                for idx, value in enumerate(
+                    var[start : start + count].tolist(), start=start
+                )
+            ]
+            start += max(1, count)
 
         # in case it has additional fields
         d = super().getVariableList(var)
@@ -656,12 +758,26 @@ class QtResolver(BaseResolver):
 
         return getattr(var, attribute, None)
 
-    def getVariableList(self, var):
+    def getVariableList(
+        self,
+        var,
+        start=0,  # noqa: U100
+        count=BatchSize,  # noqa: U100
+        budget=ElementsBudget,  # noqa: U100
+    ):
         """
         Public method to get the attributes of a variable as a list.
 
         @param var variable to be converted
         @type Any
+        @param start index of the first item to be reported (defaults to 0)
+        @type int (optional)
+        @param count number of items per batch (defaults to BatchSize)
+        @type int (optional)
+        @param budget maximum number of items an operation over the whole
+            variable may process (e.g. sorting or calculating a summary)
+            (defaults to ElementsBudget)
+        @type int (optional)
         @yield tuple containing the batch start index and a list
             containing the variable attributes
         @ytype tuple of (int, list)
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+
+"""
+Module implementing a sampling profiler.
+"""
+
+import atexit
+import contextlib
+import marshal
+import os
+import pickle  # secok
+import sys
+import threading
+import time
+
+SampleInterval = 0.005  # 5 milliseconds
+
+
+class PySampleProfile:
+    """
+    Class implementing a sampling profiler.
+
+    Instead of tracing each call and return, a background thread takes a
+    snapshot of the call stacks of all threads periodically. This keeps the
+    overhead low and independent of the number of function calls made by the
+    profiled program. A timer thread is used instead of a profiling signal
+    because signal handlers are executed by the main thread only and
+    SIGPROF is not available on Windows.
+
+    The samples are kept as a dictionary of call stacks and the number of
+    their occurrence. Like the timing cache of the deterministic profiler they
+    are saved to a sample cache and merged with the samples of subsequent
+    runs. The profile dump has the format of the deterministic profiler
+    with the number of samples reported as the number of calls. In addition
+    the samples are stored as collapsed stacks, which can be processed by
+    flame graph tools.
+    """
+
+    def __init__(self, basename, interval=SampleInterval):
+        """
+        Constructor
+
+        @param basename name of the script to be profiled
+        @type str
+        @param interval sample interval in seconds (defaults to SampleInterval)
+        @type float (optional)
+        """
+        self.__scriptName = basename
+        self.__interval = interval
+
+        basename = os.path.splitext(basename)[0]
+        self.profileCache = "{0}.profile".format(basename)
+        self.samplesCache = "{0}.samples".format(basename)
+        self.collapsedStacksFile = "{0}.collapsed".format(basename)
+
+        # dictionary with a tuple of function tuples (file name, first line
+        # number and function name) starting with the outermost frame as key
+        # and the number of samples as value
+        self.samples = {}
+        self.samplingTime = 0.0
+        self.samplingRounds = 0
+
+        # dictionary with the code object as key and the function tuple or
+        # None for debugger code as value
+        self.__functions = {}
+        self.__debuggerPath = os.path.dirname(os.path.abspath(__file__))
+
+        self.__stopEvent = threading.Event()
+        self.__samplerThread = None
+
+        self.__restore()
+        atexit.register(self.save)
+
+    def __restore(self):
+        """
+        Private method to restore the samples from the sample cache.
+        """
+        if not os.path.exists(self.samplesCache):
+            return
+
+        with contextlib.suppress(
+            OSError, EOFError, ValueError, TypeError, KeyError
+        ), open(self.samplesCache, "rb") as cache:
+            samples = marshal.load(cache)  # secok
+            if isinstance(samples, dict):
+                self.samples = samples["samples"]
+                self.samplingTime = samples["time"]
+                self.samplingRounds = samples["rounds"]
+
+    def __function(self, code):
+        """
+        Private method to get the function tuple of a code object.
+
+        @param code code object
+        @type code
+        @return tuple containing the file name, the first line number and the
+            function name or None for code of the debugger
+        @rtype tuple of (str, int, str) or None
+        """
+        try:
+            return self.__functions[code]
+        except KeyError:
+            filename = code.co_filename
+            if os.path.dirname(os.path.abspath(filename)) == self.__debuggerPath:
+                function = None
+            else:
+                function = (filename, code.co_firstlineno, code.co_name)
+            self.__functions[code] = function
+            return function
+
+    def __sample(self):
+        """
+        Private method to take a snapshot of the call stacks of all threads.
+        """
+        samplerIdent = threading.get_ident()
+        samples = self.samples
+        for ident, frame in sys._current_frames().items():
+            if ident == samplerIdent:
+                continue
+
+            stack = []
+            while frame is not None:
+                function = self.__function(frame.f_code)
+                if function is not None:
+                    stack.append(function)
+                frame = frame.f_back
+            if stack:
+                stack = tuple(reversed(stack))
+                samples[stack] = samples.get(stack, 0) + 1
+
+    def __sampler(self):
+        """
+        Private method implementing the sampler thread.
+        """
+        lastSample = time.monotonic()
+        while not self.__stopEvent.wait(self.__interval):
+            self.__sample()
+            now = time.monotonic()
+            self.samplingTime += now - lastSample
+            self.samplingRounds += 1
+            lastSample = now
+
+    def start(self):
+        """
+        Public method to start sampling.
+        """
+        if self.__samplerThread is None:
+            self.__stopEvent.clear()
+            self.__samplerThread = threading.Thread(
+                target=self.__sampler, name="eric7 sample profiler", daemon=True
+            )
+            self.__samplerThread.start()
+
+    def stop(self):
+        """
+        Public method to stop sampling.
+        """
+        if self.__samplerThread is not None:
+            self.__stopEvent.set()
+            self.__samplerThread.join()
+            self.__samplerThread = None
+
+    def run(self, cmd):
+        """
+        Public method to profile a script.
+
+        @param cmd source code of the script
+        @type str
+        """
+        import __main__  # __IGNORE_WARNING_I10__
+
+        code = compile(cmd, self.__scriptName, "exec")
+        self.start()
+        try:
+            exec(code, __main__.__dict__, __main__.__dict__)  # secok
+        finally:
+            self.stop()
+
+    def save(self):
+        """
+        Public method to store the collected profile data.
+        """
+        self.stop()
+
+        # dump the raw samples
+        with contextlib.suppress(OSError), open(self.samplesCache, "wb") as cache:
+            marshal.dump(
+                {
+                    "samples": self.samples,
+                    "time": self.samplingTime,
+                    "rounds": self.samplingRounds,
+                },
+                cache,
+            )
+
+        # dump the profile data
+        self.dump_stats(self.profileCache)
+
+        # dump the collapsed stacks
+        with contextlib.suppress(OSError), open(
+            self.collapsedStacksFile, "w", encoding="utf-8"
+        ) as f:
+            for stack, count in self.samples.items():
+                f.write(
+                    "{0} {1}\n".format(
+                        ";".join(
+                            "{2} ({0}:{1})".format(*function).replace(";", ",")
+                            for function in stack
+                        ),
+                        count,
+                    )
+                )
+
+    def create_stats(self):
+        """
+        Public method to convert the samples to profile statistics.
+
+        The statistics have the format of the 'stats' attribute of the
+        standard profiler. The number of calls is given as the number of
+        samples containing a function. The times are estimated from the
+        number of samples and the mean sample interval.
+        """
+        interval = (
+            self.samplingTime / self.samplingRounds
+            if self.samplingRounds
+            else self.__interval
+        )
+
+        selfCounts = {}
+        totalCounts = {}
+        callers = {}
+        for stack, count in self.samples.items():
+            function = stack[-1]
+            selfCounts[function] = selfCounts.get(function, 0) + count
+            for function in set(stack):
+                totalCounts[function] = totalCounts.get(function, 0) + count
+            for caller, callee in zip(stack, stack[1:]):
+                calleeCallers = callers.setdefault(callee, {})
+                calleeCallers[caller] = calleeCallers.get(caller, 0) + count
+
+        self.stats = {
+            function: (
+                totalCount,
+                totalCount,
+                selfCounts.get(function, 0) * interval,
+                totalCount * interval,
+                callers.get(function, {}),
+            )
+            for function, totalCount in totalCounts.items()
+        }
+
+    def dump_stats(self, file):
+        """
+        Public method to dump the statistics data.
+
+        @param file name of the file to write to
+        @type str
+        """
+        self.create_stats()
+        with contextlib.suppress(OSError, pickle.PickleError), open(file, "wb") as f:
+            pickle.dump(self.stats, f, 4)
+
+    def erase(self):
+        """
+        Public method to erase the collected samples.
+        """
+        self.samples = {}
+        self.samplingTime = 0.0
+        self.samplingRounds = 0
+        if os.path.exists(self.samplesCache):
+            os.remove(self.samplesCache)
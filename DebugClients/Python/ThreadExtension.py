@@ -289,13 +289,15 @@ class ThreadExtension:
             _debugClient.dumpThreadList()
 
             # see DebugBase.bootstrap
-            sys.settrace(newThread.trace_dispatch)
+            if not newThread.startFastContinue():
+                sys.settrace(newThread.trace_dispatch)
             try:
                 run()
             except Exception:
                 excinfo = sys.exc_info()
                 newThread.user_exception(excinfo, True)
             finally:
+                newThread.stopFastContinue()
                 sys.settrace(None)
                 _debugClient.dumpThreadList()
 
@@ -379,7 +381,8 @@ class ThreadExtension:
             _debugClient.dumpThreadList()
 
             # see DebugBase.bootstrap
-            sys.settrace(newThread.trace_dispatch)
+            if not newThread.startFastContinue():
+                sys.settrace(newThread.trace_dispatch)
             try:
                 run()
             except SystemExit:
@@ -389,6 +392,7 @@ class ThreadExtension:
                 excinfo = sys.exc_info()
                 newThread.user_exception(excinfo, True)
             finally:
+                newThread.stopFastContinue()
                 sys.settrace(None)
                 _debugClient.dumpThreadList()
 
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+
+"""
+Module implementing the call trace model.
+"""
+
+from PyQt6.QtCore import QAbstractItemModel, QCoreApplication, QModelIndex, Qt
+
+from eric7.EricGui import EricPixmapCache
+
+
+class CallTraceModel(QAbstractItemModel):
+    """
+    Class implementing a list model for call trace entries.
+
+    The entries are stored as tuples and formatted on demand, so that only the
+    visible rows are rendered. The nesting of the calls is shown by indenting
+    the 'From' column.
+    """
+
+    EventColumn = 0
+    FromColumn = 1
+    ToColumn = 2
+
+    Header = (
+        "",
+        QCoreApplication.translate("CallTraceModel", "From"),
+        QCoreApplication.translate("CallTraceModel", "To"),
+    )
+
+    EntryFormat = "{0}:{1} ({2})"
+    Indentation = "  "
+    MaxIndentationLevel = 64
+
+    def __init__(self, parent=None):
+        """
+        Constructor
+
+        @param parent reference to the parent object (defaults to None)
+        @type QObject (optional)
+        """
+        super().__init__(parent)
+
+        # list of tuples of the 'call' flag (None for a dropped entries
+        # marker), the nesting level, the originating file name, line number
+        # and function name and the target file name, line number and
+        # function name
+        self.__entries = []
+        self.__level = 0
+
+        self.__icons = {
+            True: EricPixmapCache.getIcon("forward"),
+            False: EricPixmapCache.getIcon("back"),
+            None: EricPixmapCache.getIcon("warning"),
+        }
+        self.__headerIcon = EricPixmapCache.getIcon("callReturn")
+
+    def columnCount(self, parent=None):  # noqa: U100
+        """
+        Public method to get the current column count.
+
+        @param parent index of the parent item (unused)
+        @type QModelIndex
+        @return column count
+        @rtype int
+        """
+        return len(CallTraceModel.Header)
+
+    def rowCount(self, parent=None):
+        """
+        Public method to get the current row count.
+
+        @param parent index of the parent item
+        @type QModelIndex
+        @return row count
+        @rtype int
+        """
+        # we do not have a tree, parent should always be invalid
+        if parent is None or not parent.isValid():
+            return len(self.__entries)
+        else:
+            return 0
+
+    def data(self, index, role):
+        """
+        Public method to get the requested data.
+
+        @param index index of the requested data
+        @type QModelIndex
+        @param role role of the requested data
+        @type Qt.ItemDataRole
+        @return the requested data
+        @rtype Any
+        """
+        if not index.isValid():
+            return None
+
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole and column != CallTraceModel.EventColumn:
+            _isCall, fromText, toText = self.entryTexts(index.row())
+            if column == CallTraceModel.FromColumn:
+                level = min(
+                    self.__entries[index.row()][1], CallTraceModel.MaxIndentationLevel
+                )
+                return CallTraceModel.Indentation * level + fromText
+            else:
+                return toText
+
+        if (
+            role == Qt.ItemDataRole.DecorationRole
+            and column == CallTraceModel.EventColumn
+        ):
+            return self.__icons[self.__entries[index.row()][0]]
+
+        return None
+
+    def flags(self, index):
+        """
+        Public method to get item flags.
+
+        @param index index of the requested flags
+        @type QModelIndex
+        @return item flags for the given index
+        @rtype Qt.ItemFlags
+        """
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsEnabled
+
+        return (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemNeverHasChildren
+        )
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Public method to get header data.
+
+        @param section section number of the requested header data
+        @type int
+        @param orientation orientation of the header
+        @type Qt.Orientation
+        @param role role of the requested data
+        @type Qt.ItemDataRole
+        @return header data
+        @rtype Any
+        """
+        if orientation == Qt.Orientation.Horizontal:
+            if role == Qt.ItemDataRole.DisplayRole:
+                if section >= len(CallTraceModel.Header):
+                    return ""
+                else:
+                    return CallTraceModel.Header[section]
+
+            if (
+                role == Qt.ItemDataRole.DecorationRole
+                and section == CallTraceModel.EventColumn
+            ):
+                return self.__headerIcon
+
+        return None
+
+    def index(self, row, column, parent=None):
+        """
+        Public method to create an index.
+
+        @param row row number for the index
+        @type int
+        @param column column number for the index
+        @type int
+        @param parent index of the parent item
+        @type QModelIndex
+        @return requested index
+        @rtype QModelIndex
+        """
+        if (
+            (parent and parent.isValid())
+            or row < 0
+            or row >= len(self.__entries)
+            or column < 0
+            or column >= len(CallTraceModel.Header)
+        ):
+            return QModelIndex()
+
+        return self.createIndex(row, column)
+
+    def parent(self, _index):
+        """
+        Public method to get the parent index.
+
+        @param _index index of item to get parent (unused)
+        @type QModelIndex
+        @return index of parent
+        @rtype QModelIndex
+        """
+        return QModelIndex()
+
+    def hasChildren(self, parent=None):
+        """
+        Public method to check for the presence of child items.
+
+        @param parent index of parent item
+        @type QModelIndex
+        @return flag indicating the presence of child items
+        @rtype bool
+        """
+        if parent is None or not parent.isValid():
+            return len(self.__entries) > 0
+        else:
+            return False
+
+    ###########################################################################
+
+    def addEntries(self, entries, dropped=0):
+        """
+        Public method to add a batch of call trace entries.
+
+        @param entries list of call trace entries, each being a tuple of the
+            'call' flag, the originating file name, line number and function
+            name and the target file name, line number and function name
+        @type list of tuple of (bool, str, int, str, str, int, str)
+        @param dropped number of entries dropped before this batch (defaults
+            to 0)
+        @type int (optional)
+        """
+        newEntries = []
+        level = self.__level
+        if dropped:
+            newEntries.append((None, level, dropped, 0, "", "", 0, ""))
+        for isCall, *info in entries:
+            newEntries.append((isCall, level, *info))
+            if isCall:
+                level += 1
+            elif level > 0:
+                level -= 1
+        self.__level = level
+
+        if newEntries:
+            count = len(self.__entries)
+            self.beginInsertRows(QModelIndex(), count, count + len(newEntries) - 1)
+            self.__entries.extend(newEntries)
+            self.endInsertRows()
+
+    def clear(self):
+        """
+        Public method to clear the model.
+        """
+        self.beginResetModel()
+        self.__entries = []
+        self.__level = 0
+        self.endResetModel()
+
+    def entryTexts(self, row):
+        """
+        Public method to get the formatted texts of an entry.
+
+        @param row row number of the entry
+        @type int
+        @return tuple containing the 'call' flag (None for a dropped entries
+            marker) and the texts of the 'From' and 'To' columns
+        @rtype tuple of (bool or None, str, str)
+        """
+        (
+            isCall,
+            _level,
+            fromFile,
+            fromLine,
+            fromFunction,
+            toFile,
+            toLine,
+            toFunction,
+        ) = self.__entries[row]
+        if isCall is None:
+            return (
+                None,
+                QCoreApplication.translate(
+                    "CallTraceModel", "{0} entries were dropped"
+                ).format(fromFile),
+                "",
+            )
+
+        return (
+            isCall,
+            CallTraceModel.EntryFormat.format(fromFile, fromLine, fromFunction),
+            CallTraceModel.EntryFormat.format(toFile, toLine, toFunction),
+        )
@@ -10,14 +10,15 @@ Module implementing the Call Trace viewer widget.
 import pathlib
 import re
 
-from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
-from PyQt6.QtWidgets import QTreeWidgetItem, QWidget
+from PyQt6.QtCore import QModelIndex, pyqtSignal, pyqtSlot
+from PyQt6.QtWidgets import QWidget
 
 from eric7 import EricUtilities, Preferences
 from eric7.EricGui import EricPixmapCache
 from eric7.EricWidgets import EricFileDialog, EricMessageBox
 from eric7.EricWidgets.EricApplication import ericApp
 
+from .CallTraceModel import CallTraceModel
 from .Ui_CallTraceViewer import Ui_CallTraceViewer
 
 
@@ -54,17 +55,16 @@ class CallTraceViewer(QWidget, Ui_CallTraceViewer):
         self.clearButton.setIcon(EricPixmapCache.getIcon("editDelete"))
         self.saveButton.setIcon(EricPixmapCache.getIcon("fileSave"))
 
-        self.__headerItem = QTreeWidgetItem(["", self.tr("From"), self.tr("To")])
-        self.__headerItem.setIcon(0, EricPixmapCache.getIcon("callReturn"))
-        self.callTrace.setHeaderItem(self.__headerItem)
+        self.__model = CallTraceModel(self)
+        self.callTrace.setModel(self.__model)
 
-        self.__callStack = []
-
-        self.__entryFormat = "{0}:{1} ({2})"
         self.__entryRe = re.compile(r"""(.+):(\d+)\s\((.*)\)""")
 
         self.__projectMode = False
         self.__project = None
+        # dictionary with the file name as key and the project relative one
+        # as value
+        self.__relativePaths = {}
         self.__tracedDebuggerId = ""
 
         stopOnExit = EricUtilities.toBool(
@@ -84,7 +84,7 @@ class CallTraceViewer(QWidget, Ui_CallTraceViewer):
         else:
             self.stopTraceButton.setEnabled(False)
 
-        self.__dbs.callTraceInfo.connect(self.__addCallTraceInfo)
+        self.__dbs.callTraceBatch.connect(self.__addCallTraceBatch)
         self.__dbs.clientExit.connect(self.__clientExit)
 
     def __setCallTraceEnabled(self, enabled):
@@ -103,8 +103,7 @@ class CallTraceViewer(QWidget, Ui_CallTraceViewer):
         Preferences.getSettings().setValue("CallTrace/Enabled", enabled)
 
         if not enabled:
-            for column in range(self.callTrace.columnCount()):
-                self.callTrace.resizeColumnToContents(column)
+            self.on_resizeButton_clicked()
 
     @pyqtSlot(bool)
     def on_stopCheckBox_clicked(self, checked):
@@ -135,7 +134,7 @@ class CallTraceViewer(QWidget, Ui_CallTraceViewer):
         """
         Private slot to resize the columns of the call trace to their contents.
         """
-        for column in range(self.callTrace.columnCount()):
+        for column in range(self.__model.columnCount()):
             self.callTrace.resizeColumnToContents(column)
 
     @pyqtSlot()
@@ -150,7 +149,7 @@ class CallTraceViewer(QWidget, Ui_CallTraceViewer):
         """
         Private slot to save the call trace info to a file.
         """
-        if self.callTrace.topLevelItemCount() > 0:
+        if self.__model.rowCount() > 0:
             fname, selectedFilter = EricFileDialog.getSaveFileNameAndFilter(
                 self,
                 self.tr("Save Call Trace Info"),
@@ -185,16 +184,15 @@ class CallTraceViewer(QWidget, Ui_CallTraceViewer):
                     with fpath.open("w", encoding="utf-8") as f:
                         f.write("{0}\n".format(title))
                         f.write("{0}\n\n".format(len(title) * "="))
-                        itm = self.callTrace.topLevelItem(0)
-                        while itm is not None:
-                            isCall = itm.data(0, Qt.ItemDataRole.UserRole)
-                            call = "->" if isCall else "<-"
-                            f.write(
-                                "{0} {1} || {2}\n".format(
-                                    call, itm.text(1), itm.text(2)
+                        for row in range(self.__model.rowCount()):
+                            isCall, fromText, toText = self.__model.entryTexts(row)
+                            if isCall is None:
+                                f.write("{0}\n".format(fromText))
+                            else:
+                                call = "->" if isCall else "<-"
+                                f.write(
+                                    "{0} {1} || {2}\n".format(call, fromText, toText)
                                 )
-                            )
-                            itm = self.callTrace.itemBelow(itm)
                 except OSError as err:
                     EricMessageBox.critical(
                         self,
@@ -206,18 +204,16 @@ class CallTraceViewer(QWidget, Ui_CallTraceViewer):
                         ).format(fpath, str(err)),
                     )
 
-    @pyqtSlot(QTreeWidgetItem, int)
-    def on_callTrace_itemDoubleClicked(self, item, column):
+    @pyqtSlot(QModelIndex)
+    def on_callTrace_doubleClicked(self, index):
         """
         Private slot to open the double clicked file in an editor.
 
-        @param item reference to the double clicked item
-        @type QTreeWidgetItem
-        @param column column that was double clicked
-        @type int
+        @param index index of the double clicked entry
+        @type QModelIndex
         """
-        if item is not None and column > 0:
-            columnStr = item.text(column)
+        if index.isValid() and index.column() > CallTraceModel.EventColumn:
+            columnStr = index.data()
             match = self.__entryRe.fullmatch(columnStr.strip())
             if match:
                 filename, lineno, _func = match.groups()
@@ -234,8 +230,7 @@ class CallTraceViewer(QWidget, Ui_CallTraceViewer):
         """
         Public slot to clear the call trace info.
         """
-        self.callTrace.clear()
-        self.__callStack = []
+        self.__model.clear()
 
     def setProjectMode(self, enabled):
         """
@@ -248,68 +243,64 @@ class CallTraceViewer(QWidget, Ui_CallTraceViewer):
         @type bool
         """
         self.__projectMode = enabled
+        self.__relativePaths.clear()
         if enabled and self.__project is None:
             self.__project = ericApp().getObject("Project")
 
-    def __addCallTraceInfo(
-        self,
-        isCall,
-        fromFile,
-        fromLine,
-        fromFunction,
-        toFile,
-        toLine,
-        toFunction,
-        debuggerId,
-    ):
+    @pyqtSlot(list, int, str)
+    def __addCallTraceBatch(self, entries, dropped, debuggerId):
         """
-        Private method to add an entry to the call trace viewer.
-
-        @param isCall flag indicating a 'call'
-        @type bool
-        @param fromFile name of the originating file
-        @type str
-        @param fromLine line number in the originating file
-        @type str
-        @param fromFunction name of the originating function
-        @type str
-        @param toFile name of the target file
-        @type str
-        @param toLine line number in the target file
-        @type str
-        @param toFunction name of the target function
-        @type str
+        Private slot to add a batch of entries to the call trace viewer.
+
+        @param entries list of call trace entries, each being a tuple of the
+            'call' flag, the originating file name, line number and function
+            name and the target file name, line number and function name
+        @type list of tuple of (bool, str, int, str, str, int, str)
+        @param dropped number of entries dropped by the client before this
+            batch
+        @type int
         @param debuggerId ID of the debugger backend
         @type str
         """
         if debuggerId == self.__tracedDebuggerId:
-            if isCall:
-                icon = EricPixmapCache.getIcon("forward")
-            else:
-                icon = EricPixmapCache.getIcon("back")
-            parentItem = self.__callStack[-1] if self.__callStack else self.callTrace
-
             if self.__projectMode:
-                fromFile = self.__project.getRelativePath(fromFile)
-                toFile = self.__project.getRelativePath(toFile)
-
-            itm = QTreeWidgetItem(
-                parentItem,
-                [
-                    "",
-                    self.__entryFormat.format(fromFile, fromLine, fromFunction),
-                    self.__entryFormat.format(toFile, toLine, toFunction),
-                ],
-            )
-            itm.setIcon(0, icon)
-            itm.setData(0, Qt.ItemDataRole.UserRole, isCall)
-            itm.setExpanded(True)
-
-            if isCall:
-                self.__callStack.append(itm)
-            else:
-                if self.__callStack:
-                    self.__callStack.pop(-1)
+                entries = [
+                    (
+                        isCall,
+                        self.__relativePath(fromFile),
+                        fromLine,
+                        fromFunction,
+                        self.__relativePath(toFile),
+                        toLine,
+                        toFunction,
+                    )
+                    for (
+                        isCall,
+                        fromFile,
+                        fromLine,
+                        fromFunction,
+                        toFile,
+                        toLine,
+                        toFunction,
+                    ) in entries
+                ]
+            self.__model.addEntries(entries, dropped)
+
+    def __relativePath(self, filename):
+        """
+        Private method to get the project relative path of a file.
+
+        @param filename name of the file
+        @type str
+        @return project relative path
+        @rtype str
+        """
+        try:
+            return self.__relativePaths[filename]
+        except KeyError:
+            relativePath = self.__project.getRelativePath(filename)
+            self.__relativePaths[filename] = relativePath
+            return relativePath
 
     def isCallTraceEnabled(self):
         """
@@ -107,9 +107,11 @@ class DebugServer(QTcpServer):
         unplanned)
     @signal clientInterpreterChanged(str) emitted to signal a change of the
         client interpreter
-    @signal callTraceInfo emitted after the client reported the call trace
-        data (isCall, fromFile, fromLine, fromFunction, toFile, toLine,
-        toFunction, debuggerId)
+    @signal callTraceBatch(entries, dropped, debuggerId) emitted after the
+        client reported a batch of call trace entries. Each entry is a tuple
+        of (isCall, fromFile, fromLine, fromFunction, toFile, toLine,
+        toFunction). dropped gives the number of entries dropped by the
+        client before this batch.
     @signal appendStdout(msg) emitted when a passive debug connection is
         established or lost
     @signal clientDebuggerId(debuggerId) emitted to indicate a newly connected
@@ -147,7 +149,7 @@ class DebugServer(QTcpServer):
     clientInterpreterChanged = pyqtSignal(str)
     clientDebuggerId = pyqtSignal(str)
     passiveDebugStarted = pyqtSignal(str, bool)
-    callTraceInfo = pyqtSignal(bool, str, str, str, str, str, str, str)
+    callTraceBatch = pyqtSignal(list, int, str)
     appendStdout = pyqtSignal(str)
 
     def __init__(
@@ -263,6 +265,9 @@ class DebugServer(QTcpServer):
         self.watchpointModel.rowsInserted.connect(self.__addWatchPoints)
 
         self.__maxVariableSize = Preferences.getDebugger("MaxVariableSize")
+        self.__variablesElementsBudget = Preferences.getDebugger(
+            "VariablesElementsBudget"
+        )
 
         self.__multiprocessNoDebugList = []
 
@@ -331,6 +336,9 @@ class DebugServer(QTcpServer):
             )
 
         self.__maxVariableSize = Preferences.getDebugger("MaxVariableSize")
+        self.__variablesElementsBudget = Preferences.getDebugger(
+            "VariablesElementsBudget"
+        )
 
     def registerDebuggerInterface(
         self, interfaceName, getRegistryData, reregister=False
@@ -1318,6 +1326,7 @@ class DebugServer(QTcpServer):
         runInConsole=False,
         clientType="",
         configOverride=None,
+        sampling=False,
     ):
         """
         Public method to load a new program to collect profiling data.
@@ -1348,6 +1357,9 @@ class DebugServer(QTcpServer):
         @param configOverride dictionary containing the global config override
             data
         @type dict
+        @param sampling flag indicating to use the sampling profiler (defaults
+            to False)
+        @type bool (optional)
         """
         self.__autoClearShell = autoClearShell
 
@@ -1384,7 +1396,7 @@ class DebugServer(QTcpServer):
 
         self.remoteEnvironment(env)
 
-        self.debuggerInterface.remoteProfile(fn, argv, wd, erase)
+        self.debuggerInterface.remoteProfile(fn, argv, wd, erase, sampling=sampling)
         self.debugging = False
         self.running = True
 
@@ -1626,7 +1638,15 @@ class DebugServer(QTcpServer):
         )
 
     def remoteClientVariable(
-        self, debuggerId, scope, filterList, var, framenr=0, maxSize=0  # noqa: U100
+        self,
+        debuggerId,
+        scope,
+        filterList,
+        var,
+        framenr=0,
+        maxSize=0,  # noqa: U100
+        start=-1,
+        count=0,
     ):
         """
         Public method to request the variables of the debugged program.
@@ -1645,9 +1665,23 @@ class DebugServer(QTcpServer):
             be shown. If it is bigger than that, a 'too big' indication will
             be given (@@TOO_BIG_TO_SHOW@@). (unused)
         @type int
+        @param start index of the first child item to be reported (-1 to
+            continue after the items reported last) (defaults to -1)
+        @type int (optional)
+        @param count number of child items to be reported per request (0 for
+            the default of the debug client) (defaults to 0)
+        @type int (optional)
         """
         self.debuggerInterface.remoteClientVariable(
-            debuggerId, scope, filterList, var, framenr, self.__maxVariableSize
+            debuggerId,
+            scope,
+            filterList,
+            var,
+            framenr,
+            self.__maxVariableSize,
+            start=start,
+            count=count,
+            budget=self.__variablesElementsBudget,
         )
 
     def remoteClientDisassembly(self, debuggerId):
@@ -2056,47 +2090,21 @@ class DebugServer(QTcpServer):
         """
         self.clientCompletionList.emit(completionList, text)
 
-    def signalClientCallTrace(
-        self,
-        isCall,
-        fromFile,
-        fromLine,
-        fromFunction,
-        toFile,
-        toLine,
-        toFunction,
-        debuggerId,
-    ):
+    def signalClientCallTraceBatch(self, entries, dropped, debuggerId):
         """
-        Public method to process the client call trace data.
+        Public method to process a batch of client call trace data.
 
-        @param isCall flag indicating a 'call'
-        @type bool
-        @param fromFile name of the originating file
-        @type str
-        @param fromLine line number in the originating file
-        @type str
-        @param fromFunction name of the originating function
-        @type str
-        @param toFile name of the target file
-        @type str
-        @param toLine line number in the target file
-        @type str
-        @param toFunction name of the target function
-        @type str
+        @param entries list of call trace entries, each being a tuple of the
+            'call' flag, the originating file name, line number and function
+            name and the target file name, line number and function name
+        @type list of tuple of (bool, str, int, str, str, int, str)
+        @param dropped number of entries dropped by the client before this
+            batch
+        @type int
         @param debuggerId ID of the debugger backend
         @type str
         """
-        self.callTraceInfo.emit(
-            isCall,
-            fromFile,
-            fromLine,
-            fromFunction,
-            toFile,
-            toLine,
-            toFunction,
-            debuggerId,
-        )
+        self.callTraceBatch.emit(entries, dropped, debuggerId)
 
     def passiveStartUp(self, fn, reportAllExceptions, debuggerId):
         """
@@ -123,6 +123,9 @@ class DebugUI(QObject):
         self.multiprocessNoDebugHistory = EricUtilities.toList(
             Preferences.getSettings().value("DebugInfo/MultiprocessNoDebugHistory")
         )
+        self.sampleProfile = EricUtilities.toBool(
+            Preferences.getSettings().value("DebugInfo/SampleProfile", False)
+        )
         self.overrideGlobalConfig = {
             "enable": EricUtilities.toBool(
                 Preferences.getSettings().value("DebugInfo/OverrideGlobal", False)
@@ -1215,6 +1218,9 @@ class DebugUI(QObject):
         Preferences.getSettings().setValue(
             "DebugInfo/MultiprocessNoDebugHistory", self.multiprocessNoDebugHistory
         )
+        Preferences.getSettings().setValue(
+            "DebugInfo/SampleProfile", self.sampleProfile
+        )
         Preferences.getSettings().setValue(
             "DebugInfo/OverrideGlobal", self.overrideGlobalConfig["enable"]
         )
@@ -2211,6 +2217,7 @@ class DebugUI(QObject):
             forProject=runProject,
             scriptName=scriptName,
             scriptsList=self.scriptsHistory,
+            sampleProfile=self.sampleProfile,
         )
         if dlg.exec() == QDialog.DialogCode.Accepted:
             (
@@ -2223,7 +2230,7 @@ class DebugUI(QObject):
                 console,
             ) = dlg.getData()
             configOverride = dlg.getGlobalOverrideData()
-            eraseTimings = dlg.getProfilingData()
+            eraseTimings, sampleProfile = dlg.getProfilingData()
 
             if runProject:
                 fn = self.project.getMainScript(True)
@@ -2298,6 +2305,9 @@ class DebugUI(QObject):
             # Save the erase timing flag
             self.eraseTimings = eraseTimings
 
+            # Save the sampling profiler flag
+            self.sampleProfile = sampleProfile
+
             # Save the clear interpreter flag
             self.autoClearShell = clearShell
 
@@ -2330,6 +2340,7 @@ class DebugUI(QObject):
                     runInConsole=console,
                     clientType=self.clientType,
                     configOverride=self.overrideGlobalConfig,
+                    sampling=sampleProfile,
                 )
 
                 self.stopAct.setEnabled(True)
@@ -2976,6 +2987,7 @@ class DebugUI(QObject):
                     runInConsole=self.runInConsole,
                     clientType=self.clientType,
                     configOverride=self.overrideGlobalConfig,
+                    sampling=self.sampleProfile,
                 )
 
             self.stopAct.setEnabled(True)
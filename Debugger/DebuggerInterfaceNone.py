@@ -230,7 +230,7 @@ class DebuggerInterfaceNone(QObject):
         """
         return
 
-    def remoteProfile(self, fn, argv, wd, erase=False):
+    def remoteProfile(self, fn, argv, wd, erase=False, sampling=False):
         """
         Public method to load a new program to collect profiling data.
 
@@ -241,8 +241,11 @@ class DebuggerInterfaceNone(QObject):
         @param wd working directory for the program
         @type str
         @param erase flag indicating that timing info should be cleared
-            first
-        @type bool
+            first (defaults to False)
+        @type bool (optional)
+        @param sampling flag indicating to use the sampling profiler
+            (defaults to False)
+        @type bool (optional)
         """
         return
 
@@ -483,7 +486,16 @@ class DebuggerInterfaceNone(QObject):
         return
 
     def remoteClientVariable(
-        self, debuggerId, scope, filterList, var, framenr=0, maxSize=0
+        self,
+        debuggerId,
+        scope,
+        filterList,
+        var,
+        framenr=0,
+        maxSize=0,
+        start=-1,
+        count=0,
+        budget=0,
     ):
         """
         Public method to request the variables of the debugged program.
@@ -502,6 +514,16 @@ class DebuggerInterfaceNone(QObject):
             be shown. If it is bigger than that, a 'too big' indication will
             be given (@@TOO_BIG_TO_SHOW@@).
         @type int
+        @param start index of the first child item to be reported (-1 to
+            continue after the items reported last) (defaults to -1)
+        @type int (optional)
+        @param count number of child items to be reported per request (0 for
+            the default of the debug client) (defaults to 0)
+        @type int (optional)
+        @param budget maximum number of elements to be processed as a whole
+            (e.g. to sort the keys of a dictionary or to calculate the minimum
+            of an array) (0 for the default of the debug client) (defaults to 0)
+        @type int (optional)
         """
         return
 
@@ -7,6 +7,7 @@
 Module implementing the Python3 debugger interface for the debug server.
 """
 
+import base64
 import contextlib
 import json
 import logging
@@ -82,6 +83,10 @@ class DebuggerInterfacePython(QObject):
 
         # set default values for capabilities of clients
         self.clientCapabilities = ClientDefaultCapabilities
+        # trace statistics as reported by the clients (key: debugger ID)
+        self.__clientTraceStatistics = {}
+        # string tables of the call trace batches (key: debugger ID)
+        self.__callTraceStrings = {}
 
         # set translation function
         self.translate = self.__identityTranslation
@@ -761,6 +766,21 @@ class DebuggerInterfacePython(QObject):
         """
         return self.clientCapabilities
 
+    def getClientTraceStatistics(self, debuggerId):
+        """
+        Public method to retrieve the trace statistics of a debug client as
+        reported with its capabilities.
+
+        @param debuggerId ID of the debugger backend
+        @type str
+        @return dictionary containing the total number of trace dispatch calls
+            ('dispatchCalls'), the number of calls per second since the
+            previous report ('dispatchCallsPerSecond') and the number of events
+            handled by the breakpoint monitor ('monitorEvents')
+        @rtype dict
+        """
+        return self.__clientTraceStatistics.get(debuggerId, {})
+
     def newConnection(self, sock):
         """
         Public slot to handle a new connection.
@@ -822,6 +842,7 @@ class DebuggerInterfacePython(QObject):
         for debuggerId in list(self.__connections):
             if self.__connections[debuggerId] is sock:
                 del self.__connections[debuggerId]
+                self.__callTraceStrings.pop(debuggerId, None)
                 self.__handleServerDebugClientDisconnected(debuggerId)
                 break
         else:
@@ -1072,7 +1093,7 @@ class DebuggerInterfacePython(QObject):
             self.__mainDebugger,
         )
 
-    def remoteProfile(self, fn, argv, wd, erase=False):
+    def remoteProfile(self, fn, argv, wd, erase=False, sampling=False):
         """
         Public method to load a new program to collect profiling data.
 
@@ -1083,8 +1104,11 @@ class DebuggerInterfacePython(QObject):
         @param wd working directory for the program
         @type str
         @param erase flag indicating that timing info should be cleared
-            first
-        @type bool
+            first (defaults to False)
+        @type bool (optional)
+        @param sampling flag indicating to use the sampling profiler
+            (defaults to False)
+        @type bool (optional)
         """
         if FileSystemUtilities.isPlainFileName(fn):
             fn = os.path.abspath(fn)
@@ -1100,6 +1124,7 @@ class DebuggerInterfacePython(QObject):
                 "filename": fn,
                 "argv": argv,
                 "erase": erase,
+                "sampling": sampling,
             },
             self.__mainDebugger,
         )
@@ -1487,7 +1512,16 @@ class DebuggerInterfacePython(QObject):
         )
 
     def remoteClientVariable(
-        self, debuggerId, scope, filterList, var, framenr=0, maxSize=0
+        self,
+        debuggerId,
+        scope,
+        filterList,
+        var,
+        framenr=0,
+        maxSize=0,
+        start=-1,
+        count=0,
+        budget=0,
     ):
         """
         Public method to request the variables of the debugged program.
@@ -1506,6 +1540,16 @@ class DebuggerInterfacePython(QObject):
             be shown. If it is bigger than that, a 'too big' indication will
             be given (@@TOO_BIG_TO_SHOW@@).
         @type int
+        @param start index of the first child item to be reported (-1 to
+            continue after the items reported last) (defaults to -1)
+        @type int (optional)
+        @param count number of child items to be reported per request (0 for
+            the default of the debug client) (defaults to 0)
+        @type int (optional)
+        @param budget maximum number of elements to be processed as a whole
+            (e.g. to sort the keys of a dictionary or to calculate the minimum
+            of an array) (0 for the default of the debug client) (defaults to 0)
+        @type int (optional)
         """
         self.__sendJsonCommand(
             "RequestVariable",
@@ -1515,6 +1559,9 @@ class DebuggerInterfacePython(QObject):
                 "scope": scope,
                 "filters": filterList,
                 "maxSize": maxSize,
+                "start": start,
+                "count": count,
+                "budget": budget,
             },
             debuggerId,
         )
@@ -1565,6 +1612,48 @@ class DebuggerInterfacePython(QObject):
             debuggerId,
         )
 
+    def __decodeCallTraceBatch(self, params, debuggerId):
+        """
+        Private method to decode a batch of call trace entries.
+
+        @param params dictionary containing the parameters of the batch
+        @type dict
+        @param debuggerId ID of the debugger backend
+        @type str
+        @return tuple containing the list of call trace entries and the number
+            of entries dropped by the debug client before this batch. Each
+            entry is a tuple of the 'call' flag, the originating file name,
+            line number and function name and the target file name, line
+            number and function name.
+        @rtype tuple of (list of tuple of (bool, str, int, str, str, int, str),
+            int)
+        """
+        if "compressed" in params:
+            params = json.loads(
+                zlib.decompress(base64.b64decode(params["compressed"])).decode("utf-8")
+            )
+
+        strings = self.__callTraceStrings.setdefault(debuggerId, [])
+        if params["stringsBase"] == 0:
+            # call tracing was restarted
+            strings.clear()
+        strings.extend(params["strings"])
+
+        flatEvents = params["events"]
+        events = [
+            (
+                bool(flatEvents[index]),
+                strings[flatEvents[index + 1]],
+                flatEvents[index + 2],
+                strings[flatEvents[index + 3]],
+                strings[flatEvents[index + 4]],
+                flatEvents[index + 5],
+                strings[flatEvents[index + 6]],
+            )
+            for index in range(0, len(flatEvents), 7)
+        ]
+        return events, params["dropped"]
+
     def remoteNoDebugList(self, debuggerId, noDebugList):
         """
         Public method to set a list of programs not to be debugged.
@@ -1737,19 +1826,14 @@ class DebuggerInterfacePython(QObject):
                     threadName=params["threadName"],
                 )
 
-        elif method == "CallTrace":
-            isCall = params["event"].lower() == "c"
-            fromInfo = params["from"]
-            toInfo = params["to"]
-            self.debugServer.signalClientCallTrace(
-                isCall,
-                fromInfo["filename"],
-                str(fromInfo["linenumber"]),
-                fromInfo["codename"],
-                toInfo["filename"],
-                str(toInfo["linenumber"]),
-                toInfo["codename"],
-                params["debuggerId"],
+        elif method == "CallTraceBatch":
+            events, dropped = self.__decodeCallTraceBatch(params, params["debuggerId"])
+            self.debugServer.signalClientCallTraceBatch(
+                events, dropped, params["debuggerId"]
+            )
+            # acknowledge the batch after it has been processed
+            self.__sendJsonCommand(
+                "RequestCallTraceAck", {"batch": params["batch"]}, params["debuggerId"]
             )
 
         elif method == "ResponseVariables":
@@ -1774,6 +1858,10 @@ class DebuggerInterfacePython(QObject):
 
         elif method == "ResponseCapabilities":
             self.clientCapabilities = params["capabilities"]
+            if "traceStatistics" in params:
+                self.__clientTraceStatistics[params["debuggerId"]] = params[
+                    "traceStatistics"
+                ]
             if params["debuggerId"] == self.__mainDebugger:
                 # signal only for the main connection
                 self.debugServer.signalClientCapabilities(
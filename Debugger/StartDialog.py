@@ -62,6 +62,7 @@ class StartDialog(QDialog, Ui_StartDialog):
         forProject=False,
         scriptName="",
         scriptsList=None,
+        sampleProfile=False,
     ):
         """
         Constructor
@@ -116,6 +117,9 @@ class StartDialog(QDialog, Ui_StartDialog):
         @type str
         @param scriptsList history list of script names
         @type list of str
+        @param sampleProfile flag indicating to use the sampling profiler
+            (defaults to False)
+        @type bool (optional)
         """
         super().__init__(parent)
         self.setupUi(self)
@@ -254,6 +258,7 @@ class StartDialog(QDialog, Ui_StartDialog):
 
         if dialogMode == StartDialogMode.Profile:
             self.eraseProfileCheckBox.setChecked(True)
+            self.sampleProfileCheckBox.setChecked(sampleProfile)
 
         self.buttonBox.button(QDialogButtonBox.StandardButton.Ok).setFocus(
             Qt.FocusReason.OtherFocusReason
@@ -356,13 +361,17 @@ class StartDialog(QDialog, Ui_StartDialog):
         Public method to retrieve the profiling related data entered into this
         dialog.
 
-        @return flag indicating erasure of profiling info
-        @rtype bool
+        @return tuple containing a flag indicating erasure of profiling info
+            and a flag indicating to use the sampling profiler
+        @rtype tuple of (bool, bool)
         """
         if self.__dialogMode == StartDialogMode.Profile:
-            return self.eraseProfileCheckBox.isChecked()
+            return (
+                self.eraseProfileCheckBox.isChecked(),
+                self.sampleProfileCheckBox.isChecked(),
+            )
         else:
-            return False
+            return (False, False)
 
     def __clearHistories(self):
         """
@@ -43,8 +43,10 @@ class Ui_CallTraceViewer(object):
         self.saveButton.setObjectName("saveButton")
         self.horizontalLayout.addWidget(self.saveButton)
         self.verticalLayout.addLayout(self.horizontalLayout)
-        self.callTrace = QtWidgets.QTreeWidget(parent=CallTraceViewer)
+        self.callTrace = QtWidgets.QTreeView(parent=CallTraceViewer)
         self.callTrace.setAlternatingRowColors(True)
+        self.callTrace.setRootIsDecorated(False)
+        self.callTrace.setUniformRowHeights(True)
         self.callTrace.setExpandsOnDoubleClick(False)
         self.callTrace.setObjectName("callTrace")
         self.verticalLayout.addWidget(self.callTrace)
@@ -68,5 +70,3 @@ class Ui_CallTraceViewer(object):
         self.resizeButton.setToolTip(_translate("CallTraceViewer", "Press to resize the columns to their contents"))
         self.clearButton.setToolTip(_translate("CallTraceViewer", "Press to clear the call trace"))
         self.saveButton.setToolTip(_translate("CallTraceViewer", "Press to save the call trace as a text file"))
-        self.callTrace.headerItem().setText(1, _translate("CallTraceViewer", "From"))
-        self.callTrace.headerItem().setText(2, _translate("CallTraceViewer", "To"))
@@ -165,6 +165,9 @@ class Ui_StartDialog(object):
         self.eraseProfileCheckBox = QtWidgets.QCheckBox(parent=self.profileGroup)
         self.eraseProfileCheckBox.setObjectName("eraseProfileCheckBox")
         self.verticalLayout_5.addWidget(self.eraseProfileCheckBox)
+        self.sampleProfileCheckBox = QtWidgets.QCheckBox(parent=self.profileGroup)
+        self.sampleProfileCheckBox.setObjectName("sampleProfileCheckBox")
+        self.verticalLayout_5.addWidget(self.sampleProfileCheckBox)
         self.verticalLayout_6.addWidget(self.profileGroup)
         self.buttonBox = QtWidgets.QDialogButtonBox(parent=StartDialog)
         self.buttonBox.setOrientation(QtCore.Qt.Orientation.Horizontal)
@@ -191,6 +194,7 @@ class Ui_StartDialog(object):
         StartDialog.setTabOrder(self.multiprocessGroup, self.multiprocessNoDebugCombo)
         StartDialog.setTabOrder(self.multiprocessNoDebugCombo, self.eraseCoverageCheckBox)
         StartDialog.setTabOrder(self.eraseCoverageCheckBox, self.eraseProfileCheckBox)
+        StartDialog.setTabOrder(self.eraseProfileCheckBox, self.sampleProfileCheckBox)
 
     def retranslateUi(self, StartDialog):
         _translate = QtCore.QCoreApplication.translate
@@ -254,4 +258,8 @@ class Ui_StartDialog(object):
 "<p>Select this to erase the collected timing data before the next profiling run.</p>"))
         self.eraseProfileCheckBox.setText(_translate("StartDialog", "Erase timing data"))
         self.eraseProfileCheckBox.setShortcut(_translate("StartDialog", "Alt+C"))
+        self.sampleProfileCheckBox.setToolTip(_translate("StartDialog", "Select this to sample the call stacks periodically instead of tracing all calls"))
+        self.sampleProfileCheckBox.setWhatsThis(_translate("StartDialog", "<b>Sampling profiler</b>\n"
+"<p>Select this to sample the call stacks of all threads periodically instead of tracing all function calls. This has a low overhead but gives statistical results. The number of samples is shown as the number of calls. In addition the samples are saved as collapsed stacks (<i>.collapsed</i> file) for flame graph tools.</p>"))
+        self.sampleProfileCheckBox.setText(_translate("StartDialog", "Use sampling profiler"))
 from eric7.EricWidgets.EricPathPicker import EricComboPathPicker
@@ -226,6 +226,8 @@ class VariablesModel(QAbstractItemModel):
 
     expand = pyqtSignal(QModelIndex)
 
+    WindowSize = 200  # minimum number of children requested at once
+
     def __init__(self, treeView, globalScope):
         """
         Constructor
@@ -757,7 +759,15 @@ class VariablesModel(QAbstractItemModel):
         node.pendigFetch = True
         # step 3: get a pathlist up to the requested variable
         pathlist = self.__buildTreePath(node)
-        # step 4: request the variable from the debugger
+        # step 4: determine the window of children to be requested, which is
+        #         big enough to fill the view
+        start = max(node.currentCount, 0)
+        rowHeight = max(self.treeView.fontMetrics().height(), 1)
+        count = max(
+            VariablesModel.WindowSize,
+            2 * self.treeView.viewport().height() // rowHeight,
+        )
+        # step 5: request the variable from the debugger
         variablesFilter = (
             ericApp().getObject("DebugUI").variablesFilter(self.__globalScope)
         )
@@ -767,6 +777,8 @@ class VariablesModel(QAbstractItemModel):
             variablesFilter,
             pathlist,
             self.framenr,
+            start=start,
+            count=count,
         )
 
     def setExpanded(self, index, state):
@@ -1304,3 +1304,137 @@ class ModuleDocument:
             self.genDocument()
 
         return self.keywords
+
+
+class ModuleDocumentInfo:
+    """
+    Class holding the information of a module document needed to generate the
+    index and QtHelp files.
+
+    Objects of this class can be transferred between processes and stored in
+    JSON format. They provide the same interface as ModuleDocument for the
+    index generators.
+    """
+
+    def __init__(self, name, description, shortDescription, empty, keywords):
+        """
+        Constructor
+
+        @param name name of the module
+        @type str
+        @param description formatted description of the module
+        @type str
+        @param shortDescription short description of the module
+        @type str
+        @param empty flag indicating an empty module
+        @type bool
+        @param keywords list of tuples containing the name and the ref of the
+            QtHelp keywords
+        @type list of tuples of (str, str)
+        """
+        self.__name = name
+        self.__description = description
+        self.__shortDescription = shortDescription
+        self.__empty = empty
+        self.__keywords = [tuple(kw) for kw in keywords]
+
+    @classmethod
+    def fromDocument(cls, moduleDocument):
+        """
+        Class method to create the information of a module document.
+
+        @param moduleDocument reference to the module document
+        @type ModuleDocument
+        @return information of the module document
+        @rtype ModuleDocumentInfo
+        """
+        keywords = moduleDocument.getQtHelpKeywords()
+        return cls(
+            moduleDocument.name(),
+            moduleDocument.description(),
+            moduleDocument.shortDescription(),
+            moduleDocument.isEmpty(),
+            keywords,
+        )
+
+    @classmethod
+    def fromDict(cls, data):
+        """
+        Class method to create the information of a module document from a
+        dictionary as created by toDict().
+
+        @param data dictionary containing the module document information
+        @type dict
+        @return information of the module document
+        @rtype ModuleDocumentInfo
+        """
+        return cls(
+            data["name"],
+            data["description"],
+            data["shortDescription"],
+            data["empty"],
+            data["keywords"],
+        )
+
+    def toDict(self):
+        """
+        Public method to convert the module document information into a
+        dictionary.
+
+        @return dictionary containing the module document information
+        @rtype dict
+        """
+        return {
+            "name": self.__name,
+            "description": self.__description,
+            "shortDescription": self.__shortDescription,
+            "empty": self.__empty,
+            "keywords": self.__keywords,
+        }
+
+    def isEmpty(self):
+        """
+        Public method to determine, if the module contains any classes or
+        functions.
+
+        @return flag indicating an empty module
+        @rtype bool
+        """
+        return self.__empty
+
+    def name(self):
+        """
+        Public method used to get the module name.
+
+        @return name of the module
+        @rtype str
+        """
+        return self.__name
+
+    def description(self):
+        """
+        Public method used to get the description of the module.
+
+        @return description of the module
+        @rtype str
+        """
+        return self.__description
+
+    def shortDescription(self):
+        """
+        Public method used to get the short description of the module.
+
+        @return short description of the module
+        @rtype str
+        """
+        return self.__shortDescription
+
+    def getQtHelpKeywords(self):
+        """
+        Public method to retrieve the parts for the QtHelp keywords section.
+
+        @return list of tuples containing the name and the ref. The ref is without
+            the filename part.
+        @rtype list of tuples of (str, str)
+        """
+        return self.__keywords
@@ -7,66 +7,91 @@
 Module implementing classes used for caching objects.
 """
 
-from PyQt6.QtCore import QDateTime, QTimer
+import collections
+import sys
+import time
 
 
 class EricCache:
     """
     Class implementing a LRU cache of a specific size.
 
-    If the maximum number of entries is exceeded, the least recently used item
-    is removed from the cache. A cache hit moves the entry to the front of the
-    cache.
+    If the maximum number of entries or the maximum size in bytes is exceeded,
+    the least recently used items are removed from the cache. A cache hit moves
+    the entry to the MRU position of the cache. All these operations take
+    constant time.
+
+    If a maximum cache time is set, entries not accessed within this time are
+    treated as missing. Because the entries are ordered by their last access,
+    the outdated entries are removed from the LRU end of the cache, whenever an
+    entry is added.
     """
 
-    def __init__(self, size=100):
+    def __init__(self, size=100, maxBytes=0, sizeFunction=None):
         """
         Constructor
 
         @param size maximum number of entries that may be stored in the cache
-        @type int
-        @exception ValueError raised to indicate an illegal 'size' parameter
+            (defaults to 100)
+        @type int (optional)
+        @param maxBytes maximum size of the cached items in bytes (0 means no
+            limit) (defaults to 0)
+        @type int (optional)
+        @param sizeFunction function to determine the size of an item in bytes
+            (defaults to None for sys.getsizeof)
+        @type function (optional)
+        @exception ValueError raised to indicate an illegal 'size' or 'maxBytes'
+            parameter
         """
         if size < 0:
             raise ValueError("'size' parameter must be positive.")
+        if maxBytes < 0:
+            raise ValueError("'maxBytes' parameter must be positive.")
 
         self.__size = size
+        self.__maxBytes = maxBytes
+        self.__sizeFunction = sys.getsizeof if sizeFunction is None else sizeFunction
 
         # internal objects
-        self.__keyList = []
-        self.__store = {}  # stores the cache entries
-        self.__accesStore = {}  # stores the last access date and times
+        # ordered dictionary with the key as key and a tuple of the cached item,
+        # its last access time and its size in bytes as value; the least
+        # recently used entry comes first
+        self.__store = collections.OrderedDict()
+        self.__bytes = 0
         self.__hits = 0
         self.__misses = 0
+        self.__evictions = 0
+        self.__expirations = 0
         self.__maxsize = 0
         self.__maxCacheTime = 0  # 0 seconds means aging is disabled
 
-        self.__cacheTimer = QTimer()
-        self.__cacheTimer.setSingleShot(True)
-        self.__cacheTimer.timeout.connect(self.__pruneCache)
-
-    def __moveLast(self, key):
-        """
-        Private method to move a cached item to the MRU position.
-
-        @param key key of the item to be retrieved
-        @type any hashable type that can be used as a dict key
-        """
-        self.__keyList.remove(key)
-        self.__keyList.append(key)
-
     def __adjustToSize(self):
         """
         Private method to adjust the cache to its size.
         """
         if self.__size:
-            removeList = self.__keyList[: -self.__size]
-            self.__keyList = self.__keyList[-self.__size :]
-            for key in removeList:
-                del self.__store[key]
-                del self.__accesStore[key]
+            while len(self.__store) > self.__size or (
+                self.__maxBytes and self.__bytes > self.__maxBytes
+            ):
+                self.__bytes -= self.__store.popitem(last=False)[1][2]
+                self.__evictions += 1
         else:
-            self.reset()
+            self.clear()
+
+    def __pruneCache(self):
+        """
+        Private method to remove the entries not accessed within the maximum
+        cache time.
+        """
+        if self.__maxCacheTime > 0:
+            oldest = time.monotonic() - self.__maxCacheTime
+            while self.__store:
+                key, (_item, lastAccessTime, nbytes) = next(iter(self.__store.items()))
+                if lastAccessTime >= oldest:
+                    break
+                del self.__store[key]
+                self.__bytes -= nbytes
+                self.__expirations += 1
 
     def getSize(self):
         """
@@ -89,6 +114,26 @@ class EricCache:
             self.__size = newSize
             self.__adjustToSize()
 
+    def getMaximumBytes(self):
+        """
+        Public method to get the maximum size of the cached items in bytes.
+
+        @return maximum size in bytes (0 means no limit)
+        @rtype int
+        """
+        return self.__maxBytes
+
+    def setMaximumBytes(self, maxBytes):
+        """
+        Public method to change the maximum size of the cached items in bytes.
+
+        @param maxBytes maximum size in bytes (0 means no limit)
+        @type int
+        """
+        if maxBytes >= 0:
+            self.__maxBytes = maxBytes
+            self.__adjustToSize()
+
     def getMaximumCacheTime(self):
         """
         Public method to get the maximum time entries may exist in the cache.
@@ -106,12 +151,8 @@ class EricCache:
         @type int
         """
         if time != self.__maxCacheTime:
-            self.__cacheTimer.stop()
-            self.__pruneCache()
             self.__maxCacheTime = time
-            if self.__maxCacheTime > 0:
-                self.__cacheTimer.setInterval(self.__maxCacheTime * 1000)
-                self.__cacheTimer.start()
+            self.__pruneCache()
 
     def get(self, key):
         """
@@ -125,15 +166,25 @@ class EricCache:
             present
         @rtype object or None
         """
-        if key in self.__store:
-            self.__hits += 1
-            self.__moveLast(key)
-            self.__accesStore[key] = QDateTime.currentDateTimeUtc()
-            return self.__store[key]
-        else:
+        try:
+            item, lastAccessTime, nbytes = self.__store[key]
+        except KeyError:
+            self.__misses += 1
+            return None
+
+        now = time.monotonic()
+        if self.__maxCacheTime > 0 and now - lastAccessTime > self.__maxCacheTime:
+            del self.__store[key]
+            self.__bytes -= nbytes
+            self.__expirations += 1
             self.__misses += 1
             return None
 
+        self.__hits += 1
+        self.__store[key] = (item, now, nbytes)
+        self.__store.move_to_end(key)
+        return item
+
     def add(self, key, item):
         """
         Public method to add an item to the cache.
@@ -146,16 +197,17 @@ class EricCache:
         @param item item to be cached under the given key
         @type object
         """
+        nbytes = self.__sizeFunction(item)
         if key in self.__store:
-            self.__moveLast(key)
-        else:
-            self.__keyList.append(key)
-        self.__store[key] = item
-        self.__accesStore[key] = QDateTime.currentDateTimeUtc()
+            self.__bytes -= self.__store[key][2]
+            self.__store.move_to_end(key)
+        self.__store[key] = (item, time.monotonic(), nbytes)
+        self.__bytes += nbytes
 
+        self.__pruneCache()
         self.__adjustToSize()
 
-        self.__maxsize = max(self.__maxsize, len(self.__keyList))
+        self.__maxsize = max(self.__maxsize, len(self.__store))
 
     def remove(self, key):
         """
@@ -165,17 +217,14 @@ class EricCache:
         @type any hashable type that can be used as a dict key
         """
         if key in self.__store:
-            del self.__store[key]
-            del self.__accesStore[key]
-            self.__keyList.remove(key)
+            self.__bytes -= self.__store.pop(key)[2]
 
     def clear(self):
         """
         Public method to clear the cache.
         """
-        self.__keyList = []
-        self.__store = {}
-        self.__accesStore = {}
+        self.__store.clear()
+        self.__bytes = 0
 
     def reset(self):
         """
@@ -187,6 +236,8 @@ class EricCache:
         self.clear()
         self.__hits = 0
         self.__misses = 0
+        self.__evictions = 0
+        self.__expirations = 0
         self.__maxsize = 0
 
     def length(self):
@@ -196,34 +247,22 @@ class EricCache:
         @return current length of the cache
         @rtype int
         """
-        return len(self.__keyList)
+        return len(self.__store)
 
     def info(self):
         """
         Public method to get some information about the cache.
 
         @return dictionary containing the cache info
-        @rtype dict (with keys "hits", "misses", "maxsize", "currsize")
+        @rtype dict (with keys "hits", "misses", "maxsize", "currsize",
+            "currbytes", "evictions", "expirations")
         """
         return {
             "hits": self.__hits,
             "misses": self.__misses,
             "maxsize": self.__maxsize,
             "currsize": self.length(),
+            "currbytes": self.__bytes,
+            "evictions": self.__evictions,
+            "expirations": self.__expirations,
         }
-
-    def __pruneCache(self):
-        """
-        Private slot to prune outdated cache entries and restart the timer.
-        """
-        if self.__maxCacheTime > 0:
-            current = QDateTime.currentDateTimeUtc()
-
-            keysToBeDeleted = []
-            for key, lastAccessTime in self.__accesStore.items():
-                if lastAccessTime.secsTo(current) > self.__maxCacheTime:
-                    keysToBeDeleted.append(key)
-            for key in keysToBeDeleted:
-                self.remove(key)
-
-            self.__cacheTimer.start()
@@ -9,13 +9,14 @@ Module implementing a checker for function type annotations.
 
 import ast
 import contextlib
-import copy
 import sys
 
 from functools import lru_cache
 
 import AstUtilities
 
+from AstDispatcher import AstDispatcher
+
 from .AnnotationsCheckerDefaults import AnnotationsCheckerDefaultArgs
 from .AnnotationsEnums import AnnotationType, ClassDecoratorType, FunctionType
 
@@ -59,7 +60,18 @@ class AnnotationsChecker:
         "A911",
     ]
 
-    def __init__(self, source, filename, tree, select, ignore, expected, repeat, args):
+    def __init__(
+        self,
+        source,
+        filename,
+        tree,
+        select,
+        ignore,
+        expected,
+        repeat,
+        args,
+        dispatcher=None,
+    ):
         """
         Constructor
 
@@ -79,6 +91,8 @@ class AnnotationsChecker:
         @type bool
         @param args dictionary of arguments for the annotation checks
         @type dict
+        @param dispatcher reference to a shared AST dispatcher (defaults to None)
+        @type AstDispatcher (optional)
         """
         self.__select = tuple(select)
         self.__ignore = ("",) if select else tuple(ignore)
@@ -86,8 +100,13 @@ class AnnotationsChecker:
         self.__repeat = repeat
         self.__filename = filename
         self.__source = source[:]
-        self.__tree = copy.deepcopy(tree)
+        self.__tree = tree
         self.__args = args
+        self.__dispatcher = dispatcher
+
+        # nodes collected by the AST dispatcher
+        self.__functionDefs = []
+        self.__annAssigns = []
 
         # statistics counters
         self.counters = {}
@@ -115,10 +134,18 @@ class AnnotationsChecker:
                 ),
             ),
             (self.__checkAnnotationsFuture, ("A871", "A872", "A873")),
+            (self.__checkDeprecatedTypingSymbols, ("A911",)),
+        ]
+
+        # checks driven by node visitors registered with the AST dispatcher
+        visitorCheckersWithCodes = [
+            (self.__checkAnnotationPep604, ("A901",)),
+        ]
+
+        # checkers working on the nodes collected during the AST dispatch
+        collectedNodesCheckersWithCodes = [
             (self.__checkAnnotationsCoverage, ("A881",)),
             (self.__checkAnnotationComplexity, ("A891", "A892")),
-            (self.__checkAnnotationPep604, ("A901",)),
-            (self.__checkDeprecatedTypingSymbols, ("A911",)),
         ]
 
         self.__checkers = []
@@ -126,6 +153,16 @@ class AnnotationsChecker:
             if any(not (code and self.__ignoreCode(code)) for code in codes):
                 self.__checkers.append(checker)
 
+        self.__visitorCheckers = []
+        for checker, codes in visitorCheckersWithCodes:
+            if any(not (code and self.__ignoreCode(code)) for code in codes):
+                self.__visitorCheckers.append(checker)
+
+        self.__collectedNodesCheckers = []
+        for checker, codes in collectedNodesCheckersWithCodes:
+            if any(not (code and self.__ignoreCode(code)) for code in codes):
+                self.__collectedNodesCheckers.append(checker)
+
     def __ignoreCode(self, code):
         """
         Private method to check if the message code should be ignored.
@@ -182,13 +219,36 @@ class AnnotationsChecker:
             # don't do anything, if essential data is missing
             return
 
-        if not self.__checkers:
+        if (
+            not self.__checkers
+            and not self.__visitorCheckers
+            and not self.__collectedNodesCheckers
+        ):
             # don't do anything, if no codes were selected
             return
 
         for check in self.__checkers:
             check()
 
+        if self.__visitorCheckers or self.__collectedNodesCheckers:
+            dispatcher = (
+                AstDispatcher(self.__tree)
+                if self.__dispatcher is None
+                else self.__dispatcher
+            )
+            for check in self.__visitorCheckers:
+                check(dispatcher)
+            if self.__collectedNodesCheckers:
+                dispatcher.register(
+                    (ast.AsyncFunctionDef, ast.FunctionDef),
+                    self.__functionDefs.append,
+                )
+                dispatcher.register(ast.AnnAssign, self.__annAssigns.append)
+                for check in self.__collectedNodesCheckers:
+                    dispatcher.registerFinalizer(check)
+            if self.__dispatcher is None:
+                dispatcher.run()
+
     #######################################################################
     ## Annotations
     ##
@@ -472,11 +532,7 @@ class AnnotationsChecker:
             # 0 means it is switched off
             return
 
-        functionDefs = [
-            f
-            for f in ast.walk(self.__tree)
-            if isinstance(f, (ast.AsyncFunctionDef, ast.FunctionDef))
-        ]
+        functionDefs = self.__functionDefs
         if not functionDefs:
             # no functions/methods at all
             return
@@ -544,22 +600,13 @@ class AnnotationsChecker:
         )
         typeAnnotations = []
 
-        functionDefs = [
-            f
-            for f in ast.walk(self.__tree)
-            if isinstance(f, (ast.AsyncFunctionDef, ast.FunctionDef))
-        ]
-        for functionDef in functionDefs:
+        for functionDef in self.__functionDefs:
             typeAnnotations += list(
                 filter(None, (a.annotation for a in functionDef.args.args))
             )
             if functionDef.returns:
                 typeAnnotations.append(functionDef.returns)
-        typeAnnotations += [
-            a.annotation
-            for a in ast.walk(self.__tree)
-            if isinstance(a, ast.AnnAssign) and a.annotation
-        ]
+        typeAnnotations += [a.annotation for a in self.__annAssigns if a.annotation]
         for annotation in typeAnnotations:
             complexity = self.__getAnnotationComplexity(annotation)
             if complexity > maxAnnotationComplexity:
@@ -692,9 +739,12 @@ class AnnotationsChecker:
     ## adapted from: flake8-pep604 v1.1.0
     #######################################################################
 
-    def __checkAnnotationPep604(self):
+    def __checkAnnotationPep604(self, dispatcher):
         """
         Private method to check the use of typing.Union.
+
+        @param dispatcher reference to the AST dispatcher
+        @type AstDispatcher
         """
         from .AnnotationsUnionVisitor import AnnotationsUnionVisitor
 
@@ -703,8 +753,16 @@ class AnnotationsChecker:
             return
 
         visitor = AnnotationsUnionVisitor()
-        visitor.visit(self.__tree)
+        dispatcher.registerNodeVisitor(visitor)
+        dispatcher.registerFinalizer(lambda: self.__reportAnnotationPep604(visitor))
 
+    def __reportAnnotationPep604(self, visitor):
+        """
+        Private method to report the use of typing.Union.
+
+        @param visitor reference to the union visitor fed by the AST dispatcher
+        @type AnnotationsUnionVisitor
+        """
         for node in visitor.getIssues():
             self.__error(node.lineno - 1, node.col_offset, "A901")
 
@@ -14,9 +14,11 @@ Module implementing a node visitor for checking the import of typing.Union.
 import ast
 
 
-class AnnotationsUnionVisitor(ast.NodeVisitor):
+class AnnotationsUnionVisitor:
     """
     Class implementing a node visitor for checking the import of typing.Union.
+
+    Note: The nodes are handed to the visitor by the AST dispatcher.
     """
 
     ModuleName = "typing"
@@ -43,8 +45,6 @@ class AnnotationsUnionVisitor(ast.NodeVisitor):
             elif name.name == self.ModuleName and name.asname:
                 self.__aliasedUnionImports.add(name.asname)
 
-        self.generic_visit(node)
-
     def visit_ImportFrom(self, node):
         """
         Public method to handle an ast.ImportFrom node.
@@ -59,8 +59,6 @@ class AnnotationsUnionVisitor(ast.NodeVisitor):
                     if name.asname:
                         self.__aliasedUnionImports.add(name.asname)
 
-        self.generic_visit(node)
-
     def visit_Attribute(self, node):
         """
         Public method to handle an ast.Attribute node.
@@ -78,8 +76,6 @@ class AnnotationsUnionVisitor(ast.NodeVisitor):
         ):
             self.__unionImports.append(node)
 
-        self.generic_visit(node)
-
     def visit_Subscript(self, node):
         """
         Public method to handle an ast.Subscript node.
@@ -93,8 +89,6 @@ class AnnotationsUnionVisitor(ast.NodeVisitor):
         ):
             self.__unionImports.append(node)
 
-        self.generic_visit(node)
-
     def getIssues(self):
         """
         Public method to get the collected Union nodes.
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+
+"""
+Module implementing a single pass AST dispatch engine shared by the code style
+checkers.
+"""
+
+import ast
+
+from collections import defaultdict
+
+
+class AstDispatcher:
+    """
+    Class implementing a single pass AST dispatch engine.
+
+    The various checkers register callbacks for the node types they are
+    interested in. The tree is walked exactly once in depth first order. Each
+    node is handed to the callbacks registered for its type or any of its base
+    classes.
+
+    Three kinds of node callbacks are supported.
+    <ul>
+    <li>Visitor callbacks are called in the order of an ast.NodeVisitor. A
+        visitor may register a 'leave' callback as well, which is called after
+        the subtree of the node has been visited. This allows to keep track of
+        the enclosing nodes (e.g. a class definition stack). The handler
+        methods of a node visitor class may be registered in one go.</li>
+    <li>Walk callbacks are called in the order determined by ast.walk(). They
+        are replayed from the nodes collected during the tree walk.</li>
+    <li>Annotators are called with each node and the list of its child nodes
+        before the node is handed to the visitor callbacks. They may amend the
+        child nodes with references to their parent or siblings.</li>
+    </ul>
+
+    Checks needing the complete set of collected nodes may register a
+    finalizer, which is called after the walk.
+
+    The callbacks must not modify the structure of the tree because it is
+    shared by all checkers.
+    """
+
+    def __init__(self, tree):
+        """
+        Constructor
+
+        @param tree reference to the AST tree to be dispatched
+        @type ast.Module
+        """
+        self.__tree = tree
+
+        # dictionaries with the registered node type as key and a list of
+        # callbacks as value
+        self.__enterCallbacks = defaultdict(list)
+        self.__leaveCallbacks = defaultdict(list)
+        self.__walkCallbacks = defaultdict(list)
+        # dictionary with the concrete node type as key and a tuple of the
+        # enter, leave and walk callbacks as value
+        self.__dispatchTable = {}
+        self.__annotators = []
+        self.__finalizers = []
+
+    def register(self, nodeTypes, callback):
+        """
+        Public method to register a callback called in ast.walk() order.
+
+        @param nodeTypes node type or tuple of node types the callback is
+            interested in
+        @type type or tuple of type
+        @param callback reference to the callback to be called with the node
+        @type function
+        """
+        self.__registerCallback(self.__walkCallbacks, nodeTypes, callback)
+
+    def registerVisitor(self, nodeTypes, enter, leave=None):
+        """
+        Public method to register callbacks called in ast.NodeVisitor order.
+
+        @param nodeTypes node type or tuple of node types the callbacks are
+            interested in
+        @type type or tuple of type
+        @param enter reference to the callback to be called with the node
+            before its subtree is visited
+        @type function
+        @param leave reference to the callback to be called with the node after
+            its subtree was visited (defaults to None)
+        @type function (optional)
+        """
+        self.__registerCallback(self.__enterCallbacks, nodeTypes, enter)
+        if leave is not None:
+            self.__registerCallback(self.__leaveCallbacks, nodeTypes, leave)
+
+    def registerNodeVisitor(self, visitor):
+        """
+        Public method to register the handler methods of a node visitor.
+
+        Methods named 'visit_<NodeType>' are registered as visitor callbacks
+        and methods named 'leave_<NodeType>' as leave callbacks for the
+        respective node type. The handler methods must not descend into the
+        child nodes because this is done by the dispatcher.
+
+        @param visitor reference to the node visitor
+        @type object
+        """
+        for name in dir(visitor):
+            kind, _, typeName = name.partition("_")
+            if kind in ("visit", "leave"):
+                nodeType = getattr(ast, typeName, None)
+                if isinstance(nodeType, type) and issubclass(nodeType, ast.AST):
+                    self.__registerCallback(
+                        (
+                            self.__enterCallbacks
+                            if kind == "visit"
+                            else self.__leaveCallbacks
+                        ),
+                        nodeType,
+                        getattr(visitor, name),
+                    )
+
+    def registerAnnotator(self, callback):
+        """
+        Public method to register a callback amending the child nodes.
+
+        @param callback reference to the callback to be called with a node and
+            the list of its child nodes
+        @type function
+        """
+        self.__annotators.append(callback)
+
+    def registerFinalizer(self, callback):
+        """
+        Public method to register a callback to be called after the tree walk.
+
+        @param callback reference to the callback to be called without
+            arguments
+        @type function
+        """
+        self.__finalizers.append(callback)
+
+    def __registerCallback(self, callbacks, nodeTypes, callback):
+        """
+        Private method to register a callback for a set of node types.
+
+        @param callbacks dictionary of callbacks to register with
+        @type dict
+        @param nodeTypes node type or tuple of node types the callback is
+            interested in
+        @type type or tuple of type
+        @param callback reference to the callback
+        @type function
+        """
+        if not isinstance(nodeTypes, tuple):
+            nodeTypes = (nodeTypes,)
+
+        for nodeType in nodeTypes:
+            callbacks[nodeType].append(callback)
+        self.__dispatchTable.clear()
+
+    def hasCallbacks(self):
+        """
+        Public method to check, if any callback was registered.
+
+        @return flag indicating registered callbacks
+        @rtype bool
+        """
+        return bool(
+            self.__enterCallbacks
+            or self.__walkCallbacks
+            or self.__annotators
+            or self.__finalizers
+        )
+
+    def __callbacksForType(self, nodeType):
+        """
+        Private method to determine the callbacks to be called for a concrete
+        node type.
+
+        @param nodeType concrete node type
+        @type type
+        @return tuple containing the enter, leave and walk callbacks
+        @rtype tuple of (tuple of function, tuple of function, tuple of function)
+        """
+        try:
+            return self.__dispatchTable[nodeType]
+        except KeyError:
+            callbacks = tuple(
+                tuple(
+                    callback
+                    for baseType in nodeType.__mro__
+                    for callback in registry.get(baseType, [])
+                )
+                for registry in (
+                    self.__enterCallbacks,
+                    self.__leaveCallbacks,
+                    self.__walkCallbacks,
+                )
+            )
+            self.__dispatchTable[nodeType] = callbacks
+            return callbacks
+
+    def run(self):
+        """
+        Public method to walk the tree once and dispatch each node to the
+        registered callbacks.
+        """
+        if not self.hasCallbacks():
+            # nothing to dispatch
+            return
+
+        callbacksForType = self.__callbacksForType
+        annotators = self.__annotators
+        iterChildNodes = ast.iter_child_nodes
+
+        # The nodes of interest for the walk callbacks are collected per
+        # depth. ast.walk() delivers the nodes level by level and, within a
+        # level, in the order of a depth first walk.
+        levels = []
+
+        # The stack contains tuples of a node and its depth. A depth of None
+        # marks a tuple of a node and its leave callbacks.
+        stack = [(self.__tree, 0)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node, depth = pop()
+            if depth is None:
+                node, leaveCallbacks = node
+                for callback in leaveCallbacks:
+                    callback(node)
+                continue
+
+            enterCallbacks, leaveCallbacks, walkCallbacks = callbacksForType(type(node))
+
+            children = list(iterChildNodes(node))
+            for annotator in annotators:
+                annotator(node, children)
+
+            for callback in enterCallbacks:
+                callback(node)
+
+            if walkCallbacks:
+                while len(levels) <= depth:
+                    levels.append([])
+                levels[depth].append(node)
+
+            if leaveCallbacks:
+                push(((node, leaveCallbacks), None))
+            depth += 1
+            for child in reversed(children):
+                push((child, depth))
+
+        for level in levels:
+            for node in level:
+                for callback in callbacksForType(type(node))[2]:
+                    callback(node)
+
+        for finalizer in self.__finalizers:
+            finalizer()
@@ -7,8 +7,7 @@
 Module implementing a checker for "async" related issues.
 """
 
-
-import copy
+from AstDispatcher import AstDispatcher
 
 
 class AsyncChecker:
@@ -25,7 +24,18 @@ class AsyncChecker:
         "ASY105",
     ]
 
-    def __init__(self, source, filename, tree, select, ignore, expected, repeat, args):
+    def __init__(
+        self,
+        source,
+        filename,
+        tree,
+        select,
+        ignore,
+        expected,
+        repeat,
+        args,
+        dispatcher=None,
+    ):
         """
         Constructor
 
@@ -45,6 +55,8 @@ class AsyncChecker:
         @type bool
         @param args dictionary of arguments for the various checks
         @type dict
+        @param dispatcher reference to a shared AST dispatcher (defaults to None)
+        @type AstDispatcher (optional)
         """
         self.__select = tuple(select)
         self.__ignore = (
@@ -54,8 +66,9 @@ class AsyncChecker:
         self.__repeat = repeat
         self.__filename = filename
         self.__source = source[:]
-        self.__tree = copy.deepcopy(tree)
+        self.__tree = tree
         self.__args = args
+        self.__dispatcher = dispatcher
 
         # statistics counters
         self.counters = {}
@@ -136,18 +149,42 @@ class AsyncChecker:
             # don't do anything, if no codes were selected
             return
 
+        # The checks are registered with the AST dispatcher. A shared
+        # dispatcher is run by the caller after all checkers have registered
+        # their callbacks.
+        dispatcher = (
+            AstDispatcher(self.__tree)
+            if self.__dispatcher is None
+            else self.__dispatcher
+        )
         for check in self.__checkers:
-            check()
+            check(dispatcher)
+        if self.__dispatcher is None:
+            dispatcher.run()
 
-    def __checkSyncUses(self):
+    def __checkSyncUses(self, dispatcher):
         """
         Private method to check for use of synchroneous functions in async methods.
+
+        @param dispatcher reference to the AST dispatcher
+        @type AstDispatcher
         """
         from .AsyncVisitor import AsyncVisitor
 
         visitor = AsyncVisitor(self.__args, self)
-        visitor.visit(copy.deepcopy(self.__tree))
-        for violation in visitor.violations:
+        dispatcher.registerNodeVisitor(visitor)
+        dispatcher.registerFinalizer(lambda: self.__reportSyncUses(visitor.violations))
+
+    def __reportSyncUses(self, violations):
+        """
+        Private method to report the use of synchroneous functions in async
+        methods.
+
+        @param violations list of tuples containing the offending node and the
+            message code
+        @type list of tuple of (ast.AST, str)
+        """
+        for violation in violations:
             if not self.__ignoreCode(violation[1]):
                 node = violation[0]
                 reason = violation[1]
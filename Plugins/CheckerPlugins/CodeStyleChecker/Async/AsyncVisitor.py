@@ -25,10 +25,13 @@ except ImportError:
 #######################################################################
 
 
-class AsyncVisitor(ast.NodeVisitor):
+class AsyncVisitor:
     """
     Class implementing a node visitor for checking async functions for use of
     synchronous functions.
+
+    Note: The visit methods are called by the AST dispatcher, which descends
+    into the child nodes.
     """
 
     HttpPackages = (
@@ -215,5 +218,3 @@ class AsyncVisitor(ast.NodeVisitor):
 
             if errorCode:
                 self.violations.append((inner, errorCode))
-
-        self.generic_visit(node)
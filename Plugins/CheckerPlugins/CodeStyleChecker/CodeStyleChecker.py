@@ -9,13 +9,12 @@ Module implementing the code style checker.
 
 import ast
 import contextlib
-import multiprocessing
-import queue
 import sys
 
 import pycodestyle
 
 from Annotations.AnnotationsChecker import AnnotationsChecker
+from AstDispatcher import AstDispatcher
 from Async.AsyncChecker import AsyncChecker
 from CodeStyleFixer import CodeStyleFixer
 from Complexity.ComplexityChecker import ComplexityChecker
@@ -44,14 +43,40 @@ def initService():
     return codeStyleCheck
 
 
-def initBatchService():
+def initBatchTask():
     """
-    Initialize the batch service and return the entry point.
+    Initialize the batch service and return the function to be executed for
+    each file by the worker pool of the background client.
 
-    @return the entry point for the background client
+    @return the task function for the background client worker pool
     @rtype function
     """
-    return codeStyleBatchCheck
+    return codeStyleBatchTask
+
+
+def batchCacheKey(arguments):
+    """
+    Function to determine the data identifying a batch check request for the
+    result cache of the background client.
+
+    @param arguments arguments tuple as given for codeStyleCheck
+    @type tuple of (str, list of str, list)
+    @return tuple containing the file name, the source and the normalized
+        arguments or None, if the result must not be cached
+    @rtype tuple of (str, list of str, list) or None
+    """
+    filename, source, args = arguments
+    if args[5]:
+        # fixing issues modifies the file, never serve it from the cache
+        return None
+
+    normalizedArgs = list(args)
+    for index in (0, 1, 3, 4):
+        # normalize the comma separated message code lists
+        normalizedArgs[index] = sorted(
+            {c.strip() for c in args[index].split(",") if c.strip()}
+        )
+    return filename, source, normalizedArgs
 
 
 class CodeStyleCheckerReport(pycodestyle.BaseReport):
@@ -223,98 +248,19 @@ def codeStyleCheck(filename, source, args):
     return __checkCodeStyle(filename, source, args)
 
 
-def codeStyleBatchCheck(argumentsList, send, fx, cancelled, maxProcesses=0):
+def codeStyleBatchTask(arguments):
     """
-    Module function to check source code style for a batch of files.
+    Module function executing the code style check for one file of a batch.
 
-    @param argumentsList list of arguments tuples as given for codeStyleCheck
-    @type list
-    @param send reference to send function
-    @type func
-    @param fx registered service name
-    @type str
-    @param cancelled reference to function checking for a cancellation
-    @type func
-    @param maxProcesses number of processes to be used
-    @type int
-    """
-    if maxProcesses == 0:
-        # determine based on CPU count
-        try:
-            NumberOfProcesses = multiprocessing.cpu_count()
-            if NumberOfProcesses >= 1:
-                NumberOfProcesses -= 1
-        except NotImplementedError:
-            NumberOfProcesses = 1
-    else:
-        NumberOfProcesses = maxProcesses
-
-    # Create queues
-    taskQueue = multiprocessing.Queue()
-    doneQueue = multiprocessing.Queue()
-
-    # Submit tasks (initially two times the number of processes)
-    tasks = len(argumentsList)
-    initialTasks = min(2 * NumberOfProcesses, tasks)
-    for _ in range(initialTasks):
-        taskQueue.put(argumentsList.pop(0))
-
-    # Start worker processes
-    workers = [
-        multiprocessing.Process(target=workerTask, args=(taskQueue, doneQueue))
-        for _ in range(NumberOfProcesses)
-    ]
-    for worker in workers:
-        worker.start()
-
-    # Get and send results
-    for _ in range(tasks):
-        resultSent = False
-        wasCancelled = False
-
-        while not resultSent:
-            try:
-                # get result (waiting max. 3 seconds and send it to frontend
-                filename, result = doneQueue.get(timeout=3)
-                send(fx, filename, result)
-                resultSent = True
-            except queue.Empty:
-                # ignore empty queue, just carry on
-                if cancelled():
-                    wasCancelled = True
-                    break
-
-        if wasCancelled or cancelled():
-            # just exit the loop ignoring the results of queued tasks
-            break
-
-        if argumentsList:
-            taskQueue.put(argumentsList.pop(0))
-
-    # Tell child processes to stop
-    for _ in range(NumberOfProcesses):
-        taskQueue.put("STOP")
-
-    for worker in workers:
-        worker.join()
-        worker.close()
-
-    taskQueue.close()
-    doneQueue.close()
-
-
-def workerTask(inputQueue, outputQueue):
-    """
-    Module function acting as the parallel worker for the style check.
-
-    @param inputQueue input queue
-    @type multiprocessing.Queue
-    @param outputQueue output queue
-    @type multiprocessing.Queue
+    @param arguments tuple containing the file name, the source and the
+        check arguments as given for codeStyleCheck
+    @type tuple
+    @return tuple containing the file name and the check result
+    @rtype tuple
     """
-    for filename, source, args in iter(inputQueue.get, "STOP"):
-        result = __checkCodeStyle(filename, source, args)
-        outputQueue.put((filename, result))
+    filename, source, args = arguments
+    result = __checkCodeStyle(filename, source, args)
+    return filename, result
 
 
 def __checkSyntax(filename, source):
@@ -485,6 +431,11 @@ def __checkCodeStyle(filename, source, args):
             stats.update(docStyleChecker.counters)
             errors += docStyleChecker.errors
 
+            # The AST based checkers register their node based checks with a
+            # shared dispatcher, so the tree is walked only once for all of them.
+            dispatcher = AstDispatcher(tree)
+            checkers = []
+
             # miscellaneous additional checks
             miscellaneousChecker = MiscellaneousChecker(
                 source,
@@ -495,18 +446,23 @@ def __checkCodeStyle(filename, source, args):
                 [],
                 repeatMessages,
                 miscellaneousArgs,
+                dispatcher=dispatcher,
             )
             miscellaneousChecker.run()
-            stats.update(miscellaneousChecker.counters)
-            errors += miscellaneousChecker.errors
+            checkers.append(miscellaneousChecker)
 
             # check code complexity
             complexityChecker = ComplexityChecker(
-                source, filename, tree, select, ignore, codeComplexityArgs
+                source,
+                filename,
+                tree,
+                select,
+                ignore,
+                codeComplexityArgs,
+                dispatcher=dispatcher,
             )
             complexityChecker.run()
-            stats.update(complexityChecker.counters)
-            errors += complexityChecker.errors
+            checkers.append(complexityChecker)
 
             # check function annotations
             annotationsChecker = AnnotationsChecker(
@@ -518,42 +474,68 @@ def __checkCodeStyle(filename, source, args):
                 [],
                 repeatMessages,
                 annotationArgs,
+                dispatcher=dispatcher,
             )
             annotationsChecker.run()
-            stats.update(annotationsChecker.counters)
-            errors += annotationsChecker.errors
+            checkers.append(annotationsChecker)
 
             # check for security issues
             securityChecker = SecurityChecker(
-                source, filename, tree, select, ignore, [], repeatMessages, securityArgs
+                source,
+                filename,
+                tree,
+                select,
+                ignore,
+                [],
+                repeatMessages,
+                securityArgs,
+                dispatcher=dispatcher,
             )
             securityChecker.run()
-            stats.update(securityChecker.counters)
-            errors += securityChecker.errors
+            checkers.append(securityChecker)
 
             # check for pathlib usage
             pathlibChecker = PathlibChecker(
-                source, filename, tree, select, ignore, [], repeatMessages
+                source,
+                filename,
+                tree,
+                select,
+                ignore,
+                [],
+                repeatMessages,
+                dispatcher=dispatcher,
             )
             pathlibChecker.run()
-            stats.update(pathlibChecker.counters)
-            errors += pathlibChecker.errors
+            checkers.append(pathlibChecker)
 
             # check for code simplifications
             simplifyChecker = SimplifyChecker(
-                source, filename, tree, select, ignore, [], repeatMessages
+                source,
+                filename,
+                tree,
+                select,
+                ignore,
+                [],
+                repeatMessages,
+                dispatcher=dispatcher,
             )
             simplifyChecker.run()
-            stats.update(simplifyChecker.counters)
-            errors += simplifyChecker.errors
+            checkers.append(simplifyChecker)
 
             # check import statements
             importsChecker = ImportsChecker(
-                source, filename, tree, select, ignore, [], repeatMessages, importsArgs
+                source,
+                filename,
+                tree,
+                select,
+                ignore,
+                [],
+                repeatMessages,
+                importsArgs,
+                dispatcher=dispatcher,
             )
             importsChecker.run()
-            stats.update(importsChecker.counters)
-            errors += importsChecker.errors
+            checkers.append(importsChecker)
 
             # check name ordering
             nameOrderChecker = NameOrderChecker(
@@ -565,10 +547,10 @@ def __checkCodeStyle(filename, source, args):
                 [],
                 repeatMessages,
                 nameOrderArgs,
+                dispatcher=dispatcher,
             )
             nameOrderChecker.run()
-            stats.update(nameOrderChecker.counters)
-            errors += nameOrderChecker.errors
+            checkers.append(nameOrderChecker)
 
             # check unused arguments and variables
             unusedChecker = UnusedChecker(
@@ -580,10 +562,10 @@ def __checkCodeStyle(filename, source, args):
                 [],
                 repeatMessages,
                 unusedArgs,
+                dispatcher=dispatcher,
             )
             unusedChecker.run()
-            stats.update(unusedChecker.counters)
-            errors += unusedChecker.errors
+            checkers.append(unusedChecker)
 
             # check async function definitions
             asyncChecker = AsyncChecker(
@@ -595,10 +577,10 @@ def __checkCodeStyle(filename, source, args):
                 [],
                 repeatMessages,
                 {},  # no arguments yet
+                dispatcher=dispatcher,
             )
             asyncChecker.run()
-            stats.update(asyncChecker.counters)
-            errors += asyncChecker.errors
+            checkers.append(asyncChecker)
 
             # checking logging statements
             loggingChecker = LoggingChecker(
@@ -610,10 +592,17 @@ def __checkCodeStyle(filename, source, args):
                 [],
                 repeatMessages,
                 {},  # no arguments yet
+                dispatcher=dispatcher,
             )
             loggingChecker.run()
-            stats.update(loggingChecker.counters)
-            errors += loggingChecker.errors
+            checkers.append(loggingChecker)
+
+            # walk the tree once dispatching the nodes to all registered checks
+            dispatcher.run()
+
+            for checker in checkers:
+                stats.update(checker.counters)
+                errors += checker.errors
 
         elif syntaxError:
             errors = [syntaxError]
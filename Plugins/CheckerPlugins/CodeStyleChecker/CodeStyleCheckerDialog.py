@@ -178,6 +178,7 @@ class CodeStyleCheckerDialog(QDialog, Ui_CodeStyleCheckerDialog):
         self.styleCheckService = styleCheckService
         self.styleCheckService.styleChecked.connect(self.__processResult)
         self.styleCheckService.batchFinished.connect(self.__batchFinished)
+        self.styleCheckService.batchCacheStatistics.connect(self.__batchCacheStatistics)
         self.styleCheckService.error.connect(self.__processError)
         self.filename = None
 
@@ -397,6 +398,8 @@ class CodeStyleCheckerDialog(QDialog, Ui_CodeStyleCheckerDialog):
         self.__statistics["_FilesIssues"] = 0
         self.__statistics["_IssuesFixed"] = 0
         self.__statistics["_SecurityOK"] = 0
+        self.__statistics["_CacheHits"] = 0
+        self.__statistics["_CacheMisses"] = 0
 
     def __getBanRelativeImportsValue(self):
         """
@@ -1200,6 +1203,18 @@ class CodeStyleCheckerDialog(QDialog, Ui_CodeStyleCheckerDialog):
         self.checkProgress.setValue(1)
         self.__finish()
 
+    def __batchCacheStatistics(self, hits, misses):
+        """
+        Private slot handling the result cache statistics of a batch job.
+
+        @param hits number of results served from the cache
+        @type int
+        @param misses number of results not found in the cache
+        @type int
+        """
+        self.__statistics["_CacheHits"] += hits
+        self.__statistics["_CacheMisses"] += misses
+
     def __processError(self, fn, msg):
         """
         Private slot to process an error indication from the service.
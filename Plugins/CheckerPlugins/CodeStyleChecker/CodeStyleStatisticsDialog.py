@@ -41,6 +41,8 @@ class CodeStyleStatisticsDialog(QDialog, Ui_CodeStyleStatisticsDialog):
         filesIssues = stats["_FilesIssues"]
         fixesCount = stats["_IssuesFixed"]
         securityOk = stats["_SecurityOK"]
+        cacheHits = stats.pop("_CacheHits", 0)
+        cacheMisses = stats.pop("_CacheMisses", 0)
         del stats["_FilesCount"]
         del stats["_FilesIssues"]
         del stats["_IssuesFixed"]
@@ -72,6 +74,14 @@ class CodeStyleStatisticsDialog(QDialog, Ui_CodeStyleStatisticsDialog):
         self.securityOk.setText(
             self.tr("%n security issue(s) acknowledged", "", securityOk)
         )
+        if cacheHits or cacheMisses:
+            self.cacheStatistics.setText(
+                self.tr("Result cache: {0} hit(s), {1} miss(es)").format(
+                    cacheHits, cacheMisses
+                )
+            )
+        else:
+            self.cacheStatistics.hide()
 
         self.statisticsList.resizeColumnToContents(0)
         self.statisticsList.resizeColumnToContents(1)
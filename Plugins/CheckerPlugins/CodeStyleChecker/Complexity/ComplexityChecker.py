@@ -8,7 +8,8 @@ Module implementing a checker for code complexity.
 """
 
 import ast
-import copy
+
+from AstDispatcher import AstDispatcher
 
 from .mccabe import PathGraphingAstVisitor
 
@@ -24,7 +25,7 @@ class ComplexityChecker:
         "C112",
     ]
 
-    def __init__(self, source, filename, tree, select, ignore, args):
+    def __init__(self, source, filename, tree, select, ignore, args, dispatcher=None):
         """
         Constructor
 
@@ -40,10 +41,13 @@ class ComplexityChecker:
         @type list of str
         @param args dictionary of arguments for the miscellaneous checks
         @type dict
+        @param dispatcher reference to a shared AST dispatcher (defaults to None)
+        @type AstDispatcher (optional)
         """
         self.__filename = filename
         self.__source = source[:]
-        self.__tree = copy.deepcopy(tree)
+        self.__tree = tree
+        self.__dispatcher = dispatcher
         self.__select = tuple(select)
         self.__ignore = ("",) if select else tuple(ignore)
         self.__args = args
@@ -126,12 +130,28 @@ class ComplexityChecker:
             # don't do anything, if no codes were selected
             return
 
+        # The checks are registered with the AST dispatcher. A shared
+        # dispatcher is run by the caller after all checkers have registered
+        # their callbacks.
+        dispatcher = (
+            AstDispatcher(self.__tree)
+            if self.__dispatcher is None
+            else self.__dispatcher
+        )
         for check in self.__checkers:
-            check()
+            check(dispatcher)
+        if self.__dispatcher is None:
+            dispatcher.run()
 
-    def __checkMcCabeComplexity(self):
+    def __checkMcCabeComplexity(self, dispatcher):  # noqa: U100
         """
         Private method to check the McCabe code complexity.
+
+        Note: The McCabe visitor is not driven by the AST dispatcher because
+        it builds the path graphs by its own recursion on a tree of its own.
+
+        @param dispatcher reference to the AST dispatcher
+        @type AstDispatcher
         """
         try:
             # create the AST again because it is modified by the checker
@@ -152,13 +172,28 @@ class ComplexityChecker:
             if graph.complexity() > maxComplexity:
                 self.__error(graph.lineno, 0, "C101", graph.entity, graph.complexity())
 
-    def __checkLineComplexity(self):
+    def __checkLineComplexity(self, dispatcher):
         """
         Private method to check the complexity of a single line of code and
         the median line complexity of the source code.
 
         Complexity is defined as the number of AST nodes produced by a line
         of code.
+
+        @param dispatcher reference to the AST dispatcher
+        @type AstDispatcher
+        """
+        visitor = LineComplexityVisitor()
+        dispatcher.registerNodeVisitor(visitor)
+        dispatcher.registerFinalizer(lambda: self.__reportLineComplexity(visitor))
+
+    def __reportLineComplexity(self, visitor):
+        """
+        Private method to report the line complexity issues.
+
+        @param visitor reference to the line complexity visitor fed by the AST
+            dispatcher
+        @type LineComplexityVisitor
         """
         maxLineComplexity = self.__args.get(
             "LineComplexity", self.__defaultArgs["LineComplexity"]
@@ -167,9 +202,6 @@ class ComplexityChecker:
             "LineComplexityScore", self.__defaultArgs["LineComplexityScore"]
         )
 
-        visitor = LineComplexityVisitor()
-        visitor.visit(self.__tree)
-
         sortedItems = visitor.sortedList()
         score = visitor.score()
 
@@ -181,30 +213,29 @@ class ComplexityChecker:
             self.__error(0, 0, "C112", score)
 
 
-class LineComplexityVisitor(ast.NodeVisitor):
+class LineComplexityVisitor:
     """
     Class calculating the number of AST nodes per line of code
     and the median nodes/line score.
+
+    Note: All nodes are handed to the visitor by the AST dispatcher.
     """
 
     def __init__(self):
         """
         Constructor
         """
-        super().__init__()
         self.__count = {}
 
-    def visit(self, node):
+    def visit_AST(self, node):
         """
-        Public method to recursively visit all the nodes and add up the
-        instructions.
+        Public method to add up the instructions of a node.
 
         @param node reference to the node
         @type ast.AST
         """
         if hasattr(node, "lineno"):
             self.__count[node.lineno] = self.__count.get(node.lineno, 0) + 1
-        self.generic_visit(node)
 
     def sortedList(self):
         """
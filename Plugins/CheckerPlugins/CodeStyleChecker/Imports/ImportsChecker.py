@@ -8,9 +8,10 @@ Module implementing a checker for import statements.
 """
 
 import ast
-import copy
 import re
 
+from AstDispatcher import AstDispatcher
+
 
 class ImportsChecker:
     """
@@ -29,7 +30,18 @@ class ImportsChecker:
         "I904",
     ]
 
-    def __init__(self, source, filename, tree, select, ignore, expected, repeat, args):
+    def __init__(
+        self,
+        source,
+        filename,
+        tree,
+        select,
+        ignore,
+        expected,
+        repeat,
+        args,
+        dispatcher=None,
+    ):
         """
         Constructor
 
@@ -49,6 +61,8 @@ class ImportsChecker:
         @type bool
         @param args dictionary of arguments for the various checks
         @type dict
+        @param dispatcher reference to a shared AST dispatcher (defaults to None)
+        @type AstDispatcher (optional)
         """
         self.__select = tuple(select)
         self.__ignore = ("",) if select else tuple(ignore)
@@ -56,8 +70,9 @@ class ImportsChecker:
         self.__repeat = repeat
         self.__filename = filename
         self.__source = source[:]
-        self.__tree = copy.deepcopy(tree)
+        self.__tree = tree
         self.__args = args
+        self.__dispatcher = dispatcher
 
         # statistics counters
         self.counters = {}
@@ -148,11 +163,15 @@ class ImportsChecker:
     def __checkLocalImports(self):
         """
         Private method to check local imports.
+
+        Note: The local import visitor is not driven by the AST dispatcher
+        because it propagates the 'is_local' flag by its own recursion. It
+        just adds attributes to the nodes of the shared tree.
         """
         from .LocalImportVisitor import LocalImportVisitor
 
         visitor = LocalImportVisitor(self.__args, self)
-        visitor.visit(copy.deepcopy(self.__tree))
+        visitor.visit(self.__tree)
         for violation in visitor.violations:
             if not self.__ignoreCode(violation[1]):
                 node = violation[0]
@@ -204,9 +223,15 @@ class ImportsChecker:
         ) or (not self.__ignoreCode("I904") and self.__banRelativeImports == "true"):
             ruleMethods.append(self.__checkBannedRelativeImports)
 
-        for node in ast.walk(self.__tree):
-            for method in ruleMethods:
-                method(node)
+        dispatcher = (
+            AstDispatcher(self.__tree)
+            if self.__dispatcher is None
+            else self.__dispatcher
+        )
+        for method in ruleMethods:
+            dispatcher.register((ast.Import, ast.ImportFrom), method)
+        if self.__dispatcher is None:
+            dispatcher.run()
 
     def __compileUnstructuredGlob(self, module):
         """
@@ -7,7 +7,7 @@
 Module implementing a checker for logging related issues.
 """
 
-import copy
+from AstDispatcher import AstDispatcher
 
 
 class LoggingChecker:
@@ -34,7 +34,18 @@ class LoggingChecker:
         "L115",
     ]
 
-    def __init__(self, source, filename, tree, select, ignore, expected, repeat, args):
+    def __init__(
+        self,
+        source,
+        filename,
+        tree,
+        select,
+        ignore,
+        expected,
+        repeat,
+        args,
+        dispatcher=None,
+    ):
         """
         Constructor
 
@@ -54,6 +65,8 @@ class LoggingChecker:
         @type bool
         @param args dictionary of arguments for the various checks
         @type dict
+        @param dispatcher reference to a shared AST dispatcher (defaults to None)
+        @type AstDispatcher (optional)
         """
         self.__select = tuple(select)  # noqa: M188
         self.__ignore = ("",) if select else tuple(ignore)  # noqa: M188
@@ -61,8 +74,9 @@ class LoggingChecker:
         self.__repeat = repeat
         self.__filename = filename
         self.__source = source[:]
-        self.__tree = copy.deepcopy(tree)
+        self.__tree = tree
         self.__args = args
+        self.__dispatcher = dispatcher
 
         # statistics counters
         self.counters = {}
@@ -159,14 +173,27 @@ class LoggingChecker:
             # don't do anything, if no codes were selected
             return
 
+        # The checks are registered with the AST dispatcher. A shared
+        # dispatcher is run by the caller after all checkers have registered
+        # their callbacks.
+        dispatcher = (
+            AstDispatcher(self.__tree)
+            if self.__dispatcher is None
+            else self.__dispatcher
+        )
         for check in self.__checkers:
-            check()
+            check(dispatcher)
+        if self.__dispatcher is None:
+            dispatcher.run()
 
-    def __checkLogging(self):
+    def __checkLogging(self, dispatcher):
         """
         Private method to check logging statements.
+
+        @param dispatcher reference to the AST dispatcher
+        @type AstDispatcher
         """
         from .LoggingVisitor import LoggingVisitor
 
         visitor = LoggingVisitor(errorCallback=self.__error)
-        visitor.visit(self.__tree)
+        dispatcher.registerNodeVisitor(visitor)
@@ -117,9 +117,11 @@ def _modnamedPlaceholderRe():
     )
 
 
-class LoggingVisitor(ast.NodeVisitor):
+class LoggingVisitor:
     """
     Class implementing a node visitor to check for logging issues.
+
+    Note: The nodes are handed to the visitor by the AST dispatcher.
     """
 
     GetLoggerNames = frozenset(("__cached__", "__file__"))
@@ -131,8 +133,6 @@ class LoggingVisitor(ast.NodeVisitor):
         @param errorCallback callback function to register an error
         @type func
         """
-        super().__init__()
-
         self.__error = errorCallback
 
         self.__loggingName = None
@@ -140,15 +140,25 @@ class LoggingVisitor(ast.NodeVisitor):
         self.__fromImports = {}
         self.__stack = []
 
-    def visit(self, node):
+    def visit_AST(self, node):
         """
-        Public method to handle ast nodes.
+        Public method to record entering an ast node.
+
+        Note: This is called after the node type specific handler, i.e. the
+        stack contains the enclosing nodes only while the node is handled.
 
         @param node reference to the node to be processed
         @type ast.AST
         """
         self.__stack.append(node)
-        super().visit(node)
+
+    def leave_AST(self, node):  # noqa: U100
+        """
+        Public method to record leaving an ast node.
+
+        @param node reference to the node to be processed
+        @type ast.AST
+        """
         self.__stack.pop()
 
     def visit_Import(self, node):
@@ -161,7 +171,6 @@ class LoggingVisitor(ast.NodeVisitor):
         for alias in node.names:
             if alias.name == "logging":
                 self.__loggingName = alias.asname or alias.name
-        self.generic_visit(node)
 
     def visit_ImportFrom(self, node):
         """
@@ -183,8 +192,6 @@ class LoggingVisitor(ast.NodeVisitor):
                 if not alias.asname:
                     self.__fromImports[alias.name] = node.module
 
-        self.generic_visit(node)
-
     def visit_Attribute(self, node):
         """
         Public method to handle  Attribute nodes.
@@ -200,8 +207,6 @@ class LoggingVisitor(ast.NodeVisitor):
         ):
             self.__error(node.lineno - 1, node.col_offset, "L109")
 
-        self.generic_visit(node)
-
     def visit_Call(self, node):
         """
         Public method to handle Call nodes.
@@ -412,8 +417,6 @@ class LoggingVisitor(ast.NodeVisitor):
             ):
                 self.__checkMsgAndArgs(node, msgArg, msg)
 
-        self.generic_visit(node)
-
     def __checkMsgAndArgs(self, node, msgArg, msg):
         """
         Private method to check the message and arguments a given Call node.
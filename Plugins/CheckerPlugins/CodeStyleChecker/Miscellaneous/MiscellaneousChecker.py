@@ -10,7 +10,6 @@ Module implementing a checker for miscellaneous checks.
 import ast
 import builtins
 import contextlib
-import copy
 import itertools
 import math
 import re
@@ -37,6 +36,8 @@ except ImportError:
 
 import AstUtilities
 
+from AstDispatcher import AstDispatcher
+
 from .eradicate import Eradicator
 from .MiscellaneousDefaults import MiscellaneousCheckerDefaultArgs
 
@@ -257,7 +258,24 @@ class MiscellaneousChecker:
         "credits",
     ]
 
-    def __init__(self, source, filename, tree, select, ignore, expected, repeat, args):
+    ComprehensionTypes = {
+        ast.DictComp: "dict",
+        ast.ListComp: "list",
+        ast.SetComp: "set",
+    }
+
+    def __init__(
+        self,
+        source,
+        filename,
+        tree,
+        select,
+        ignore,
+        expected,
+        repeat,
+        args,
+        dispatcher=None,
+    ):
         """
         Constructor
 
@@ -277,6 +295,8 @@ class MiscellaneousChecker:
         @type bool
         @param args dictionary of arguments for the miscellaneous checks
         @type dict
+        @param dispatcher reference to a shared AST dispatcher (defaults to None)
+        @type AstDispatcher (optional)
         """
         self.__select = tuple(select)
         self.__ignore = ("",) if select else tuple(ignore)
@@ -284,7 +304,7 @@ class MiscellaneousChecker:
         self.__repeat = repeat
         self.__filename = filename
         self.__source = source[:]
-        self.__tree = copy.deepcopy(tree)
+        self.__tree = tree
         self.__args = args
 
         linesIterator = iter(self.__source)
@@ -298,6 +318,13 @@ class MiscellaneousChecker:
 
         self.__eradicator = Eradicator()
 
+        self.__dispatcher = dispatcher
+        self.__ignoreBuiltinAssignments = self.__args.get(
+            "BuiltinsChecker", MiscellaneousCheckerDefaultArgs["BuiltinsChecker"]
+        )
+        self.__visitedMapCalls = set()
+        self.__properties = []
+
         # statistics counters
         self.counters = {}
 
@@ -307,77 +334,6 @@ class MiscellaneousChecker:
         checkersWithCodes = [
             (self.__checkCoding, ("M101", "M102")),
             (self.__checkCopyright, ("M111", "M112")),
-            (self.__checkBuiltins, ("M131", "M132")),
-            (
-                self.__checkComprehensions,
-                (
-                    "M180",
-                    "M181",
-                    "M182",
-                    "M183",
-                    "M184",
-                    "M185",
-                    "M186",
-                    "M188",
-                    "M189",
-                    "M189a",
-                    "M189b",
-                    "M190",
-                    "M190a",
-                    "M190b",
-                    "M191",
-                    "M193",
-                    "M193a",
-                    "M193b",
-                    "M193c",
-                    "M194",
-                    "M195",
-                    "M196",
-                    "M197",
-                    "M198",
-                    "M199",
-                    "M200",
-                ),
-            ),
-            (self.__checkDictWithSortedKeys, ("M251",)),
-            (
-                self.__checkProperties,
-                ("M260", "M261", "M262", "M263", "M264", "M265", "M266", "M267"),
-            ),
-            (
-                self.__checkDateTime,
-                (
-                    "M301",
-                    "M302",
-                    "M303",
-                    "M304",
-                    "M305",
-                    "M306",
-                    "M307",
-                    "M308",
-                    "M311",
-                    "M312",
-                    "M313",
-                    "M314",
-                    "M315",
-                    "M321",
-                ),
-            ),
-            (
-                self.__checkSysVersion,
-                (
-                    "M401",
-                    "M402",
-                    "M403",
-                    "M411",
-                    "M412",
-                    "M413",
-                    "M414",
-                    "M421",
-                    "M422",
-                    "M423",
-                ),
-            ),
             (
                 self.__checkBugBear,
                 (
@@ -442,16 +398,100 @@ class MiscellaneousChecker:
                 ),
             ),
             (self.__checkFuture, ("M701", "M702")),
-            (self.__checkGettext, ("M711",)),
-            (self.__checkPrintStatements, ("M801",)),
-            (self.__checkTuple, ("M811",)),
             (self.__checkReturn, ("M831", "M832", "M833", "M834")),
             (self.__checkLineContinuation, ("M841",)),
             (self.__checkImplicitStringConcat, ("M851", "M852")),
-            (self.__checkExplicitStringConcat, ("M853",)),
             (self.__checkCommentedCode, ("M891",)),
         ]
 
+        # checks driven by node visitors registered with the AST dispatcher
+        visitorCheckersWithCodes = [
+            (
+                self.__checkDateTime,
+                (
+                    "M301",
+                    "M302",
+                    "M303",
+                    "M304",
+                    "M305",
+                    "M306",
+                    "M307",
+                    "M308",
+                    "M311",
+                    "M312",
+                    "M313",
+                    "M314",
+                    "M315",
+                    "M321",
+                ),
+            ),
+            (
+                self.__checkSysVersion,
+                (
+                    "M401",
+                    "M402",
+                    "M403",
+                    "M411",
+                    "M412",
+                    "M413",
+                    "M414",
+                    "M421",
+                    "M422",
+                    "M423",
+                ),
+            ),
+        ]
+
+        nodeCheckersWithCodes = [
+            (
+                self.__checkBuiltins,
+                (ast.Assign, ast.For, ast.FunctionDef, ast.AsyncFunctionDef),
+                ("M131", "M132"),
+            ),
+            (
+                self.__checkComprehensions,
+                (ast.Call, ast.DictComp, ast.ListComp, ast.SetComp),
+                (
+                    "M180",
+                    "M181",
+                    "M182",
+                    "M183",
+                    "M184",
+                    "M185",
+                    "M186",
+                    "M188",
+                    "M189",
+                    "M189a",
+                    "M189b",
+                    "M190",
+                    "M190a",
+                    "M190b",
+                    "M191",
+                    "M193",
+                    "M193a",
+                    "M193b",
+                    "M193c",
+                    "M194",
+                    "M195",
+                    "M196",
+                    "M197",
+                    "M198",
+                    "M199",
+                    "M200",
+                ),
+            ),
+            (self.__checkDictWithSortedKeys, (ast.Dict,), ("M251",)),
+            (
+                self.__checkProperties,
+                (ast.ClassDef, ast.FunctionDef),
+                ("M260", "M261", "M262", "M263", "M264", "M265", "M266", "M267"),
+            ),
+            (self.__checkGettext, (ast.ImportFrom,), ("M711",)),
+            (self.__checkPrintStatements, (ast.Call,), ("M801",)),
+            (self.__checkTuple, (ast.Tuple,), ("M811",)),
+            (self.__checkExplicitStringConcat, (ast.BinOp,), ("M853",)),
+        ]
+
         # the eradicate whitelist
         commentedCodeCheckerArgs = self.__args.get(
             "CommentedCodeChecker",
@@ -470,6 +510,16 @@ class MiscellaneousChecker:
             if any(not (code and self.__ignoreCode(code)) for code in codes):
                 self.__checkers.append(checker)
 
+        self.__visitorCheckers = []
+        for checker, codes in visitorCheckersWithCodes:
+            if any(not (code and self.__ignoreCode(code)) for code in codes):
+                self.__visitorCheckers.append(checker)
+
+        self.__nodeCheckers = []
+        for checker, nodeTypes, codes in nodeCheckersWithCodes:
+            if any(not (code and self.__ignoreCode(code)) for code in codes):
+                self.__nodeCheckers.append((nodeTypes, checker))
+
     def __ignoreCode(self, code):
         """
         Private method to check if the message code should be ignored.
@@ -527,13 +577,32 @@ class MiscellaneousChecker:
             # don't do anything, if essential data is missing
             return
 
-        if not self.__checkers:
+        if (
+            not self.__checkers
+            and not self.__visitorCheckers
+            and not self.__nodeCheckers
+        ):
             # don't do anything, if no codes were selected
             return
 
         for check in self.__checkers:
             check()
 
+        # The node based checks are registered with the AST dispatcher. A
+        # shared dispatcher is run by the caller after all checkers have
+        # registered their callbacks.
+        dispatcher = (
+            AstDispatcher(self.__tree)
+            if self.__dispatcher is None
+            else self.__dispatcher
+        )
+        for check in self.__visitorCheckers:
+            check(dispatcher)
+        for nodeTypes, check in self.__nodeCheckers:
+            dispatcher.register(nodeTypes, check)
+        if self.__dispatcher is None:
+            dispatcher.run()
+
     def __getCoding(self):
         """
         Private method to get the defined coding of the source.
@@ -646,23 +715,27 @@ class MiscellaneousChecker:
             ):
                 self.__error(lineIndex, len(line), "M841")
 
-    def __checkPrintStatements(self):
+    def __checkPrintStatements(self, node):
         """
         Private method to check for print statements.
+
+        @param node reference to the node to be checked
+        @type ast.Call
         """
-        for node in ast.walk(self.__tree):
-            if (
-                isinstance(node, ast.Call) and getattr(node.func, "id", None) == "print"
-            ) or (hasattr(ast, "Print") and isinstance(node, ast.Print)):
-                self.__error(node.lineno - 1, node.col_offset, "M801")
+        if (
+            isinstance(node, ast.Call) and getattr(node.func, "id", None) == "print"
+        ) or (hasattr(ast, "Print") and isinstance(node, ast.Print)):
+            self.__error(node.lineno - 1, node.col_offset, "M801")
 
-    def __checkTuple(self):
+    def __checkTuple(self, node):
         """
         Private method to check for one element tuples.
+
+        @param node reference to the node to be checked
+        @type ast.Tuple
         """
-        for node in ast.walk(self.__tree):
-            if isinstance(node, ast.Tuple) and len(node.elts) == 1:
-                self.__error(node.lineno - 1, node.col_offset, "M811")
+        if isinstance(node, ast.Tuple) and len(node.elts) == 1:
+            self.__error(node.lineno - 1, node.col_offset, "M811")
 
     def __checkFuture(self):
         """
@@ -857,372 +930,353 @@ class MiscellaneousChecker:
         else:
             return fields, implicit, explicit
 
-    def __checkBuiltins(self):
+    def __checkBuiltins(self, node):
         """
         Private method to check, if built-ins are shadowed.
-        """
-        functionDefs = [ast.FunctionDef]
-        with contextlib.suppress(AttributeError):
-            functionDefs.append(ast.AsyncFunctionDef)
-
-        ignoreBuiltinAssignments = self.__args.get(
-            "BuiltinsChecker", MiscellaneousCheckerDefaultArgs["BuiltinsChecker"]
-        )
 
-        for node in ast.walk(self.__tree):
-            if isinstance(node, ast.Assign):
-                # assign statement
-                for element in node.targets:
-                    if isinstance(element, ast.Name) and element.id in self.__builtins:
-                        value = node.value
-                        if (
-                            isinstance(value, ast.Name)
-                            and element.id in ignoreBuiltinAssignments
-                            and value.id in ignoreBuiltinAssignments[element.id]
-                        ):
-                            # ignore compatibility assignments
-                            continue
-                        self.__error(
-                            element.lineno - 1, element.col_offset, "M131", element.id
-                        )
-                    elif isinstance(element, (ast.Tuple, ast.List)):
-                        for tupleElement in element.elts:
-                            if (
-                                isinstance(tupleElement, ast.Name)
-                                and tupleElement.id in self.__builtins
-                            ):
-                                self.__error(
-                                    tupleElement.lineno - 1,
-                                    tupleElement.col_offset,
-                                    "M131",
-                                    tupleElement.id,
-                                )
-            elif isinstance(node, ast.For):
-                # for loop
-                target = node.target
-                if isinstance(target, ast.Name) and target.id in self.__builtins:
+        @param node reference to the node to be checked
+        @type ast.Assign, ast.For, ast.FunctionDef or ast.AsyncFunctionDef
+        """
+        if isinstance(node, ast.Assign):
+            # assign statement
+            for element in node.targets:
+                if isinstance(element, ast.Name) and element.id in self.__builtins:
+                    value = node.value
+                    if (
+                        isinstance(value, ast.Name)
+                        and element.id in self.__ignoreBuiltinAssignments
+                        and value.id in self.__ignoreBuiltinAssignments[element.id]
+                    ):
+                        # ignore compatibility assignments
+                        continue
                     self.__error(
-                        target.lineno - 1, target.col_offset, "M131", target.id
+                        element.lineno - 1, element.col_offset, "M131", element.id
                     )
-                elif isinstance(target, (ast.Tuple, ast.List)):
-                    for element in target.elts:
+                elif isinstance(element, (ast.Tuple, ast.List)):
+                    for tupleElement in element.elts:
                         if (
-                            isinstance(element, ast.Name)
-                            and element.id in self.__builtins
+                            isinstance(tupleElement, ast.Name)
+                            and tupleElement.id in self.__builtins
                         ):
                             self.__error(
-                                element.lineno - 1,
-                                element.col_offset,
+                                tupleElement.lineno - 1,
+                                tupleElement.col_offset,
                                 "M131",
-                                element.id,
+                                tupleElement.id,
                             )
-            elif any(isinstance(node, functionDef) for functionDef in functionDefs):
-                # (asynchronous) function definition
-                for arg in node.args.args:
-                    if isinstance(arg, ast.arg) and arg.arg in self.__builtins:
-                        self.__error(arg.lineno - 1, arg.col_offset, "M132", arg.arg)
+        elif isinstance(node, ast.For):
+            # for loop
+            target = node.target
+            if isinstance(target, ast.Name) and target.id in self.__builtins:
+                self.__error(target.lineno - 1, target.col_offset, "M131", target.id)
+            elif isinstance(target, (ast.Tuple, ast.List)):
+                for element in target.elts:
+                    if isinstance(element, ast.Name) and element.id in self.__builtins:
+                        self.__error(
+                            element.lineno - 1,
+                            element.col_offset,
+                            "M131",
+                            element.id,
+                        )
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            # (asynchronous) function definition
+            for arg in node.args.args:
+                if isinstance(arg, ast.arg) and arg.arg in self.__builtins:
+                    self.__error(arg.lineno - 1, arg.col_offset, "M132", arg.arg)
 
-    def __checkComprehensions(self):
+    def __checkComprehensions(self, node):
         """
         Private method to check some comprehension related things.
 
         This method is adapted from: flake8-comprehensions v3.15.0
         Original: Copyright (c) 2017 Adam Johnson
-        """
-        compType = {
-            ast.DictComp: "dict",
-            ast.ListComp: "list",
-            ast.SetComp: "set",
-        }
-
-        visitedMapCalls = set()
-
-        for node in ast.walk(self.__tree):
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-                numPositionalArgs = len(node.args)
-                numKeywordArgs = len(node.keywords)
 
-                if (
-                    numPositionalArgs == 1
-                    and isinstance(node.args[0], ast.GeneratorExp)
-                    and node.func.id in ("list", "set")
-                ):
-                    errorCode = {
-                        "list": "M180",
-                        "set": "M181",
-                    }[node.func.id]
-                    self.__error(node.lineno - 1, node.col_offset, errorCode)
+        @param node reference to the node to be checked
+        @type ast.Call, ast.DictComp, ast.ListComp or ast.SetComp
+        """
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            numPositionalArgs = len(node.args)
+            numKeywordArgs = len(node.keywords)
 
-                elif (
-                    numPositionalArgs == 1
-                    and node.func.id == "dict"
-                    and len(node.keywords) == 0
-                    and isinstance(node.args[0], (ast.GeneratorExp, ast.ListComp))
-                    and isinstance(node.args[0].elt, ast.Tuple)
-                    and len(node.args[0].elt.elts) == 2
-                ):
-                    if isinstance(node.args[0], ast.GeneratorExp):
-                        errorCode = "M182"
-                    else:
-                        errorCode = "M184"
-                    self.__error(node.lineno - 1, node.col_offset, errorCode)
+            if (
+                numPositionalArgs == 1
+                and isinstance(node.args[0], ast.GeneratorExp)
+                and node.func.id in ("list", "set")
+            ):
+                errorCode = {
+                    "list": "M180",
+                    "set": "M181",
+                }[node.func.id]
+                self.__error(node.lineno - 1, node.col_offset, errorCode)
 
-                elif (
-                    numPositionalArgs == 1
-                    and isinstance(node.args[0], ast.ListComp)
-                    and node.func.id in ("list", "set", "any", "all")
-                ):
-                    errorCode = {
-                        "list": "M191",
-                        "set": "M183",
-                        "any": "M199",
-                        "all": "M199",
-                    }[node.func.id]
-                    self.__error(
-                        node.lineno - 1, node.col_offset, errorCode, node.func.id
-                    )
+            elif (
+                numPositionalArgs == 1
+                and node.func.id == "dict"
+                and len(node.keywords) == 0
+                and isinstance(node.args[0], (ast.GeneratorExp, ast.ListComp))
+                and isinstance(node.args[0].elt, ast.Tuple)
+                and len(node.args[0].elt.elts) == 2
+            ):
+                if isinstance(node.args[0], ast.GeneratorExp):
+                    errorCode = "M182"
+                else:
+                    errorCode = "M184"
+                self.__error(node.lineno - 1, node.col_offset, errorCode)
 
-                elif numPositionalArgs == 1 and (
-                    isinstance(node.args[0], ast.Tuple)
-                    and node.func.id == "tuple"
-                    or isinstance(node.args[0], ast.List)
-                    and node.func.id == "list"
-                ):
-                    errorCode = {
-                        "tuple": "M189a",
-                        "list": "M190a",
-                    }[node.func.id]
-                    self.__error(
-                        node.lineno - 1,
-                        node.col_offset,
-                        errorCode,
-                        type(node.args[0]).__name__.lower(),
-                        node.func.id,
-                    )
+            elif (
+                numPositionalArgs == 1
+                and isinstance(node.args[0], ast.ListComp)
+                and node.func.id in ("list", "set", "any", "all")
+            ):
+                errorCode = {
+                    "list": "M191",
+                    "set": "M183",
+                    "any": "M199",
+                    "all": "M199",
+                }[node.func.id]
+                self.__error(node.lineno - 1, node.col_offset, errorCode, node.func.id)
+
+            elif numPositionalArgs == 1 and (
+                isinstance(node.args[0], ast.Tuple)
+                and node.func.id == "tuple"
+                or isinstance(node.args[0], ast.List)
+                and node.func.id == "list"
+            ):
+                errorCode = {
+                    "tuple": "M189a",
+                    "list": "M190a",
+                }[node.func.id]
+                self.__error(
+                    node.lineno - 1,
+                    node.col_offset,
+                    errorCode,
+                    type(node.args[0]).__name__.lower(),
+                    node.func.id,
+                )
 
-                elif (
-                    numPositionalArgs == 1
-                    and numKeywordArgs == 0
-                    and isinstance(node.args[0], (ast.Dict, ast.DictComp))
-                    and node.func.id == "dict"
-                ):
-                    if isinstance(node.args[0], ast.Dict):
-                        type_ = "dict"
-                    else:
-                        type_ = "dict comprehension"
-                    self.__error(
-                        node.lineno - 1,
-                        node.col_offset,
-                        "M198",
-                        type_,
-                    )
+            elif (
+                numPositionalArgs == 1
+                and numKeywordArgs == 0
+                and isinstance(node.args[0], (ast.Dict, ast.DictComp))
+                and node.func.id == "dict"
+            ):
+                if isinstance(node.args[0], ast.Dict):
+                    type_ = "dict"
+                else:
+                    type_ = "dict comprehension"
+                self.__error(
+                    node.lineno - 1,
+                    node.col_offset,
+                    "M198",
+                    type_,
+                )
 
-                elif (
-                    numPositionalArgs == 1
-                    and isinstance(node.args[0], (ast.Tuple, ast.List))
-                    and (
-                        node.func.id in ("tuple", "list", "set")
-                        or (
-                            node.func.id == "dict"
-                            and all(
-                                isinstance(elt, ast.Tuple) and len(elt.elts) == 2
-                                for elt in node.args[0].elts
-                            )
+            elif (
+                numPositionalArgs == 1
+                and isinstance(node.args[0], (ast.Tuple, ast.List))
+                and (
+                    node.func.id in ("tuple", "list", "set")
+                    or (
+                        node.func.id == "dict"
+                        and all(
+                            isinstance(elt, ast.Tuple) and len(elt.elts) == 2
+                            for elt in node.args[0].elts
                         )
                     )
-                ):
-                    errorCode = {
-                        "tuple": "M189b",
-                        "list": "M190b",
-                        "set": "M185",
-                        "dict": "M186",
-                    }[node.func.id]
-                    self.__error(
-                        node.lineno - 1,
-                        node.col_offset,
-                        errorCode,
-                        type(node.args[0]).__name__.lower(),
-                        node.func.id,
-                    )
-
-                elif (
-                    numPositionalArgs == 0
-                    and not any(isinstance(a, ast.Starred) for a in node.args)
-                    and not any(k.arg is None for k in node.keywords)
-                    and node.func.id == "dict"
-                ) or (
-                    numPositionalArgs == 0
-                    and numKeywordArgs == 0
-                    and node.func.id in ("tuple", "list")
-                ):
-                    self.__error(node.lineno - 1, node.col_offset, "M188", node.func.id)
+                )
+            ):
+                errorCode = {
+                    "tuple": "M189b",
+                    "list": "M190b",
+                    "set": "M185",
+                    "dict": "M186",
+                }[node.func.id]
+                self.__error(
+                    node.lineno - 1,
+                    node.col_offset,
+                    errorCode,
+                    type(node.args[0]).__name__.lower(),
+                    node.func.id,
+                )
 
-                elif (
-                    node.func.id in {"list", "reversed"}
-                    and numPositionalArgs > 0
-                    and isinstance(node.args[0], ast.Call)
-                    and isinstance(node.args[0].func, ast.Name)
-                    and node.args[0].func.id == "sorted"
-                ):
-                    if node.func.id == "reversed":
-                        reverseFlagValue = False
-                        for kw in node.args[0].keywords:
-                            if kw.arg != "reverse":
-                                continue
-                            reverseFlagValue = (
-                                bool(kw.value.value)
-                                if isinstance(kw.value, ast.Constant)
-                                else None
-                            )
+            elif (
+                numPositionalArgs == 0
+                and not any(isinstance(a, ast.Starred) for a in node.args)
+                and not any(k.arg is None for k in node.keywords)
+                and node.func.id == "dict"
+            ) or (
+                numPositionalArgs == 0
+                and numKeywordArgs == 0
+                and node.func.id in ("tuple", "list")
+            ):
+                self.__error(node.lineno - 1, node.col_offset, "M188", node.func.id)
 
-                        if reverseFlagValue is None:
-                            self.__error(
-                                node.lineno - 1,
-                                node.col_offset,
-                                "M193a",
-                                node.func.id,
-                                node.args[0].func.id,
-                            )
-                        else:
-                            self.__error(
-                                node.lineno - 1,
-                                node.col_offset,
-                                "M193b",
-                                node.func.id,
-                                node.args[0].func.id,
-                                not reverseFlagValue,
-                            )
+            elif (
+                node.func.id in {"list", "reversed"}
+                and numPositionalArgs > 0
+                and isinstance(node.args[0], ast.Call)
+                and isinstance(node.args[0].func, ast.Name)
+                and node.args[0].func.id == "sorted"
+            ):
+                if node.func.id == "reversed":
+                    reverseFlagValue = False
+                    for kw in node.args[0].keywords:
+                        if kw.arg != "reverse":
+                            continue
+                        reverseFlagValue = (
+                            bool(kw.value.value)
+                            if isinstance(kw.value, ast.Constant)
+                            else None
+                        )
 
+                    if reverseFlagValue is None:
+                        self.__error(
+                            node.lineno - 1,
+                            node.col_offset,
+                            "M193a",
+                            node.func.id,
+                            node.args[0].func.id,
+                        )
                     else:
                         self.__error(
                             node.lineno - 1,
                             node.col_offset,
-                            "M193c",
+                            "M193b",
                             node.func.id,
                             node.args[0].func.id,
+                            not reverseFlagValue,
                         )
 
-                elif (
-                    numPositionalArgs > 0
-                    and isinstance(node.args[0], ast.Call)
-                    and isinstance(node.args[0].func, ast.Name)
-                    and (
-                        (
-                            node.func.id in {"set", "sorted"}
-                            and node.args[0].func.id
-                            in {"list", "reversed", "sorted", "tuple"}
-                        )
-                        or (
-                            node.func.id in {"list", "tuple"}
-                            and node.args[0].func.id in {"list", "tuple"}
-                        )
-                        or (node.func.id == "set" and node.args[0].func.id == "set")
-                    )
-                ):
+                else:
                     self.__error(
                         node.lineno - 1,
                         node.col_offset,
-                        "M194",
-                        node.args[0].func.id,
+                        "M193c",
                         node.func.id,
+                        node.args[0].func.id,
                     )
 
-                elif (
-                    node.func.id in {"reversed", "set", "sorted"}
-                    and numPositionalArgs > 0
-                    and isinstance(node.args[0], ast.Subscript)
-                    and isinstance(node.args[0].slice, ast.Slice)
-                    and node.args[0].slice.lower is None
-                    and node.args[0].slice.upper is None
-                    and isinstance(node.args[0].slice.step, ast.UnaryOp)
-                    and isinstance(node.args[0].slice.step.op, ast.USub)
-                    and isinstance(node.args[0].slice.step.operand, ast.Constant)
-                    and node.args[0].slice.step.operand.n == 1
-                ):
-                    self.__error(node.lineno - 1, node.col_offset, "M195", node.func.id)
-
-                elif (
-                    node.func.id == "map"
-                    and node not in visitedMapCalls
-                    and len(node.args) == 2
-                    and isinstance(node.args[0], ast.Lambda)
-                ):
-                    self.__error(
-                        node.lineno - 1, node.col_offset, "M197", "generator expression"
+            elif (
+                numPositionalArgs > 0
+                and isinstance(node.args[0], ast.Call)
+                and isinstance(node.args[0].func, ast.Name)
+                and (
+                    (
+                        node.func.id in {"set", "sorted"}
+                        and node.args[0].func.id
+                        in {"list", "reversed", "sorted", "tuple"}
+                    )
+                    or (
+                        node.func.id in {"list", "tuple"}
+                        and node.args[0].func.id in {"list", "tuple"}
                     )
+                    or (node.func.id == "set" and node.args[0].func.id == "set")
+                )
+            ):
+                self.__error(
+                    node.lineno - 1,
+                    node.col_offset,
+                    "M194",
+                    node.args[0].func.id,
+                    node.func.id,
+                )
 
-                elif (
-                    node.func.id in ("list", "set", "dict")
-                    and len(node.args) == 1
-                    and isinstance(node.args[0], ast.Call)
-                    and isinstance(node.args[0].func, ast.Name)
-                    and node.args[0].func.id == "map"
-                    and len(node.args[0].args) == 2
-                    and isinstance(node.args[0].args[0], ast.Lambda)
-                ):
-                    # To avoid raising M197 on the map() call inside the list/set/dict.
-                    mapCall = node.args[0]
-                    visitedMapCalls.add(mapCall)
-
-                    rewriteable = True
-                    if node.func.id == "dict":
-                        # For the generator expression to be rewriteable as a
-                        # dict comprehension, its lambda must return a 2-tuple.
-                        lambdaNode = node.args[0].args[0]
-                        if (
-                            not isinstance(lambdaNode.body, (ast.List, ast.Tuple))
-                            or len(lambdaNode.body.elts) != 2
-                        ):
-                            rewriteable = False
+            elif (
+                node.func.id in {"reversed", "set", "sorted"}
+                and numPositionalArgs > 0
+                and isinstance(node.args[0], ast.Subscript)
+                and isinstance(node.args[0].slice, ast.Slice)
+                and node.args[0].slice.lower is None
+                and node.args[0].slice.upper is None
+                and isinstance(node.args[0].slice.step, ast.UnaryOp)
+                and isinstance(node.args[0].slice.step.op, ast.USub)
+                and isinstance(node.args[0].slice.step.operand, ast.Constant)
+                and node.args[0].slice.step.operand.n == 1
+            ):
+                self.__error(node.lineno - 1, node.col_offset, "M195", node.func.id)
 
-                    if rewriteable:
-                        comprehensionType = f"{node.func.id} comprehension"
-                        self.__error(
-                            node.lineno - 1, node.col_offset, "M197", comprehensionType
-                        )
+            elif (
+                node.func.id == "map"
+                and node not in self.__visitedMapCalls
+                and len(node.args) == 2
+                and isinstance(node.args[0], ast.Lambda)
+            ):
+                self.__error(
+                    node.lineno - 1, node.col_offset, "M197", "generator expression"
+                )
 
-            elif isinstance(node, (ast.DictComp, ast.ListComp, ast.SetComp)) and (
-                len(node.generators) == 1
-                and not node.generators[0].ifs
-                and not node.generators[0].is_async
+            elif (
+                node.func.id in ("list", "set", "dict")
+                and len(node.args) == 1
+                and isinstance(node.args[0], ast.Call)
+                and isinstance(node.args[0].func, ast.Name)
+                and node.args[0].func.id == "map"
+                and len(node.args[0].args) == 2
+                and isinstance(node.args[0].args[0], ast.Lambda)
             ):
-                if (
-                    isinstance(node, (ast.ListComp, ast.SetComp))
-                    and isinstance(node.elt, ast.Name)
-                    and isinstance(node.generators[0].target, ast.Name)
-                    and node.elt.id == node.generators[0].target.id
-                ) or (
-                    isinstance(node, ast.DictComp)
-                    and isinstance(node.key, ast.Name)
-                    and isinstance(node.value, ast.Name)
-                    and isinstance(node.generators[0].target, ast.Tuple)
-                    and len(node.generators[0].target.elts) == 2
-                    and isinstance(node.generators[0].target.elts[0], ast.Name)
-                    and node.generators[0].target.elts[0].id == node.key.id
-                    and isinstance(node.generators[0].target.elts[1], ast.Name)
-                    and node.generators[0].target.elts[1].id == node.value.id
-                ):
-                    self.__error(
-                        node.lineno - 1,
-                        node.col_offset,
-                        "M196",
-                        compType[node.__class__],
-                    )
+                # To avoid raising M197 on the map() call inside the list/set/dict.
+                mapCall = node.args[0]
+                self.__visitedMapCalls.add(mapCall)
+
+                rewriteable = True
+                if node.func.id == "dict":
+                    # For the generator expression to be rewriteable as a
+                    # dict comprehension, its lambda must return a 2-tuple.
+                    lambdaNode = node.args[0].args[0]
+                    if (
+                        not isinstance(lambdaNode.body, (ast.List, ast.Tuple))
+                        or len(lambdaNode.body.elts) != 2
+                    ):
+                        rewriteable = False
 
-                elif (
-                    isinstance(node, ast.DictComp)
-                    and isinstance(node.key, ast.Name)
-                    and isinstance(node.value, ast.Constant)
-                    and isinstance(node.generators[0].target, ast.Name)
-                    and node.key.id == node.generators[0].target.id
-                ):
+                if rewriteable:
+                    comprehensionType = f"{node.func.id} comprehension"
                     self.__error(
-                        node.lineno - 1,
-                        node.col_offset,
-                        "M200",
-                        compType[node.__class__],
+                        node.lineno - 1, node.col_offset, "M197", comprehensionType
                     )
 
+        elif isinstance(node, (ast.DictComp, ast.ListComp, ast.SetComp)) and (
+            len(node.generators) == 1
+            and not node.generators[0].ifs
+            and not node.generators[0].is_async
+        ):
+            if (
+                isinstance(node, (ast.ListComp, ast.SetComp))
+                and isinstance(node.elt, ast.Name)
+                and isinstance(node.generators[0].target, ast.Name)
+                and node.elt.id == node.generators[0].target.id
+            ) or (
+                isinstance(node, ast.DictComp)
+                and isinstance(node.key, ast.Name)
+                and isinstance(node.value, ast.Name)
+                and isinstance(node.generators[0].target, ast.Tuple)
+                and len(node.generators[0].target.elts) == 2
+                and isinstance(node.generators[0].target.elts[0], ast.Name)
+                and node.generators[0].target.elts[0].id == node.key.id
+                and isinstance(node.generators[0].target.elts[1], ast.Name)
+                and node.generators[0].target.elts[1].id == node.value.id
+            ):
+                self.__error(
+                    node.lineno - 1,
+                    node.col_offset,
+                    "M196",
+                    MiscellaneousChecker.ComprehensionTypes[node.__class__],
+                )
+
+            elif (
+                isinstance(node, ast.DictComp)
+                and isinstance(node.key, ast.Name)
+                and isinstance(node.value, ast.Constant)
+                and isinstance(node.generators[0].target, ast.Name)
+                and node.key.id == node.generators[0].target.id
+            ):
+                self.__error(
+                    node.lineno - 1,
+                    node.col_offset,
+                    "M200",
+                    MiscellaneousChecker.ComprehensionTypes[node.__class__],
+                )
+
     def __dictShouldBeChecked(self, node):
         """
         Private function to test, if the node should be checked.
@@ -1244,33 +1298,35 @@ class MiscellaneousChecker:
         lineNumbers = [key.lineno for key in node.keys]
         return len(lineNumbers) == len(set(lineNumbers))
 
-    def __checkDictWithSortedKeys(self):
+    def __checkDictWithSortedKeys(self, node):
         """
         Private method to check, if dictionary keys appear in sorted order.
+
+        @param node reference to the node to be checked
+        @type ast.Dict
         """
-        for node in ast.walk(self.__tree):
-            if isinstance(node, ast.Dict) and self.__dictShouldBeChecked(node):
-                for key1, key2 in zip(node.keys, node.keys[1:]):
-                    if key2.value < key1.value:
-                        self.__error(
-                            key2.lineno - 1,
-                            key2.col_offset,
-                            "M251",
-                            key2.value,
-                            key1.value,
-                        )
+        if isinstance(node, ast.Dict) and self.__dictShouldBeChecked(node):
+            for key1, key2 in zip(node.keys, node.keys[1:]):
+                if key2.value < key1.value:
+                    self.__error(
+                        key2.lineno - 1,
+                        key2.col_offset,
+                        "M251",
+                        key2.value,
+                        key1.value,
+                    )
 
-    def __checkGettext(self):
+    def __checkGettext(self, node):
         """
         Private method to check the 'gettext' import statement.
+
+        @param node reference to the node to be checked
+        @type ast.ImportFrom
         """
-        for node in ast.walk(self.__tree):
-            if isinstance(node, ast.ImportFrom) and any(
-                name.asname == "_" for name in node.names
-            ):
-                self.__error(
-                    node.lineno - 1, node.col_offset, "M711", node.names[0].name
-                )
+        if isinstance(node, ast.ImportFrom) and any(
+            name.asname == "_" for name in node.names
+        ):
+            self.__error(node.lineno - 1, node.col_offset, "M711", node.names[0].name)
 
     def __checkBugBear(self):
         """
@@ -1295,119 +1351,141 @@ class MiscellaneousChecker:
             reason = violation[1]
             self.__error(node.lineno - 1, node.col_offset, reason)
 
-    def __checkDateTime(self):
+    def __checkDateTime(self, dispatcher):
         """
         Private method to check use of naive datetime functions.
+
+        @param dispatcher reference to the AST dispatcher
+        @type AstDispatcher
         """
-        # step 1: generate an augmented node tree containing parent info
-        #         for each child node
-        tree = copy.deepcopy(self.__tree)
-        for node in ast.walk(tree):
-            for childNode in ast.iter_child_nodes(node):
-                childNode._dtCheckerParent = node
+        # step 1: augment the nodes with parent info for each child node
+        dispatcher.registerAnnotator(self.__addDateTimeParent)
 
         # step 2: perform checks and report issues
         visitor = DateTimeVisitor()
-        visitor.visit(tree)
-        for violation in visitor.violations:
-            node = violation[0]
-            reason = violation[1]
-            self.__error(node.lineno - 1, node.col_offset, reason)
+        dispatcher.registerNodeVisitor(visitor)
+        dispatcher.registerFinalizer(lambda: self.__reportViolations(visitor))
 
-    def __checkSysVersion(self):
+    def __addDateTimeParent(self, node, children):
+        """
+        Private method to add a reference to the parent node to the child
+        nodes.
+
+        @param node reference to the parent node
+        @type ast.AST
+        @param children list of child nodes
+        @type list of ast.AST
+        """
+        for childNode in children:
+            childNode._dtCheckerParent = node
+
+    def __checkSysVersion(self, dispatcher):
         """
         Private method to check the use of sys.version and sys.version_info.
+
+        @param dispatcher reference to the AST dispatcher
+        @type AstDispatcher
         """
         visitor = SysVersionVisitor()
-        visitor.visit(self.__tree)
+        dispatcher.registerNodeVisitor(visitor)
+        dispatcher.registerFinalizer(lambda: self.__reportViolations(visitor))
+
+    def __reportViolations(self, visitor):
+        """
+        Private method to report the violations collected by a node visitor.
+
+        @param visitor reference to the node visitor fed by the AST dispatcher
+        @type DateTimeVisitor or SysVersionVisitor
+        """
         for violation in visitor.violations:
             node = violation[0]
             reason = violation[1]
             self.__error(node.lineno - 1, node.col_offset, reason)
 
-    def __checkProperties(self):
+    def __checkProperties(self, node):
         """
         Private method to check for issue with property related methods.
-        """
-        properties = []
-        for node in ast.walk(self.__tree):
-            if isinstance(node, ast.ClassDef):
-                properties.clear()
-
-            elif isinstance(node, ast.FunctionDef):
-                propertyCount = 0
-                for decorator in node.decorator_list:
-                    # property getter method
-                    if isinstance(decorator, ast.Name) and decorator.id == "property":
+
+        @param node reference to the node to be checked
+        @type ast.ClassDef or ast.FunctionDef
+        """
+        if isinstance(node, ast.ClassDef):
+            self.__properties.clear()
+
+        elif isinstance(node, ast.FunctionDef):
+            propertyCount = 0
+            for decorator in node.decorator_list:
+                # property getter method
+                if isinstance(decorator, ast.Name) and decorator.id == "property":
+                    propertyCount += 1
+                    self.__properties.append(node.name)
+                    if len(node.args.args) != 1:
+                        self.__error(
+                            node.lineno - 1,
+                            node.col_offset,
+                            "M260",
+                            len(node.args.args),
+                        )
+
+                if isinstance(decorator, ast.Attribute):
+                    # property setter method
+                    if decorator.attr == "setter":
                         propertyCount += 1
-                        properties.append(node.name)
-                        if len(node.args.args) != 1:
+                        if node.name != decorator.value.id:
+                            if node.name in self.__properties:
+                                self.__error(
+                                    node.lineno - 1,
+                                    node.col_offset,
+                                    "M265",
+                                    node.name,
+                                    decorator.value.id,
+                                )
+                            else:
+                                self.__error(
+                                    node.lineno - 1,
+                                    node.col_offset,
+                                    "M263",
+                                    decorator.value.id,
+                                    node.name,
+                                )
+                        if len(node.args.args) != 2:
                             self.__error(
                                 node.lineno - 1,
                                 node.col_offset,
-                                "M260",
+                                "M261",
                                 len(node.args.args),
                             )
 
-                    if isinstance(decorator, ast.Attribute):
-                        # property setter method
-                        if decorator.attr == "setter":
-                            propertyCount += 1
-                            if node.name != decorator.value.id:
-                                if node.name in properties:
-                                    self.__error(
-                                        node.lineno - 1,
-                                        node.col_offset,
-                                        "M265",
-                                        node.name,
-                                        decorator.value.id,
-                                    )
-                                else:
-                                    self.__error(
-                                        node.lineno - 1,
-                                        node.col_offset,
-                                        "M263",
-                                        decorator.value.id,
-                                        node.name,
-                                    )
-                            if len(node.args.args) != 2:
+                    # property deleter method
+                    if decorator.attr == "deleter":
+                        propertyCount += 1
+                        if node.name != decorator.value.id:
+                            if node.name in self.__properties:
                                 self.__error(
                                     node.lineno - 1,
                                     node.col_offset,
-                                    "M261",
-                                    len(node.args.args),
+                                    "M266",
+                                    node.name,
+                                    decorator.value.id,
                                 )
-
-                        # property deleter method
-                        if decorator.attr == "deleter":
-                            propertyCount += 1
-                            if node.name != decorator.value.id:
-                                if node.name in properties:
-                                    self.__error(
-                                        node.lineno - 1,
-                                        node.col_offset,
-                                        "M266",
-                                        node.name,
-                                        decorator.value.id,
-                                    )
-                                else:
-                                    self.__error(
-                                        node.lineno - 1,
-                                        node.col_offset,
-                                        "M264",
-                                        decorator.value.id,
-                                        node.name,
-                                    )
-                            if len(node.args.args) != 1:
+                            else:
                                 self.__error(
                                     node.lineno - 1,
                                     node.col_offset,
-                                    "M262",
-                                    len(node.args.args),
+                                    "M264",
+                                    decorator.value.id,
+                                    node.name,
                                 )
+                        if len(node.args.args) != 1:
+                            self.__error(
+                                node.lineno - 1,
+                                node.col_offset,
+                                "M262",
+                                len(node.args.args),
+                            )
 
-                if propertyCount > 1:
-                    self.__error(node.lineno - 1, node.col_offset, "M267", node.name)
+            if propertyCount > 1:
+                self.__error(node.lineno - 1, node.col_offset, "M267", node.name)
 
     #######################################################################
     ## The following methods check for implicitly concatenated strings.
@@ -1484,21 +1562,22 @@ class MiscellaneousChecker:
                     a.end[0] - 1, a.end[1], "M851" if a.end[0] == b.start[0] else "M852"
                 )
 
-    def __checkExplicitStringConcat(self):
+    def __checkExplicitStringConcat(self, node):
         """
         Private method to check for explicitly concatenated strings.
+
+        @param node reference to the node to be checked
+        @type ast.BinOp
         """
-        for node in ast.walk(self.__tree):
-            if (
-                isinstance(node, ast.BinOp)
-                and isinstance(node.op, ast.Add)
-                and all(
-                    AstUtilities.isBaseString(operand)
-                    or isinstance(operand, ast.JoinedStr)
-                    for operand in (node.left, node.right)
-                )
-            ):
-                self.__error(node.lineno - 1, node.col_offset, "M853")
+        if (
+            isinstance(node, ast.BinOp)
+            and isinstance(node.op, ast.Add)
+            and all(
+                AstUtilities.isBaseString(operand) or isinstance(operand, ast.JoinedStr)
+                for operand in (node.left, node.right)
+            )
+        ):
+            self.__error(node.lineno - 1, node.col_offset, "M853")
 
 
 class TextVisitor(ast.NodeVisitor):
@@ -3937,19 +4016,18 @@ class ReturnVisitor(ast.NodeVisitor):
         return False
 
 
-class DateTimeVisitor(ast.NodeVisitor):
+class DateTimeVisitor:
     """
     Class implementing a node visitor to check datetime function calls.
 
     Note: This class is modeled after flake8_datetimez checker.
+    The nodes are handed to the visitor by the AST dispatcher.
     """
 
     def __init__(self):
         """
         Constructor
         """
-        super().__init__()
-
         self.violations = []
 
     def __getFromKeywords(self, keywords, name):
@@ -4136,23 +4214,20 @@ class DateTimeVisitor(ast.NodeVisitor):
             elif node.func.attr == "fromisoformat":
                 self.violations.append((node, "M315"))
 
-        self.generic_visit(node)
 
-
-class SysVersionVisitor(ast.NodeVisitor):
+class SysVersionVisitor:
     """
     Class implementing a node visitor to check the use of sys.version and
     sys.version_info.
 
     Note: This class is modeled after flake8-2020 checker.
+    The nodes are handed to the visitor by the AST dispatcher.
     """
 
     def __init__(self):
         """
         Constructor
         """
-        super().__init__()
-
         self.violations = []
         self.__fromImports = {}
 
@@ -4167,8 +4242,6 @@ class SysVersionVisitor(ast.NodeVisitor):
             if node.module is not None and not alias.asname:
                 self.__fromImports[alias.name] = node.module
 
-        self.generic_visit(node)
-
     def __isSys(self, attr, node):
         """
         Private method to check for a reference to sys attribute.
@@ -4241,8 +4314,6 @@ class SysVersionVisitor(ast.NodeVisitor):
         ):
             self.violations.append((node.value, "M421"))
 
-        self.generic_visit(node)
-
     def visit_Compare(self, node):
         """
         Public method to handle a comparison.
@@ -4294,8 +4365,6 @@ class SysVersionVisitor(ast.NodeVisitor):
         ):
             self.violations.append((node, "M414"))
 
-        self.generic_visit(node)
-
     def visit_Attribute(self, node):
         """
         Public method to handle an attribute.
@@ -4310,8 +4379,6 @@ class SysVersionVisitor(ast.NodeVisitor):
         ):
             self.violations.append((node, "M412"))
 
-        self.generic_visit(node)
-
     def visit_Name(self, node):
         """
         Public method to handle an name.
@@ -4322,8 +4389,6 @@ class SysVersionVisitor(ast.NodeVisitor):
         if node.id == "PY3" and self.__fromImports.get(node.id) == "six":
             self.violations.append((node, "M412"))
 
-        self.generic_visit(node)
-
 
 #
 # eflag: noqa = M891
@@ -8,9 +8,10 @@ Module implementing a checker for import statements.
 """
 
 import ast
-import copy
 import re
 
+from AstDispatcher import AstDispatcher
+
 
 class NameOrderChecker:
     """
@@ -29,7 +30,18 @@ class NameOrderChecker:
         "NO105",
     ]
 
-    def __init__(self, source, filename, tree, select, ignore, expected, repeat, args):
+    def __init__(
+        self,
+        source,
+        filename,
+        tree,
+        select,
+        ignore,
+        expected,
+        repeat,
+        args,
+        dispatcher=None,
+    ):
         """
         Constructor
 
@@ -49,6 +61,8 @@ class NameOrderChecker:
         @type bool
         @param args dictionary of arguments for the various checks
         @type dict
+        @param dispatcher reference to a shared AST dispatcher (defaults to None)
+        @type AstDispatcher (optional)
         """
         self.__select = tuple(select)
         self.__ignore = ("",) if select else tuple(ignore)
@@ -56,8 +70,12 @@ class NameOrderChecker:
         self.__repeat = repeat
         self.__filename = filename
         self.__source = source[:]
-        self.__tree = copy.deepcopy(tree)
+        self.__tree = tree
         self.__args = args
+        self.__dispatcher = dispatcher
+
+        # exception type lists collected by the AST dispatcher
+        self.__exceptionListNodes = []
 
         # parameters for import sorting
         if args["SortOrder"] == "native":
@@ -143,8 +161,18 @@ class NameOrderChecker:
             # don't do anything, if no codes were selected
             return
 
+        # The checks are registered with the AST dispatcher. A shared
+        # dispatcher is run by the caller after all checkers have registered
+        # their callbacks.
+        dispatcher = (
+            AstDispatcher(self.__tree)
+            if self.__dispatcher is None
+            else self.__dispatcher
+        )
         for check in self.__checkers:
-            check()
+            check(dispatcher)
+        if self.__dispatcher is None:
+            dispatcher.run()
 
     #######################################################################
     ## Name Order
@@ -152,15 +180,27 @@ class NameOrderChecker:
     ## adapted from: flake8-alphabetize v0.0.21
     #######################################################################
 
-    def __checkNameOrder(self):
+    def __checkNameOrder(self, dispatcher):
         """
         Private method to check the order of import statements and handled exceptions.
+
+        @param dispatcher reference to the AST dispatcher
+        @type AstDispatcher
+        """
+        dispatcher.register(ast.ExceptHandler, self.__collectExceptionListNode)
+        dispatcher.registerFinalizer(self.__reportNameOrder)
+
+    def __reportNameOrder(self):
+        """
+        Private method to report the order of import statements and handled
+        exceptions after the exception handlers have been collected.
         """
         from .ImportNode import ImportNode
 
         errors = []
         imports = []
-        importNodes, aListNode, eListNodes = self.__findNodes(self.__tree)
+        importNodes, aListNode = self.__findNodes(self.__tree)
+        eListNodes = self.__exceptionListNodes
 
         # check for an error in '__all__'
         allError = self.__findErrorInAll(aListNode)
@@ -212,24 +252,17 @@ class NameOrderChecker:
                 args = error[2:]
                 self.__error(node.lineno - 1, node.col_offset, reason, *args)
 
-    def __findExceptionListNodes(self, tree):
+    def __collectExceptionListNode(self, node):
         """
-        Private method to find all exception types handled by given tree.
+        Private method to collect the exception types handled by an exception
+        handler.
 
-        @param tree reference to the ast node tree to be parsed
-        @type ast.AST
-        @return list of exception types
-        @rtype list of ast.Name
+        @param node reference to the exception handler node
+        @type ast.ExceptHandler
         """
-        nodes = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ExceptHandler):
-                nodeType = node.type
-                if isinstance(nodeType, (ast.List, ast.Tuple)):
-                    nodes.append(nodeType)
-
-        return nodes
+        nodeType = node.type
+        if isinstance(nodeType, (ast.List, ast.Tuple)):
+            self.__exceptionListNodes.append(nodeType)
 
     def __findNodes(self, tree):
         """
@@ -238,14 +271,11 @@ class NameOrderChecker:
 
         @param tree reference to the ast node tree to be parsed
         @type ast.AST
-        @return tuple containing a list of import nodes, the '__all__' node and
-            exception nodes
-        @rtype tuple of (ast.Import | ast.ImportFrom, ast.List | ast.Tuple,
-            ast.List | ast.Tuple)
+        @return tuple containing a list of import nodes and the '__all__' node
+        @rtype tuple of (ast.Import | ast.ImportFrom, ast.List | ast.Tuple)
         """
         importNodes = []
         aListNode = None
-        eListNodes = self.__findExceptionListNodes(tree)
 
         if isinstance(tree, ast.Module):
             body = tree.body
@@ -262,7 +292,7 @@ class NameOrderChecker:
                             if isinstance(value, (ast.List, ast.Tuple)):
                                 aListNode = value
 
-        return importNodes, aListNode, eListNodes
+        return importNodes, aListNode
 
     def __findErrorInAll(self, node):
         """
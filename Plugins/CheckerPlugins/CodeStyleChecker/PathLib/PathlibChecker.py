@@ -34,7 +34,8 @@ the pathlib module.
 
 import ast
 import contextlib
-import copy
+
+from AstDispatcher import AstDispatcher
 
 
 class PathlibChecker:
@@ -112,7 +113,17 @@ class PathlibChecker:
         "py.path.local": "P401",
     }
 
-    def __init__(self, source, filename, tree, selected, ignored, expected, repeat):
+    def __init__(
+        self,
+        source,
+        filename,
+        tree,
+        selected,
+        ignored,
+        expected,
+        repeat,
+        dispatcher=None,
+    ):
         """
         Constructor
 
@@ -130,6 +141,8 @@ class PathlibChecker:
         @type list of str
         @param repeat flag indicating to report each occurrence of a code
         @type bool
+        @param dispatcher reference to a shared AST dispatcher (defaults to None)
+        @type AstDispatcher (optional)
         """
         self.__select = tuple(selected)
         self.__ignore = ("",) if selected else tuple(ignored)
@@ -137,7 +150,8 @@ class PathlibChecker:
         self.__repeat = repeat
         self.__filename = filename
         self.__source = source[:]
-        self.__tree = copy.deepcopy(tree)
+        self.__tree = tree
+        self.__dispatcher = dispatcher
 
         # statistics counters
         self.counters = {}
@@ -208,8 +222,17 @@ class PathlibChecker:
             # don't do anything, if no codes were selected
             return
 
-        visitor = PathlibVisitor(self.__checkForReplacement)
-        visitor.visit(self.__tree)
+        # The visitor is registered with the AST dispatcher. A shared
+        # dispatcher is run by the caller after all checkers have registered
+        # their callbacks.
+        dispatcher = (
+            AstDispatcher(self.__tree)
+            if self.__dispatcher is None
+            else self.__dispatcher
+        )
+        dispatcher.registerNodeVisitor(PathlibVisitor(self.__checkForReplacement))
+        if self.__dispatcher is None:
+            dispatcher.run()
 
     def __checkForReplacement(self, node, name):
         """
@@ -226,9 +249,12 @@ class PathlibChecker:
             self.__error(node.lineno - 1, node.col_offset, errorCode)
 
 
-class PathlibVisitor(ast.NodeVisitor):
+class PathlibVisitor:
     """
     Class to traverse the AST node tree and check for potential issues.
+
+    Note: The visit methods are called by the AST dispatcher, which descends
+    into the child nodes. Calls nested in another call are not checked.
     """
 
     def __init__(self, checkCallback):
@@ -239,10 +265,9 @@ class PathlibVisitor(ast.NodeVisitor):
             AST node and the resolved name
         @type func
         """
-        super().__init__()
-
         self.__checkCallback = checkCallback
         self.__importAlias = {}
+        self.__callDepth = 0
 
     def visit_ImportFrom(self, node):
         """
@@ -275,10 +300,22 @@ class PathlibVisitor(ast.NodeVisitor):
         @param node reference to the Call AST node
         @type ast.Call
         """
-        nameResolver = NameResolver(self.__importAlias)
-        nameResolver.visit(node.func)
+        if self.__callDepth == 0:
+            nameResolver = NameResolver(self.__importAlias)
+            nameResolver.visit(node.func)
+
+            self.__checkCallback(node, nameResolver.name())
+
+        self.__callDepth += 1
+
+    def leave_Call(self, node):  # noqa: U100
+        """
+        Public method to handle the end of a Call AST node.
 
-        self.__checkCallback(node, nameResolver.name())
+        @param node reference to the Call AST node
+        @type ast.Call
+        """
+        self.__callDepth -= 1
 
 
 class NameResolver(ast.NodeVisitor):
@@ -265,7 +265,8 @@ def checkStartProcessWithPartialPath(reportError, context, config):
     @param config dictionary with configuration data
     @type dict
     """
-    functionNames = (
+    # copy the list because the other function names are added to it
+    functionNames = list(
         config["shell_injection_subprocess"]
         if config and "shell_injection_subprocess" in config
         else SecurityDefaults["shell_injection_subprocess"]
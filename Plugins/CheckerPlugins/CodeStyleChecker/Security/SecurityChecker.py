@@ -8,7 +8,8 @@ Module implementing the security checker.
 """
 
 import collections
-import copy
+
+from AstDispatcher import AstDispatcher
 
 from . import Checks
 from .SecurityNodeVisitor import SecurityNodeVisitor
@@ -120,7 +121,18 @@ class SecurityChecker:
         "S802",
     ]
 
-    def __init__(self, source, filename, tree, select, ignore, expected, repeat, args):
+    def __init__(
+        self,
+        source,
+        filename,
+        tree,
+        select,
+        ignore,
+        expected,
+        repeat,
+        args,
+        dispatcher=None,
+    ):
         """
         Constructor
 
@@ -140,6 +152,8 @@ class SecurityChecker:
         @type bool
         @param args dictionary of arguments for the security checks
         @type dict
+        @param dispatcher reference to a shared AST dispatcher (defaults to None)
+        @type AstDispatcher (optional)
         """
         self.__select = tuple(select)
         self.__ignore = ("",) if select else tuple(ignore)
@@ -147,8 +161,9 @@ class SecurityChecker:
         self.__repeat = repeat
         self.__filename = filename
         self.__source = source[:]
-        self.__tree = copy.deepcopy(tree)
+        self.__tree = tree
         self.__args = args
+        self.__dispatcher = dispatcher
 
         # statistics counters
         self.counters = {}
@@ -242,8 +257,18 @@ class SecurityChecker:
             # don't do anything, if no codes were selected
             return
 
+        # The node visitor is registered with the AST dispatcher. A shared
+        # dispatcher is run by the caller after all checkers have registered
+        # their callbacks.
+        dispatcher = (
+            AstDispatcher(self.__tree)
+            if self.__dispatcher is None
+            else self.__dispatcher
+        )
         securityNodeVisitor = SecurityNodeVisitor(
             self, self.__checkers, self.__filename, self.__source
         )
-        securityNodeVisitor.generic_visit(self.__tree)
-        securityNodeVisitor.checkFile()
+        securityNodeVisitor.register(dispatcher)
+        dispatcher.registerFinalizer(securityNodeVisitor.checkFile)
+        if self.__dispatcher is None:
+            dispatcher.run()
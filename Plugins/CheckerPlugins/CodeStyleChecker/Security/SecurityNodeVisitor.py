@@ -16,6 +16,8 @@ from .SecurityContext import SecurityContext
 class SecurityNodeVisitor:
     """
     Class implementing an AST node visitor for security checks.
+
+    Note: The nodes are handed to the visitor by the AST dispatcher.
     """
 
     def __init__(self, checker, secCheckers, filename, fileData):
@@ -257,13 +259,29 @@ class SecurityNodeVisitor:
         if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
             self.namespace = SecurityUtils.namespacePathSplit(self.namespace)[0]
 
-    def generic_visit(self, node):
+    def register(self, dispatcher):
         """
-        Public method to drive the node visitor.
+        Public method to register the visitor with an AST dispatcher.
 
-        @param node node to be inspected
+        @param dispatcher reference to the AST dispatcher
+        @type AstDispatcher
+        """
+        dispatcher.registerAnnotator(self.__addParentAndSibling)
+        dispatcher.registerVisitor(ast.AST, self.__enterNode, self.__leaveNode)
+
+    def __addParentAndSibling(self, node, children):
+        """
+        Private method to add the parent and the next sibling to the child
+        nodes of a node.
+
+        @param node reference to the node
         @type ast.AST
+        @param children list of child nodes
+        @type list of ast.AST
         """
+        if not children:
+            return
+
         for _, value in ast.iter_fields(node):
             if isinstance(value, list):
                 maxIndex = len(value) - 1
@@ -275,18 +293,31 @@ class SecurityNodeVisitor:
                             item._securitySibling = None
                         item._securityParent = node
 
-                        if self.__preVisit(item):
-                            self.visit(item)
-                            self.generic_visit(item)
-                            self.__postVisit(item)
-
             elif isinstance(value, ast.AST):
                 value._securitySibling = None
                 value._securityParent = node
-                if self.__preVisit(value):
-                    self.visit(value)
-                    self.generic_visit(value)
-                    self.__postVisit(value)
+
+    def __enterNode(self, node):
+        """
+        Private method to inspect a node before its child nodes are visited.
+
+        @param node node to be inspected
+        @type ast.AST
+        """
+        # the module node itself is not inspected
+        if not isinstance(node, ast.mod) and self.__preVisit(node):
+            self.visit(node)
+
+    def __leaveNode(self, node):
+        """
+        Private method to clean up after the child nodes of a node were
+        visited.
+
+        @param node node that was visited
+        @type ast.AST
+        """
+        if not isinstance(node, ast.mod):
+            self.__postVisit(node)
 
     def checkFile(self):
         """
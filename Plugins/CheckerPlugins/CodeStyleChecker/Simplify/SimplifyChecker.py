@@ -7,8 +7,7 @@
 Module implementing the checker for simplifying Python code.
 """
 
-import ast
-import copy
+from AstDispatcher import AstDispatcher
 
 from .SimplifyNodeVisitor import SimplifyNodeVisitor
 
@@ -78,7 +77,17 @@ class SimplifyChecker:
         "Y911",
     ]
 
-    def __init__(self, source, filename, tree, selected, ignored, expected, repeat):
+    def __init__(
+        self,
+        source,
+        filename,
+        tree,
+        selected,
+        ignored,
+        expected,
+        repeat,
+        dispatcher=None,
+    ):
         """
         Constructor
 
@@ -96,6 +105,8 @@ class SimplifyChecker:
         @type list of str
         @param repeat flag indicating to report each occurrence of a code
         @type bool
+        @param dispatcher reference to a shared AST dispatcher (defaults to None)
+        @type AstDispatcher (optional)
         """
         self.__select = tuple(selected)
         self.__ignore = ("",) if selected else tuple(ignored)
@@ -103,7 +114,8 @@ class SimplifyChecker:
         self.__repeat = repeat
         self.__filename = filename
         self.__source = source[:]
-        self.__tree = copy.deepcopy(tree)
+        self.__tree = tree
+        self.__dispatcher = dispatcher
 
         # statistics counters
         self.counters = {}
@@ -176,31 +188,35 @@ class SimplifyChecker:
             # don't do anything, if no codes were selected
             return
 
-        # Add parent information
-        self.__addMeta(self.__tree)
-
-        visitor = SimplifyNodeVisitor(self.__error)
-        visitor.visit(self.__tree)
-
-    def __addMeta(self, root, level=0):
+        # The visitor is registered with the AST dispatcher together with an
+        # annotator adding the parent and sibling information. A shared
+        # dispatcher is run by the caller after all checkers have registered
+        # their callbacks.
+        dispatcher = (
+            AstDispatcher(self.__tree)
+            if self.__dispatcher is None
+            else self.__dispatcher
+        )
+        dispatcher.registerAnnotator(self.__addMeta)
+        dispatcher.registerNodeVisitor(SimplifyNodeVisitor(self.__error))
+        if self.__dispatcher is None:
+            dispatcher.run()
+
+    def __addMeta(self, node, children):
         """
-        Private method to amend the nodes of the given AST tree with backward and
-        forward references.
+        Private method to amend the child nodes of the given node with backward
+        and forward references.
 
-        @param root reference to the root node of the tree
+        @param node reference to the node
         @type ast.AST
-        @param level nesting level (defaults to 0)
-        @type int (optional)
+        @param children list of child nodes of the node
+        @type list of ast.AST
         """
         previousSibling = None
-        for node in ast.iter_child_nodes(root):
-            if level == 0:
-                node.parent = root
-            node.previous_sibling = previousSibling
-            node.next_sibling = None
+        for child in children:
+            child.parent = node
+            child.previous_sibling = previousSibling
+            child.next_sibling = None
             if previousSibling:
-                node.previous_sibling.next_sibling = node
-            previousSibling = node
-            for child in ast.iter_child_nodes(node):
-                child.parent = node
-            self.__addMeta(node, level=level + 1)
+                previousSibling.next_sibling = child
+            previousSibling = child
@@ -50,10 +50,13 @@ import AstUtilities
 ###############################################################################
 
 
-class SimplifyNodeVisitor(ast.NodeVisitor):
+class SimplifyNodeVisitor:
     """
     Class to traverse the AST node tree and check for code that can be
     simplified.
+
+    Note: The visit methods are called by the AST dispatcher, which descends
+    into the child nodes.
     """
 
     def __init__(self, errorCallback):
@@ -63,8 +66,6 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         @param errorCallback callback function to register an error
         @type func
         """
-        super().__init__()
-
         self.__error = errorCallback
 
         self.__classDefinitionStack = []
@@ -78,8 +79,6 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         """
         self.__check112(node)
 
-        self.generic_visit(node)
-
     def visit_Assign(self, node):
         """
         Public method to process an Assign node.
@@ -91,8 +90,6 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         self.__check904(node)
         self.__check909(node)
 
-        self.generic_visit(node)
-
     def visit_BoolOp(self, node):
         """
         Public method to process a BoolOp node.
@@ -107,8 +104,6 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         self.__check223(node)
         self.__check224(node)
 
-        self.generic_visit(node)
-
     def visit_If(self, node):
         """
         Public method to process an If node.
@@ -125,8 +120,6 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         self.__check122(node)
         self.__check123(node)
 
-        self.generic_visit(node)
-
     def visit_IfExp(self, node):
         """
         Public method to process an IfExp node.
@@ -138,8 +131,6 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         self.__check212(node)
         self.__check213(node)
 
-        self.generic_visit(node)
-
     def visit_For(self, node):
         """
         Public method to process a For node.
@@ -152,8 +143,6 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         self.__check113(node)
         self.__check118(node)
 
-        self.generic_visit(node)
-
     def visit_Try(self, node):
         """
         Public method to process a Try node.
@@ -164,8 +153,6 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         self.__check105(node)
         self.__check107(node)
 
-        self.generic_visit(node)
-
     def visit_Call(self, node):
         """
         Public method to process a Call node.
@@ -183,8 +170,6 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         self.__check910(node)
         self.__check911(node)
 
-        self.generic_visit(node)
-
     def visit_With(self, node):
         """
         Public method to process a With node.
@@ -194,8 +179,6 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         """
         self.__check117(node)
 
-        self.generic_visit(node)
-
     def visit_Compare(self, node):
         """
         Public method to process a Compare node.
@@ -206,8 +189,6 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         self.__check118(node)
         self.__check301(node)
 
-        self.generic_visit(node)
-
     def visit_ClassDef(self, node):
         """
         Public method to process a ClassDef node.
@@ -221,8 +202,13 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         self.__check119(node)
         self.__check120_121(node)
 
-        self.generic_visit(node)
+    def leave_ClassDef(self, node):  # noqa: U100
+        """
+        Public method to process the end of a ClassDef node.
 
+        @param node reference to the ClassDef node
+        @type ast.ClassDef
+        """
         self.__classDefinitionStack.pop()
 
     def visit_UnaryOp(self, node):
@@ -241,8 +227,6 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         self.__check207(node)
         self.__check208(node)
 
-        self.generic_visit(node)
-
     def visit_Subscript(self, node):
         """
         Public method to process a Subscript node.
@@ -252,8 +236,6 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         """
         self.__check907(node)
 
-        self.generic_visit(node)
-
     #############################################################
     ## Helper methods for the various checkers below
     #############################################################
@@ -371,14 +353,17 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
             return False
 
         if isinstance(a, ast.AST):
-            for k, v in vars(a).items():
-                if k in ("lineno", "col_offset", "ctx", "end_lineno", "parent"):
-                    continue
-                if not self.__isStatementEqual(v, getattr(b, k)):
-                    return False
-            return True
+            # Compare the node fields only. The references added to the nodes
+            # of the shared tree (e.g. parent and siblings) must not be followed.
+            return all(
+                self.__isStatementEqual(getattr(a, k, None), getattr(b, k, None))
+                for k in a._fields
+                if k != "ctx"
+            )
         elif isinstance(a, list):
-            return all(itertools.starmap(self.__isStatementEqual, zip(a, b)))
+            return len(a) == len(b) and all(
+                itertools.starmap(self.__isStatementEqual, zip(a, b))
+            )
         else:
             return a == b
 
@@ -402,7 +387,10 @@ class SimplifyNodeVisitor(ast.NodeVisitor):
         @return node with negated logic
         @rtype ast.Compare
         """
-        newNode = copy.deepcopy(node)
+        # A shallow copy is sufficient because only the list of operators is
+        # replaced. A deep copy would follow the parent references added to
+        # the nodes and copy the complete tree.
+        newNode = copy.copy(node)
         op = newNode.ops[0]
         if isinstance(op, ast.Eq):
             op = ast.NotEq()
@@ -41,6 +41,9 @@ class Ui_CodeStyleStatisticsDialog(object):
         self.securityOk = QtWidgets.QLabel(parent=CodeStyleStatisticsDialog)
         self.securityOk.setObjectName("securityOk")
         self.gridLayout.addWidget(self.securityOk, 2, 1, 1, 1)
+        self.cacheStatistics = QtWidgets.QLabel(parent=CodeStyleStatisticsDialog)
+        self.cacheStatistics.setObjectName("cacheStatistics")
+        self.gridLayout.addWidget(self.cacheStatistics, 3, 0, 1, 2)
         self.verticalLayout.addLayout(self.gridLayout)
         self.buttonBox = QtWidgets.QDialogButtonBox(parent=CodeStyleStatisticsDialog)
         self.buttonBox.setOrientation(QtCore.Qt.Orientation.Horizontal)
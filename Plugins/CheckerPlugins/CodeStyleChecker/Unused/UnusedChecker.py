@@ -9,10 +9,11 @@ Module implementing a checker for unused arguments, variables, ... .
 
 import ast
 import collections
-import copy
 
 import AstUtilities
 
+from AstDispatcher import AstDispatcher
+
 
 class UnusedChecker:
     """
@@ -27,7 +28,18 @@ class UnusedChecker:
         "U200",
     ]
 
-    def __init__(self, source, filename, tree, select, ignore, expected, repeat, args):
+    def __init__(
+        self,
+        source,
+        filename,
+        tree,
+        select,
+        ignore,
+        expected,
+        repeat,
+        args,
+        dispatcher=None,
+    ):
         """
         Constructor
 
@@ -47,6 +59,8 @@ class UnusedChecker:
         @type bool
         @param args dictionary of arguments for the various checks
         @type dict
+        @param dispatcher reference to a shared AST dispatcher (defaults to None)
+        @type AstDispatcher (optional)
         """
         self.__select = tuple(select)
         self.__ignore = ("",) if select else tuple(ignore)
@@ -54,8 +68,9 @@ class UnusedChecker:
         self.__repeat = repeat
         self.__filename = filename
         self.__source = source[:]
-        self.__tree = copy.deepcopy(tree)
+        self.__tree = tree
         self.__args = args
+        self.__dispatcher = dispatcher
 
         # statistics counters
         self.counters = {}
@@ -134,8 +149,18 @@ class UnusedChecker:
             # don't do anything, if no codes were selected
             return
 
+        # The checks are registered with the AST dispatcher. A shared
+        # dispatcher is run by the caller after all checkers have registered
+        # their callbacks.
+        dispatcher = (
+            AstDispatcher(self.__tree)
+            if self.__dispatcher is None
+            else self.__dispatcher
+        )
         for check in self.__checkers:
-            check()
+            check(dispatcher)
+        if self.__dispatcher is None:
+            dispatcher.run()
 
     #######################################################################
     ## Unused Arguments
@@ -143,9 +168,15 @@ class UnusedChecker:
     ## adapted from: flake8-unused-arguments v0.0.13
     #######################################################################
 
-    def __checkUnusedArguments(self):
+    def __checkUnusedArguments(self, dispatcher):  # noqa: U100
         """
         Private method to check function and method definitions for unused arguments.
+
+        Note: The function finder is not driven by the AST dispatcher because
+        it descends into the function bodies only.
+
+        @param dispatcher reference to the AST dispatcher
+        @type AstDispatcher
         """
         finder = FunctionFinder(self.__args["IgnoreNestedFunctions"])
         finder.visit(self.__tree)
@@ -391,14 +422,26 @@ class UnusedChecker:
     ## adapted from: flake8-unused-globals v0.1.10
     #######################################################################
 
-    def __checkUnusedGlobals(self):
+    def __checkUnusedGlobals(self, dispatcher):
         """
         Private method to check for unused global variables.
+
+        @param dispatcher reference to the AST dispatcher
+        @type AstDispatcher
         """
-        errors = {}
         loadCounter = GlobalVariableLoadCounter()
-        loadCounter.visit(self.__tree)
+        dispatcher.registerNodeVisitor(loadCounter)
+        dispatcher.registerFinalizer(lambda: self.__reportUnusedGlobals(loadCounter))
+
+    def __reportUnusedGlobals(self, loadCounter):
+        """
+        Private method to report the unused global variables.
 
+        @param loadCounter reference to the load counter fed by the AST
+            dispatcher
+        @type GlobalVariableLoadCounter
+        """
+        errors = {}
         globalVariables = self.__extractGlobalVariables()
 
         for varId, loads in loadCounter.getLoads():
@@ -516,17 +559,17 @@ GlobalVariableStoreInfo = collections.namedtuple(
 )
 
 
-class GlobalVariableLoadCounter(ast.NodeVisitor):
+class GlobalVariableLoadCounter:
     """
     Class to find all defined global variables and count their usages.
+
+    Note: The name nodes are handed to the counter by the AST dispatcher.
     """
 
     def __init__(self):
         """
         Constructor
         """
-        super().__init__()
-
         self.__loads = {}
         self.__storeInfo = {}
 
@@ -27,11 +27,14 @@ class SyntaxCheckService(QObject):
         one file
     @signal batchFinished() emitted when a syntax check batch is done
     @signal error(str, str) emitted in case of an error
+    @signal sourceRequested(str) emitted to request a syntax check with the
+        complete source because a source delta could not be applied
     """
 
     syntaxChecked = pyqtSignal(str, dict)
     batchFinished = pyqtSignal()
     error = pyqtSignal(str, str)
+    sourceRequested = pyqtSignal(str)
 
     def __init__(self):
         """
@@ -39,6 +42,7 @@ class SyntaxCheckService(QObject):
         """
         super().__init__()
         self.backgroundService = ericApp().getObject("BackgroundService")
+        self.backgroundService.sourceRequested.connect(self.__sourceRequested)
         self.__supportedLanguages = {}
 
         self.queuedBatches = []
@@ -132,17 +136,80 @@ class SyntaxCheckService(QObject):
                 extensions.add(ext)
         return extensions
 
+    def supportsSourceDelta(self, lang):
+        """
+        Public method to check, if the syntax check of a language accepts
+        source deltas.
+
+        @param lang language to be checked
+        @type str
+        @return flag indicating support for source deltas
+        @rtype bool
+        """
+        if lang == "MicroPython":
+            lang = "Python3"
+        try:
+            # only the built-in background client keeps shadow copies
+            return self.__supportedLanguages[lang][0] == "Python3"
+        except KeyError:
+            return False
+
+    def isCheckPending(self, lang, filename):
+        """
+        Public method to check, if a syntax check request for a file is still
+        waiting to be sent to the background client.
+
+        A new request for the file replaces the waiting one.
+
+        @param lang language of the file
+        @type str
+        @param filename source filename
+        @type str
+        @return flag indicating a waiting request
+        @rtype bool
+        """
+        if lang == "MicroPython":
+            lang = "Python3"
+        try:
+            env = self.__supportedLanguages[lang][0]
+        except KeyError:
+            return False
+
+        return self.backgroundService.isRequestPending(
+            "{0}Syntax".format(lang), env, filename
+        )
+
+    def __sourceRequested(self, fx, _lang, fn):
+        """
+        Private slot handling a request of the background client to send the
+        complete source of a file.
+
+        @param fx service name
+        @type str
+        @param _lang language of the background client (unused)
+        @type str
+        @param fn file name
+        @type str
+        """
+        if fx in ["{0}Syntax".format(lang) for lang in self.__supportedLanguages]:
+            self.sourceRequested.emit(fn)
+
     def syntaxCheck(self, lang, filename, source, *args):
         """
         Public method to prepare a syntax check of one source file.
 
+        Note: A source delta may only be given together with the language and
+        only, if the language supports them (see supportsSourceDelta()).
+
         @param lang language of the file or None to determine by internal
             algorithm
         @type str or None
         @param filename source filename
         @type str
-        @param source string containing the code to check
-        @type str
+        @param source string containing the code to check or a dictionary
+            containing the complete source or a source delta as created by
+            the BackgroundProtocol module
+        @type str or dict
         @param args tuple containing additional positional arguments
         @type tuple
         """
@@ -7,9 +7,6 @@
 Module implementing the syntax check for TOML.
 """
 
-import multiprocessing
-import queue
-
 
 def initService():
     """
@@ -21,14 +18,15 @@ def initService():
     return tomlSyntaxCheck
 
 
-def initBatchService():
+def initBatchTask():
     """
-    Initialize the batch service and return the entry point.
+    Initialize the batch service and return the function to be executed for
+    each file by the worker pool of the background client.
 
-    @return the entry point for the background client
+    @return the task function for the background client worker pool
     @rtype function
     """
-    return tomlSyntaxBatchCheck
+    return tomlSyntaxBatchTask
 
 
 def tomlSyntaxCheck(file, codestring):
@@ -47,99 +45,20 @@ def tomlSyntaxCheck(file, codestring):
     return __tomlSyntaxCheck(file, codestring)
 
 
-def tomlSyntaxBatchCheck(argumentsList, send, fx, cancelled, maxProcesses=0):
-    """
-    Module function to check syntax for a batch of files.
-
-    @param argumentsList list of arguments tuples as given for tomlSyntaxCheck
-    @type list
-    @param send reference to send function
-    @type function
-    @param fx registered service name
-    @type str
-    @param cancelled reference to function checking for a cancellation
-    @type function
-    @param maxProcesses number of processes to be used
-    @type int
-    """
-    if maxProcesses == 0:
-        # determine based on CPU count
-        try:
-            NumberOfProcesses = multiprocessing.cpu_count()
-            if NumberOfProcesses >= 1:
-                NumberOfProcesses -= 1
-        except NotImplementedError:
-            NumberOfProcesses = 1
-    else:
-        NumberOfProcesses = maxProcesses
-
-    # Create queues
-    taskQueue = multiprocessing.Queue()
-    doneQueue = multiprocessing.Queue()
-
-    # Submit tasks (initially two times the number of processes)
-    tasks = len(argumentsList)
-    initialTasks = min(2 * NumberOfProcesses, tasks)
-    for _ in range(initialTasks):
-        taskQueue.put(argumentsList.pop(0))
-
-    # Start worker processes
-    workers = [
-        multiprocessing.Process(target=workerTask, args=(taskQueue, doneQueue))
-        for _ in range(NumberOfProcesses)
-    ]
-    for worker in workers:
-        worker.start()
-
-    # Get and send results
-    for _ in range(tasks):
-        resultSent = False
-        wasCancelled = False
-
-        while not resultSent:
-            try:
-                # get result (waiting max. 3 seconds and send it to frontend
-                filename, result = doneQueue.get()
-                send(fx, filename, result)
-                resultSent = True
-            except queue.Empty:
-                # ignore empty queue, just carry on
-                if cancelled():
-                    wasCancelled = True
-                    break
-
-        if wasCancelled or cancelled():
-            # just exit the loop ignoring the results of queued tasks
-            break
-
-        if argumentsList:
-            taskQueue.put(argumentsList.pop(0))
-
-    # Tell child processes to stop
-    for _ in range(NumberOfProcesses):
-        taskQueue.put("STOP")
-
-    for worker in workers:
-        worker.join()
-        worker.close()
-
-    taskQueue.close()
-    doneQueue.close()
-
-
-def workerTask(inputQueue, outputQueue):
+def tomlSyntaxBatchTask(arguments):
     """
-    Module function acting as the parallel worker for the syntax check.
+    Module function executing the TOML syntax check for one file of a batch.
 
-    @param inputQueue input queue
-    @type multiprocessing.Queue
-    @param outputQueue output queue
-    @type multiprocessing.Queue
+    @param arguments tuple containing the file name and the check
+        arguments as given for the syntax check
+    @type tuple
+    @return tuple containing the file name and the check result
+    @rtype tuple
     """
-    for filename, args in iter(inputQueue.get, "STOP"):
-        source = args[0]
-        result = __tomlSyntaxCheck(filename, source)
-        outputQueue.put((filename, result))
+    filename, args = arguments
+    source = args[0]
+    result = __tomlSyntaxCheck(filename, source)
+    return filename, result
 
 
 def __tomlSyntaxCheck(file, codestring):
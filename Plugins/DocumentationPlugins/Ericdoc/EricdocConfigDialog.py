@@ -122,6 +122,8 @@ class EricdocConfigDialog(QDialog, Ui_EricdocConfigDialog):
         self.recursionCheckBox.setChecked(self.parameters["useRecursion"])
         self.noindexCheckBox.setChecked(self.parameters["noindex"])
         self.noemptyCheckBox.setChecked(self.parameters["noempty"])
+        self.incrementalCheckBox.setChecked(self.parameters["incremental"])
+        self.jobsSpinBox.setValue(self.parameters["jobs"])
         self.startDirPicker.setText(self.parameters["startDirectory"])
         self.outputDirPicker.setText(self.parameters["outputDirectory"])
         self.ignoreDirsList.clear()
@@ -156,6 +158,8 @@ class EricdocConfigDialog(QDialog, Ui_EricdocConfigDialog):
             "useRecursion": False,
             "noindex": False,
             "noempty": False,
+            "incremental": False,
+            "jobs": 1,
             "startDirectory": "",
             "outputDirectory": "",
             "ignoreDirectories": [],
@@ -234,6 +238,12 @@ class EricdocConfigDialog(QDialog, Ui_EricdocConfigDialog):
         if self.parameters["noempty"] != self.defaults["noempty"]:
             parms["noempty"] = self.parameters["noempty"]
             args.append("-e")
+        if self.parameters["incremental"] != self.defaults["incremental"]:
+            parms["incremental"] = self.parameters["incremental"]
+            args.append("--incremental")
+        if self.parameters["jobs"] != self.defaults["jobs"]:
+            parms["jobs"] = self.parameters["jobs"]
+            args.append("--jobs={0}".format(self.parameters["jobs"]))
         if self.parameters["sourceExtensions"] != self.defaults["sourceExtensions"]:
             parms["sourceExtensions"] = self.parameters["sourceExtensions"][:]
             for ext in self.parameters["sourceExtensions"]:
@@ -563,6 +573,8 @@ class EricdocConfigDialog(QDialog, Ui_EricdocConfigDialog):
         self.parameters["useRecursion"] = self.recursionCheckBox.isChecked()
         self.parameters["noindex"] = self.noindexCheckBox.isChecked()
         self.parameters["noempty"] = self.noemptyCheckBox.isChecked()
+        self.parameters["incremental"] = self.incrementalCheckBox.isChecked()
+        self.parameters["jobs"] = self.jobsSpinBox.value()
 
         startdir = self.startDirPicker.text()
         if startdir:
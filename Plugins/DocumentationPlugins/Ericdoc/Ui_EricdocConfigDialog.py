@@ -77,6 +77,18 @@ class Ui_EricdocConfigDialog(object):
         self.noemptyCheckBox = QtWidgets.QCheckBox(parent=self.generalTab)
         self.noemptyCheckBox.setObjectName("noemptyCheckBox")
         self.hboxlayout2.addWidget(self.noemptyCheckBox)
+        self.incrementalCheckBox = QtWidgets.QCheckBox(parent=self.generalTab)
+        self.incrementalCheckBox.setObjectName("incrementalCheckBox")
+        self.hboxlayout2.addWidget(self.incrementalCheckBox)
+        self.label_8 = QtWidgets.QLabel(parent=self.generalTab)
+        self.label_8.setObjectName("label_8")
+        self.hboxlayout2.addWidget(self.label_8)
+        self.jobsSpinBox = QtWidgets.QSpinBox(parent=self.generalTab)
+        self.jobsSpinBox.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.jobsSpinBox.setMaximum(256)
+        self.jobsSpinBox.setProperty("value", 1)
+        self.jobsSpinBox.setObjectName("jobsSpinBox")
+        self.hboxlayout2.addWidget(self.jobsSpinBox)
         spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
         self.hboxlayout2.addItem(spacerItem1)
         self.verticalLayout_2.addLayout(self.hboxlayout2)
@@ -256,7 +268,9 @@ class Ui_EricdocConfigDialog(object):
         EricdocConfigDialog.setTabOrder(self.sourceExtEdit, self.recursionCheckBox)
         EricdocConfigDialog.setTabOrder(self.recursionCheckBox, self.noindexCheckBox)
         EricdocConfigDialog.setTabOrder(self.noindexCheckBox, self.noemptyCheckBox)
-        EricdocConfigDialog.setTabOrder(self.noemptyCheckBox, self.excludeFilesEdit)
+        EricdocConfigDialog.setTabOrder(self.noemptyCheckBox, self.incrementalCheckBox)
+        EricdocConfigDialog.setTabOrder(self.incrementalCheckBox, self.jobsSpinBox)
+        EricdocConfigDialog.setTabOrder(self.jobsSpinBox, self.excludeFilesEdit)
         EricdocConfigDialog.setTabOrder(self.excludeFilesEdit, self.ignoreDirsList)
         EricdocConfigDialog.setTabOrder(self.ignoreDirsList, self.ignoreDirPicker)
         EricdocConfigDialog.setTabOrder(self.ignoreDirPicker, self.addButton)
@@ -296,6 +310,11 @@ class Ui_EricdocConfigDialog(object):
         self.noindexCheckBox.setText(_translate("EricdocConfigDialog", "Don\'t generate index files"))
         self.noemptyCheckBox.setToolTip(_translate("EricdocConfigDialog", "Select to exclude empty modules"))
         self.noemptyCheckBox.setText(_translate("EricdocConfigDialog", "Don\'t include empty modules"))
+        self.incrementalCheckBox.setToolTip(_translate("EricdocConfigDialog", "Select to skip modules, whose source and options are unchanged since the last run"))
+        self.incrementalCheckBox.setText(_translate("EricdocConfigDialog", "Incremental"))
+        self.label_8.setText(_translate("EricdocConfigDialog", "Parallel Jobs:"))
+        self.jobsSpinBox.setToolTip(_translate("EricdocConfigDialog", "Enter the number of parallel jobs (0 = number of CPUs)"))
+        self.jobsSpinBox.setSpecialValueText(_translate("EricdocConfigDialog", "Auto"))
         self.label.setText(_translate("EricdocConfigDialog", "Exclude Files:"))
         self.excludeFilesEdit.setToolTip(_translate("EricdocConfigDialog", "Enter filename patterns of files to be excluded separated by a comma"))
         self.groupBox.setTitle(_translate("EricdocConfigDialog", "Exclude Directories"))
@@ -53,11 +53,14 @@ class CodeStyleCheckerPlugin(QObject):
     @signal styleChecked(str, dict, int, list) emitted when the style check was
         done for a file.
     @signal batchFinished() emitted when a style check batch is done
+    @signal batchCacheStatistics(int, int) emitted to report the number of
+        result cache hits and misses of a style check batch
     @signal error(str, str) emitted in case of an error
     """
 
     styleChecked = pyqtSignal(str, dict, int, list)
     batchFinished = pyqtSignal()
+    batchCacheStatistics = pyqtSignal(int, int)
     error = pyqtSignal(str, str)
 
     def __init__(self, ui):
@@ -85,6 +88,7 @@ class CodeStyleCheckerPlugin(QObject):
             onErrorCallback=self.serviceErrorPy3,
             onBatchDone=self.batchJobDone,
         )
+        self.backgroundService.batchCacheStatistics.connect(self.__batchCacheStatistics)
 
         self.queuedBatches = []
         self.batchesFinished = True
@@ -139,6 +143,22 @@ class CodeStyleCheckerPlugin(QObject):
                 self.batchFinished.emit()
                 self.batchesFinished = True
 
+    def __batchCacheStatistics(self, fx, lang, hits, misses):
+        """
+        Private slot handling the result cache statistics of a batch job.
+
+        @param fx service name
+        @type str
+        @param lang language
+        @type str
+        @param hits number of results served from the cache
+        @type int
+        @param misses number of results not found in the cache
+        @type int
+        """
+        if fx == "style" and lang == "Python3":
+            self.batchCacheStatistics.emit(hits, misses)
+
     def __initialize(self):
         """
         Private slot to (re)initialize the plugin.
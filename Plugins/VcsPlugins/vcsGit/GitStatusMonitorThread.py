@@ -7,17 +7,27 @@
 Module implementing the VCS status monitor thread class for Git.
 """
 
-from PyQt6.QtCore import QProcess
+import os
+
+from PyQt6.QtCore import QProcess, pyqtSignal
 
 from eric7 import Preferences
 from eric7.VCS.StatusMonitorThread import VcsStatusMonitorThread
 
+from .GitStatusProvider import GitStatusSnapshot
+
 
 class GitStatusMonitorThread(VcsStatusMonitorThread):
     """
     Class implementing the VCS status monitor thread class for Git.
+
+    @signal statusEntries(repodir:str, indexTime:float, entries:list) emitted
+        with the entries of the repository status in order to share them with
+        the status provider of the project browsers
     """
 
+    statusEntries = pyqtSignal(str, object, list)
+
     ConflictStates = ["AA", "AU", "DD", "DU", "UA", "UD", "UU"]
 
     def __init__(self, interval, project, vcs, parent=None):
@@ -40,6 +50,8 @@ class GitStatusMonitorThread(VcsStatusMonitorThread):
         self.__client = None
         self.__useCommandLine = False
 
+        self.__repodir = vcs.findRepoRoot(os.path.normcase(self.projectDir))
+
     def _performMonitor(self):
         """
         Protected method implementing the monitoring action.
@@ -67,10 +79,18 @@ class GitStatusMonitorThread(VcsStatusMonitorThread):
         self.shouldUpdate = False
 
         # step 1: get overall status
-        args = self.vcs.initCommand("status")
-        args.append("--porcelain")
-
-        output = ""
+        indexTime = (
+            self.vcs.getStatusProvider().indexTime(self.__repodir)
+            if self.__repodir
+            else None
+        )
+        # prevent 'git status' from updating the index, which would be seen as
+        # a change of the repository
+        args = ["--no-optional-locks"]
+        args.extend(self.vcs.initCommand("status"))
+        args.extend(["--porcelain=v2", "-z"])
+
+        output = b""
         error = ""
         process = QProcess()
         process.setWorkingDirectory(self.projectDir)
@@ -79,9 +99,7 @@ class GitStatusMonitorThread(VcsStatusMonitorThread):
         if procStarted:
             finished = process.waitForFinished(300000)
             if finished and process.exitCode() == 0:
-                output = str(
-                    process.readAllStandardOutput(), self.__ioEncoding, "replace"
-                )
+                output = bytes(process.readAllStandardOutput())
             else:
                 process.kill()
                 process.waitForFinished()
@@ -96,10 +114,14 @@ class GitStatusMonitorThread(VcsStatusMonitorThread):
         if error:
             return False, error
 
+        entries = GitStatusSnapshot.parseOutput(output)
+        if self.__repodir:
+            self.statusEntries.emit(self.__repodir, indexTime, entries)
+
         states = {}
-        for line in output.splitlines():
-            flags = line[:2]
-            name = line[3:].split(" -> ")[-1]
+        for xyFlags, name in entries:
+            # porcelain v2 uses '.' for an unmodified index or work tree
+            flags = xyFlags.replace(".", " ")
             if flags in self.ConflictStates:
                 states[name] = "Z"
             if flags[0] in "AMDR":
@@ -0,0 +1,535 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+
+"""
+Module implementing an asynchronous provider of the Git status of the files of
+a repository.
+"""
+
+import contextlib
+import os
+
+from PyQt6.QtCore import QObject, QProcess, QTimer, pyqtSignal, pyqtSlot
+
+from eric7.VCS.VersionControl import VersionControlState
+
+
+class GitStatusSnapshot:
+    """
+    Class implementing a snapshot of the status of a repository.
+
+    The entries reported by 'git status --porcelain=v2 -z' are stored in a
+    trie of the path components relative to the repository root. Files not
+    contained in the snapshot are unmodified and under version control.
+    """
+
+    def __init__(self, indexTime=None):
+        """
+        Constructor
+
+        @param indexTime modification time of the Git index the snapshot was
+            taken for (defaults to None)
+        @type float (optional)
+        """
+        self.indexTime = indexTime
+
+        # nested dictionaries with the path component as key; the status flags
+        # of an entry are stored with key None
+        self.__root = {}
+
+    @classmethod
+    def parseOutput(cls, output):
+        """
+        Class method to parse the output of 'git status --porcelain=v2 -z'.
+
+        @param output output of the Git process
+        @type bytes
+        @return list of tuples containing the status flags and the path
+            relative to the repository root (untracked directories end with
+            '/')
+        @rtype list of tuple of (str, str)
+        """
+        entries = []
+        records = iter(output.split(b"\0"))
+        for record in records:
+            kind = record[:1]
+            if kind == b"1":
+                # ordinary changed entry
+                fields = record.split(b" ", 8)
+            elif kind == b"2":
+                # renamed or copied entry, followed by the original path
+                fields = record.split(b" ", 9)
+                next(records, None)
+            elif kind == b"u":
+                # unmerged entry
+                fields = record.split(b" ", 10)
+            elif kind in (b"?", b"!"):
+                # untracked or ignored entry
+                fields = [kind, kind * 2, record[2:]]
+            else:
+                # empty record or header line
+                continue
+
+            entries.append((fields[1].decode("ascii"), os.fsdecode(fields[-1])))
+
+        return entries
+
+    def __components(self, path):
+        """
+        Private method to split a relative path into its normalized components.
+
+        @param path path relative to the repository root
+        @type str
+        @return list of path components
+        @rtype list of str
+        """
+        path = os.path.normcase(path.rstrip("/"))
+        return path.split(os.sep) if path and path != os.curdir else []
+
+    def setStatus(self, path, flags):
+        """
+        Public method to set the status flags of an entry.
+
+        @param path path relative to the repository root
+        @type str
+        @param flags status flags (e.g. '.M', 'A.' or '??')
+        @type str
+        """
+        node = self.__root
+        for component in self.__components(path):
+            node = node.setdefault(component, {})
+        node[None] = flags
+
+    def remove(self, path):
+        """
+        Public method to remove an entry and all entries below it.
+
+        @param path path relative to the repository root
+        @type str
+        """
+        components = self.__components(path)
+        if not components:
+            self.__root.clear()
+            return
+
+        node = self.__root
+        for component in components[:-1]:
+            node = node.get(component)
+            if node is None:
+                return
+        node.pop(components[-1], None)
+
+    def status(self, path):
+        """
+        Public method to get the status flags of an entry.
+
+        @param path path relative to the repository root
+        @type str
+        @return status flags or None, if the entry is unmodified
+        @rtype str or None
+        """
+        node = self.__root
+        for component in self.__components(path):
+            node = node.get(component)
+            if node is None:
+                return None
+        return node.get(None)
+
+    def isUntracked(self, path):
+        """
+        Public method to check, if an entry is not under version control.
+
+        @param path path relative to the repository root
+        @type str
+        @return flag indicating an untracked entry
+        @rtype bool
+        """
+        node = self.__root
+        for component in self.__components(path):
+            node = node.get(component)
+            if node is None:
+                return False
+            if node.get(None) == "??":
+                # the entry or one of its parent directories is untracked
+                return True
+        return False
+
+    def registeredState(self, path):
+        """
+        Public method to get the registered state of an entry.
+
+        @param path path relative to the repository root
+        @type str
+        @return registered state
+        @rtype VersionControlState
+        """
+        return (
+            VersionControlState.Uncontrolled
+            if self.isUntracked(path)
+            else VersionControlState.Controlled
+        )
+
+    def entries(self):
+        """
+        Public generator returning all entries of the snapshot.
+
+        @yield tuple containing the path relative to the repository root and
+            the status flags
+        @ytype tuple of (str, str)
+        """
+        stack = [("", self.__root)]
+        while stack:
+            prefix, node = stack.pop()
+            for component, child in node.items():
+                if component is None:
+                    continue
+                path = os.path.join(prefix, component) if prefix else component
+                if None in child:
+                    yield path, child[None]
+                stack.append((path, child))
+
+    def untrackedPaths(self):
+        """
+        Public method to get the paths of all untracked entries.
+
+        @return set of paths relative to the repository root
+        @rtype set of str
+        """
+        return {path for path, flags in self.entries() if flags == "??"}
+
+
+class GitStatusProvider(QObject):
+    """
+    Class implementing an asynchronous provider of the Git status of the files
+    of a repository.
+
+    A snapshot of the status is created with one 'git status' call per
+    repository and serves all status lookups. A snapshot is refreshed in the
+    background after the Git index has been modified. Saved files are
+    refreshed individually. The status determined by the VCS status monitor
+    thread replaces the snapshot of the project repository.
+
+    @signal statusChanged(repodir:str, paths:list) emitted after a refresh
+        with the repository root and the absolute paths of the entries, whose
+        registered state has changed
+    """
+
+    statusChanged = pyqtSignal(str, list)
+
+    RefreshDelay = 200  # milliseconds to collect refresh requests
+
+    def __init__(self, vcs, parent=None):
+        """
+        Constructor
+
+        @param vcs reference to the Git interface object
+        @type Git
+        @param parent reference to the parent object (defaults to None)
+        @type QObject (optional)
+        """
+        super().__init__(parent)
+
+        self.__vcs = vcs
+
+        # dictionary with the repository root as key and the snapshot as value
+        self.__snapshots = {}
+        # dictionary with the repository root as key and a set of relative
+        # paths to be refreshed or None for a complete refresh as value
+        self.__pending = {}
+        # dictionary with the repository root as key and the running process
+        # as value
+        self.__processes = {}
+
+        self.__refreshTimer = QTimer(self)
+        self.__refreshTimer.setSingleShot(True)
+        self.__refreshTimer.setInterval(GitStatusProvider.RefreshDelay)
+        self.__refreshTimer.timeout.connect(self.__startRefreshes)
+
+    def __statusArguments(self, paths=None):
+        """
+        Private method to assemble the arguments of the status command.
+
+        @param paths list of paths relative to the repository root to restrict
+            the status to (defaults to None)
+        @type list of str (optional)
+        @return list of command arguments
+        @rtype list of str
+        """
+        # prevent 'git status' from updating the index, which would trigger
+        # another refresh
+        args = ["--no-optional-locks"]
+        args.extend(self.__vcs.initCommand("status"))
+        args.extend(["--porcelain=v2", "-z"])
+        if paths:
+            args.append("--")
+            args.extend(paths)
+        return args
+
+    def indexTime(self, repodir):
+        """
+        Public method to get the modification time of the Git index of a
+        repository.
+
+        @param repodir root directory of the repository
+        @type str
+        @return modification time of the index or None, if it doesn't exist
+        @rtype float or None
+        """
+        gitPath = os.path.join(repodir, self.__vcs.adminDirOrFile)
+        if os.path.isfile(gitPath):
+            # worktree or submodule: '.git' contains the path of the Git dir
+            with contextlib.suppress(OSError, UnicodeError):
+                with open(gitPath, "r", encoding="utf-8") as f:
+                    content = f.read().strip()
+                if content.startswith("gitdir:"):
+                    gitPath = os.path.join(repodir, content[7:].strip())
+
+        try:
+            return os.stat(os.path.join(gitPath, "index")).st_mtime
+        except OSError:
+            return None
+
+    def snapshot(self, repodir):
+        """
+        Public method to get the status snapshot of a repository.
+
+        The first snapshot of a repository is created synchronously. An
+        outdated snapshot is refreshed in the background, while the current
+        one is returned.
+
+        @param repodir root directory of the repository
+        @type str
+        @return status snapshot of the repository
+        @rtype GitStatusSnapshot
+        """
+        snapshot = self.__snapshots.get(repodir)
+        if snapshot is None:
+            indexTime = self.indexTime(repodir)
+            snapshot = GitStatusSnapshot(indexTime)
+
+            process = QProcess()
+            process.setWorkingDirectory(repodir)
+            process.start("git", self.__statusArguments())
+            procStarted = process.waitForStarted(5000)
+            if procStarted:
+                finished = process.waitForFinished(30000)
+                if finished and process.exitCode() == 0:
+                    for flags, path in GitStatusSnapshot.parseOutput(
+                        bytes(process.readAllStandardOutput())
+                    ):
+                        snapshot.setStatus(path, flags)
+                else:
+                    process.kill()
+                    process.waitForFinished()
+
+            self.__snapshots[repodir] = snapshot
+        elif snapshot.indexTime != self.indexTime(repodir):
+            self.refresh(repodir)
+
+        return snapshot
+
+    def registeredState(self, repodir, name):
+        """
+        Public method to get the registered state of a file or directory.
+
+        @param repodir root directory of the repository
+        @type str
+        @param name absolute path of the file or directory
+        @type str
+        @return registered state
+        @rtype VersionControlState
+        """
+        return self.snapshot(repodir).registeredState(os.path.relpath(name, repodir))
+
+    def hasSnapshot(self, repodir):
+        """
+        Public method to check, if a snapshot of a repository exists.
+
+        @param repodir root directory of the repository
+        @type str
+        @return flag indicating an existing snapshot
+        @rtype bool
+        """
+        return repodir in self.__snapshots
+
+    def checkRepositories(self):
+        """
+        Public method to refresh the snapshots of all repositories with a
+        modified index.
+        """
+        for repodir, snapshot in self.__snapshots.items():
+            if snapshot.indexTime != self.indexTime(repodir):
+                self.refresh(repodir)
+
+    def refresh(self, repodir, paths=None):
+        """
+        Public method to schedule a refresh of a snapshot.
+
+        @param repodir root directory of the repository
+        @type str
+        @param paths list of paths relative to the repository root to be
+            refreshed or None to refresh all entries (defaults to None)
+        @type list of str (optional)
+        """
+        if repodir not in self.__snapshots:
+            # snapshot will be created on demand
+            return
+
+        if paths is None:
+            self.__pending[repodir] = None
+        elif repodir not in self.__pending:
+            self.__pending[repodir] = set(paths)
+        elif self.__pending[repodir] is not None:
+            self.__pending[repodir].update(paths)
+
+        self.__refreshTimer.start()
+
+    @pyqtSlot(str, object, list)
+    def setEntries(self, repodir, indexTime, entries):
+        """
+        Public slot to replace the snapshot of a repository with the status
+        determined by someone else (e.g. the status monitor thread).
+
+        @param repodir root directory of the repository
+        @type str
+        @param indexTime modification time of the Git index before the status
+            was determined
+        @type float
+        @param entries list of tuples containing the status flags and the path
+            relative to the repository root as returned by
+            GitStatusSnapshot.parseOutput()
+        @type list of tuple of (str, str)
+        """
+        if self.__pending.get(repodir, set()) is None:
+            # a complete refresh is not needed anymore
+            del self.__pending[repodir]
+
+        self.__replaceSnapshot(repodir, indexTime, entries)
+
+    def clear(self):
+        """
+        Public method to discard all snapshots and to stop running refreshes.
+        """
+        self.__refreshTimer.stop()
+        self.__pending.clear()
+        for process in self.__processes.values():
+            with contextlib.suppress(RuntimeError):
+                process.finished.disconnect()
+            process.kill()
+            process.waitForFinished(3000)
+        self.__processes.clear()
+        self.__snapshots.clear()
+
+    @pyqtSlot()
+    def __startRefreshes(self):
+        """
+        Private slot to start the scheduled refreshes.
+        """
+        for repodir in list(self.__pending):
+            if repodir in self.__processes:
+                # wait for the running refresh to finish
+                continue
+
+            paths = self.__pending.pop(repodir)
+            indexTime = self.indexTime(repodir)
+
+            process = QProcess(self)
+            process.setWorkingDirectory(repodir)
+            process.finished.connect(
+                lambda exitCode, exitStatus, r=repodir, p=paths, t=indexTime: (
+                    self.__refreshFinished(r, p, t, exitCode, exitStatus)
+                )
+            )
+            self.__processes[repodir] = process
+            process.start(
+                "git", self.__statusArguments(None if paths is None else sorted(paths))
+            )
+
+    def __refreshFinished(self, repodir, paths, indexTime, exitCode, exitStatus):
+        """
+        Private method handling the end of a refresh process.
+
+        @param repodir root directory of the repository
+        @type str
+        @param paths refreshed paths relative to the repository root or None
+            for a complete refresh
+        @type set of str
+        @param indexTime modification time of the index at the start of the
+            refresh
+        @type float
+        @param exitCode exit code of the process
+        @type int
+        @param exitStatus exit status of the process
+        @type QProcess.ExitStatus
+        """
+        process = self.__processes.pop(repodir)
+        process.deleteLater()
+        if self.__pending:
+            self.__refreshTimer.start()
+
+        snapshot = self.__snapshots.get(repodir)
+        if (
+            snapshot is None
+            or exitStatus != QProcess.ExitStatus.NormalExit
+            or exitCode != 0
+        ):
+            return
+
+        entries = GitStatusSnapshot.parseOutput(bytes(process.readAllStandardOutput()))
+        if paths is None:
+            self.__replaceSnapshot(repodir, indexTime, entries)
+        else:
+            candidates = set(paths) | {path for _flags, path in entries}
+            before = {p: snapshot.isUntracked(p) for p in candidates}
+            for path in paths:
+                snapshot.remove(path)
+            for flags, path in entries:
+                snapshot.setStatus(path, flags)
+            self.__reportChanges(
+                repodir,
+                {p for p in candidates if snapshot.isUntracked(p) != before[p]},
+            )
+
+    def __replaceSnapshot(self, repodir, indexTime, entries):
+        """
+        Private method to replace the snapshot of a repository.
+
+        @param repodir root directory of the repository
+        @type str
+        @param indexTime modification time of the Git index before the status
+            was determined
+        @type float
+        @param entries list of tuples containing the status flags and the path
+            relative to the repository root
+        @type list of tuple of (str, str)
+        """
+        newSnapshot = GitStatusSnapshot(indexTime)
+        for flags, path in entries:
+            newSnapshot.setStatus(path, flags)
+
+        oldSnapshot = self.__snapshots.get(repodir)
+        self.__snapshots[repodir] = newSnapshot
+        if oldSnapshot is not None:
+            self.__reportChanges(
+                repodir, oldSnapshot.untrackedPaths() ^ newSnapshot.untrackedPaths()
+            )
+
+    def __reportChanges(self, repodir, changed):
+        """
+        Private method to report entries with a changed registered state.
+
+        @param repodir root directory of the repository
+        @type str
+        @param changed paths relative to the repository root
+        @type set of str
+        """
+        if changed:
+            self.statusChanged.emit(
+                repodir,
+                sorted(
+                    os.path.normcase(os.path.join(repodir, path.rstrip("/")))
+                    for path in changed
+                ),
+            )
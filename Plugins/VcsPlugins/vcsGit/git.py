@@ -26,6 +26,7 @@ from eric7.VCS.RepositoryInfoDialog import VcsRepositoryInfoDialog
 from eric7.VCS.VersionControl import VersionControl, VersionControlState
 
 from .GitDialog import GitDialog
+from .GitStatusProvider import GitStatusProvider
 
 
 class Git(VersionControl):
@@ -102,7 +103,10 @@ class Git(VersionControl):
         self.__lastBundlePath = None
         self.__lastReplayPath = None
 
-        self.statusCache = {}
+        self.__statusProvider = GitStatusProvider(self, self)
+        self.__statusProvider.statusChanged.connect(self.__registeredStatesChanged)
+        with contextlib.suppress(KeyError):
+            ericApp().getObject("ViewManager").editorSaved.connect(self.__fileSaved)
 
         self.__commitData = {}
         self.__commitDialog = None
@@ -161,6 +165,10 @@ class Git(VersionControl):
         if self.worktreeDialog is not None:
             self.worktreeDialog.close()
 
+        self.__statusProvider.clear()
+        with contextlib.suppress(KeyError, TypeError):
+            ericApp().getObject("ViewManager").editorSaved.disconnect(self.__fileSaved)
+
         # shut down the project helpers
         if self.__projectHelper is not None:
             self.__projectHelper.shutdown()
@@ -1109,59 +1117,21 @@ class Git(VersionControl):
         if fname == "." and os.path.exists(os.path.join(dname, self.adminDirOrFile)):
             return VersionControlState.Controlled
 
-        if name in self.statusCache:
-            return self.statusCache[name]
-
         # find the root of the repo
         repodir = self.findRepoRoot(dname)
         if not repodir:
             return 0
 
-        args = self.initCommand("status")
-        args.append("--porcelain")
-        args.append(name)
-
-        ioEncoding = Preferences.getSystem("IOEncoding")
-        output = ""
-        process = QProcess()
-        process.setWorkingDirectory(repodir)
-        process.start("git", args)
-        procStarted = process.waitForStarted(5000)
-        if procStarted:
-            finished = process.waitForFinished(30000)
-            if finished and process.exitCode() == 0:
-                output = str(process.readAllStandardOutput(), ioEncoding, "replace")
-
-        if output:
-            for line in output.splitlines():
-                if line and line[0] in " MADRCU!?":
-                    flag = line[1]
-                    path = line[3:].split(" -> ")[-1]
-                    absname = os.path.join(repodir, os.path.normcase(path))
-                    if absname.endswith(("/", "\\")):
-                        absname = absname[:-1]
-                    if flag not in "?!":
-                        if fname == ".":
-                            if absname.startswith(dname + os.path.sep):
-                                return VersionControlState.Controlled
-                            if absname == dname:
-                                return VersionControlState.Controlled
-                        else:
-                            if absname == name:
-                                return VersionControlState.Controlled
-        else:
-            return VersionControlState.Controlled
-
-        return VersionControlState.Uncontrolled
+        return self.__statusProvider.registeredState(repodir, name)
 
     def vcsAllRegisteredStates(self, names, dname, shortcut=True):  # noqa: U100
         """
         Public method used to get the registered states of a number of files
         in the vcs.
 
-        <b>Note:</b> If a shortcut is to be taken, the code will only check,
-        if the named directory has been scanned already. If so, it is assumed,
-        that the states for all files have been populated by the previous run.
+        <b>Note:</b> The states are determined from the status snapshot of
+        the repository, which is created once and refreshed in the background
+        after the repository has changed.
 
         @param names dictionary with all filenames to be checked as keys
         @type dict
@@ -1181,67 +1151,69 @@ class Git(VersionControl):
         for name in names:
             names[name] = VersionControlState.Controlled
 
-        found = False
-        for name in self.statusCache:
-            if name in names:
-                found = True
-                names[name] = self.statusCache[name]
+        # find the root of the repo
+        repodir = self.findRepoRoot(dname)
+        if not repodir:
+            return names
 
-        if not found:
-            # find the root of the repo
-            repodir = self.findRepoRoot(dname)
-            if not repodir:
-                return names
+        snapshot = self.__statusProvider.snapshot(repodir)
+        for name in names:
+            names[name] = snapshot.registeredState(os.path.relpath(name, repodir))
 
-            args = self.initCommand("status")
-            args.append("--porcelain")
+        return names
 
-            ioEncoding = Preferences.getSystem("IOEncoding")
-            output = ""
-            process = QProcess()
-            process.setWorkingDirectory(dname)
-            process.start("git", args)
-            procStarted = process.waitForStarted(5000)
-            if procStarted:
-                finished = process.waitForFinished(30000)
-                if finished and process.exitCode() == 0:
-                    output = str(process.readAllStandardOutput(), ioEncoding, "replace")
-
-            if output:
-                for line in output.splitlines():
-                    if line and line[0] in " MADRCU!?":
-                        flag = line[1]
-                        path = line[3:].split(" -> ")[-1]
-                        name = os.path.normcase(os.path.join(repodir, path))
-                        dirName = os.path.dirname(name)
-                        if name.startswith(dname) and flag in "?!":
-                            isDir = name.endswith(("/", "\\"))
-                            if isDir:
-                                name = name[:-1]
-                            if name in names:
-                                names[name] = VersionControlState.Uncontrolled
-                            if isDir:
-                                # it's a directory
-                                for nname in names:
-                                    if nname.startswith(name):
-                                        names[nname] = VersionControlState.Uncontrolled
-                        if flag not in "?!":
-                            self.statusCache[name] = VersionControlState.Controlled
-                            self.statusCache[dirName] = VersionControlState.Controlled
-                        else:
-                            self.statusCache[name] = VersionControlState.Uncontrolled
-                            if dirName not in self.statusCache:
-                                self.statusCache[dirName] = (
-                                    VersionControlState.Uncontrolled
-                                )
+    def getStatusProvider(self):
+        """
+        Public method to get a reference to the status provider.
 
-        return names
+        @return reference to the status provider
+        @rtype GitStatusProvider
+        """
+        return self.__statusProvider
 
     def clearStatusCache(self):
         """
         Public method to clear the status cache.
+
+        Note: The status snapshots are refreshed in the background, if the
+        index of their repository has been modified.
         """
-        self.statusCache = {}
+        self.__statusProvider.checkRepositories()
+
+    def __fileSaved(self, fileName):
+        """
+        Private slot handling a saved file.
+
+        @param fileName name of the saved file
+        @type str
+        """
+        fileName = os.path.normcase(os.path.abspath(fileName))
+        repodir = self.findRepoRoot(os.path.dirname(fileName))
+        if repodir and self.__statusProvider.hasSnapshot(repodir):
+            if os.path.basename(fileName) == Git.IgnoreFileName or fileName.endswith(
+                os.path.join(self.adminDirOrFile, "info", "exclude")
+            ):
+                # the saved file changes the untracked state of other files
+                self.__statusProvider.refresh(repodir)
+            else:
+                self.__statusProvider.refresh(
+                    repodir, [os.path.relpath(fileName, repodir)]
+                )
+
+    def __registeredStatesChanged(self, repodir, names):  # noqa: U100
+        """
+        Private slot handling a change of the registered state of files.
+
+        @param repodir root directory of the repository (unused)
+        @type str
+        @param names absolute paths of the changed files and directories
+        @type list of str
+        """
+        project = ericApp().getObject("Project")
+        if project.vcs is self:
+            model = project.getModel()
+            for name in names:
+                model.updateVCSStatus(name)
 
     def vcsName(self):
         """
@@ -4614,7 +4586,10 @@ class Git(VersionControl):
         """
         from .GitStatusMonitorThread import GitStatusMonitorThread
 
-        return GitStatusMonitorThread(interval, project, self)
+        thread = GitStatusMonitorThread(interval, project, self)
+        # share the repository status with the project browsers
+        thread.statusEntries.connect(self.__statusProvider.setEntries)
+        return thread
 
     ###########################################################################
     ##  Method to find the repository root
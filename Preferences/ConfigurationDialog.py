@@ -1592,6 +1592,8 @@ class ConfigurationWidget(QWidget):
                     QApplication.processEvents()  # ensure HMI is responsive
                     now = time.monotonic()
 
+        Preferences.refreshSnapshots()
+
     def on_buttonBox_clicked(self, button):
         """
         Private slot called by a button of the button box clicked.
@@ -1613,6 +1615,7 @@ class ConfigurationWidget(QWidget):
             page = self.configStack.currentWidget()
             savedState = page.saveState()
             page.save()
+            Preferences.refreshSnapshots()
             self.preferencesChanged.emit()
             if savedState is not None:
                 page.setState(savedState)
@@ -103,6 +103,15 @@ class ApplicationPage(ConfigurationPageBase, Ui_ApplicationPage):
         self.backgroundServicesSpinBox.setValue(
             Preferences.getUI("BackgroundServiceProcesses")
         )
+        self.backgroundServicesCacheSpinBox.setValue(
+            Preferences.getUI("BackgroundServiceCacheSize")
+        )
+        self.backgroundServicesCompressionCheckBox.setChecked(
+            Preferences.getUI("BackgroundServiceCompression")
+        )
+        self.backgroundServicesChecksumsCheckBox.setChecked(
+            Preferences.getUI("BackgroundServiceChecksums")
+        )
 
         self.upgraderDelaySpinBox.setValue(Preferences.getUI("UpgraderDelay"))
 
@@ -165,6 +174,17 @@ class ApplicationPage(ConfigurationPageBase, Ui_ApplicationPage):
         Preferences.setUI(
             "BackgroundServiceProcesses", self.backgroundServicesSpinBox.value()
         )
+        Preferences.setUI(
+            "BackgroundServiceCacheSize", self.backgroundServicesCacheSpinBox.value()
+        )
+        Preferences.setUI(
+            "BackgroundServiceCompression",
+            self.backgroundServicesCompressionCheckBox.isChecked(),
+        )
+        Preferences.setUI(
+            "BackgroundServiceChecksums",
+            self.backgroundServicesChecksumsCheckBox.isChecked(),
+        )
 
         Preferences.setUI("UpgraderDelay", self.upgraderDelaySpinBox.value())
 
@@ -177,6 +177,9 @@ class DebuggerGeneralPage(ConfigurationPageBase, Ui_DebuggerGeneralPage):
             Preferences.getDebugger("ShowExceptionInShell")
         )
         self.maxSizeSpinBox.setValue(Preferences.getDebugger("MaxVariableSize"))
+        self.elementsBudgetSpinBox.setValue(
+            Preferences.getDebugger("VariablesElementsBudget")
+        )
         # Set the colours for debug viewer backgrounds
         self.previewMdl = PreviewModel()
         self.preView.setModel(self.previewMdl)
@@ -280,6 +283,9 @@ class DebuggerGeneralPage(ConfigurationPageBase, Ui_DebuggerGeneralPage):
             "ShowExceptionInShell", self.exceptionShellCheckBox.isChecked()
         )
         Preferences.setDebugger("MaxVariableSize", self.maxSizeSpinBox.value())
+        Preferences.setDebugger(
+            "VariablesElementsBudget", self.elementsBudgetSpinBox.value()
+        )
         # Store background colors for debug viewer
         self.saveColours(Preferences.setDebugger)
 
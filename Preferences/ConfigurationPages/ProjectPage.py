@@ -79,6 +79,9 @@ class ProjectPage(ConfigurationPageBase, Ui_ProjectPage):
         self.restartShellCheckBox.setChecked(
             Preferences.getProject("RestartShellForProject")
         )
+        self.projectSearchIndexCheckBox.setChecked(
+            Preferences.getProject("SearchIndex")
+        )
 
     def save(self):
         """
@@ -138,6 +141,9 @@ class ProjectPage(ConfigurationPageBase, Ui_ProjectPage):
         Preferences.setProject(
             "RestartShellForProject", self.restartShellCheckBox.isChecked()
         )
+        Preferences.setProject(
+            "SearchIndex", self.projectSearchIndexCheckBox.isChecked()
+        )
 
 
 def create(_dlg):
@@ -168,6 +168,26 @@ class Ui_ApplicationPage(object):
         spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
         self.horizontalLayout.addItem(spacerItem2)
         self.verticalLayout_3.addLayout(self.horizontalLayout)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.label_4 = QtWidgets.QLabel(parent=self.groupBox_6)
+        self.label_4.setObjectName("label_4")
+        self.horizontalLayout_4.addWidget(self.label_4)
+        self.backgroundServicesCacheSpinBox = QtWidgets.QSpinBox(parent=self.groupBox_6)
+        self.backgroundServicesCacheSpinBox.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.backgroundServicesCacheSpinBox.setMaximum(10000)
+        self.backgroundServicesCacheSpinBox.setSingleStep(10)
+        self.backgroundServicesCacheSpinBox.setObjectName("backgroundServicesCacheSpinBox")
+        self.horizontalLayout_4.addWidget(self.backgroundServicesCacheSpinBox)
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_4.addItem(spacerItem4)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_4)
+        self.backgroundServicesCompressionCheckBox = QtWidgets.QCheckBox(parent=self.groupBox_6)
+        self.backgroundServicesCompressionCheckBox.setObjectName("backgroundServicesCompressionCheckBox")
+        self.verticalLayout_3.addWidget(self.backgroundServicesCompressionCheckBox)
+        self.backgroundServicesChecksumsCheckBox = QtWidgets.QCheckBox(parent=self.groupBox_6)
+        self.backgroundServicesChecksumsCheckBox.setObjectName("backgroundServicesChecksumsCheckBox")
+        self.verticalLayout_3.addWidget(self.backgroundServicesChecksumsCheckBox)
         self.verticalLayout_5.addWidget(self.groupBox_6)
         spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
         self.verticalLayout_5.addItem(spacerItem3)
@@ -197,6 +217,9 @@ class Ui_ApplicationPage(object):
         ApplicationPage.setTabOrder(self.errorlogCheckBox, self.msgSeverityComboBox)
         ApplicationPage.setTabOrder(self.msgSeverityComboBox, self.intervalSpinBox)
         ApplicationPage.setTabOrder(self.intervalSpinBox, self.backgroundServicesSpinBox)
+        ApplicationPage.setTabOrder(self.backgroundServicesSpinBox, self.backgroundServicesCacheSpinBox)
+        ApplicationPage.setTabOrder(self.backgroundServicesCacheSpinBox, self.backgroundServicesCompressionCheckBox)
+        ApplicationPage.setTabOrder(self.backgroundServicesCompressionCheckBox, self.backgroundServicesChecksumsCheckBox)
 
     def retranslateUi(self, ApplicationPage):
         _translate = QtCore.QCoreApplication.translate
@@ -256,3 +279,12 @@ class Ui_ApplicationPage(object):
         self.groupBox_6.setTitle(_translate("ApplicationPage", "Background Services"))
         self.label.setText(_translate("ApplicationPage", "max. Processes:"))
         self.backgroundServicesSpinBox.setSpecialValueText(_translate("ApplicationPage", "Automatic"))
+        self.label_4.setToolTip(_translate("ApplicationPage", "Enter the maximum size of the persistent result cache of the batch checkers"))
+        self.label_4.setText(_translate("ApplicationPage", "Result Cache Size:"))
+        self.backgroundServicesCacheSpinBox.setToolTip(_translate("ApplicationPage", "Enter the maximum size of the persistent result cache of the batch checkers"))
+        self.backgroundServicesCacheSpinBox.setSpecialValueText(_translate("ApplicationPage", "Disabled"))
+        self.backgroundServicesCacheSpinBox.setSuffix(_translate("ApplicationPage", " MB"))
+        self.backgroundServicesCompressionCheckBox.setToolTip(_translate("ApplicationPage", "Select to compress large messages exchanged with the background services"))
+        self.backgroundServicesCompressionCheckBox.setText(_translate("ApplicationPage", "Compress large messages"))
+        self.backgroundServicesChecksumsCheckBox.setToolTip(_translate("ApplicationPage", "Select to protect the messages exchanged with the background services by a checksum"))
+        self.backgroundServicesChecksumsCheckBox.setText(_translate("ApplicationPage", "Verify message checksums"))
@@ -276,6 +276,16 @@ class Ui_DebuggerGeneralPage(object):
         self.maxSizeSpinBox.setSingleStep(16384)
         self.maxSizeSpinBox.setObjectName("maxSizeSpinBox")
         self.horizontalLayout.addWidget(self.maxSizeSpinBox)
+        self.label_7 = QtWidgets.QLabel(parent=self.groupBox_11)
+        self.label_7.setObjectName("label_7")
+        self.horizontalLayout.addWidget(self.label_7)
+        self.elementsBudgetSpinBox = QtWidgets.QSpinBox(parent=self.groupBox_11)
+        self.elementsBudgetSpinBox.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.elementsBudgetSpinBox.setProperty("showGroupSeparator", True)
+        self.elementsBudgetSpinBox.setMaximum(1073741824)
+        self.elementsBudgetSpinBox.setSingleStep(65536)
+        self.elementsBudgetSpinBox.setObjectName("elementsBudgetSpinBox")
+        self.horizontalLayout.addWidget(self.elementsBudgetSpinBox)
         spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
         self.horizontalLayout.addItem(spacerItem5)
         self.verticalLayout_6.addLayout(self.horizontalLayout)
@@ -373,7 +383,8 @@ class Ui_DebuggerGeneralPage(object):
         DebuggerGeneralPage.setTabOrder(self.recentFilesSpinBox, self.exceptionBreakCheckBox)
         DebuggerGeneralPage.setTabOrder(self.exceptionBreakCheckBox, self.exceptionShellCheckBox)
         DebuggerGeneralPage.setTabOrder(self.exceptionShellCheckBox, self.maxSizeSpinBox)
-        DebuggerGeneralPage.setTabOrder(self.maxSizeSpinBox, self.backgroundNewButton)
+        DebuggerGeneralPage.setTabOrder(self.maxSizeSpinBox, self.elementsBudgetSpinBox)
+        DebuggerGeneralPage.setTabOrder(self.elementsBudgetSpinBox, self.backgroundNewButton)
         DebuggerGeneralPage.setTabOrder(self.backgroundNewButton, self.backgroundChangedButton)
         DebuggerGeneralPage.setTabOrder(self.backgroundChangedButton, self.showOnlyCheckBox)
         DebuggerGeneralPage.setTabOrder(self.showOnlyCheckBox, self.autoViewSourcecodeCheckBox)
@@ -468,6 +479,9 @@ class Ui_DebuggerGeneralPage(object):
         self.maxSizeSpinBox.setToolTip(_translate("DebuggerGeneralPage", "Enter the maximum size of a variable to be shown (0 = no limit)"))
         self.maxSizeSpinBox.setSpecialValueText(_translate("DebuggerGeneralPage", "no limit"))
         self.maxSizeSpinBox.setSuffix(_translate("DebuggerGeneralPage", " Bytes"))
+        self.label_7.setText(_translate("DebuggerGeneralPage", "Elements Budget:"))
+        self.elementsBudgetSpinBox.setToolTip(_translate("DebuggerGeneralPage", "Enter the maximum number of elements of a variable processed as a whole, e.g. to sort the keys of a dictionary (0 = default of the debug client)"))
+        self.elementsBudgetSpinBox.setSpecialValueText(_translate("DebuggerGeneralPage", "default"))
         self.groupBox_2.setTitle(_translate("DebuggerGeneralPage", "Background Colors"))
         self.backgroundChangedButton.setToolTip(_translate("DebuggerGeneralPage", "Select the background color for changed items."))
         self.label_bgChangedItems.setText(_translate("DebuggerGeneralPage", "Changed elements:"))
@@ -137,6 +137,14 @@ class Ui_ProjectPage(object):
         self.rescanTasksCheckBox.setObjectName("rescanTasksCheckBox")
         self.horizontalLayout_2.addWidget(self.rescanTasksCheckBox)
         self.verticalLayout_3.addWidget(self.groupBox_8)
+        self.groupBox_11 = QtWidgets.QGroupBox(parent=ProjectPage)
+        self.groupBox_11.setObjectName("groupBox_11")
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout(self.groupBox_11)
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.projectSearchIndexCheckBox = QtWidgets.QCheckBox(parent=self.groupBox_11)
+        self.projectSearchIndexCheckBox.setObjectName("projectSearchIndexCheckBox")
+        self.horizontalLayout_4.addWidget(self.projectSearchIndexCheckBox)
+        self.verticalLayout_3.addWidget(self.groupBox_11)
         spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
         self.verticalLayout_3.addItem(spacerItem1)
 
@@ -160,6 +168,7 @@ class Ui_ProjectPage(object):
         ProjectPage.setTabOrder(self.restartShellCheckBox, self.projectRecentSpinBox)
         ProjectPage.setTabOrder(self.projectRecentSpinBox, self.autosaveTasksCheckBox)
         ProjectPage.setTabOrder(self.autosaveTasksCheckBox, self.rescanTasksCheckBox)
+        ProjectPage.setTabOrder(self.rescanTasksCheckBox, self.projectSearchIndexCheckBox)
 
     def retranslateUi(self, ProjectPage):
         _translate = QtCore.QCoreApplication.translate
@@ -209,3 +218,6 @@ class Ui_ProjectPage(object):
         self.autosaveTasksCheckBox.setText(_translate("ProjectPage", "Save tasks automatically"))
         self.rescanTasksCheckBox.setToolTip(_translate("ProjectPage", "Select to rescan the project tasks when a project is opened"))
         self.rescanTasksCheckBox.setText(_translate("ProjectPage", "Rescan tasks upon opening"))
+        self.groupBox_11.setTitle(_translate("ProjectPage", "Find in Files"))
+        self.projectSearchIndexCheckBox.setToolTip(_translate("ProjectPage", "Select to maintain an index of the project files to speed up searching them"))
+        self.projectSearchIndexCheckBox.setText(_translate("ProjectPage", "Use a search index for project files"))
@@ -17,6 +17,7 @@ needed with the statement 'from eric7 import Preferences'. Do not use
 """
 
 import ast
+import contextlib
 import fnmatch
 import json
 import os
@@ -31,12 +32,14 @@ from PyQt6.QtCore import (
     QDir,
     QLibraryInfo,
     QLocale,
+    QObject,
     QPoint,
     QSettings,
     QSize,
     Qt,
     QtMsgType,
     QUrl,
+    pyqtSignal,
 )
 from PyQt6.QtGui import QColor, QFont, QPalette
 from PyQt6.QtPdfWidgets import QPdfView
@@ -111,6 +114,9 @@ class Prefs:
         "AutoViewSourceCode": False,
         "ShowOnlyAsDefault": False,
         "MaxVariableSize": 0,  # Bytes, 0 = no limit
+        "VariablesElementsBudget": 1024 * 1024,
+        # maximum number of elements processed as a whole (e.g. to sort the keys
+        # of a dictionary or to calculate the minimum of an array)
         "BgColorNew": QColor("#28FFEEAA"),
         "BgColorChanged": QColor("#2870FF66"),
         "AllowedHosts": ["127.0.0.1", "::1%0"],
@@ -126,6 +132,9 @@ class Prefs:
     uiDefaults = {
         "KeyboardInputInterval": 0,  # 0 = use system default
         "BackgroundServiceProcesses": 0,  # 0 = max. CPUs minus one
+        "BackgroundServiceCacheSize": 100,  # MB, 0 = result cache disabled
+        "BackgroundServiceCompression": False,
+        "BackgroundServiceChecksums": False,
         "Language": "System",
         "Style": "System",
         "StyleSheet": "",
@@ -907,6 +916,7 @@ class Prefs:
         "RestartShellForProject": True,
         "BrowsersListHiddenFiles": False,
         "AutoSaveProject": False,
+        "SearchIndex": False,
     }
 
     # defaults for the multi project settings
@@ -1878,6 +1888,9 @@ def initPreferences(withMigration=False):
                 )
                 Prefs.settings.remove(oldKey)
 
+    # the settings object was replaced (e.g. by importing preferences)
+    refreshSnapshots()
+
 
 def getSettings():
     """
@@ -2045,7 +2058,13 @@ def getDebugger(key):
         return EricUtilities.toBool(
             Prefs.settings.value("Debugger/" + key, Prefs.debuggerDefaults[key])
         )
-    elif key in ("PassiveDbgPort", "MaxVariableSize", "RecentNumber", "NetworkPort"):
+    elif key in (
+        "PassiveDbgPort",
+        "MaxVariableSize",
+        "RecentNumber",
+        "NetworkPort",
+        "VariablesElementsBudget",
+    ):
         return int(Prefs.settings.value("Debugger/" + key, Prefs.debuggerDefaults[key]))
     elif key in ["AllowedHosts"]:
         return EricUtilities.toList(
@@ -2258,6 +2277,8 @@ def getUI(key):
         "CombinedLeftRightSidebar",
         "LoadUnknownMimeTypeFiles",
         "TextMimeTypesAskUser",
+        "BackgroundServiceCompression",
+        "BackgroundServiceChecksums",
     ]:
         return EricUtilities.toBool(
             Prefs.settings.value("UI/" + key, Prefs.uiDefaults[key])
@@ -2272,6 +2293,7 @@ def getUI(key):
         "UpgraderDelay",
         "KeyboardInputInterval",
         "BackgroundServiceProcesses",
+        "BackgroundServiceCacheSize",
         "MinimumMessageTypeSeverity",
     ]:
         return int(Prefs.settings.value("UI/" + key, Prefs.uiDefaults[key]))
@@ -2534,6 +2556,7 @@ def setEditor(key, value):
         Prefs.settings.setValue("Editor/" + key, value.value)
     else:
         Prefs.settings.setValue("Editor/" + key, value)
+    _updateSnapshotValue("Editor", key)
 
 
 def getEditorColour(key):
@@ -3994,6 +4017,7 @@ def setDocuViewer(key, value):
     @type Any
     """
     Prefs.settings.setValue("CodeDocumentationViewer/" + key, value)
+    _updateSnapshotValue("CodeDocumentationViewer", key)
 
 
 def getConda(key):
@@ -4360,6 +4384,159 @@ def convertPasswords(oldPassword, newPassword):
     EricPreferences.convertPasswords(oldPassword, newPassword)
 
 
+class PreferencesSnapshot(QObject):
+    """
+    Class implementing a typed, in-memory snapshot of a preferences section.
+
+    The values of all keys of the section are decoded once and are available
+    as plain attributes of the snapshot (e.g. 'snapshot.OnlineChangeTrace').
+    Code executed very often (e.g. on every key stroke) should use these in
+    order to avoid the key lookup, the settings access and the type conversion
+    done by the accessor functions.
+
+    A value is updated, whenever it is stored with the respective set function.
+    All values are read again, after the configuration dialog saved the
+    preferences or the preferences were imported.
+
+    @signal valueChanged(key:str, value:Any) emitted after the value of a key
+        has changed
+    @signal sectionChanged(keys:list) emitted with the list of changed keys
+        after values of the section have changed
+    """
+
+    valueChanged = pyqtSignal(str, object)
+    sectionChanged = pyqtSignal(list)
+
+    def __init__(self, section, getter, keys, parent=None):
+        """
+        Constructor
+
+        @param section name of the preferences section
+        @type str
+        @param getter accessor function of the section
+        @type function
+        @param keys keys of the section
+        @type list of str
+        @param parent reference to the parent object (defaults to None)
+        @type QObject (optional)
+        """
+        super().__init__(parent)
+
+        self.__section = section
+        self.__getter = getter
+        self.__keys = list(keys)
+        self.__keysSet = set(self.__keys)
+
+        for key in self.__keys:
+            setattr(self, key, getter(key))
+
+    def section(self):
+        """
+        Public method to get the name of the preferences section.
+
+        @return name of the preferences section
+        @rtype str
+        """
+        return self.__section
+
+    def __update(self, key):
+        """
+        Private method to read the value of a key again.
+
+        @param key key of the value
+        @type str
+        @return flag indicating a changed value
+        @rtype bool
+        """
+        value = self.__getter(key)
+        if value != getattr(self, key):
+            setattr(self, key, value)
+            self.valueChanged.emit(key, value)
+            return True
+
+        return False
+
+    def updateValue(self, key):
+        """
+        Public method to read the value of a key again.
+
+        @param key key of the value
+        @type str
+        """
+        if key in self.__keysSet and self.__update(key):
+            self.sectionChanged.emit([key])
+
+    def refresh(self):
+        """
+        Public method to read all values of the section again.
+
+        @return list of changed keys
+        @rtype list of str
+        """
+        changedKeys = [key for key in self.__keys if self.__update(key)]
+        if changedKeys:
+            self.sectionChanged.emit(changedKeys)
+
+        return changedKeys
+
+
+_SnapshotSections = {
+    # dictionary with the section name as key and a tuple of the accessor
+    # function and the default values as value
+    "CodeDocumentationViewer": (getDocuViewer, Prefs.docuViewerDefaults),
+    "Editor": (getEditor, Prefs.editorDefaults),
+}
+_Snapshots = {}
+
+
+def getSnapshot(section):
+    """
+    Module function to get the typed snapshot of a preferences section.
+
+    @param section name of the preferences section (one of "Editor" or
+        "CodeDocumentationViewer")
+    @type str
+    @return reference to the snapshot of the section
+    @rtype PreferencesSnapshot
+    @exception KeyError raised to indicate an unsupported section
+    """
+    try:
+        return _Snapshots[section]
+    except KeyError:
+        if section not in _SnapshotSections:
+            raise KeyError(
+                "Snapshots of the section '{0}' are not supported.".format(section)
+            ) from None
+
+        getter, defaults = _SnapshotSections[section]
+        _Snapshots[section] = PreferencesSnapshot(section, getter, defaults.keys())
+        return _Snapshots[section]
+
+
+def refreshSnapshots():
+    """
+    Module function to read all values of the preferences snapshots again.
+
+    This must be called after the preferences were changed without using the
+    set functions (e.g. by the configuration dialog).
+    """
+    for snapshot in _Snapshots.values():
+        snapshot.refresh()
+
+
+def _updateSnapshotValue(section, key):
+    """
+    Function to read the value of a key of a preferences snapshot again.
+
+    @param section name of the preferences section
+    @type str
+    @param key key of the value
+    @type str
+    """
+    with contextlib.suppress(KeyError):
+        _Snapshots[section].updateValue(key)
+
+
 initPreferences(withMigration=True)
 initRecentSettings()
 EricPreferences.initPreferences()
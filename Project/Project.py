@@ -61,6 +61,7 @@ from .DebuggerPropertiesFile import DebuggerPropertiesFile
 from .FileCategoryRepositoryItem import FileCategoryRepositoryItem
 from .ProjectBrowserModel import ProjectBrowserModel
 from .ProjectFile import ProjectFile
+from .ProjectSearchIndex import ProjectSearchIndex
 from .UserProjectFile import UserProjectFile
 
 
@@ -528,6 +529,7 @@ class Project(QObject):
         self.dbgReportAllExceptions = False
         self.dbgEnableMultiprocess = True
         self.dbgMultiprocessNoDebug = ""
+        self.__searchIndex = None
         self.dbgGlobalConfigOverride = {
             "enable": False,
             "redirect": True,
@@ -2609,6 +2611,8 @@ class Project(QObject):
             if fn in self.__pdata[fileCategory]:
                 self.__pdata[fileCategory].remove(fn)
                 self.projectFileRemoved.emit(fn, fileCategory)
+                if self.__searchIndex is not None:
+                    self.__searchIndex.remove(self.getAbsolutePath(fn))
                 self.setDirty(True)
                 if updateModel:
                     self.__model.removeItem(fn)
@@ -4052,6 +4056,9 @@ class Project(QObject):
         # now close all project related tool windows
         self.__closeAllWindows()
 
+        if self.__searchIndex is not None:
+            self.__searchIndex.save()
+
         self.__initData()
         self.reloadAct.setEnabled(False)
         self.closeAct.setEnabled(False)
@@ -6288,6 +6295,35 @@ class Project(QObject):
         ]
 
         dirs = [""] if recursiveSearch else self.subdirs[:] + [""]
+        if isRemote:
+            # scan the project tree with a single request and group the entries
+            # by directory
+            remoteEntries = {}
+            remoteDirectories = set()
+            try:
+                listing = self.__remotefsInterface.scanTree(
+                    self.ppath,
+                    directories=[
+                        d
+                        for d in dirs
+                        if not any(
+                            fnmatch.fnmatch(d, ignore_pattern)
+                            for ignore_pattern in ignore_patterns
+                        )
+                    ],
+                    recursive=recursiveSearch,
+                    excludeNames=["__pycache__"],
+                    excludeDirs=ignore_patterns,
+                )
+            except OSError:
+                listing = []
+            for entry in listing:
+                remoteEntries.setdefault(entry["directory"], []).append(entry["name"])
+                if entry["is_dir"]:
+                    remoteDirectories.add(
+                        self.__remotefsInterface.join(entry["directory"], entry["name"])
+                    )
+
         for directory in dirs:
             if any(
                 fnmatch.fnmatch(directory, ignore_pattern)
@@ -6300,14 +6336,13 @@ class Project(QObject):
                 if isRemote
                 else os.path.join(self.ppath, directory)
             )
-            try:
-                newSources = (
-                    [e["name"] for e in self.__remotefsInterface.listdir(curpath)[2]]
-                    if isRemote
-                    else os.listdir(curpath)
-                )
-            except OSError:
-                newSources = []
+            if isRemote:
+                newSources = remoteEntries.get(directory, [])
+            else:
+                try:
+                    newSources = os.listdir(curpath)
+                except OSError:
+                    newSources = []
             pattern = (
                 self.__pdata["TRANSLATIONPATTERN"].replace("%language%", "*")
                 if self.__pdata["TRANSLATIONPATTERN"]
@@ -6332,7 +6367,7 @@ class Project(QObject):
                         self.__remotefsInterface.join(curpath, ns)
                     )
 
-                    isdir_ns = self.__remotefsInterface.isdir(ns)
+                    isdir_ns = fn in remoteDirectories
                 else:
                     fn = os.path.join(directory, ns) if directory else ns
                     ns = os.path.abspath(os.path.join(curpath, ns))
@@ -6492,6 +6527,47 @@ class Project(QObject):
             self.__model.repopulateItem(name)
             self.completeRepopulateItem.emit(name)
 
+    def getSearchIndex(self):
+        """
+        Public method to get a reference to the search index of the project.
+
+        The search index is loaded on first use. It is only available for
+        local projects and if it is enabled in the project settings.
+
+        @return reference to the search index
+        @rtype ProjectSearchIndex or None
+        """
+        if (
+            self.__searchIndex is None
+            and self.isOpen()
+            and not FileSystemUtilities.isRemoteFileName(self.ppath)
+            and Preferences.getProject("SearchIndex")
+        ):
+            with contextlib.suppress(OSError):
+                self.createProjectManagementDir()
+            self.__searchIndex = ProjectSearchIndex(
+                os.path.join(
+                    self.getProjectManagementDir(), "{0}.esi".format(self.name)
+                ),
+                self.ppath,
+            )
+            self.__searchIndex.load()
+
+        return self.__searchIndex
+
+    def updateSearchIndex(self, fullname):
+        """
+        Public slot to update the search index entry of a file.
+
+        Note: Nothing is done, if the search index was not loaded yet. Outdated
+        entries are detected and updated by the next search.
+
+        @param fullname full name of the changed file
+        @type str
+        """
+        if self.__searchIndex is not None:
+            self.__searchIndex.updateFile(os.path.abspath(fullname))
+
     ##############################################################
     ## Below is the VCS interface
     ##############################################################
@@ -368,12 +368,7 @@ class ProjectBrowserModel(BrowserModel):
             entryInfoList = qdir.entryInfoList(fileFilter)
 
             if len(entryInfoList) > 0:
-                if repopulate:
-                    self.beginInsertRows(
-                        self.createIndex(parentItem.row(), 0, parentItem),
-                        0,
-                        len(entryInfoList) - 1,
-                    )
+                nodes = []
                 states = {}
                 if self.project.vcs is not None:
                     for f in entryInfoList:
@@ -418,19 +413,13 @@ class ProjectBrowserModel(BrowserModel):
                             node.addVcsStatus(self.tr("local"))
                     else:
                         node.addVcsStatus("")
-                    self._addItem(node, parentItem)
-                if repopulate:
-                    self.endInsertRows()
+                    nodes.append(node)
+                self._addItems(nodes, parentItem, repopulate)
 
         elif FileSystemUtilities.isRemoteFileName(dirName):
             entriesList = self.__remotefsInterface.listdir(dirName)[2]
             if len(entriesList) > 0:
-                if repopulate:
-                    self.beginInsertRows(
-                        self.createIndex(parentItem.row(), 0, parentItem),
-                        0,
-                        len(entryInfoList) - 1,
-                    )
+                nodes = []
                 for entry in entriesList:
                     node = (
                         ProjectBrowserDirectoryItem(
@@ -449,9 +438,8 @@ class ProjectBrowserModel(BrowserModel):
                         )
                     )
                     node.addVcsStatus("")
-                    self._addItem(node, parentItem)
-                if repopulate:
-                    self.endInsertRows()
+                    nodes.append(node)
+                self._addItems(nodes, parentItem, repopulate)
 
     def projectClosed(self):
         """
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+
+"""
+Module implementing a persistent trigram index of the project files used to
+narrow the files to be searched by Find in Files.
+"""
+
+import array
+import collections
+import contextlib
+import itertools
+import operator
+import os
+import re
+import sqlite3
+import sys
+import threading
+
+
+class ProjectSearchIndex:
+    """
+    Class implementing a persistent trigram index of the project files.
+
+    For each file a signature of the trigrams contained in its words (runs of
+    ASCII letters, digits and underscores) is stored. A trigram sets the bit
+    given by its value modulo the signature size. A file may contain a literal
+    search text, only if its signature contains all bits of the trigrams of the
+    words of the search text. The trigrams are built from the lower cased text,
+    so the index serves case sensitive and case insensitive searches.
+
+    Files containing NUL bytes (e.g. binary or UTF-16 encoded files) are not
+    indexed and are always searched. Files containing non-ASCII characters are
+    searched as well for case insensitive searches of texts, whose letters have
+    non-ASCII case variants (e.g. 'k' and the Kelvin sign).
+
+    The index is stored in a SQLite database in the project management
+    directory. Entries are validated by the size and modification time of the
+    file.
+    """
+
+    DatabaseVersion = 1
+    SignatureBits = 4093  # prime to spread the trigram values
+
+    FlagUnindexable = 0x01
+    FlagNonAscii = 0x02
+
+    # ASCII letters having non-ASCII case variants in Unicode case folding
+    NonAsciiCaseLetters = "iks"
+
+    __WordTable = bytes.maketrans(
+        bytes(range(256)),
+        bytes(
+            c if (48 <= c <= 57 or 97 <= c <= 122 or c == 95) else 32
+            for c in range(256)
+        ),
+    )
+    __TrigramRe = re.compile(rb"(?=([a-z0-9_]{3}))")
+
+    def __init__(self, databaseFile, rootPath):
+        """
+        Constructor
+
+        @param databaseFile path of the index database
+        @type str
+        @param rootPath root directory of the indexed files
+        @type str
+        """
+        self.__databaseFile = databaseFile
+        self.__rootPath = os.path.join(os.path.abspath(rootPath), "")
+
+        self.__lock = threading.Lock()
+        # dictionary with the file path as key and a tuple of modification
+        # time, size, flags and signature as value
+        self.__entries = None
+        self.__dirty = set()
+
+    @classmethod
+    def fileSignature(cls, data):
+        """
+        Class method to calculate the index entry data of a file.
+
+        @param data contents of the file
+        @type bytes
+        @return tuple containing the flags and the signature of the data
+        @rtype tuple of (int, int)
+        """
+        if b"\0" in data:
+            return cls.FlagUnindexable, 0
+
+        flags = 0 if data.isascii() else cls.FlagNonAscii
+        words = set(data.lower().translate(cls.__WordTable).split())
+        trigrams = set(cls.__TrigramRe.findall(b" ".join(words)))
+        if not trigrams:
+            return flags, 0
+
+        # the trigram values are the little endian values of the zero padded
+        # trigrams
+        values = array.array("I", b"\0".join(trigrams) + b"\0")
+        if sys.byteorder == "big":
+            values.byteswap()
+        # the bits are collected as digits of a binary number, which is faster
+        # than combining large integers per trigram
+        digits = bytearray(b"0" * cls.SignatureBits)
+        collections.deque(
+            map(
+                digits.__setitem__,
+                map(operator.mod, values, itertools.repeat(cls.SignatureBits)),
+                itertools.repeat(ord("1")),
+            ),
+            maxlen=0,
+        )
+        return flags, int(digits[::-1], 2)
+
+    @classmethod
+    def queryMask(cls, literal):
+        """
+        Class method to calculate the signature bits a file containing the given
+        literal text must have.
+
+        @param literal literal text to be searched for
+        @type str
+        @return signature mask (0, if the text does not allow narrowing the
+            files to be searched)
+        @rtype int
+        """
+        if not literal.isascii():
+            return 0
+
+        return cls.fileSignature(literal.encode("ascii"))[1]
+
+    def isValid(self):
+        """
+        Public method to check, if the index could be loaded.
+
+        @return flag indicating a usable index
+        @rtype bool
+        """
+        return self.__entries is not None
+
+    def load(self):
+        """
+        Public method to load the index from the database.
+
+        Note: An index of an incompatible version or of a different root
+        directory is discarded.
+        """
+        entries = {}
+        try:
+            with contextlib.closing(self.__connect()) as connection:
+                row = connection.execute(
+                    "SELECT version, root FROM info WHERE id = 0"
+                ).fetchone()
+                if row == (ProjectSearchIndex.DatabaseVersion, self.__rootPath):
+                    for path, mtime, size, flags, signature in connection.execute(
+                        "SELECT path, mtime, size, flags, signature FROM files"
+                    ):
+                        entries[path] = (
+                            mtime,
+                            size,
+                            flags,
+                            int.from_bytes(signature, "little"),
+                        )
+                else:
+                    connection.execute("DELETE FROM files")
+                    connection.execute(
+                        "INSERT OR REPLACE INTO info (id, version, root)"
+                        " VALUES (0, ?, ?)",
+                        (ProjectSearchIndex.DatabaseVersion, self.__rootPath),
+                    )
+                    connection.commit()
+        except (OSError, sqlite3.Error):
+            # use an in memory index only
+            pass
+
+        with self.__lock:
+            self.__entries = entries
+            self.__dirty.clear()
+
+    def save(self):
+        """
+        Public method to write the changed entries to the database.
+        """
+        with self.__lock:
+            if not self.__dirty or self.__entries is None:
+                return
+            changed = [(path, self.__entries.get(path)) for path in self.__dirty]
+            self.__dirty.clear()
+
+        signatureSize = (ProjectSearchIndex.SignatureBits + 7) // 8
+        try:
+            with contextlib.closing(self.__connect()) as connection:
+                connection.executemany(
+                    "DELETE FROM files WHERE path = ?",
+                    [(path,) for path, entry in changed if entry is None],
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO files"
+                    " (path, mtime, size, flags, signature) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (
+                            path,
+                            entry[0],
+                            entry[1],
+                            entry[2],
+                            entry[3].to_bytes(signatureSize, "little"),
+                        )
+                        for path, entry in changed
+                        if entry is not None
+                    ],
+                )
+                connection.commit()
+        except (OSError, sqlite3.Error):
+            pass
+
+    def __connect(self):
+        """
+        Private method to open the index database.
+
+        @return connection to the database
+        @rtype sqlite3.Connection
+        """
+        connection = sqlite3.connect(self.__databaseFile, timeout=5.0)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS info ("
+            " id INTEGER PRIMARY KEY,"
+            " version INTEGER NOT NULL,"
+            " root TEXT NOT NULL)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY,"
+            " mtime REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " flags INTEGER NOT NULL,"
+            " signature BLOB NOT NULL)"
+        )
+        return connection
+
+    def isIndexed(self, path):
+        """
+        Public method to check, if a file belongs to the indexed directory tree.
+
+        @param path absolute path of the file
+        @type str
+        @return flag indicating an indexed file
+        @rtype bool
+        """
+        return path.startswith(self.__rootPath)
+
+    def mayContain(self, path, fileStat, mask, nonAsciiCandidate=False):
+        """
+        Public method to check, if a file may contain a literal text.
+
+        @param path absolute path of the file
+        @type str
+        @param fileStat status of the file
+        @type os.stat_result
+        @param mask signature mask of the searched text as returned by
+            queryMask()
+        @type int
+        @param nonAsciiCandidate flag indicating that files containing
+            non-ASCII characters have to be searched (defaults to False)
+        @type bool (optional)
+        @return flag indicating a file, that may contain the text, or None, if
+            the file is not indexed or its index entry is outdated
+        @rtype bool or None
+        """
+        try:
+            mtime, size, flags, signature = self.__entries[path]
+        except (KeyError, TypeError):
+            return None
+
+        if mtime != fileStat.st_mtime or size != fileStat.st_size:
+            return None
+
+        return bool(
+            flags & ProjectSearchIndex.FlagUnindexable
+            or (nonAsciiCandidate and flags & ProjectSearchIndex.FlagNonAscii)
+            or signature & mask == mask
+        )
+
+    def update(self, path, fileStat, data):
+        """
+        Public method to update the index entry of a file given its contents.
+
+        @param path absolute path of the file
+        @type str
+        @param fileStat status of the file
+        @type os.stat_result
+        @param data contents of the file
+        @type bytes
+        """
+        if self.__entries is None or not self.isIndexed(path):
+            return
+
+        flags, signature = ProjectSearchIndex.fileSignature(data)
+        with self.__lock:
+            self.__entries[path] = (
+                fileStat.st_mtime,
+                fileStat.st_size,
+                flags,
+                signature,
+            )
+            self.__dirty.add(path)
+
+    def updateFile(self, path):
+        """
+        Public method to update the index entry of a file.
+
+        @param path absolute path of the file
+        @type str
+        """
+        if self.__entries is None or not self.isIndexed(path):
+            return
+
+        try:
+            with open(path, "rb") as f:
+                fileStat = os.fstat(f.fileno())
+                data = f.read()
+        except OSError:
+            self.remove(path)
+            return
+
+        self.update(path, fileStat, data)
+
+    def remove(self, path):
+        """
+        Public method to remove the index entry of a file.
+
+        @param path absolute path of the file
+        @type str
+        """
+        if self.__entries is None:
+            return
+
+        with self.__lock:
+            if self.__entries.pop(path, None) is not None:
+                self.__dirty.add(path)
+
+    def count(self):
+        """
+        Public method to get the number of indexed files.
+
+        @return number of indexed files
+        @rtype int
+        """
+        return 0 if self.__entries is None else len(self.__entries)
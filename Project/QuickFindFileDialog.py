@@ -21,8 +21,10 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from eric7.EricCore import EricFileSystemWatcher
 from eric7.EricWidgets.EricApplication import ericApp
 
+from .QuickFindFileIndex import QuickFindFileIndex
 from .Ui_QuickFindFile import Ui_QuickFindFile
 
 
@@ -68,6 +70,26 @@ class QuickFindFileDialog(QWidget, Ui_QuickFindFile):
         self.__remotefsInterface = (
             ericApp().getObject("EricServer").getServiceInterface("FileSystem")
         )
+        self.__isRemote = False
+
+        # The index of the project files is rebuilt lazily after the list of
+        # project files has changed. The cached modification times are
+        # discarded, when the dialog is shown, and are invalidated by saved
+        # editors and the file system watcher while it is open.
+        self.__index = QuickFindFileIndex()
+        self.__indexValid = False
+        self.project.projectOpened.connect(self.__invalidateIndex)
+        self.project.projectClosed.connect(self.__invalidateIndex)
+        self.project.projectFileAdded.connect(self.__invalidateIndex)
+        self.project.projectFileRemoved.connect(self.__invalidateIndex)
+        self.project.projectFileRenamed.connect(self.__invalidateIndex)
+
+        watcher = EricFileSystemWatcher.instance()
+        watcher.fileCreated.connect(self.__fileChanged)
+        watcher.fileDeleted.connect(self.__fileChanged)
+        watcher.fileModified.connect(self.__fileChanged)
+        watcher.fileMoved.connect(self.__fileMoved)
+        ericApp().getObject("ViewManager").editorSaved.connect(self.__fileChanged)
 
     def eventFilter(self, source, event):
         """
@@ -159,69 +181,80 @@ class QuickFindFileDialog(QWidget, Ui_QuickFindFile):
             entries = self.project.getProjectData(dataKey=fileCategory, default=[])
             yield from entries[:]
 
-    def __sortedMatches(self, items, searchTerm):
+    @pyqtSlot()
+    def __invalidateIndex(self):
+        """
+        Private slot to mark the index of the project files as outdated.
         """
-        Private method to find the subset of items which match a search term.
+        self.__indexValid = False
 
-        @param items list of items to be scanned for the search term
-        @type list of str
-        @param searchTerm search term to be searched for
+    def __updateIndex(self):
+        """
+        Private method to rebuild the index of the project files, if it is
+        outdated.
+        """
+        if not self.__indexValid:
+            self.__index.setEntries(
+                list(self.__generateLocations()),
+                (self.__remotefsInterface.separator() if self.__isRemote else os.sep),
+            )
+            self.__indexValid = True
+
+    @pyqtSlot(str)
+    def __fileChanged(self, path):
+        """
+        Private slot handling a created, deleted, modified or saved file.
+
+        @param path path of the changed file
+        @type str
+        """
+        if not self.__isRemote and self.project.startswithProjectPath(path):
+            self.__index.forgetModificationTime(self.project.getRelativePath(path))
+
+    @pyqtSlot(str, str)
+    def __fileMoved(self, srcPath, dstPath):
+        """
+        Private slot handling a moved file.
+
+        @param srcPath old path of the file
+        @type str
+        @param dstPath new path of the file
         @type str
-        @return sorted subset of items which match searchTerm in
-            relevance order (i.e. the most likely match first)
-        @rtype list of tuple of bool, int and str
-        """
-        fragments = searchTerm.split()
-
-        possible = [
-            # matches, in_order, file name
-        ]
-
-        for entry in items:
-            count = 0
-            match_order = []
-            for fragment in fragments:
-                index = entry.find(fragment)
-                if index == -1:
-                    # try case-insensitive match
-                    index = entry.lower().find(fragment.lower())
-                if index != -1:
-                    count += 1
-                    match_order.append(index)
-            if count:
-                record = (count, match_order == sorted(match_order), entry)
-                if possible and count < possible[0][0]:
-                    # ignore...
-                    continue
-                elif possible and count > possible[0][0]:
-                    # better than all previous matches, discard them and
-                    # keep this
-                    del possible[:]
-                possible.append(record)
-
-        ordered = []
-        for _, in_order, name in possible:
+        """
+        self.__fileChanged(srcPath)
+        self.__fileChanged(dstPath)
+
+    def __modificationTimes(self, names):
+        """
+        Private method to determine the modification times of project files.
+
+        @param names project relative file names
+        @type list of str
+        @return list of modification times (None for a non-existing file)
+        @rtype list of float or None
+        """
+        if self.__isRemote:
+            # get the modification times with a single request
             try:
-                age = (
-                    self.__remotefsInterface.stat(
-                        self.__remotefsInterface.join(self.project.ppath, name),
-                        ["st_mtime"],
-                    )["st_mtime"]
-                    if self.__isRemote
-                    else os.stat(os.path.join(self.project.ppath, name)).st_mtime
+                stResults = self.__remotefsInterface.statMany(
+                    [
+                        self.__remotefsInterface.join(self.project.ppath, name)
+                        for name in names
+                    ],
+                    ["st_mtime"],
                 )
             except OSError:
-                # skipping, because it doesn't appear to exist...
-                continue
-            ordered.append(
-                (
-                    in_order,  # we want closer match first
-                    -age,  # then approximately "most recently edited"
-                    name,
-                )
-            )
-        ordered.sort()
-        return ordered
+                return [None] * len(names)
+
+            return [None if st is None else st["st_mtime"] for st in stResults]
+
+        mtimes = []
+        for name in names:
+            try:
+                mtimes.append(os.stat(os.path.join(self.project.ppath, name)).st_mtime)
+            except OSError:
+                mtimes.append(None)
+        return mtimes
 
     def __searchFile(self):
         """
@@ -232,13 +265,14 @@ class QuickFindFileDialog(QWidget, Ui_QuickFindFile):
             self.fileList.clear()
             return
 
-        ordered = self.__sortedMatches(self.__generateLocations(), fileName)
+        self.__updateIndex()
+        names = self.__index.search(fileName, self.__modificationTimes)
 
         found = False
         self.fileList.clear()
         locations = {}
 
-        for _in_order, _age, name in ordered:
+        for name in names:
             found = True
             head, tail = (
                 self.__remotefsInterface.split(name)
@@ -310,7 +344,12 @@ class QuickFindFileDialog(QWidget, Ui_QuickFindFile):
         @param isRemote flag indicating a remote project
         @type bool
         """
-        self.__isRemote = isRemote
+        if isRemote != self.__isRemote:
+            self.__isRemote = isRemote
+            self.__indexValid = False
+        # Files may have been changed while the dialog was hidden without being
+        # observed (e.g. remote files or changes of unwatched directories).
+        self.__index.forgetModificationTimes()
 
         self.fileNameEdit.selectAll()
         self.fileNameEdit.setFocus()
@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+
+"""
+Module implementing the index of the project files used by the quick file
+finder.
+"""
+
+import bisect
+import contextlib
+import functools
+import heapq
+import itertools
+import operator
+import re
+
+from itertools import repeat
+
+
+class QuickFindFileIndex:
+    """
+    Class implementing the index of the project files used by the quick file
+    finder.
+
+    The lower cased file names and paths are kept in lists ordered by the
+    length of the paths, which are tested without a Python level loop. The
+    file names are additionally kept in sorted order, so that the names
+    starting with the search term are found by a binary search. For each
+    character a mask of the entries containing it is kept. These masks
+    determine the entries to be tested by a search for a new term. The
+    results of a search are used to narrow the entries to be tested by the
+    next search, if its term extends the previous one (i.e. while typing).
+    The matches are ranked in tiers of decreasing quality:
+
+    <ol>
+    <li>file name starts with the search term</li>
+    <li>file name contains the search term</li>
+    <li>path contains the search term</li>
+    <li>path contains the characters of the search term in order</li>
+    </ol>
+
+    Lower tiers are only searched, if the higher ones didn't deliver enough
+    results. Of each tier only the RankedEntries entries with the shortest
+    paths are considered, so that the entries are tested only until that many
+    matches were found. Within a tier entries matching the case of the search
+    term come first, followed by the most recently modified ones.
+    """
+
+    MaxResults = 100
+    RankedEntries = 200
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__entries = []
+        self.__lowerEntries = []
+        self.__names = []
+        self.__indexes = {}
+
+        # indexes of the entries in the order of their file names and the
+        # sorted file names
+        self.__nameOrder = []
+        self.__sortedNames = []
+        # dictionary with a character as key and a mask of the entries
+        # containing it as value (one byte per entry stored as an integer)
+        self.__characterMasks = {}
+
+        # caches of the entries matching the fragments searched last
+        self.__nameCache = {}
+        self.__containingCache = {}
+        self.__fuzzyCache = {}
+
+        # dictionary with the entry as key and its modification time or None
+        # for a non-existing file as value
+        self.__modificationTimes = {}
+
+    def setEntries(self, entries, separator="/"):
+        """
+        Public method to set the entries of the index.
+
+        @param entries file names relative to the project directory
+        @type list of str
+        @param separator path separator of the file names (defaults to "/")
+        @type str (optional)
+        """
+        # the shortest entries come first
+        self.__entries = sorted(dict.fromkeys(entries), key=len)
+        self.__lowerEntries = [e.lower() for e in self.__entries]
+        self.__indexes = {e: i for i, e in enumerate(self.__entries)}
+
+        self.__names = [e.rsplit(separator, 1)[-1] for e in self.__lowerEntries]
+        if separator != "/":
+            # accept both separators (e.g. for Windows)
+            self.__names = [n.rsplit("/", 1)[-1] for n in self.__names]
+
+        self.__nameOrder = sorted(
+            range(len(self.__names)), key=self.__names.__getitem__
+        )
+        self.__sortedNames = [self.__names[index] for index in self.__nameOrder]
+
+        self.__characterMasks = {
+            c: int.from_bytes(
+                bytes(map(operator.contains, self.__lowerEntries, repeat(c))),
+                "little",
+            )
+            for c in set().union(*self.__lowerEntries)
+        }
+
+        self.__nameCache.clear()
+        self.__containingCache.clear()
+        self.__fuzzyCache.clear()
+
+        # keep the modification times of the remaining entries
+        self.__modificationTimes = {
+            e: t for e, t in self.__modificationTimes.items() if e in self.__indexes
+        }
+
+    def count(self):
+        """
+        Public method to get the number of indexed entries.
+
+        @return number of indexed entries
+        @rtype int
+        """
+        return len(self.__entries)
+
+    def setModificationTime(self, entry, mtime):
+        """
+        Public method to set the modification time of an entry.
+
+        @param entry indexed file name
+        @type str
+        @param mtime modification time (None for a non-existing file)
+        @type float or None
+        """
+        if entry in self.__indexes:
+            self.__modificationTimes[entry] = mtime
+
+    def forgetModificationTime(self, entry):
+        """
+        Public method to forget the modification time of an entry.
+
+        @param entry indexed file name
+        @type str
+        """
+        self.__modificationTimes.pop(entry, None)
+
+    def forgetModificationTimes(self):
+        """
+        Public method to forget the modification times of all entries.
+        """
+        self.__modificationTimes.clear()
+
+    def search(self, searchTerm, statFunction, maxResults=MaxResults):
+        """
+        Public method to search the index.
+
+        The search term is split into fragments at whitespace. The primary
+        (i.e. longest) fragment determines the tier of an entry, all other
+        fragments must be contained in the path in order of their characters.
+
+        @param searchTerm search term
+        @type str
+        @param statFunction function determining the modification times of a
+            list of entries (None for a non-existing file)
+        @type function
+        @param maxResults maximum number of results (defaults to MaxResults)
+        @type int (optional)
+        @return list of the best matching entries (best match first)
+        @rtype list of str
+        """
+        fragments = searchTerm.split()
+        if not fragments or not self.__entries:
+            return []
+
+        primary = max(fragments, key=len)
+        lowerPrimary = primary.lower()
+        otherFilters = [
+            self.__fuzzyRegExp(f.lower()).match for f in fragments if f is not primary
+        ]
+        rankedEntries = max(self.RankedEntries, maxResults)
+        # A tier is searched only, if less than maxResults entries were found
+        # before. The entries of the previous tiers are contained in a tier,
+        # so that they are searched for in addition. All entries have to be
+        # tested, if the other fragments filter the matches.
+        limit = None if otherFilters else rankedEntries + maxResults
+
+        candidates = []  # list of tuples of tier and entry index
+        seen = set()
+        for tier, indexes in enumerate(self.__tiers(lowerPrimary, limit)):
+            tierIndexes = [index for index in indexes if index not in seen]
+            for fragmentFilter in otherFilters:
+                tierIndexes = list(
+                    itertools.compress(
+                        tierIndexes,
+                        map(
+                            fragmentFilter,
+                            [self.__lowerEntries[index] for index in tierIndexes],
+                        ),
+                    )
+                )
+            # the tiers are ordered by the length of the entries
+            del tierIndexes[rankedEntries:]
+            candidates.extend(zip(repeat(tier), tierIndexes))
+            if len(candidates) >= maxResults:
+                break
+            seen.update(tierIndexes)
+
+        # determine the unknown modification times with a single call
+        entries = [self.__entries[index] for _tier, index in candidates]
+        unknown = [e for e in entries if e not in self.__modificationTimes]
+        if unknown:
+            self.__modificationTimes.update(zip(unknown, statFunction(unknown)))
+
+        mtimes = [self.__modificationTimes[e] for e in entries]
+        ranked = [
+            (tier, primary not in entry, -mtime, len(entry), entry)
+            for (tier, _index), entry, mtime in zip(candidates, entries, mtimes)
+            if mtime is not None  # skip files, that don't appear to exist
+        ]
+
+        return [r[-1] for r in heapq.nsmallest(maxResults, ranked)]
+
+    def __tiers(self, fragment, limit):
+        """
+        Private generator determining the entries of the match tiers.
+
+        All tests are executed by map() and itertools.compress() in order to
+        avoid a Python loop over all entries. The entries matching the fragment
+        are remembered, so that the next search for an extended fragment (i.e.
+        the next key stroke) only needs to test these.
+
+        @param fragment lower cased search fragment
+        @type str
+        @param limit number of matches to stop the search of a tier at (None
+            to determine all matches)
+        @type int or None
+        @yield list of indexes of the entries of a tier ordered by their
+            lengths
+        @ytype list of int
+        """
+        # names starting with the fragment are found by a binary search
+        yield sorted(
+            self.__nameOrder[
+                bisect.bisect_left(self.__sortedNames, fragment) : bisect.bisect_right(
+                    self.__sortedNames, fragment + "\U0010ffff"
+                )
+            ]
+        )
+        yield self.__matching(self.__nameCache, self.__names, fragment, limit)
+        yield self.__matching(
+            self.__containingCache, self.__lowerEntries, fragment, limit
+        )
+        yield self.__matching(
+            self.__fuzzyCache, self.__lowerEntries, fragment, limit, fuzzy=True
+        )
+
+    def __matching(self, cache, strings, fragment, limit, fuzzy=False):
+        """
+        Private method to determine the entries matching a fragment using the
+        results for a shorter fragment.
+
+        @param cache dictionary with the fragment as key and the list of
+            indexes of all entries matching it as value
+        @type dict
+        @param strings list of the lower cased strings to be tested
+        @type list of str
+        @param fragment lower cased search fragment
+        @type str
+        @param limit number of matches to stop the search at (None to
+            determine all matches)
+        @type int or None
+        @param fuzzy flag indicating to test for the characters of the fragment
+            in order instead of the fragment itself (defaults to False)
+        @type bool (optional)
+        @return list of indexes of the matching entries ordered by their
+            lengths
+        @rtype list of int
+        """
+        with contextlib.suppress(KeyError):
+            return cache[fragment]
+
+        base = None
+        for length in range(len(fragment) - 1, 0, -1):
+            with contextlib.suppress(KeyError):
+                base = cache[fragment[:length]]
+                break
+        # remember the results of the current sequence of key strokes only
+        for key in [k for k in cache if not fragment.startswith(k)]:
+            del cache[key]
+
+        if base is None:
+            base = self.__containingCharacters(fragment)
+        indexes, testIndexes = itertools.tee(base)
+        tested = map(strings.__getitem__, testIndexes)
+        if fuzzy:
+            tests = map(self.__fuzzyRegExp(fragment).match, tested)
+        else:
+            tests = map(operator.contains, tested, repeat(fragment))
+        matches = list(itertools.islice(itertools.compress(indexes, tests), limit))
+        if limit is None or len(matches) < limit:
+            # only complete results may be narrowed by the next search
+            cache[fragment] = matches
+        return matches
+
+    def __containingCharacters(self, fragment):
+        """
+        Private method to determine the entries containing all characters of a
+        fragment.
+
+        @param fragment lower cased search fragment
+        @type str
+        @return iterator over the indexes of the entries containing all
+            characters in ascending order
+        @rtype Iterator of int
+        """
+        mask = functools.reduce(
+            operator.and_, (self.__characterMasks.get(c, 0) for c in set(fragment))
+        )
+        if not mask:
+            return iter(())
+
+        flags = mask.to_bytes(len(self.__entries), "little")
+        if flags.count(1) * 16 < len(flags):
+            # searching the few set flags is faster than testing all of them
+            return map(re.Match.start, re.finditer(b"\x01", flags))
+        return itertools.compress(itertools.count(), flags)
+
+    def __fuzzyRegExp(self, fragment):
+        """
+        Private method to create a regular expression matching the characters
+        of a fragment in order.
+
+        The expression is to be matched at the start of a string. Each
+        character is searched without backtracking.
+
+        @param fragment fragment to be matched
+        @type str
+        @return compiled regular expression
+        @rtype re.Pattern
+        """
+        escaped = [re.escape(c) for c in fragment]
+        return re.compile("".join(f"[^{c}]*{c}" for c in escaped))
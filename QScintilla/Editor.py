@@ -12,6 +12,7 @@ import collections
 import contextlib
 import difflib
 import enum
+import itertools
 import os
 import pathlib
 import re
@@ -62,6 +63,7 @@ from eric7.CodeFormatting.BlackFormattingAction import BlackFormattingAction
 from eric7.CodeFormatting.BlackUtilities import aboutBlack
 from eric7.CodeFormatting.IsortFormattingAction import IsortFormattingAction
 from eric7.CodeFormatting.IsortUtilities import aboutIsort
+from eric7.DataViews.CoverageDataService import getCoverageDataService
 from eric7.EricGui import EricPixmapCache
 from eric7.EricGui.EricOverrideCursor import EricOverrideCursor
 from eric7.EricUtilities.EricCache import EricCache
@@ -71,7 +73,7 @@ from eric7.Globals import recentNameBreakpointConditions
 from eric7.RemoteServerInterface import EricServerFileDialog
 from eric7.SystemUtilities import FileSystemUtilities, OSUtilities, PythonUtilities
 from eric7.UI import PythonDisViewer
-from eric7.Utilities import MouseUtilities
+from eric7.Utilities import BackgroundProtocol, MouseUtilities
 
 from . import Exporters, Lexers, TypingCompleters
 from .EditorMarkerMap import EditorMarkerMap
@@ -109,6 +111,16 @@ class EditorIconId(enum.IntEnum):
     TemplateImage = 100
 
 
+class EditorChangeState(enum.IntEnum):
+    """
+    Class defining the change states of the editor lines.
+    """
+
+    Unchanged = 0
+    Saved = 1
+    Unsaved = 2
+
+
 class EditorWarningKind(enum.Enum):
     """
     Class defining the kind of warnings supported by the Editor class.
@@ -227,6 +239,10 @@ class Editor(QsciScintillaCompat):
         ">": "<>",
     }
 
+    # versions of the sources sent to the syntax checker (unique across all
+    # editors because clones share the shadow copy of the background client)
+    SyntaxCheckSourceVersions = itertools.count(1)
+
     def __init__(
         self,
         dbs,
@@ -282,6 +298,12 @@ class Editor(QsciScintillaCompat):
             ericApp().getObject("EricServer").getServiceInterface("FileSystem")
         )
 
+        # typed preferences used by code executed on every key stroke
+        self.__editorPreferences = Preferences.getSnapshot("Editor")
+        self.__docuViewerPreferences = Preferences.getSnapshot(
+            "CodeDocumentationViewer"
+        )
+
         # clear some variables
         self.lastHighlight = None  # remember the last highlighted line
         self.lastErrorMarker = None  # remember the last error line
@@ -441,6 +463,19 @@ class Editor(QsciScintillaCompat):
         # set the text display
         self.__setTextDisplay()
 
+        # state of the source transfer to the syntax checker
+        self.__syntaxCheckSourceVersion = 0  # 0 = send the complete source
+        self.__syntaxCheckFileName = ""
+        self.__syntaxCheckDirtyLines = None
+        # base version and changed lines of the last request (used to rebuild
+        # the delta, if the request is replaced while still being queued)
+        self.__syntaxCheckRequest = None
+
+        # state of the online change trace
+        self.__changeTraceStates = []
+        self.__changeTraceDirtyLines = None
+        self.__changeTraceReconcile = False
+
         # initialize the online syntax check timer
         try:
             self.syntaxCheckService = ericApp().getObject("SyntaxCheckService")
@@ -448,6 +483,9 @@ class Editor(QsciScintillaCompat):
                 self.__processSyntaxCheckResult
             )
             self.syntaxCheckService.error.connect(self.__processSyntaxCheckError)
+            self.syntaxCheckService.sourceRequested.connect(
+                self.__syntaxCheckSourceRequested
+            )
             self.__initOnlineSyntaxCheck()
         except KeyError:
             self.syntaxCheckService = None
@@ -633,6 +671,8 @@ class Editor(QsciScintillaCompat):
 
         # code coverage related attributes
         self.__coverageFile = ""
+        self.__coverageDataServiceConnected = False
+        self.__coverageDataUsed = ""
 
         self.__initContextMenu()
         self.__initContextMenuMargins()
@@ -1242,7 +1282,7 @@ class Editor(QsciScintillaCompat):
         )
         self.coverageHideAnnotationMenuAct = menu.addAction(
             self.tr("Hide code coverage annotations"),
-            self.__codeCoverageHideAnnotations,
+            self.codeCoverageHideAnnotations,
         )
         self.profileMenuAct = menu.addAction(
             self.tr("Profile data..."), self.__showProfileData
@@ -2233,7 +2273,7 @@ class Editor(QsciScintillaCompat):
         """
         self.cursorChanged.emit(self.fileName, line + 1, index)
 
-        if Preferences.getEditor("MarkOccurrencesEnabled"):
+        if self.__editorPreferences.MarkOccurrencesEnabled:
             self.__markOccurrencesTimer.start()
 
         if self.lastLine != line:
@@ -2504,7 +2544,7 @@ class Editor(QsciScintillaCompat):
 
     def __modified(
         self,
-        _pos,
+        pos,
         mtype,
         _text,
         _length,
@@ -2518,7 +2558,7 @@ class Editor(QsciScintillaCompat):
         """
         Private method to handle changes of the number of lines.
 
-        @param _pos start position of change (unused)
+        @param pos start position of change
         @type int
         @param mtype flags identifying the change
         @type int
@@ -2565,6 +2605,17 @@ class Editor(QsciScintillaCompat):
                     self.breakpointModel.setData(index2, line)
                 self.inLinesChanged = False
 
+            # 3. record the lines to be sent to the syntax checker
+            if self.__syntaxCheckSourceVersion:
+                self.__recordSyntaxCheckDirtyLines(pos, linesAdded)
+
+            # 4. record the lines changed for the online change trace
+            self.__recordChangeTraceLines(
+                pos,
+                linesAdded,
+                bool(mtype & (self.SC_PERFORMED_UNDO | self.SC_PERFORMED_REDO)),
+            )
+
     def __restoreBreakpoints(self):
         """
         Private method to restore the breakpoints.
@@ -3271,14 +3322,14 @@ class Editor(QsciScintillaCompat):
         painter.end()
         return pixmap
 
+    ChangeTraceReconcileCount = 10
+    # number of online change trace updates triggering a reconciliation
+
     @pyqtSlot()
     def __initOnlineChangeTrace(self):
         """
         Private slot to initialize the online change trace.
         """
-        self.__hasChangeMarkers = False
-        self.__oldText = self.text()
-        self.__lastSavedText = self.text()
         self.__onlineChangeTraceTimer = QTimer(self)
         self.__onlineChangeTraceTimer.setSingleShot(True)
         self.__onlineChangeTraceTimer.setInterval(
@@ -3289,78 +3340,264 @@ class Editor(QsciScintillaCompat):
         )
         self.textChanged.connect(self.__resetOnlineChangeTraceTimer)
 
+        self.__resetChangeTraceStates()
+        self.__hasChangeMarkers = False
+
+    def __resetChangeTraceStates(self):
+        """
+        Private method to take the current text as the original and saved text
+        of the online change trace.
+        """
+        self.__originalLines = self.text().splitlines()
+        self.__lastSavedLines = self.__originalLines[:]
+        self.__savedChangeStates = [EditorChangeState.Unchanged] * len(
+            self.__originalLines
+        )
+        self.__changeTraceStates = [EditorChangeState.Unchanged] * self.lines()
+        self.__changeTraceDirtyLines = None
+        self.__changeTraceReconcile = False
+        self.__changeTraceUpdates = 0
+
     @pyqtSlot()
     def __reinitOnlineChangeTrace(self):
         """
         Private slot to re-initialize the online change trace.
         """
-        self.__oldText = self.text()
-        self.__lastSavedText = self.text()
+        self.__resetChangeTraceStates()
         self.__deleteAllChangeMarkers()
 
     def __resetOnlineChangeTraceTimer(self):
         """
         Private method to reset the online syntax check timer.
         """
-        if Preferences.getEditor("OnlineChangeTrace"):
+        if self.__editorPreferences.OnlineChangeTrace:
             self.__onlineChangeTraceTimer.stop()
             self.__onlineChangeTraceTimer.start()
 
-    @pyqtSlot()
-    def __onlineChangeTraceTimerTimeout(self):
+    def __recordChangeTraceLines(self, pos, linesAdded, undoRedo):
         """
-        Private slot to mark added and changed lines.
+        Private method to update the line states of the online change trace
+        for a text modification.
+
+        The changed lines are marked as unsaved changes. Lines, which got their
+        saved text back (e.g. by an undo), are corrected by the next
+        reconciliation.
+
+        @param pos start position of the change
+        @type int
+        @param linesAdded number of added (positive) or deleted (negative) lines
+        @type int
+        @param undoRedo flag indicating a change caused by an undo or redo
+        @type bool
         """
-        self.__deleteAllChangeMarkers()
+        line = self.lineIndexFromPosition(pos)[0]
+        states = self.__changeTraceStates
+        if linesAdded > 0:
+            states[line + 1 : line + 1] = [EditorChangeState.Unsaved] * linesAdded
+        elif linesAdded < 0:
+            del states[line + 1 : line + 1 - linesAdded]
+        end = line + 1 + max(0, linesAdded)
+        states[line:end] = [EditorChangeState.Unsaved] * (end - line)
+
+        # Scintilla moves the markers together with their lines and merges the
+        # markers of deleted lines into the first line of the change
+        if self.__changeTraceDirtyLines is None:
+            self.__changeTraceDirtyLines = (line, end)
+        else:
+            dirtyStart, dirtyEnd = self.__changeTraceDirtyLines
+            if dirtyEnd > line:
+                dirtyEnd = max(line + 1, dirtyEnd + linesAdded)
+            self.__changeTraceDirtyLines = (
+                min(dirtyStart, line),
+                max(dirtyEnd, end),
+            )
 
-        # step 1: mark saved changes
-        oldL = self.__oldText.splitlines()
-        newL = self.__lastSavedText.splitlines()
-        matcher = difflib.SequenceMatcher(None, oldL, newL)
+        if undoRedo or not self.isModified():
+            self.__changeTraceReconcile = True
+
+    def __changedLines(self, oldLines, newLines):
+        """
+        Private method to determine the line changes between two texts.
+
+        The common leading and trailing lines are skipped before the remaining
+        lines are compared by difflib. This limits the expensive comparison to
+        the changed part of the text.
+
+        @param oldLines lines of the old text
+        @type list of str
+        @param newLines lines of the new text
+        @type list of str
+        @return list of opcodes as returned by difflib.SequenceMatcher
+        @rtype list of tuple of (str, int, int, int, int)
+        """
+        maxCommon = min(len(oldLines), len(newLines))
+        start = 0
+        while start < maxCommon and oldLines[start] == newLines[start]:
+            start += 1
+        end = 0
+        while end < maxCommon - start and oldLines[-1 - end] == newLines[-1 - end]:
+            end += 1
+
+        opcodes = [("equal", 0, start, 0, start)] if start else []
+        matcher = difflib.SequenceMatcher(
+            None,
+            oldLines[start : len(oldLines) - end],
+            newLines[start : len(newLines) - end],
+        )
+        opcodes.extend(
+            (tag, i1 + start, i2 + start, j1 + start, j2 + start)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        )
+        if end:
+            opcodes.append(
+                (
+                    "equal",
+                    len(oldLines) - end,
+                    len(oldLines),
+                    len(newLines) - end,
+                    len(newLines),
+                )
+            )
+        return opcodes
 
-        for token, _, _, j1, j2 in matcher.get_opcodes():
-            if token in ["insert", "replace"]:
-                for lineNo in range(j1, j2):
-                    self.markerAdd(lineNo, self.__changeMarkerSaved)
-                    self.__hasChangeMarkers = True
+    def __reconciledChangeStates(self):
+        """
+        Private method to determine the line states by comparing the current
+        text with the last saved one.
 
-        # step 2: mark unsaved changes
-        oldL = self.__lastSavedText.splitlines()
-        newL = self.text().splitlines()
-        matcher = difflib.SequenceMatcher(None, oldL, newL)
+        @return list of line states
+        @rtype list of EditorChangeState
+        """
+        states = [EditorChangeState.Unchanged] * self.lines()
+        for tag, i1, i2, j1, j2 in self.__changedLines(
+            self.__lastSavedLines, self.text().splitlines()
+        ):
+            if tag == "equal":
+                states[j1:j2] = self.__savedChangeStates[i1:i2]
+            elif tag in ("insert", "replace"):
+                states[j1:j2] = [EditorChangeState.Unsaved] * (j2 - j1)
+        return states
 
-        for token, _, _, j1, j2 in matcher.get_opcodes():
-            if token in ["insert", "replace"]:
-                for lineNo in range(j1, j2):
-                    self.markerAdd(lineNo, self.__changeMarkerUnsaved)
-                    self.__hasChangeMarkers = True
+    def __updateChangeMarkers(self, lines):
+        """
+        Private method to adjust the change markers of some lines to their
+        line state.
 
-        if self.__hasChangeMarkers:
-            self.changeMarkersUpdated.emit(self)
-            self.__markerMap.update()
+        @param lines iterable of line numbers
+        @type iterable of int
+        @return flag indicating a change of the markers
+        @rtype bool
+        """
+        markers = {
+            EditorChangeState.Unchanged: None,
+            EditorChangeState.Saved: self.__changeMarkerSaved,
+            EditorChangeState.Unsaved: self.__changeMarkerUnsaved,
+        }
+        changed = False
+        for line in lines:
+            marker = markers[self.__changeTraceStates[line]]
+            wanted = 0 if marker is None else 1 << marker
+            if self.markersAtLine(line) & self.changeMarkersMask != wanted:
+                self.markerDelete(line, self.__changeMarkerSaved)
+                self.markerDelete(line, self.__changeMarkerUnsaved)
+                if marker is not None:
+                    self.markerAdd(line, marker)
+                changed = True
+        return changed
+
+    def __updateDirtyChangeMarkers(self):
+        """
+        Private method to adjust the change markers of the lines changed since
+        the last update.
+
+        @return flag indicating a change of the markers
+        @rtype bool
+        """
+        if self.__changeTraceDirtyLines is None:
+            return False
+
+        dirtyStart, dirtyEnd = self.__changeTraceDirtyLines
+        self.__changeTraceDirtyLines = None
+        return self.__updateChangeMarkers(
+            range(dirtyStart, min(dirtyEnd, len(self.__changeTraceStates)))
+        )
+
+    def __applyChangeStates(self, states):
+        """
+        Private method to set new line states and to adjust the markers of the
+        lines with a changed state.
+
+        @param states list of line states
+        @type list of EditorChangeState
+        @return flag indicating a change of the markers
+        @rtype bool
+        """
+        changedLines = [
+            line
+            for line, (oldState, newState) in enumerate(
+                zip(self.__changeTraceStates, states)
+            )
+            if oldState != newState
+        ]
+        self.__changeTraceStates = states
+        return self.__updateChangeMarkers(changedLines)
+
+    def __changeMarkersChanged(self):
+        """
+        Private method to announce changed change markers.
+        """
+        self.__hasChangeMarkers = any(self.__changeTraceStates)
+        self.changeMarkersUpdated.emit(self)
+        self.__markerMap.update()
 
     @pyqtSlot()
-    def resetOnlineChangeTraceInfo(self):
+    def __onlineChangeTraceTimerTimeout(self):
         """
-        Public slot to reset the online change trace info.
+        Private slot to mark added and changed lines.
+
+        Only the markers of the lines changed since the last update are
+        adjusted. Every ChangeTraceReconcileCount updates and after an undo
+        or redo the line states are reconciled with the last saved text.
         """
-        self.__lastSavedText = self.text()
-        self.__deleteAllChangeMarkers()
+        changed = self.__updateDirtyChangeMarkers()
 
-        # mark saved changes
-        oldL = self.__oldText.splitlines()
-        newL = self.__lastSavedText.splitlines()
-        matcher = difflib.SequenceMatcher(None, oldL, newL)
+        self.__changeTraceUpdates += 1
+        if (
+            self.__changeTraceReconcile
+            or self.__changeTraceUpdates >= Editor.ChangeTraceReconcileCount
+        ):
+            self.__changeTraceReconcile = False
+            self.__changeTraceUpdates = 0
+            changed |= self.__applyChangeStates(self.__reconciledChangeStates())
 
-        for token, _, _, j1, j2 in matcher.get_opcodes():
-            if token in ["insert", "replace"]:
-                for lineNo in range(j1, j2):
-                    self.markerAdd(lineNo, self.__changeMarkerSaved)
-                    self.__hasChangeMarkers = True
+        if changed:
+            self.__changeMarkersChanged()
 
-        if self.__hasChangeMarkers:
-            self.changeMarkersUpdated.emit(self)
-            self.__markerMap.update()
+    @pyqtSlot()
+    def resetOnlineChangeTraceInfo(self):
+        """
+        Public slot to reset the online change trace info.
+        """
+        self.__lastSavedLines = self.text().splitlines()
+        self.__savedChangeStates = [EditorChangeState.Unchanged] * len(
+            self.__lastSavedLines
+        )
+        for tag, _i1, _i2, j1, j2 in self.__changedLines(
+            self.__originalLines, self.__lastSavedLines
+        ):
+            if tag in ("insert", "replace"):
+                self.__savedChangeStates[j1:j2] = [EditorChangeState.Saved] * (j2 - j1)
+
+        changed = self.__updateDirtyChangeMarkers()
+        self.__changeTraceReconcile = False
+        self.__changeTraceUpdates = 0
+        changed |= self.__applyChangeStates(
+            self.__savedChangeStates
+            + [EditorChangeState.Unchanged]
+            * (self.lines() - len(self.__savedChangeStates))
+        )
+        if changed:
+            self.__changeMarkersChanged()
 
     @pyqtSlot()
     def __deleteAllChangeMarkers(self):
@@ -5318,6 +5555,10 @@ class Editor(QsciScintillaCompat):
         else:
             self.__onlineChangeTraceTimer.stop()
             self.__deleteAllChangeMarkers()
+            # restore the markers by the first update after re-enabling
+            self.__changeTraceStates = [EditorChangeState.Unchanged] * self.lines()
+            self.__changeTraceDirtyLines = None
+            self.__changeTraceReconcile = True
         self.markerDefine(
             self.__createChangeMarkerPixmap("OnlineChangeTraceMarkerUnsaved"),
             self.__changeMarkerUnsaved,
@@ -5789,7 +6030,7 @@ class Editor(QsciScintillaCompat):
         """
         char = chr(charNumber)
         # update code documentation viewer
-        if char == "(" and Preferences.getDocuViewer("ShowInfoOnOpenParenthesis"):
+        if char == "(" and self.__docuViewerPreferences.ShowInfoOnOpenParenthesis:
             self.vm.showEditorInfo(self)
 
         self.__delayedDocstringMenuPopup(self.getCursorPosition())
@@ -5819,7 +6060,7 @@ class Editor(QsciScintillaCompat):
 
             line, col = self.getCursorPosition()
             txt = self.getWordLeft(line, col)
-            if len(txt) >= Preferences.getEditor("AutoCompletionThreshold"):
+            if len(txt) >= self.__editorPreferences.AutoCompletionThreshold:
                 self.autoComplete(auto=True, context=False)
                 return
 
@@ -5923,7 +6164,7 @@ class Editor(QsciScintillaCompat):
         @param context flag indicating to complete a context
         @type bool
         """
-        if auto and not Preferences.getEditor("AutoCompletionEnabled"):
+        if auto and not self.__editorPreferences.AutoCompletionEnabled:
             # auto-completion is disabled
             return
 
@@ -5936,7 +6177,7 @@ class Editor(QsciScintillaCompat):
         ):
             # Avoid delayed auto-completion after cursor repositioning
             self.__acText = self.__getAcText()
-            if auto and Preferences.getEditor("AutoCompletionTimeout"):
+            if auto and self.__editorPreferences.AutoCompletionTimeout:
                 self.__acTimer.stop()
                 self.__acContext = context
                 self.__acTimer.start()
@@ -6881,16 +7122,146 @@ class Editor(QsciScintillaCompat):
             self.syntaxCheckService.syntaxCheck(
                 fileType,
                 self.fileName or "(Unnamed)",
-                self.text(),
+                self.__syntaxCheckSource(fileType),
                 additionalBuiltins,
             )
         else:
             self.syntaxCheckService.syntaxCheck(
                 fileType,
                 self.fileName or "(Unnamed)",
-                self.text(),
+                self.__syntaxCheckSource(fileType),
+            )
+
+    def __recordSyntaxCheckDirtyLines(self, pos, linesAdded):
+        """
+        Private method to record the range of lines changed since the source
+        was sent to the syntax checker the last time.
+
+        The range is kept as a tuple of the first line, the end line in the
+        sent source and the end line in the current text.
+
+        @param pos start position of the change
+        @type int
+        @param linesAdded number of added (positive) or deleted (negative) lines
+        @type int
+        """
+        line = self.lineIndexFromPosition(pos)[0]
+        # include the neighbouring lines to cover joined or split line ends
+        start = max(0, line - 1)
+        end = line + 2 + max(0, -linesAdded)
+
+        self.__syntaxCheckDirtyLines = self.__mergeSyntaxCheckDirtyLines(
+            self.__syntaxCheckDirtyLines, (start, end, end + linesAdded)
+        )
+
+    def __mergeSyntaxCheckDirtyLines(self, first, second):
+        """
+        Private method to merge two successive ranges of changed lines.
+
+        Each range is given as a tuple of the first line, the end line in the
+        text before the change and the end line in the changed text. The
+        second range refers to the text resulting from the first change.
+
+        @param first first range of changed lines
+        @type tuple of (int, int, int) or None
+        @param second second range of changed lines
+        @type tuple of (int, int, int) or None
+        @return merged range of changed lines
+        @rtype tuple of (int, int, int) or None
+        """
+        if first is None:
+            return second
+        if second is None:
+            return first
+
+        firstStart, firstEndOld, firstEnd = first
+        secondStart, secondEndOld, secondEnd = second
+        if secondEndOld > firstEnd:
+            firstEndOld += secondEndOld - firstEnd
+            firstEnd = secondEndOld
+
+        return (
+            min(firstStart, secondStart),
+            firstEndOld,
+            firstEnd + secondEnd - secondEndOld,
+        )
+
+    def __syntaxCheckSource(self, fileType):
+        """
+        Private method to determine the source argument of a syntax check
+        request.
+
+        If the syntax check keeps a shadow copy of the source and only a small
+        part of the text was changed since the last check, only the changed
+        lines are sent.
+
+        @param fileType file type of the editor
+        @type str
+        @return complete source text or a dictionary containing the complete
+            source or the changed lines
+        @rtype str or dict
+        """
+        if not self.syntaxCheckService.supportsSourceDelta(fileType):
+            self.__syntaxCheckSourceVersion = 0
+            return self.text()
+
+        fileName = self.fileName or "(Unnamed)"
+        version = next(Editor.SyntaxCheckSourceVersions)
+        lineCount = self.lines()
+        baseVersion = self.__syntaxCheckSourceVersion
+        dirtyLines = self.__syntaxCheckDirtyLines
+        if (
+            baseVersion
+            and self.__syntaxCheckRequest is not None
+            and fileName == self.__syntaxCheckFileName
+            and self.syntaxCheckService.isCheckPending(fileType, fileName)
+        ):
+            # The last request is still queued and gets replaced by this one.
+            # So the client never sees its version and the delta has to be
+            # built against the base of the replaced request.
+            baseVersion, requestDirtyLines = self.__syntaxCheckRequest
+            dirtyLines = self.__mergeSyntaxCheckDirtyLines(
+                requestDirtyLines, dirtyLines
             )
 
+        source = None
+        if baseVersion and fileName == self.__syntaxCheckFileName:
+            start, endOld, end = dirtyLines or (0, 0, 0)
+            end = min(end, lineCount)
+            if (end - start) * 2 <= lineCount:
+                source = BackgroundProtocol.sourceDelta(
+                    baseVersion,
+                    version,
+                    start,
+                    endOld,
+                    [self.text(line) for line in range(start, end)],
+                    lineCount,
+                )
+                self.__syntaxCheckRequest = (baseVersion, dirtyLines)
+        if source is None:
+            source = BackgroundProtocol.fullSource(version, self.text())
+            self.__syntaxCheckRequest = (0, None)
+
+        self.__syntaxCheckSourceVersion = version
+        self.__syntaxCheckFileName = fileName
+        self.__syntaxCheckDirtyLines = None
+        return source
+
+    @pyqtSlot(str)
+    def __syntaxCheckSourceRequested(self, fn):
+        """
+        Private slot to repeat the syntax check with the complete source after
+        a source delta could not be applied.
+
+        @param fn filename of the file
+        @type str
+        """
+        if fn != self.fileName and (bool(self.fileName) or fn != "(Unnamed)"):
+            return
+
+        self.__syntaxCheckSourceVersion = 0
+        self.checkSyntax()
+
     @pyqtSlot(str, str)
     def __processSyntaxCheckError(self, fn, msg):
         """
@@ -6965,7 +7336,7 @@ class Editor(QsciScintillaCompat):
         """
         Private method to reset the online syntax check timer.
         """
-        if Preferences.getEditor("OnlineSyntaxCheck"):
+        if self.__editorPreferences.OnlineSyntaxCheck:
             self.__onlineSyntaxCheckTimer.stop()
             self.__onlineSyntaxCheckTimer.start()
 
@@ -7052,7 +7423,97 @@ class Editor(QsciScintillaCompat):
         Public method to refresh the code coverage annotations.
         """
         if self.showingNotcoveredMarkers:
-            self.codeCoverageShowAnnotations(silent=True)
+            if FileSystemUtilities.isRemoteFileName(self.__coverageFile):
+                self.codeCoverageShowAnnotations(silent=True)
+            else:
+                # the analysis is delivered by the coverage data service
+                self.__connectCoverageDataService()
+                getCoverageDataService().requestAnalysis(
+                    self.__coverageFile, self.fileName
+                )
+
+    def __connectCoverageDataService(self):
+        """
+        Private method to connect to the signals of the coverage data service.
+        """
+        if not self.__coverageDataServiceConnected:
+            coverageDataService = getCoverageDataService()
+            coverageDataService.analysisAvailable.connect(
+                self.__coverageAnalysisAvailable
+            )
+            coverageDataService.dataChanged.connect(self.__coverageDataChanged)
+            self.__coverageDataServiceConnected = True
+
+    def __useCoverageData(self, coverageFile):
+        """
+        Private method to register the editor as a user of the data of a
+        coverage data file with the coverage data service.
+
+        The registration for the data file used before is removed, so that
+        its cached data may be released.
+
+        @param coverageFile path of the coverage data file (empty to use
+            none)
+        @type str
+        """
+        if coverageFile != self.__coverageDataUsed:
+            coverageDataService = getCoverageDataService()
+            if self.__coverageDataUsed:
+                coverageDataService.removeUser(self.__coverageDataUsed, self)
+            if coverageFile:
+                coverageDataService.addUser(coverageFile, self)
+            self.__coverageDataUsed = coverageFile
+
+    @pyqtSlot(str, str, object)
+    def __coverageAnalysisAvailable(self, coverageFile, filename, analysis):
+        """
+        Private slot handling an analysis delivered by the coverage data
+        service.
+
+        @param coverageFile path of the coverage data file
+        @type str
+        @param filename name of the analyzed file
+        @type str
+        @param analysis analysis of the file (None, if it could not be
+            analyzed)
+        @type tuple of (list of int, list of int, list of int, str) or None
+        """
+        if (
+            self.showingNotcoveredMarkers
+            and coverageFile == self.__coverageFile
+            and filename == self.fileName
+        ):
+            self.__codeCoverageHideAnnotations()
+            if analysis is None:
+                self.__useCoverageData("")
+            else:
+                self.__addCoverageMarkers(analysis[2])
+                self.showingNotcoveredMarkers = True
+
+    @pyqtSlot(str)
+    def __coverageDataChanged(self, coverageFile):
+        """
+        Private slot handling a change of a coverage data file.
+
+        @param coverageFile path of the changed coverage data file
+        @type str
+        """
+        if coverageFile == self.__coverageFile:
+            self.refreshCoverageAnnotations()
+
+    def __addCoverageMarkers(self, missing):
+        """
+        Private method to add the markers for the lines not covered.
+
+        @param missing list of line numbers not covered
+        @type list of int
+        """
+        for line in missing:
+            handle = self.markerAdd(line - 1, self.notcovered)
+            self.notcoveredMarkers.append(handle)
+        if missing:
+            self.coverageMarkersShown.emit(True)
+            self.__markerMap.update()
 
     def codeCoverageShowAnnotations(self, silent=False, coverageFile=None):
         """
@@ -7066,8 +7527,6 @@ class Editor(QsciScintillaCompat):
             (defaults to None)
         @type str (optional)
         """
-        from coverage import Coverage  # __IGNORE_WARNING_I102__
-
         self.__codeCoverageHideAnnotations()
 
         fn = coverageFile if bool(coverageFile) else self.__getCodeCoverageFile()
@@ -7075,6 +7534,7 @@ class Editor(QsciScintillaCompat):
 
         if fn:
             if FileSystemUtilities.isRemoteFileName(fn):
+                self.__useCoverageData("")
                 coverageInterface = (
                     ericApp().getObject("EricServer").getServiceInterface("Coverage")
                 )
@@ -7091,15 +7551,24 @@ class Editor(QsciScintillaCompat):
                     return
                 missing = coverageInterface.analyzeFile(self.fileName)[3]
             else:
-                cover = Coverage(data_file=fn)
-                cover.load()
-                missing = cover.analysis2(self.fileName)[3]
+                self.__connectCoverageDataService()
+                self.__useCoverageData(fn)
+                analysis = getCoverageDataService().analysis(fn, self.fileName)
+                if analysis is None:
+                    self.__useCoverageData("")
+                    if not silent:
+                        EricMessageBox.critical(
+                            self,
+                            self.tr("Show Code Coverage Annotations"),
+                            self.tr(
+                                "<p>The coverage data of <b>{0}</b> could not be"
+                                " determined from file <b>{1}</b>.</p>"
+                            ).format(self.fileName, fn),
+                        )
+                    return
+                missing = analysis[2]
             if missing:
-                for line in missing:
-                    handle = self.markerAdd(line - 1, self.notcovered)
-                    self.notcoveredMarkers.append(handle)
-                self.coverageMarkersShown.emit(True)
-                self.__markerMap.update()
+                self.__addCoverageMarkers(missing)
             else:
                 if not silent:
                     EricMessageBox.information(
@@ -7109,6 +7578,7 @@ class Editor(QsciScintillaCompat):
                     )
             self.showingNotcoveredMarkers = True
         else:
+            self.__useCoverageData("")
             if not silent:
                 EricMessageBox.warning(
                     self,
@@ -7116,10 +7586,18 @@ class Editor(QsciScintillaCompat):
                     self.tr("""There is no coverage file available."""),
                 )
 
+    @pyqtSlot()
+    def codeCoverageHideAnnotations(self):
+        """
+        Public slot to handle the hide code coverage annotations context menu
+        action.
+        """
+        self.__codeCoverageHideAnnotations()
+        self.__useCoverageData("")
+
     def __codeCoverageHideAnnotations(self):
         """
-        Private method to handle the hide code coverage annotations context
-        menu action.
+        Private method to remove the code coverage annotations.
         """
         for handle in self.notcoveredMarkers:
             self.markerDeleteHandle(handle)
@@ -8061,10 +8539,16 @@ class Editor(QsciScintillaCompat):
                 self.__processSyntaxCheckResult
             )
             self.syntaxCheckService.error.disconnect(self.__processSyntaxCheckError)
+            self.syntaxCheckService.sourceRequested.disconnect(
+                self.__syntaxCheckSourceRequested
+            )
 
         if self.spell:
             self.spell.stopIncrementalCheck()
 
+        # release the cached coverage data, if no other editor uses them
+        self.__useCoverageData("")
+
         with contextlib.suppress(TypeError):
             self.project.projectPropertiesChanged.disconnect(
                 self.__projectPropertiesChanged
@@ -10127,9 +10611,10 @@ class Editor(QsciScintillaCompat):
         @param cursorPosition current cursor position (line and column)
         @type tuple of (int, int)
         """
-        if Preferences.getEditor(
-            "DocstringAutoGenerate"
-        ) and self.getDocstringGenerator().isDocstringIntro(cursorPosition):
+        if (
+            self.__editorPreferences.DocstringAutoGenerate
+            and self.getDocstringGenerator().isDocstringIntro(cursorPosition)
+        ):
             lineText2Cursor = self.text(cursorPosition[0])[: cursorPosition[1]]
 
             QTimer.singleShot(
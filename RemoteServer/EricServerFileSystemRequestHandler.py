@@ -9,10 +9,12 @@ Module implementing the file system request handler of the eric-ide server.
 
 import base64
 import contextlib
+import fnmatch
 import os
 import shutil
 import stat
 import time
+import zlib
 
 from eric7.SystemUtilities import FileSystemUtilities
 
@@ -25,6 +27,9 @@ class EricServerFileSystemRequestHandler(EricServerBaseRequestHandler):
     Class implementing the file system request handler of the eric-ide server.
     """
 
+    MaxChunkSize = 4 * 1024 * 1024
+    PartialFileSuffix = ".ericpart"
+
     def __init__(self, server):
         """
         Constructor
@@ -47,10 +52,16 @@ class EricServerFileSystemRequestHandler(EricServerBaseRequestHandler):
             "Replace": self.__replace,
             "Remove": self.__remove,
             "Stat": self.__stat,
+            "StatMany": self.__statMany,
+            "ScanTree": self.__scanTree,
             "Exists": self.__exists,
             "Access": self.__access,
             "ReadFile": self.__readFile,
             "WriteFile": self.__writeFile,
+            "ReadFileChunk": self.__readFileChunk,
+            "WriteFileChunk": self.__writeFileChunk,
+            "WriteFileResume": self.__writeFileResume,
+            "FileChecksum": self.__fileChecksum,
             "DirEntries": self.__dirEntries,
             "ExpandUser": self.__expanduser,
             "ShutilCopy": self.__shutilCopy,
@@ -208,6 +219,90 @@ class EricServerFileSystemRequestHandler(EricServerBaseRequestHandler):
                 "error": str(err),
             }
 
+    def __statMany(self, params):
+        """
+        Private method to get the status of a list of files.
+
+        @param params dictionary containing the request data
+        @type dict
+        @return dictionary containing the reply data
+        @rtype dict
+        """
+        stNames = params["st_names"]
+        results = []
+        for filename in params["filenames"]:
+            try:
+                result = os.stat(filename)
+                results.append({st: getattr(result, st) for st in stNames})
+            except OSError:
+                # report non-existent or inaccessible files as None
+                results.append(None)
+
+        return {"ok": True, "result": results}
+
+    def __scanTree(self, params):
+        """
+        Private method to scan a list of directories of a directory tree.
+
+        Each entry reports the directory it was found in relative to the root
+        directory of the scan.
+
+        @param params dictionary containing the request data
+        @type dict
+        @return dictionary containing the reply data
+        @rtype dict
+        """
+        root = params["root"]
+        excludeNames = params["exclude_names"]
+        excludeDirs = params["exclude_dirs"]
+        withHidden = params["with_hidden"]
+
+        listing = []
+        directories = list(reversed(params["directories"]))
+        while directories:
+            directory = directories.pop()
+            try:
+                with os.scandir(os.path.join(root, directory)) as dirEntries:
+                    for dirEntry in dirEntries:
+                        name = dirEntry.name
+                        if (not withHidden and name.startswith(".")) or any(
+                            fnmatch.fnmatch(name, pattern) for pattern in excludeNames
+                        ):
+                            continue
+
+                        try:
+                            filestat = dirEntry.stat()
+                            size, mtime = filestat.st_size, filestat.st_mtime
+                        except OSError:
+                            # e.g. a dangling symbolic link
+                            size, mtime = 0, 0.0
+                        isDir = dirEntry.is_dir()
+                        listing.append(
+                            {
+                                "name": name,
+                                "directory": directory,
+                                "path": dirEntry.path,
+                                "is_dir": isDir,
+                                "is_file": dirEntry.is_file(),
+                                "is_link": dirEntry.is_symlink(),
+                                "size": size,
+                                "mtime": mtime,
+                            }
+                        )
+
+                        if isDir and params["recursive"]:
+                            subdirectory = os.path.join(directory, name)
+                            if not any(
+                                fnmatch.fnmatch(subdirectory, pattern)
+                                for pattern in excludeDirs
+                            ):
+                                directories.append(subdirectory)
+            except OSError:
+                # ignore directories, that cannot be scanned
+                continue
+
+        return {"ok": True, "listing": listing}
+
     def __exists(self, params):
         """
         Private method to check if a file or directory of the given name exists.
@@ -378,19 +473,7 @@ class EricServerFileSystemRequestHandler(EricServerBaseRequestHandler):
 
         # 1. create backup file if asked for
         if params["with_backup"]:
-            if os.path.islink(filename):
-                filename = os.path.realpath(filename)
-            backupFilename = "{0}~".format(filename)
-            try:
-                permissions = os.stat(filename).st_mode
-                perms_valid = True
-            except OSError:
-                # if there was an error, ignore it
-                perms_valid = False
-            with contextlib.suppress(OSError):
-                os.remove(backupFilename)
-            with contextlib.suppress(OSError):
-                os.rename(filename, backupFilename)
+            filename, permissions = self.__createBackup(filename)
 
         # 2. write the data to the file and reset the permissions
         newline = None if params["newline"] == "<<none>>" else params["newline"]
@@ -402,7 +485,7 @@ class EricServerFileSystemRequestHandler(EricServerBaseRequestHandler):
         try:
             with open(filename, mode, newline=newline) as f:
                 f.write(data)
-            if params["with_backup"] and perms_valid:
+            if params["with_backup"] and permissions is not None:
                 os.chmod(filename, permissions)
             return {"ok": True}
         except OSError as err:
@@ -411,6 +494,192 @@ class EricServerFileSystemRequestHandler(EricServerBaseRequestHandler):
                 "error": str(err),
             }
 
+    def __createBackup(self, filename):
+        """
+        Private method to rename a file to its backup file name.
+
+        @param filename name of the file
+        @type str
+        @return tuple containing the name of the file to be written (links are
+            resolved) and its permissions (None, if they could not be determined)
+        @rtype tuple of (str, int or None)
+        """
+        if os.path.islink(filename):
+            filename = os.path.realpath(filename)
+        backupFilename = "{0}~".format(filename)
+        try:
+            permissions = os.stat(filename).st_mode
+        except OSError:
+            # if there was an error, ignore it
+            permissions = None
+        with contextlib.suppress(OSError):
+            os.remove(backupFilename)
+        with contextlib.suppress(OSError):
+            os.rename(filename, backupFilename)
+
+        return filename, permissions
+
+    def __readFileChunk(self, params):
+        """
+        Private method to read a chunk of a file.
+
+        @param params dictionary containing the request data
+        @type dict
+        @return dictionary containing the reply data
+        @rtype dict
+        """
+        filename = params["filename"]
+
+        if params.get("create", False) and not os.path.exists(filename):
+            with open(filename, "wb"):
+                pass
+
+        size = params["size"]
+        if size < 0 or size > EricServerFileSystemRequestHandler.MaxChunkSize:
+            size = EricServerFileSystemRequestHandler.MaxChunkSize
+        try:
+            with open(filename, "rb") as f:
+                fileStat = os.fstat(f.fileno())
+                f.seek(params["offset"])
+                data = f.read(size)
+            return {
+                "ok": True,
+                "filedata": str(base64.b85encode(data), encoding="ascii"),
+                "offset": params["offset"],
+                "filesize": fileStat.st_size,
+                "mtime": fileStat.st_mtime,
+            }
+        except OSError as err:
+            return {
+                "ok": False,
+                "error": str(err),
+            }
+
+    def __writeFileChunk(self, params):
+        """
+        Private method to write a chunk of a file.
+
+        The chunks are collected in a partial file, which replaces the file
+        after the final chunk has been written. A transfer starting at an
+        offset greater than zero continues an interrupted transfer. Symbolic
+        links are resolved, i.e. the file they point to gets replaced, and
+        the permissions of an existing file are kept.
+
+        @param params dictionary containing the request data
+        @type dict
+        @return dictionary containing the reply data
+        @rtype dict
+        """
+        filename = os.path.realpath(params["filename"])
+        partialFilename = (
+            filename + EricServerFileSystemRequestHandler.PartialFileSuffix
+        )
+        offset = params["offset"]
+        data = base64.b85decode(bytes(params["filedata"], encoding="ascii"))
+
+        try:
+            if offset == 0:
+                mode = "wb"
+            else:
+                partialSize = os.path.getsize(partialFilename)
+                if partialSize != offset:
+                    return {
+                        "ok": False,
+                        "error": "Offset {0} does not match the size of the partial"
+                        " file ({1}).".format(offset, partialSize),
+                        "offset": partialSize,
+                    }
+                mode = "ab"
+            with open(partialFilename, mode) as f:
+                f.write(data)
+                offset = f.tell()
+
+            if params["final"]:
+                permissions = None
+                if params["with_backup"]:
+                    filename, permissions = self.__createBackup(filename)
+                else:
+                    with contextlib.suppress(OSError):
+                        shutil.copymode(filename, partialFilename)
+                os.replace(partialFilename, filename)
+                if permissions is not None:
+                    os.chmod(filename, permissions)
+            return {"ok": True, "offset": offset}
+        except OSError as err:
+            return {
+                "ok": False,
+                "error": str(err),
+            }
+
+    def __writeFileResume(self, params):
+        """
+        Private method to report the state of an interrupted chunked write.
+
+        @param params dictionary containing the request data
+        @type dict
+        @return dictionary containing the reply data
+        @rtype dict
+        """
+        partialFilename = (
+            os.path.realpath(params["filename"])
+            + EricServerFileSystemRequestHandler.PartialFileSuffix
+        )
+        if not os.path.isfile(partialFilename):
+            return {"ok": True, "offset": 0, "checksum": 0}
+
+        try:
+            checksum, offset = self.__checksum(partialFilename, -1)
+            return {"ok": True, "offset": offset, "checksum": checksum}
+        except OSError as err:
+            return {
+                "ok": False,
+                "error": str(err),
+            }
+
+    def __fileChecksum(self, params):
+        """
+        Private method to calculate the checksum of the start of a file.
+
+        @param params dictionary containing the request data
+        @type dict
+        @return dictionary containing the reply data
+        @rtype dict
+        """
+        try:
+            checksum, size = self.__checksum(params["filename"], params["size"])
+            return {"ok": True, "checksum": checksum, "size": size}
+        except OSError as err:
+            return {
+                "ok": False,
+                "error": str(err),
+            }
+
+    def __checksum(self, filename, size):
+        """
+        Private method to calculate the CRC32 checksum of the start of a file.
+
+        @param filename name of the file
+        @type str
+        @param size number of bytes to include (-1 for the complete file)
+        @type int
+        @return tuple containing the checksum and the number of bytes included
+        @rtype tuple of (int, int)
+        """
+        checksum = 0
+        count = 0
+        with open(filename, "rb") as f:
+            while size < 0 or count < size:
+                readSize = EricServerFileSystemRequestHandler.MaxChunkSize
+                if size >= 0:
+                    readSize = min(readSize, size - count)
+                data = f.read(readSize)
+                if not data:
+                    break
+                checksum = zlib.crc32(data, checksum)
+                count += len(data)
+
+        return checksum, count
+
     def __dirEntries(self, params):
         """
         Private method to get a list of all files and directories of a given directory.
@@ -9,12 +9,14 @@ Module implementing the file system interface to the eric-ide server.
 
 import base64
 import contextlib
+import fnmatch
 import logging
 import os
 import re
 import stat
+import zlib
 
-from PyQt6.QtCore import QByteArray, QEventLoop, QObject, pyqtSlot
+from PyQt6.QtCore import QByteArray, QEventLoop, QObject, pyqtSignal, pyqtSlot
 
 from eric7 import Utilities
 from eric7.RemoteServer.EricRequestCategory import EricRequestCategory
@@ -36,15 +38,43 @@ class EricServerNotConnectedError(OSError):
         super().__init__("Not connected to an 'eric-ide' server.")
 
 
+class EricServerUnsupportedRequestError(OSError):
+    """
+    Class defining a special OSError indicating a request not supported by the
+    connected server.
+    """
+
+    def __init__(self, request):
+        """
+        Constructor
+
+        @param request name of the unsupported request
+        @type str
+        """
+        super().__init__(
+            "Request type '{0}' is not supported by the 'eric-ide' server.".format(
+                request
+            )
+        )
+
+
 class EricServerFileSystemInterface(QObject):
     """
     Class implementing the file system interface to the eric-ide server.
+
+    @signal transferProgress(filename:str, transferred:int, total:int) emitted
+        to report the progress of a chunked file transfer
     """
 
+    transferProgress = pyqtSignal(str, int, int)
+
     _MagicCheck = re.compile("([*?[])")
 
     NotConnectedMessage = "Not connected to an 'eric-ide' server."
 
+    ChunkSize = 512 * 1024
+    PartialFileSuffix = ".ericpart"
+
     def __init__(self, serverInterface):
         """
         Constructor
@@ -60,6 +90,8 @@ class EricServerFileSystemInterface(QObject):
         )
 
         self.__serverPathSep = self.__getPathSep()
+        # requests found to be unsupported by the connected server
+        self.__unsupportedRequests = set()
 
     def serverInterface(self):
         """
@@ -94,6 +126,8 @@ class EricServerFileSystemInterface(QObject):
         """
         if connected and not bool(self.__serverPathSep):
             self.__serverPathSep = self.__getPathSep()
+        if connected:
+            self.__unsupportedRequests.clear()
 
     def __getPathSep(self):
         """
@@ -449,6 +483,145 @@ class EricServerFileSystemInterface(QObject):
 
         return stResult
 
+    def statMany(self, filenames, stNames):
+        """
+        Public method to get the status of a list of files with one request.
+
+        @param filenames list of file names
+        @type list of str
+        @param stNames list of 'stat_result' members to retrieve
+        @type list of str
+        @return list containing a dictionary with the requested status data or
+            None for each file (None indicates a non-existent or inaccessible file)
+        @rtype list of dict
+        """
+        try:
+            reply = self.__sendRequest(
+                "StatMany",
+                {
+                    "filenames": [
+                        FileSystemUtilities.plainFileName(f) for f in filenames
+                    ],
+                    "st_names": stNames,
+                },
+            )
+            return reply["result"]
+        except EricServerUnsupportedRequestError:
+            results = []
+            for filename in filenames:
+                try:
+                    results.append(self.stat(filename, stNames))
+                except OSError:
+                    results.append(None)
+            return results
+
+    def scanTree(
+        self,
+        root,
+        directories=None,
+        recursive=True,
+        excludeNames=None,
+        excludeDirs=None,
+        includeHidden=False,
+    ):
+        """
+        Public method to scan directories of a directory tree with one request.
+
+        Each listing entry contains a dictionary with the keys 'name', 'directory'
+        (the directory containing the entry relative to the root directory),
+        'path', 'is_dir', 'is_file', 'is_link', 'size' and 'mtime'.
+
+        @param root root directory of the scan
+        @type str
+        @param directories list of directories to be scanned relative to the root
+            directory (defaults to None for the root directory)
+        @type list of str (optional)
+        @param recursive flag indicating to scan subdirectories as well (defaults
+            to True)
+        @type bool (optional)
+        @param excludeNames list of wildcard patterns for entries to be skipped
+            (defaults to None)
+        @type list of str (optional)
+        @param excludeDirs list of wildcard patterns for directories (relative
+            to the root directory) not to be descended into (defaults to None)
+        @type list of str (optional)
+        @param includeHidden flag indicating to include hidden files and
+            directories (defaults to False)
+        @type bool (optional)
+        @return directory listing
+        @rtype list of dict
+        """
+        params = {
+            "root": FileSystemUtilities.plainFileName(root),
+            "directories": [""] if directories is None else directories,
+            "recursive": recursive,
+            "exclude_names": [] if excludeNames is None else excludeNames,
+            "exclude_dirs": [] if excludeDirs is None else excludeDirs,
+            "with_hidden": includeHidden,
+        }
+        try:
+            listing = self.__sendRequest("ScanTree", params)["listing"]
+        except EricServerUnsupportedRequestError:
+            listing = self.__scanTreeWithListdir(params)
+
+        for entry in listing:
+            entry["path"] = FileSystemUtilities.remoteFileName(entry["path"])
+        return listing
+
+    def __scanTreeWithListdir(self, params):
+        """
+        Private method to scan directories of a directory tree using one listdir
+        request per directory (for servers not supporting 'ScanTree').
+
+        @param params dictionary containing the scan parameters
+        @type dict
+        @return directory listing
+        @rtype list of dict
+        """
+        listing = []
+        directories = list(reversed(params["directories"]))
+        while directories:
+            directory = directories.pop()
+            try:
+                _, _, entries = self.listdir(
+                    self.join(params["root"], directory)
+                    if directory
+                    else params["root"]
+                )
+            except OSError:
+                continue
+
+            for entry in entries:
+                name = entry["name"]
+                if (not params["with_hidden"] and name.startswith(".")) or any(
+                    fnmatch.fnmatch(name, pattern)
+                    for pattern in params["exclude_names"]
+                ):
+                    continue
+
+                listing.append(
+                    {
+                        "name": name,
+                        "directory": directory,
+                        "path": entry["path"],
+                        "is_dir": entry["is_dir"],
+                        "is_file": entry["is_file"],
+                        "is_link": entry["is_link"],
+                        "size": entry["size"],
+                        "mtime": entry["mtime"],
+                    }
+                )
+
+                if entry["is_dir"] and params["recursive"]:
+                    subdirectory = self.join(directory, name) if directory else name
+                    if not any(
+                        fnmatch.fnmatch(subdirectory, pattern)
+                        for pattern in params["exclude_dirs"]
+                    ):
+                        directories.append(subdirectory)
+
+        return listing
+
     def isdir(self, name):
         """
         Public method to check, if the given name is a directory.
@@ -1083,6 +1256,9 @@ class EricServerFileSystemInterface(QObject):
             connection
         @exception OSError raised in case the server reported an issue
         """
+        with contextlib.suppress(EricServerUnsupportedRequestError):
+            return self.readFileRange(filename, create=create)
+
         loop = QEventLoop()
         ok = False
         error = ""
@@ -1148,6 +1324,12 @@ class EricServerFileSystemInterface(QObject):
             connection
         @exception OSError raised in case the server reported an issue
         """
+        if newline is None:
+            # text mode writes are performed by the server in one go
+            with contextlib.suppress(EricServerUnsupportedRequestError):
+                self.__writeChunks(filename, bytes(data), 0, withBackup)
+                return
+
         loop = QEventLoop()
         ok = False
         error = ""
@@ -1251,6 +1433,303 @@ class EricServerFileSystemInterface(QObject):
 
         return encoding
 
+    #######################################################################
+    ## Methods implementing chunked file transfers.
+    #######################################################################
+
+    def __sendRequest(self, request, params):
+        """
+        Private method to send a file system request and wait for the reply.
+
+        @param request name of the request
+        @type str
+        @param params dictionary containing the request data
+        @type dict
+        @return dictionary containing the reply data
+        @rtype dict
+        @exception EricServerNotConnectedError raised to indicate a missing server
+            connection
+        @exception EricServerUnsupportedRequestError raised to indicate a server
+            not supporting the request
+        """
+        if request in self.__unsupportedRequests:
+            raise EricServerUnsupportedRequestError(request)
+
+        loop = QEventLoop()
+        replyParams = {}
+
+        def callback(reply, params):
+            """
+            Function to handle the server reply
+
+            @param reply name of the server reply
+            @type str
+            @param params dictionary containing the reply data
+            @type dict
+            """
+            nonlocal replyParams
+
+            if reply == request:
+                replyParams = params
+                loop.quit()
+
+        if not self.__serverInterface.isServerConnected():
+            raise EricServerNotConnectedError
+
+        self.__serverInterface.sendJson(
+            category=EricRequestCategory.FileSystem,
+            request=request,
+            params=params,
+            callback=callback,
+        )
+
+        loop.exec()
+        if "info" in replyParams or "Error" in replyParams:
+            # server of an older eric-ide release
+            self.__unsupportedRequests.add(request)
+            raise EricServerUnsupportedRequestError(request)
+
+        return replyParams
+
+    def iterFileChunks(
+        self, filename, offset=0, size=-1, create=False, chunkSize=ChunkSize
+    ):
+        """
+        Public method to read a file from the eric-ide server in chunks.
+
+        @param filename name of the file to read
+        @type str
+        @param offset position to start reading at (defaults to 0)
+        @type int (optional)
+        @param size maximum number of bytes to read (-1 to read up to the end of
+            the file) (defaults to -1)
+        @type int (optional)
+        @param create flag indicating to create an empty file, if it does not exist
+            (defaults to False)
+        @type bool (optional)
+        @param chunkSize number of bytes requested per chunk (defaults to
+            ChunkSize)
+        @type int (optional)
+        @yield chunk of data read from the eric-ide server
+        @ytype bytes
+        @exception OSError raised in case the server reported an issue
+        """
+        plainFilename = FileSystemUtilities.plainFileName(filename)
+        end = -1 if size < 0 else offset + size
+        position = offset
+        while end < 0 or position < end:
+            requestSize = chunkSize if end < 0 else min(chunkSize, end - position)
+            reply = self.__sendRequest(
+                "ReadFileChunk",
+                {
+                    "filename": plainFilename,
+                    "offset": position,
+                    "size": requestSize,
+                    "create": create and position == offset,
+                },
+            )
+            if not reply["ok"]:
+                raise OSError(reply["error"])
+
+            data = base64.b85decode(bytes(reply["filedata"], encoding="ascii"))
+            position += len(data)
+            total = reply["filesize"] if end < 0 else min(end, reply["filesize"])
+            self.transferProgress.emit(filename, position - offset, total - offset)
+            if data:
+                yield data
+            if len(data) < requestSize or position >= reply["filesize"]:
+                break
+
+    def readFileRange(self, filename, offset=0, size=-1, create=False):
+        """
+        Public method to read a range of a file from the eric-ide server.
+
+        Note: This is useful for viewers needing just the start of a big file.
+
+        @param filename name of the file to read
+        @type str
+        @param offset position to start reading at (defaults to 0)
+        @type int (optional)
+        @param size maximum number of bytes to read (-1 to read up to the end of
+            the file) (defaults to -1)
+        @type int (optional)
+        @param create flag indicating to create an empty file, if it does not exist
+            (defaults to False)
+        @type bool (optional)
+        @return bytes data read from the eric-ide server
+        @rtype bytes
+        """
+        return b"".join(
+            self.iterFileChunks(filename, offset=offset, size=size, create=create)
+        )
+
+    def __writeChunks(self, filename, data, offset, withBackup):
+        """
+        Private method to write data to a file on the eric-ide server in chunks.
+
+        @param filename name of the file to write
+        @type str
+        @param data data to be written or a file object to read it from
+        @type bytes or io.BufferedIOBase
+        @param offset position of the first byte of data within the file
+        @type int
+        @param withBackup flag indicating to create a backup file first
+        @type bool
+        @exception OSError raised in case the server reported an issue
+        """
+        plainFilename = FileSystemUtilities.plainFileName(filename)
+        if isinstance(data, bytes):
+            total = len(data)
+            position = 0
+
+            def nextChunk():
+                """
+                Function to get the next chunk of the data.
+
+                @return chunk of data
+                @rtype bytes
+                """
+                nonlocal position
+                chunk = data[position : position + self.ChunkSize]
+                position += len(chunk)
+                return chunk
+
+        else:
+            total = offset + os.fstat(data.fileno()).st_size - data.tell()
+
+            def nextChunk():
+                """
+                Function to read the next chunk of data from the file.
+
+                @return chunk of data
+                @rtype bytes
+                """
+                return data.read(self.ChunkSize)
+
+        chunk = nextChunk()
+        while True:
+            final = offset + len(chunk) >= total
+            reply = self.__sendRequest(
+                "WriteFileChunk",
+                {
+                    "filename": plainFilename,
+                    "offset": offset,
+                    "filedata": str(base64.b85encode(chunk), encoding="ascii"),
+                    "final": final,
+                    "with_backup": withBackup,
+                },
+            )
+            if not reply["ok"]:
+                raise OSError(reply["error"])
+
+            offset = reply["offset"]
+            self.transferProgress.emit(filename, offset, total)
+            if final:
+                break
+            chunk = nextChunk()
+
+    def downloadFile(self, filename, localFilename, resume=True):
+        """
+        Public method to copy a file of the eric-ide server to the local file
+        system.
+
+        The data is collected in a partial file next to the local file. An
+        interrupted download is continued, if the server file still starts with
+        the data already received.
+
+        @param filename name of the file on the eric-ide server
+        @type str
+        @param localFilename name of the local file
+        @type str
+        @param resume flag indicating to continue an interrupted download
+            (defaults to True)
+        @type bool (optional)
+        """
+        partialFilename = localFilename + self.PartialFileSuffix
+        offset = 0
+        if resume and os.path.isfile(partialFilename):
+            checksum, offset = self.__localChecksum(partialFilename)
+            if offset:
+                reply = self.__sendRequest(
+                    "FileChecksum",
+                    {
+                        "filename": FileSystemUtilities.plainFileName(filename),
+                        "size": offset,
+                    },
+                )
+                if (
+                    not reply["ok"]
+                    or reply["size"] != offset
+                    or reply["checksum"] != checksum
+                ):
+                    offset = 0
+
+        with open(partialFilename, "ab" if offset else "wb") as f:
+            for chunk in self.iterFileChunks(filename, offset=offset):
+                f.write(chunk)
+        os.replace(partialFilename, localFilename)
+
+    def uploadFile(self, localFilename, filename, withBackup=False, resume=True):
+        """
+        Public method to copy a local file to the eric-ide server.
+
+        An interrupted upload is continued, if the local file still starts with
+        the data already received by the server.
+
+        @param localFilename name of the local file
+        @type str
+        @param filename name of the file on the eric-ide server
+        @type str
+        @param withBackup flag indicating to create a backup file first
+            (defaults to False)
+        @type bool (optional)
+        @param resume flag indicating to continue an interrupted upload
+            (defaults to True)
+        @type bool (optional)
+        """
+        offset = 0
+        if resume:
+            reply = self.__sendRequest(
+                "WriteFileResume",
+                {"filename": FileSystemUtilities.plainFileName(filename)},
+            )
+            if reply["ok"] and reply["offset"]:
+                checksum, size = self.__localChecksum(localFilename, reply["offset"])
+                if size == reply["offset"] and checksum == reply["checksum"]:
+                    offset = size
+
+        with open(localFilename, "rb") as f:
+            f.seek(offset)
+            self.__writeChunks(filename, f, offset, withBackup)
+
+    def __localChecksum(self, filename, size=-1):
+        """
+        Private method to calculate the CRC32 checksum of the start of a local
+        file.
+
+        @param filename name of the local file
+        @type str
+        @param size number of bytes to include (-1 for the complete file)
+            (defaults to -1)
+        @type int (optional)
+        @return tuple containing the checksum and the number of bytes included
+        @rtype tuple of (int, int)
+        """
+        checksum = 0
+        count = 0
+        with open(filename, "rb") as f:
+            while size < 0 or count < size:
+                readSize = (
+                    self.ChunkSize if size < 0 else min(self.ChunkSize, size - count)
+                )
+                data = f.read(readSize)
+                if not data:
+                    break
+                checksum = zlib.crc32(data, checksum)
+                count += len(data)
+
+        return checksum, count
+
     #######################################################################
     ## Methods implementing some 'shutil' like functionality.
     #######################################################################
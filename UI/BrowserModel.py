@@ -231,30 +231,24 @@ class BrowserModel(QAbstractItemModel):
         if parent is None:
             parent = QModelIndex()
 
-        # The model/view framework considers negative values out-of-bounds,
-        # however in python they work when indexing into lists. So make sure
-        # we return an invalid index for out-of-bounds row/col
-        if (
-            row < 0
-            or column < 0
-            or row >= self.rowCount(parent)
-            or column >= self.columnCount(parent)
-        ):
+        # Only the first column should have children
+        if row < 0 or column < 0 or parent.column() > 0:
             return QModelIndex()
 
         parentItem = parent.internalPointer() if parent.isValid() else self.rootItem
+        if not parentItem.isPopulated():  # lazy population
+            self.populateItem(parentItem)
 
-        try:
-            if not parentItem.isPopulated():
-                self.populateItem(parentItem)
-            childItem = parentItem.child(row)
-        except IndexError:
-            childItem = None
-        if childItem:
-            return self.createIndex(row, column, childItem)
-        else:
+        # The model/view framework considers negative values out-of-bounds,
+        # however in python they work when indexing into lists. So make sure
+        # we return an invalid index for out-of-bounds row/col. The bounds are
+        # checked directly because this method is called very often (e.g.
+        # while sorting the entries of a large directory).
+        if row >= parentItem.childCount() or column >= parentItem.columnCount():
             return QModelIndex()
 
+        return self.createIndex(row, column, parentItem.child(row))
+
     def parent(self, index):
         """
         Public method to get the index of the parent object.
@@ -605,6 +599,36 @@ class BrowserModel(QAbstractItemModel):
         """
         parentItem.appendChild(itm)
 
+    def _addItems(self, items, parentItem, repopulate=False):
+        """
+        Protected method to add a list of items.
+
+        @param items list of items to add
+        @type list of BrowserItem
+        @param parentItem reference to item to add to
+        @type BrowserItem
+        @param repopulate flag indicating a repopulation, which has to be
+            announced to the views (defaults to False)
+        @type bool (optional)
+        """
+        if not items:
+            return
+
+        if repopulate:
+            # Attached views query the row count of the parent, while the rows
+            # are being inserted. Mark the parent as populated in order to
+            # prevent its lazy population adding the entries a second time.
+            parentItem._populated = True
+            first = parentItem.childCount()
+            self.beginInsertRows(
+                self.createIndex(parentItem.row(), 0, parentItem),
+                first,
+                first + len(items) - 1,
+            )
+        parentItem.appendChildren(items)
+        if repopulate:
+            self.endInsertRows()
+
     def addItem(self, itm, parent=None):
         """
         Public slot to add an item.
@@ -658,84 +682,59 @@ class BrowserModel(QAbstractItemModel):
         self._addWatchedItem(parentItem)
 
         dirName = parentItem.dirName()
+        fileFilters = [
+            ff.strip()
+            for ff in Preferences.getUI("BrowsersFileFilters").split(";")
+            if ff.strip()
+        ]
+        nodes = []
         if FileSystemUtilities.isPlainFileName(dirName):
             qdir = QDir(dirName)
 
             dirFilter = (
                 QDir.Filter.AllEntries | QDir.Filter.NoDotAndDotDot | QDir.Filter.Hidden
             )
-            entryInfoList = qdir.entryInfoList(dirFilter)
-            if len(entryInfoList) > 0:
-                if repopulate:
-                    self.beginInsertRows(
-                        self.createIndex(parentItem.row(), 0, parentItem),
-                        0,
-                        len(entryInfoList) - 1,
+            for f in qdir.entryInfoList(dirFilter):
+                if f.isDir():
+                    node = BrowserDirectoryItem(
+                        parentItem,
+                        FileSystemUtilities.toNativeSeparators(f.absoluteFilePath()),
+                        False,
                     )
-                for f in entryInfoList:
-                    if f.isDir():
-                        node = BrowserDirectoryItem(
-                            parentItem,
-                            FileSystemUtilities.toNativeSeparators(
-                                f.absoluteFilePath()
-                            ),
-                            False,
-                        )
-                    else:
-                        fileFilters = Preferences.getUI("BrowsersFileFilters").split(
-                            ";"
-                        )
-                        if fileFilters:
-                            fn = f.fileName()
-                            if any(
-                                fnmatch.fnmatch(fn, ff.strip()) for ff in fileFilters
-                            ):
-                                continue
-                        node = BrowserFileItem(
-                            parentItem,
-                            FileSystemUtilities.toNativeSeparators(
-                                f.absoluteFilePath()
-                            ),
-                        )
-                    self._addItem(node, parentItem)
-                if repopulate:
-                    self.endInsertRows()
+                else:
+                    if fileFilters:
+                        fn = f.fileName()
+                        if any(fnmatch.fnmatch(fn, ff) for ff in fileFilters):
+                            continue
+                    node = BrowserFileItem(
+                        parentItem,
+                        FileSystemUtilities.toNativeSeparators(f.absoluteFilePath()),
+                    )
+                nodes.append(node)
 
         elif FileSystemUtilities.isRemoteFileName(dirName):
-            entriesList = self.__remotefsInterface.listdir(dirName)[2]
-            if len(entriesList) > 0:
-                if repopulate:
-                    self.beginInsertRows(
-                        self.createIndex(parentItem.row(), 0, parentItem),
-                        0,
-                        len(entriesList) - 1,
+            for entry in self.__remotefsInterface.listdir(dirName)[2]:
+                if entry["is_dir"]:
+                    node = BrowserDirectoryItem(
+                        parentItem,
+                        entry["path"],
+                        False,
+                        fsInterface=self.__remotefsInterface,
                     )
-                for entry in entriesList:
-                    if entry["is_dir"]:
-                        node = BrowserDirectoryItem(
-                            parentItem,
-                            entry["path"],
-                            False,
-                            fsInterface=self.__remotefsInterface,
-                        )
-                    else:
-                        fileFilters = Preferences.getUI("BrowsersFileFilters").split(
-                            ";"
-                        )
-                        if fileFilters:
-                            fn = entry["name"]
-                            if any(
-                                fnmatch.fnmatch(fn, ff.strip()) for ff in fileFilters
-                            ):
-                                continue
-                        node = BrowserFileItem(
-                            parentItem,
-                            entry["path"],
-                            fsInterface=self.__remotefsInterface,
-                        )
-                    self._addItem(node, parentItem)
-                if repopulate:
-                    self.endInsertRows()
+                else:
+                    if fileFilters:
+                        fn = entry["name"]
+                        if any(fnmatch.fnmatch(fn, ff) for ff in fileFilters):
+                            continue
+                    node = BrowserFileItem(
+                        parentItem,
+                        entry["path"],
+                        fsInterface=self.__remotefsInterface,
+                    )
+                nodes.append(node)
+
+        # insert all entries with one notification
+        self._addItems(nodes, parentItem, repopulate)
 
     def populateSysPathItem(self, parentItem, repopulate=False):
         """
@@ -758,22 +757,18 @@ class BrowserModel(QAbstractItemModel):
                     "replace",
                 )
                 syspath = [p for p in json.loads(procOutput) if p]
-                if len(syspath) > 0:
-                    if repopulate:
-                        self.beginInsertRows(
-                            self.createIndex(parentItem.row(), 0, parentItem),
-                            0,
-                            len(syspath) - 1,
-                        )
-                    for p in syspath:
-                        node = (
+                self._addItems(
+                    [
+                        (
                             BrowserDirectoryItem(parentItem, p)
                             if os.path.isdir(p)
                             else BrowserFileItem(parentItem, p)
                         )
-                        self._addItem(node, parentItem)
-                    if repopulate:
-                        self.endInsertRows()
+                        for p in syspath
+                    ],
+                    parentItem,
+                    repopulate,
+                )
             else:
                 proc.kill()
 
@@ -1085,6 +1080,7 @@ class BrowserItem:
         @type Any
         """
         self.childItems = []
+        self.__row = 0  # cached row number, validated on use
 
         self.parentItem = parent
         self.itemData = [data]
@@ -1103,9 +1099,22 @@ class BrowserItem:
         @param child reference to the child item to add
         @type BrowserItem
         """
+        child.setRow(len(self.childItems))
         self.childItems.append(child)
         self._populated = True
 
+    def appendChildren(self, children):
+        """
+        Public method to add a list of children to this item.
+
+        @param children list of child items to add
+        @type list of BrowserItem
+        """
+        for row, child in enumerate(children, start=len(self.childItems)):
+            child.setRow(row)
+        self.childItems.extend(children)
+        self._populated = True
+
     def removeChild(self, child):
         """
         Public method to remove a child.
@@ -1113,7 +1122,14 @@ class BrowserItem:
         @param child reference to the child to remove
         @type BrowserItem
         """
-        self.childItems.remove(child)
+        row = child.row()
+        if row < len(self.childItems) and self.childItems[row] is child:
+            del self.childItems[row]
+        else:
+            self.childItems.remove(child)
+            row = 0
+        for newRow, sibling in enumerate(self.childItems[row:], start=row):
+            sibling.setRow(newRow)
 
     def removeChildren(self):
         """
@@ -1189,10 +1205,31 @@ class BrowserItem:
         @return row number
         @rtype int
         """
+        if self.parentItem is None:
+            return 0
+
+        siblings = self.parentItem.childItems
+        if self.__row < len(siblings) and siblings[self.__row] is self:
+            return self.__row
+
+        # the cached row is outdated (e.g. the children were reordered)
         try:
-            return self.parentItem.childItems.index(self)
+            self.__row = siblings.index(self)
         except ValueError:
             return 0
+        return self.__row
+
+    def setRow(self, row):
+        """
+        Public method to set the cached row number of this item.
+
+        Note: This is called by the parent item, whenever the item is inserted
+        or moved.
+
+        @param row row number
+        @type int
+        """
+        self.__row = row
 
     def type(self):
         """
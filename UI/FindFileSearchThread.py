@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+
+"""
+Module implementing a thread searching a list of files for a regular
+expression.
+"""
+
+import bisect
+import collections
+import concurrent.futures
+import contextlib
+import hashlib
+import itertools
+import os
+import re
+import time
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from eric7 import Utilities
+
+
+class FindFileSearchThread(QThread):
+    """
+    Class implementing a thread searching a list of files for a regular
+    expression.
+
+    The files are read by a pool of reader threads, which reject files not
+    containing the searched literal text before they get decoded. If a search
+    index is given, files not containing the trigrams of the literal text are
+    not read at all and files not indexed yet are added to the index. The remaining
+    files are decoded and searched by this thread. The results are reported in
+    batches in order to keep the number of signals (and GUI updates) low.
+
+    @signal resultsAvailable(results:list) emitted with a batch of search
+        results. Each result is a tuple containing the file name, the line
+        number, the text to be shown, the start and end position of the match,
+        the line with replacements applied and the MD5 hash of the file.
+    @signal progress(files:int) emitted with the number of processed files
+    @signal searchFinished(occurrences:int, files:int) emitted after the search
+        has finished with the number of occurrences and the number of files
+        containing them
+    """
+
+    resultsAvailable = pyqtSignal(list)
+    progress = pyqtSignal(int)
+    searchFinished = pyqtSignal(int, int)
+
+    ReaderThreads = 4
+    BatchInterval = 0.05  # seconds
+    MaxLineLength = 1024
+
+    def __init__(
+        self,
+        files,
+        basePath,
+        search,
+        literal="",
+        caseSensitive=True,
+        replaceText=None,
+        escapeMode=False,
+        searchIndex=None,
+        parent=None,
+    ):
+        """
+        Constructor
+
+        @param files list of files to be searched
+        @type list of str
+        @param basePath path the file names are relative to (empty for absolute
+            file names)
+        @type str
+        @param search compiled regular expression to search for
+        @type re.Pattern
+        @param literal literal text every match contains (empty, if not known)
+            (defaults to "")
+        @type str (optional)
+        @param caseSensitive flag indicating a case sensitive search (defaults
+            to True)
+        @type bool (optional)
+        @param replaceText replacement text (None for a search without
+            replacement) (defaults to None)
+        @type str (optional)
+        @param escapeMode flag indicating to show the lines with escape codes
+            (defaults to False)
+        @type bool (optional)
+        @param searchIndex reference to the search index of the project used to
+            skip files not containing the literal text (defaults to None)
+        @type ProjectSearchIndex (optional)
+        @param parent reference to the parent object (defaults to None)
+        @type QObject (optional)
+        """
+        super().__init__(parent)
+
+        self.__files = files
+        self.__basePath = basePath
+        self.__search = search
+        self.__replaceText = replaceText
+        self.__escapeMode = escapeMode
+        self.__cancelled = False
+
+        # Searching the complete text finds every match of a line search, if
+        # the expression does not depend on the line or text boundaries and
+        # does not look behind or negatively ahead of the match. It is used to
+        # skip the lines not containing a match. If the literal text is known,
+        # it is searched for instead. Leading word boundaries are removed as
+        # well. Both let the expression profit from the literal prefix
+        # optimization of the regular expression engine.
+        if literal:
+            self.__textSearch = re.compile(re.escape(literal), search.flags)
+        elif not any(
+            s in search.pattern for s in ("^", "$", "\\A", "\\Z", "(?<", "(?!")
+        ):
+            pattern = search.pattern
+            while pattern.startswith("\\b"):
+                pattern = pattern[2:]
+            self.__textSearch = re.compile(pattern, search.flags)
+        else:
+            self.__textSearch = None
+
+        # The byte search is only valid for ASCII texts. Case insensitive
+        # searches are performed on the lower cased data, which is only exact
+        # for ASCII only data.
+        if literal and literal.isascii():
+            self.__literal = (literal if caseSensitive else literal.lower()).encode(
+                "ascii"
+            )
+        else:
+            self.__literal = b""
+        self.__caseSensitive = caseSensitive
+
+        self.__searchIndex = (
+            searchIndex if searchIndex is not None and searchIndex.isValid() else None
+        )
+        if self.__searchIndex is not None and literal:
+            self.__indexMask = self.__searchIndex.queryMask(literal)
+            self.__indexNonAscii = not caseSensitive and any(
+                c in literal.lower() for c in self.__searchIndex.NonAsciiCaseLetters
+            )
+        else:
+            self.__indexMask = 0
+            self.__indexNonAscii = False
+
+    def cancel(self):
+        """
+        Public method to cancel the search.
+
+        Note: The search stops after the line being searched. No further
+        results are reported.
+        """
+        self.__cancelled = True
+
+    def __readFile(self, filename):
+        """
+        Private method to read a file and check it for the literal text.
+
+        Note: This method is executed by the reader threads.
+
+        @param filename name of the file to be read
+        @type str
+        @return contents of the file or None, if the file could not be read or
+            does not contain the literal text
+        @rtype bytes or None
+        """
+        if self.__cancelled:
+            return None
+
+        try:
+            if self.__searchIndex is not None and self.__searchIndex.isIndexed(
+                filename
+            ):
+                # the status is determined before reading the file in order to
+                # detect a modification while being read by the next search
+                fileStat = os.stat(filename)
+                mayContain = self.__searchIndex.mayContain(
+                    filename, fileStat, self.__indexMask, self.__indexNonAscii
+                )
+                if mayContain is False:
+                    return None
+            else:
+                mayContain = True
+
+            with open(filename, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        if mayContain is None:
+            # file is not indexed yet or has been changed since
+            self.__searchIndex.update(filename, fileStat, data)
+
+        if self.__literal and b"\0" not in data:
+            # data is in an ASCII compatible encoding
+            if self.__caseSensitive:
+                if self.__literal not in data:
+                    return None
+            elif data.isascii() and self.__literal not in data.lower():
+                return None
+
+        return data
+
+    def __searchText(self, file, data):
+        """
+        Private method to search the contents of a file.
+
+        @param file file name to be reported
+        @type str
+        @param data contents of the file
+        @type bytes
+        @return list of search results
+        @rtype list of tuple of (str, int, str, int, int, str, str)
+        """
+        try:
+            text = Utilities.decode(data)[0]
+        except UnicodeError:
+            return []
+
+        if self.__textSearch is not None:
+            firstMatch = self.__textSearch.search(text)
+            if firstMatch is None:
+                return []
+            lines = text.splitlines(True)
+            candidates = self.__candidateLines(text, lines, firstMatch)
+        else:
+            lines = text.splitlines(True)
+            candidates = range(len(lines))
+
+        results = []
+        hashStr = ""
+        for index in candidates:
+            if self.__cancelled:
+                break
+
+            line = lines[index]
+            count = index + 1
+            contains = self.__search.search(line)
+            if contains:
+                if not hashStr:
+                    hashStr = hashlib.md5(data).hexdigest()  # secok
+                shownLine, rline = self.__formatLine(line)
+                results.append(
+                    (
+                        file,
+                        count,
+                        shownLine,
+                        contains.start(),
+                        contains.end(),
+                        rline,
+                        hashStr,
+                    )
+                )
+
+        return results
+
+    def __candidateLines(self, text, lines, firstMatch):
+        """
+        Private generator to determine the lines possibly containing a match.
+
+        @param text text to be searched
+        @type str
+        @param lines lines of the text
+        @type list of str
+        @param firstMatch first match of the text search
+        @type re.Match
+        @yield index of a line possibly containing a match
+        @ytype int
+        """
+        lineStarts = list(
+            itertools.accumulate((len(line) for line in lines), initial=0)
+        )
+        match = firstMatch
+        while match is not None:
+            index = bisect.bisect_right(lineStarts, match.start()) - 1
+            if index >= len(lines):
+                break
+            yield index
+            match = self.__textSearch.search(text, lineStarts[index + 1])
+
+    def __formatLine(self, line):
+        """
+        Private method to format a line containing a match for display.
+
+        @param line line containing a match
+        @type str
+        @return tuple containing the text to be shown and the line with the
+            replacements applied (empty, if no replacement is requested)
+        @rtype tuple of (str, str)
+        """
+        rline = (
+            ""
+            if self.__replaceText is None
+            else self.__search.sub(self.__replaceText, line)
+        )
+        line = Utilities.slash(line) if self.__escapeMode else line.rstrip("\n\r")
+        if len(line) > FindFileSearchThread.MaxLineLength:
+            line = "{0} ...".format(line[: FindFileSearchThread.MaxLineLength])
+        if self.__replaceText is not None:
+            if len(rline) > FindFileSearchThread.MaxLineLength:
+                rline = "{0} ...".format(line[: FindFileSearchThread.MaxLineLength])
+            line = "- {0}\n+ {1}".format(
+                line,
+                (
+                    "\n  ".join(Utilities.slash(rl) for rl in rline.splitlines(True))
+                    if self.__escapeMode
+                    else rline.rstrip("\n\r")
+                ),
+            )
+
+        return line, rline
+
+    def run(self):
+        """
+        Public method executed by the thread.
+        """
+        occurrences = 0
+        fileOccurrences = 0
+        batch = []
+        processed = 0
+        lastReport = time.monotonic()
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=FindFileSearchThread.ReaderThreads
+        ) as executor:
+            # keep a limited number of files in memory
+            files = iter(self.__files)
+            pending = collections.deque(
+                (file, executor.submit(self.__readFile, self.__fullPath(file)))
+                for file in itertools.islice(
+                    files, 4 * FindFileSearchThread.ReaderThreads
+                )
+            )
+
+            while pending and not self.__cancelled:
+                file, future = pending.popleft()
+                with contextlib.suppress(StopIteration):
+                    nextFile = next(files)
+                    pending.append(
+                        (
+                            nextFile,
+                            executor.submit(self.__readFile, self.__fullPath(nextFile)),
+                        )
+                    )
+
+                data = future.result()
+                if data is not None:
+                    results = self.__searchText(file, data)
+                    if results and not self.__cancelled:
+                        occurrences += len(results)
+                        fileOccurrences += 1
+                        batch.extend(results)
+
+                processed += 1
+                now = time.monotonic()
+                if now - lastReport >= FindFileSearchThread.BatchInterval:
+                    if batch:
+                        self.resultsAvailable.emit(batch)
+                        batch = []
+                    self.progress.emit(processed)
+                    lastReport = now
+
+            for _file, future in pending:
+                future.cancel()
+
+        if batch and not self.__cancelled:
+            self.resultsAvailable.emit(batch)
+        self.progress.emit(processed)
+        self.searchFinished.emit(occurrences, fileOccurrences)
+
+    def __fullPath(self, file):
+        """
+        Private method to get the full path of a file to be searched.
+
+        @param file file name as given in the list of files
+        @type str
+        @return full path of the file
+        @rtype str
+        """
+        return os.path.join(self.__basePath, file) if self.__basePath else file
@@ -10,7 +10,6 @@ Module implementing a dialog to search for text in files.
 import json
 import os
 import re
-import time
 
 from PyQt6.QtCore import QPoint, Qt, QUrl, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QCursor, QDesktopServices, QImageReader
@@ -33,6 +32,7 @@ from eric7.EricWidgets.EricApplication import ericApp
 from eric7.EricWidgets.EricPathPicker import EricPathPickerModes
 from eric7.SystemUtilities import FileSystemUtilities
 
+from .FindFileSearchThread import FindFileSearchThread
 from .Ui_FindFileWidget import Ui_FindFileWidget
 
 
@@ -177,7 +177,7 @@ class FindFileWidget(QWidget, Ui_FindFileWidget):
         self.__section0Size = self.findList.header().sectionSize(0)
         self.findList.setExpandsOnDoubleClick(False)
 
-        self.__cancelSearch = False
+        self.__searchThread = None
         self.__lastFileItem = None
         self.__populating = False
 
@@ -584,17 +584,6 @@ class FindFileWidget(QWidget, Ui_FindFileWidget):
         else:
             self.findButton.setEnabled(True)
 
-    def __stripEol(self, txt):
-        """
-        Private method to strip the eol part.
-
-        @param txt line of text that should be treated
-        @type str
-        @return text with eol stripped
-        @rtype str
-        """
-        return txt.rstrip("\n\r")
-
     def __buildReFileFilter(self, fileFilter):
         """
         Private method to convert a file filter expression into a valid re search
@@ -614,7 +603,8 @@ class FindFileWidget(QWidget, Ui_FindFileWidget):
         """
         Private slot to handle the stop button being pressed.
         """
-        self.__cancelSearch = True
+        if self.__searchThread is not None:
+            self.__searchThread.cancel()
 
     @pyqtSlot()
     def __doSearch(self):
@@ -627,7 +617,6 @@ class FindFileWidget(QWidget, Ui_FindFileWidget):
         ):
             return
 
-        self.__cancelSearch = False
         filterRe = None
         excludeFilterRe = None
 
@@ -735,6 +724,7 @@ class FindFileWidget(QWidget, Ui_FindFileWidget):
         cs = self.caseToolButton.isChecked()
         ct = self.findtextCombo.currentText()
         txt = Utilities.unslash(ct) if esc else ct
+        literal = "" if reg else txt
         txt = txt if reg else re.escape(txt)
         if wo:
             txt = "\\b{0}\\b".format(txt)
@@ -786,6 +776,8 @@ class FindFileWidget(QWidget, Ui_FindFileWidget):
             )
             if esc:
                 replTxt = Utilities.unslash(replTxt)
+        else:
+            replTxt = None
 
         if self.dirButton.isChecked():
             searchDir = self.dirPicker.currentText()
@@ -804,73 +796,57 @@ class FindFileWidget(QWidget, Ui_FindFileWidget):
         self.findButton.setEnabled(False)
         self.clearButton.setEnabled(False)
 
-        # now go through all the files
+        # now search all the files in the background
         self.__populating = True
-        self.findList.setUpdatesEnabled(False)
-        occurrences = 0
-        fileOccurrences = 0
-        for progress, file in enumerate(files, start=1):
-            self.__lastFileItem = None
-            found = False
-            if self.__cancelSearch:
-                break
-
-            fn = (
-                os.path.join(self.__project.getProjectPath(), file)
-                if self.projectButton.isChecked()
-                else file
-            )
-            # read the file and split it into textlines
-            try:
-                text, encoding, hashStr = Utilities.readEncodedFileWithHash(fn)
-                lines = text.splitlines(True)
-            except (OSError, UnicodeError):
-                self.findProgress.setValue(progress)
-                continue
-
-            now = time.monotonic()
-            # now perform the search and display the lines found
-            for count, line in enumerate(lines, start=1):
-                if self.__cancelSearch:
-                    break
-
-                contains = search.search(line)
-                if contains:
-                    occurrences += 1
-                    found = True
-                    start = contains.start()
-                    end = contains.end()
-                    if self.__replaceMode:
-                        rline = search.sub(replTxt, line)
-                    else:
-                        rline = ""
-                    line = Utilities.slash(line) if esc else self.__stripEol(line)
-                    if len(line) > 1024:
-                        line = "{0} ...".format(line[:1024])
-                    if self.__replaceMode:
-                        if len(rline) > 1024:
-                            rline = "{0} ...".format(line[:1024])
-                        line = "- {0}\n+ {1}".format(
-                            line,
-                            (
-                                "\n  ".join(
-                                    Utilities.slash(rl) for rl in rline.splitlines(True)
-                                )
-                                if esc
-                                else self.__stripEol(rline)
-                            ),
-                        )
-                    self.__createItem(file, count, line, start, end, rline, hashStr)
+        self.__searchThread = FindFileSearchThread(
+            files,
+            self.__project.getProjectPath() if self.projectButton.isChecked() else "",
+            search,
+            literal=literal,
+            caseSensitive=cs,
+            replaceText=replTxt,
+            escapeMode=esc,
+            searchIndex=self.__project.getSearchIndex(),
+            parent=self,
+        )
+        self.__searchThread.resultsAvailable.connect(self.__searchResultsAvailable)
+        self.__searchThread.progress.connect(self.findProgress.setValue)
+        self.__searchThread.searchFinished.connect(self.__searchFinished)
+        self.__searchThread.finished.connect(self.__searchThread.deleteLater)
+        self.__searchThread.start()
 
-                if time.monotonic() - now > 0.01:
-                    QApplication.processEvents()
-                    now = time.monotonic()
+    @pyqtSlot(list)
+    def __searchResultsAvailable(self, results):
+        """
+        Private slot to show a batch of search results.
+
+        @param results list of search results
+        @type list of tuple of (str, int, str, int, int, str, str)
+        """
+        for file, line, text, start, end, replTxt, md5 in results:
+            if self.__lastFileItem is not None and self.__lastFileItem.text(0) != file:
+                self.__lastFileItem = None
+            self.__createItem(file, line, text, start, end, replTxt, md5)
+
+    @pyqtSlot(int, int)
+    def __searchFinished(self, occurrences, fileOccurrences):
+        """
+        Private slot handling the end of the search.
+
+        @param occurrences number of occurrences found
+        @type int
+        @param fileOccurrences number of files containing an occurrence
+        @type int
+        """
+        self.__searchThread = None
+        self.__lastFileItem = None
 
-            if found:
-                fileOccurrences += 1
-            self.findProgress.setValue(progress)
+        searchIndex = self.__project.getSearchIndex()
+        if searchIndex is not None:
+            # store the index entries updated by the search
+            searchIndex.save()
 
-        if not files:
+        if self.findProgress.maximum() == 0:
             self.findProgress.setMaximum(1)
             self.findProgress.setValue(1)
 
@@ -882,7 +858,6 @@ class FindFileWidget(QWidget, Ui_FindFileWidget):
             )
         )
 
-        self.findList.setUpdatesEnabled(True)
         self.findList.sortItems(
             self.findList.sortColumn(), self.findList.header().sortIndicatorOrder()
         )
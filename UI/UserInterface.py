@@ -538,6 +538,7 @@ class UserInterface(EricMainWindow):
             )
 
         self.viewmanager.editorSaved.connect(self.project.repopulateItem)
+        self.viewmanager.editorSaved.connect(self.project.updateSearchIndex)
         self.viewmanager.lastEditorClosed.connect(self.__lastEditorClosed)
         self.viewmanager.editorOpened.connect(self.__editorOpened)
         self.viewmanager.changeCaption.connect(self.__setWindowCaption)
@@ -12,15 +12,16 @@ checkers and other python interpreter dependent functions.
 import contextlib
 import importlib
 import io
-import json
 import multiprocessing
 import socket
-import struct
 import sys
 import time
 import traceback
 
-from zlib import adler32
+import BackgroundProtocol
+
+from BackgroundResultCache import BackgroundResultCache
+from BackgroundWorkerPool import BackgroundWorkerPool
 
 
 class BackgroundClient:
@@ -28,7 +29,9 @@ class BackgroundClient:
     Class implementing the main part of the background client.
     """
 
-    def __init__(self, host, port, maxProcs):
+    MaxShadowSources = 32
+
+    def __init__(self, host, port, maxProcs, cacheDirectory="", cacheSize=0):
         """
         Constructor
 
@@ -39,13 +42,36 @@ class BackgroundClient:
         @param maxProcs maximum number of CPUs (processes) to use
             (0 = determined automatically)
         @type int
+        @param cacheDirectory directory to store the batch result cache
+            (defaults to "")
+        @type str (optional)
+        @param cacheSize maximum size of the batch result cache in bytes
+            (0 = cache disabled) (defaults to 0)
+        @type int (optional)
         """
         self.services = {}
         self.batchServices = {}
+        self.batchTasks = {}
+        self.batchCacheKeys = {}
+
+        self.__workerPool = None
+
+        # dictionary with tuple of service name and file name as key and a
+        # tuple of version and list of lines as value
+        self.__shadowSources = {}
+
+        self.__resultCache = (
+            BackgroundResultCache(cacheDirectory, cacheSize)
+            if cacheDirectory and cacheSize > 0
+            else None
+        )
 
         self.connection = socket.create_connection((host, port))
-        ver = b"Python3"
-        self.connection.sendall(ver)
+        self.connection.sendall(BackgroundProtocol.greeting("Python3"))
+        # the service answers with the protocol version and options to be used
+        _version, self.__protocolOptions = BackgroundProtocol.NegotiationStruct.unpack(
+            self.__receive(BackgroundProtocol.NegotiationStruct.size)
+        )
         self.__maxProcs = maxProcs
 
     def __initClientService(self, fn, path, module):
@@ -65,14 +91,45 @@ class BackgroundClient:
         try:
             importedModule = importlib.import_module(module)
             self.services[fn] = importedModule.initService()
-            with contextlib.suppress(AttributeError):
-                self.batchServices["batch_" + fn] = importedModule.initBatchService()
+            if hasattr(importedModule, "initBatchTask"):
+                self.batchTasks["batch_" + fn] = (
+                    path,
+                    module,
+                    importedModule.initBatchTask().__name__,
+                )
+                self.__getWorkerPool().preload(path, module)
+            else:
+                with contextlib.suppress(AttributeError):
+                    self.batchServices["batch_" + fn] = (
+                        importedModule.initBatchService()
+                    )
+            if (
+                self.__resultCache is not None
+                and self.__resultCache.isValid()
+                and hasattr(importedModule, "batchCacheKey")
+            ):
+                self.batchCacheKeys["batch_" + fn] = (
+                    importedModule.batchCacheKey,
+                    BackgroundResultCache.serviceVersion(path),
+                )
             return "ok"
         except ImportError as err:
             return "Import Error: " + str(err)
         except Exception as err:
             return str(err)
 
+    def __getWorkerPool(self):
+        """
+        Private method to get a reference to the worker pool, starting it on
+        first use.
+
+        @return reference to the worker pool
+        @rtype BackgroundWorkerPool
+        """
+        if self.__workerPool is None:
+            self.__workerPool = BackgroundWorkerPool(self.__maxProcs)
+        return self.__workerPool
+
     def __send(self, fx, fn, data):
         """
         Private method to send a job response back to the BackgroundService
@@ -101,11 +158,110 @@ class BackgroundClient:
             # handle sending of objects of unsupported types
             data = str(data)
 
-        packedData = json.dumps([fx, fn, data])
-        packedData = bytes(packedData, "utf-8")
-        header = struct.pack(b"!II", len(packedData), adler32(packedData) & 0xFFFFFFFF)
-        self.connection.sendall(header)
-        self.connection.sendall(packedData)
+        self.connection.sendall(
+            BackgroundProtocol.encodeMessage(
+                b"REPLY ", fx, fn, data, self.__protocolOptions
+            )
+        )
+
+    def __filterCachedBatchJobs(self, fx, argumentsList):
+        """
+        Private method to send cached results of a batch job and to determine
+        the arguments still to be processed.
+
+        @param fx batch service name
+        @type str
+        @param argumentsList list of arguments tuples of the batch job
+        @type list
+        @return tuple containing the list of arguments tuples not found in the
+            cache and the send function to be used for them
+        @rtype tuple of (list, function)
+        """
+        try:
+            cacheKeyFunction, version = self.batchCacheKeys[fx]
+        except KeyError:
+            # results of this service are not cached
+            return argumentsList, self.__send
+
+        self.__resultCache.resetStatistics()
+        pendingKeys = {}
+        remainingArguments = []
+        for arguments in argumentsList:
+            keyData = cacheKeyFunction(arguments)
+            if keyData is None:
+                # this request must not be cached
+                remainingArguments.append(arguments)
+                continue
+
+            key = BackgroundResultCache.makeKey(fx, version, *keyData)
+            result = self.__resultCache.get(key)
+            if result is None:
+                pendingKeys[keyData[0]] = key
+                remainingArguments.append(arguments)
+            else:
+                self.__send(fx, keyData[0], result)
+
+        def sendAndCache(fx, fn, data):
+            """
+            Function to store a batch result in the cache and send it.
+
+            @param fx remote function name to execute
+            @type str
+            @param fn filename for identification
+            @type str
+            @param data return value(s)
+            @type any basic datatype
+            """
+            key = pendingKeys.pop(fn, None)
+            if key is not None and isinstance(data, (list, tuple)):
+                self.__resultCache.put(key, data)
+            self.__send(fx, fn, data)
+
+        return remainingArguments, sendAndCache
+
+    def __resolveSource(self, fx, fn, data):
+        """
+        Private method to resolve a full source or source delta argument of a
+        service request using the shadow copy of the file.
+
+        @param fx service name
+        @type str
+        @param fn filename for identification
+        @type str
+        @param data function arguments with the source argument as the first
+            element
+        @type list
+        @return function arguments with the complete source text or None, if
+            the delta does not match the shadow copy
+        @rtype list or None
+        """
+        sourceArg = data[0]
+        key = (fx, fn)
+        if "source" in sourceArg:
+            source = sourceArg["source"]
+            lines = BackgroundProtocol.splitLines(source)
+        else:
+            try:
+                version, lines = self.__shadowSources[key]
+            except KeyError:
+                return None
+            if version != sourceArg["base"]:
+                return None
+
+            lines[sourceArg["start"] : sourceArg["end"]] = sourceArg["lines"]
+            if BackgroundProtocol.countLines(lines) != sourceArg["count"]:
+                # patched buffer is out of sync with the editor
+                del self.__shadowSources[key]
+                return None
+            source = "".join(lines)
+
+        # move the entry to the end to remove the least recently used first
+        self.__shadowSources.pop(key, None)
+        self.__shadowSources[key] = (sourceArg["version"], lines)
+        while len(self.__shadowSources) > BackgroundClient.MaxShadowSources:
+            del self.__shadowSources[next(iter(self.__shadowSources))]
+
+        return [source] + data[1:]
 
     def __receive(self, length):
         """
@@ -150,10 +306,13 @@ class BackgroundClient:
         @return flag indicating a cancellation
         @rtype bool
         """
-        msg = self.__peek(struct.calcsize(b"!II") + 6)
-        if msg[-6:] == b"CANCEL":
+        msg = self.__peek(BackgroundProtocol.HeaderSize)
+        if (
+            len(msg) == BackgroundProtocol.HeaderSize
+            and msg[BackgroundProtocol.MessageTypeOffset :] == b"CANCEL"
+        ):
             # get rid of the message data
-            self.__receive(struct.calcsize(b"!II") + 6)
+            self.__receive(BackgroundProtocol.HeaderSize)
             return True
         else:
             return False
@@ -161,48 +320,61 @@ class BackgroundClient:
     def run(self):
         """
         Public method implementing the main loop of the client.
-
-        @exception RuntimeError raised if hashes don't match
         """
         try:
             while True:
-                header = self.__receive(struct.calcsize(b"!II"))
+                header = self.__receive(BackgroundProtocol.HeaderSize)
                 # Leave main loop if connection was closed.
                 if not header:
                     break
 
-                length, datahash = struct.unpack(b"!II", header)
-                messageType = self.__receive(6)
+                length, checksum, flags, messageType = BackgroundProtocol.decodeHeader(
+                    header
+                )
                 packedData = self.__receive(length)
 
                 if messageType != b"JOB   ":
                     continue
 
-                if adler32(packedData) & 0xFFFFFFFF != datahash:
-                    raise RuntimeError("Hashes not equal")
-
-                packedData = packedData.decode("utf-8")
-
-                fx, fn, data = json.loads(packedData)
+                fx, fn, data = BackgroundProtocol.decodePayload(
+                    packedData, checksum, flags
+                )
                 if fx == "INIT":
                     ret = self.__initClientService(fn, *data)
                 elif fx.startswith("batch_"):
-                    callback = self.batchServices.get(fx)
-                    if callback:
-                        callback(
-                            data,
-                            self.__send,
-                            fx,
-                            self.__cancelled,
-                            maxProcesses=self.__maxProcs,
-                        )
+                    if fx in self.batchTasks or fx in self.batchServices:
+                        data, send = self.__filterCachedBatchJobs(fx, data)
+                        if data and fx in self.batchTasks:
+                            self.__getWorkerPool().runBatch(
+                                self.batchTasks[fx], data, send, fx, self.__cancelled
+                            )
+                        elif data:
+                            self.batchServices[fx](
+                                data,
+                                send,
+                                fx,
+                                self.__cancelled,
+                                maxProcesses=self.__maxProcs,
+                            )
+                        if fx in self.batchCacheKeys:
+                            self.__resultCache.commit()
+                            self.__send(
+                                "CACHE_STATISTICS",
+                                fx,
+                                [self.__resultCache.hits, self.__resultCache.misses],
+                            )
                         ret = "__DONE__"
                     else:
                         ret = "Unknown batch service."
                 else:
                     callback = self.services.get(fx)
                     if callback:
-                        ret = callback(fn, *data)
+                        if data and isinstance(data[0], dict):
+                            data = self.__resolveSource(fx, fn, data)
+                        if data is None:
+                            ret = BackgroundProtocol.SourceResendReply
+                        else:
+                            ret = callback(fn, *data)
                     else:
                         ret = "Unknown service."
 
@@ -222,6 +394,12 @@ class BackgroundClient:
             self.__send("EXCEPTION", "?", [str(exctype), str(excval), tbinfo])
 
         finally:
+            if self.__resultCache is not None:
+                self.__resultCache.close()
+
+            if self.__workerPool is not None:
+                self.__workerPool.shutdown()
+
             # Give time to process latest response on server side
             time.sleep(0.5)
             with contextlib.suppress(OSError):
@@ -230,7 +408,7 @@ class BackgroundClient:
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 5:
+    if len(sys.argv) not in (5, 7):
         print(
             "Host, port, max. processes and Python library path parameters"
             " are missing. Aborting..."
@@ -239,13 +417,19 @@ if __name__ == "__main__":
 
     multiprocessing.set_start_method("spawn")
 
-    host, port, maxProcs, pyLibraryPath = sys.argv[1:]
+    host, port, maxProcs, pyLibraryPath = sys.argv[1:5]
+    if len(sys.argv) == 7:
+        cacheDirectory, cacheSize = sys.argv[5], int(sys.argv[6])
+    else:
+        cacheDirectory, cacheSize = "", 0
 
     # insert pyLibraryPath into the search path because external stuff might
     # be installed in the eric (virtual) environment
     sys.path.insert(1, pyLibraryPath)
 
-    backgroundClient = BackgroundClient(host, int(port), int(maxProcs))
+    backgroundClient = BackgroundClient(
+        host, int(port), int(maxProcs), cacheDirectory, cacheSize
+    )
     # Start the main loop
     backgroundClient.run()
 
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+# pylint: disable=C0103
+
+"""
+Module implementing the Qt free message framing shared by the background
+service and the background client.
+
+Each message consists of a fixed size binary header followed by the payload.
+The header contains the payload length, an optional checksum, a flags byte and
+the six character message type. The payload is the compact JSON encoding of
+the [function, filename, data] triple, optionally compressed with zlib.
+
+The protocol options are negotiated when the client connects. The client sends
+its language followed by a NUL byte and the highest protocol version it
+supports. The service answers with the protocol version and the option flags
+to be used by both sides.
+"""
+
+import io
+import json
+import struct
+import zlib
+
+ProtocolVersion = 2
+
+# header: payload length, checksum, flags, message type
+HeaderStruct = struct.Struct("!IIB6s")
+HeaderSize = HeaderStruct.size
+MessageTypeOffset = HeaderSize - 6
+
+# reply to the client greeting: protocol version, option flags
+NegotiationStruct = struct.Struct("!BB")
+
+# message flags
+FlagCompressed = 0x01
+FlagChecksum = 0x02
+
+# negotiated options
+OptionCompression = 0x01
+OptionChecksums = 0x02
+
+# payloads smaller than this are sent uncompressed
+CompressionThreshold = 64 * 1024
+CompressionLevel = 1
+
+# reply of the client, if a source delta does not match its shadow copy
+SourceResendReply = "__RESEND_SOURCE__"
+
+
+def greeting(language):
+    """
+    Function to create the greeting sent by the client after connecting.
+
+    @param language language of the client
+    @type str
+    @return greeting data
+    @rtype bytes
+    """
+    return "{0}\0{1}".format(language, ProtocolVersion).encode("utf-8")
+
+
+def parseGreeting(data):
+    """
+    Function to parse the greeting of a client.
+
+    @param data greeting data received from the client
+    @type bytes
+    @return tuple containing the language of the client and the highest
+        protocol version supported by it (1 for clients without negotiation
+        support)
+    @rtype tuple of (str, int)
+    """
+    language, _, version = bytes(data).decode("utf-8").partition("\0")
+    try:
+        return language, int(version)
+    except ValueError:
+        return language, 1
+
+
+def encodeMessage(messageType, fx, fn, data, options=0):
+    """
+    Function to encode a message.
+
+    @param messageType six character message type
+    @type bytes
+    @param fx remote function name
+    @type str
+    @param fn filename for identification
+    @type str
+    @param data function argument(s) or return value(s)
+    @type any basic datatype
+    @param options negotiated protocol options (defaults to 0)
+    @type int (optional)
+    @return encoded message
+    @rtype bytes
+    """
+    payload = json.dumps([fx, fn, data], separators=(",", ":")).encode("utf-8")
+    flags = 0
+
+    if options & OptionCompression and len(payload) >= CompressionThreshold:
+        compressed = zlib.compress(payload, CompressionLevel)
+        if len(compressed) < len(payload):
+            payload = compressed
+            flags |= FlagCompressed
+
+    if options & OptionChecksums:
+        checksum = zlib.adler32(payload) & 0xFFFFFFFF
+        flags |= FlagChecksum
+    else:
+        checksum = 0
+
+    return HeaderStruct.pack(len(payload), checksum, flags, messageType) + payload
+
+
+def decodeHeader(header):
+    """
+    Function to decode a message header.
+
+    @param header message header
+    @type bytes
+    @return tuple containing the payload length, the checksum, the message
+        flags and the message type
+    @rtype tuple of (int, int, int, bytes)
+    """
+    return HeaderStruct.unpack(bytes(header))
+
+
+def decodePayload(payload, checksum, flags):
+    """
+    Function to decode the payload of a message.
+
+    @param payload message payload
+    @type bytes
+    @param checksum checksum as given in the message header
+    @type int
+    @param flags message flags as given in the message header
+    @type int
+    @return tuple containing the function name, the filename and the data
+    @rtype tuple of (str, str, any basic datatype)
+    @exception RuntimeError raised if the checksum does not match
+    """
+    if flags & FlagChecksum and zlib.adler32(payload) & 0xFFFFFFFF != checksum:
+        raise RuntimeError("Hashes not equal")
+
+    if flags & FlagCompressed:
+        payload = zlib.decompress(payload)
+
+    fx, fn, data = json.loads(payload)
+    return fx, fn, data
+
+
+def fullSource(version, source):
+    """
+    Function to create the source argument of a request transferring the
+    complete source, which is kept as the shadow copy by the client.
+
+    @param version version number of the source
+    @type int
+    @param source complete source text
+    @type str
+    @return source argument
+    @rtype dict
+    """
+    return {"version": version, "source": source}
+
+
+def sourceDelta(baseVersion, version, startLine, endLine, lines, lineCount):
+    """
+    Function to create the source argument of a request transferring a line
+    range replacing a range of the client's shadow copy.
+
+    @param baseVersion version of the shadow copy the delta applies to
+    @type int
+    @param version version number of the patched source
+    @type int
+    @param startLine index of the first line to be replaced
+    @type int
+    @param endLine index of the line after the last line to be replaced
+    @type int
+    @param lines replacement lines including their line ends
+    @type list of str
+    @param lineCount number of lines of the patched source as determined by
+        the editor
+    @type int
+    @return source argument
+    @rtype dict
+    """
+    return {
+        "base": baseVersion,
+        "version": version,
+        "start": startLine,
+        "end": endLine,
+        "lines": lines,
+        "count": lineCount,
+    }
+
+
+def splitLines(source):
+    """
+    Function to split a source text into lines keeping the line ends.
+
+    Only '\\n', '\\r' and '\\r\\n' are treated as line ends in order to get
+    the same line numbering as the editor.
+
+    @param source source text
+    @type str
+    @return list of lines
+    @rtype list of str
+    """
+    return io.StringIO(source, newline="").readlines()
+
+
+def countLines(lines):
+    """
+    Function to determine the number of lines as counted by the editor.
+
+    @param lines list of lines as returned by splitLines()
+    @type list of str
+    @return number of lines including an empty last line
+    @rtype int
+    """
+    if not lines or lines[-1].endswith(("\n", "\r")):
+        return len(lines) + 1
+    return len(lines)
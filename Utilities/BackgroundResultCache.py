@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+# pylint: disable=C0103
+
+"""
+Module implementing a Qt free persistent result cache for the batch services
+of the background client.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+
+
+class BackgroundResultCache:
+    """
+    Class implementing a persistent, size bounded cache for batch service
+    results.
+
+    Results are keyed by a hash of the file name, the file content, the
+    version of the service and the normalized service arguments. The cache is
+    stored in a SQLite database. If the total size of the stored results
+    exceeds the configured maximum, the least recently used entries are
+    evicted.
+    """
+
+    DatabaseName = "background_results.db"
+    EvictionRatio = 0.8  # shrink the cache to 80% of the maximum size
+
+    def __init__(self, cacheDirectory, maxSize):
+        """
+        Constructor
+
+        @param cacheDirectory path of the directory to store the cache database
+        @type str
+        @param maxSize maximum size of the cached data in bytes
+        @type int
+        """
+        self.__maxSize = maxSize
+        self.__connection = None
+
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            os.makedirs(cacheDirectory, exist_ok=True)
+            self.__connection = sqlite3.connect(
+                os.path.join(cacheDirectory, BackgroundResultCache.DatabaseName),
+                timeout=5.0,
+            )
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " data TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " accessed REAL NOT NULL)"
+            )
+            self.__connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)"
+            )
+            self.__connection.commit()
+        except (OSError, sqlite3.Error):
+            self.__connection = None
+
+    def isValid(self):
+        """
+        Public method to check, if the cache is usable.
+
+        @return flag indicating a usable cache
+        @rtype bool
+        """
+        return self.__connection is not None
+
+    def resetStatistics(self):
+        """
+        Public method to reset the hit and miss counters.
+        """
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def serviceVersion(cls, path):
+        """
+        Class method to determine a version string for a service.
+
+        The version is derived from the size and modification time of all
+        Python files of the service package and the interpreter version. This
+        invalidates cached results automatically, whenever the checker code or
+        the interpreter gets updated.
+
+        @param path path of the service package
+        @type str
+        @return version string of the service
+        @rtype str
+        """
+        versionHash = hashlib.sha1(sys.version.encode("utf-8"))  # secok
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    with contextlib.suppress(OSError):
+                        fileStat = os.stat(os.path.join(root, name))
+                        versionHash.update(
+                            "{0}:{1}:{2}".format(
+                                os.path.relpath(os.path.join(root, name), path),
+                                fileStat.st_size,
+                                fileStat.st_mtime_ns,
+                            ).encode("utf-8")
+                        )
+        return versionHash.hexdigest()
+
+    @classmethod
+    def makeKey(cls, service, version, filename, source, args):
+        """
+        Class method to generate the cache key for a service request.
+
+        @param service name of the service
+        @type str
+        @param version version string of the service
+        @type str
+        @param filename name of the checked file
+        @type str
+        @param source source code of the checked file
+        @type str or list of str
+        @param args normalized arguments of the service request
+        @type list or tuple
+        @return cache key
+        @rtype str
+        """
+        if isinstance(source, (list, tuple)):
+            source = "".join(source)
+        contentHash = hashlib.sha256(source.encode("utf-8", "replace")).hexdigest()
+        argsHash = hashlib.sha256(
+            json.dumps(args, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return hashlib.sha256(
+            "\0".join([service, version, filename, contentHash, argsHash]).encode(
+                "utf-8"
+            )
+        ).hexdigest()
+
+    def get(self, key):
+        """
+        Public method to get a cached result.
+
+        @param key cache key as generated by makeKey()
+        @type str
+        @return cached result or None, if there is no cached result
+        @rtype any basic datatype
+        """
+        if self.__connection is None:
+            return None
+
+        try:
+            row = self.__connection.execute(
+                "SELECT data FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.__connection.execute(
+                "UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            self.hits += 1
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError):
+            self.misses += 1
+            return None
+
+    def put(self, key, data):
+        """
+        Public method to store a result in the cache.
+
+        @param key cache key as generated by makeKey()
+        @type str
+        @param data result to be cached
+        @type any basic datatype
+        """
+        if self.__connection is None:
+            return
+
+        try:
+            packedData = json.dumps(data)
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO results (key, data, size, accessed)"
+                " VALUES (?, ?, ?, ?)",
+                (key, packedData, len(packedData), time.time()),
+            )
+        except (sqlite3.Error, TypeError, ValueError):
+            pass
+
+    def commit(self):
+        """
+        Public method to write pending changes and to evict the least recently
+        used entries, if the cache exceeds its maximum size.
+        """
+        if self.__connection is None:
+            return
+
+        try:
+            (totalSize,) = self.__connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+            if totalSize > self.__maxSize:
+                targetSize = int(self.__maxSize * BackgroundResultCache.EvictionRatio)
+                evictKeys = []
+                for key, size in self.__connection.execute(
+                    "SELECT key, size FROM results ORDER BY accessed"
+                ):
+                    if totalSize <= targetSize:
+                        break
+                    evictKeys.append((key,))
+                    totalSize -= size
+                self.__connection.executemany(
+                    "DELETE FROM results WHERE key = ?", evictKeys
+                )
+            self.__connection.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        """
+        Public method to close the cache.
+        """
+        if self.__connection is not None:
+            self.commit()
+            with contextlib.suppress(sqlite3.Error):
+                self.__connection.close()
+            self.__connection = None
@@ -9,21 +9,19 @@ Python interpreter dependent functions.
 """
 
 import contextlib
-import json
 import os
-import struct
 import sys
 import time
-import zlib
 
 from PyQt6.QtCore import QProcess, QThread, QTimer, pyqtSignal
 from PyQt6.QtNetwork import QHostAddress, QTcpServer
 from PyQt6.QtWidgets import QApplication
 
-from eric7 import Preferences
+from eric7 import EricUtilities, Preferences
 from eric7.EricWidgets import EricMessageBox
 from eric7.EricWidgets.EricApplication import ericApp
 from eric7.SystemUtilities import FileSystemUtilities, PythonUtilities
+from eric7.Utilities import BackgroundProtocol
 
 
 class BackgroundService(QTcpServer):
@@ -35,10 +33,17 @@ class BackgroundService(QTcpServer):
         (str, str, str, str)
     @signal batchJobDone(function, language) emitted to indicate the end of
         a batch job (str, str)
+    @signal batchCacheStatistics(function, language, hits, misses) emitted to
+        report the result cache statistics of a batch job (str, str, int, int)
+    @signal sourceRequested(function, language, filename) emitted to indicate,
+        that a source delta did not match the shadow copy of the client and
+        the complete source has to be sent (str, str, str)
     """
 
     serviceNotAvailable = pyqtSignal(str, str, str, str)
     batchJobDone = pyqtSignal(str, str)
+    batchCacheStatistics = pyqtSignal(str, str, int, int)
+    sourceRequested = pyqtSignal(str, str, str)
 
     def __init__(self, parent=None):
         """
@@ -51,9 +56,12 @@ class BackgroundService(QTcpServer):
 
         self.processes = {}
         self.connections = {}
+        self.__protocolOptions = {}
         self.isWorking = None
         self.runningJob = [None, None, None, None]
         self.__queue = []
+        self.__batchRunning = False
+        self.__batchDoneEmitted = False
         self.services = {}
 
         networkInterface = Preferences.getDebugger("NetworkInterface")
@@ -126,6 +134,8 @@ class BackgroundService(QTcpServer):
             str(port),
             str(Preferences.getUI("BackgroundServiceProcesses")),
             PythonUtilities.getPythonLibraryDirectory(),
+            os.path.join(EricUtilities.getConfigDir(), "background_cache"),
+            str(Preferences.getUI("BackgroundServiceCacheSize") * 1024 * 1024),
         ]
         proc.start(interpreter, args)
         if not proc.waitForStarted(10000):
@@ -172,14 +182,28 @@ class BackgroundService(QTcpServer):
             self.isWorking = None
             self.__processQueue()
         else:
-            packedData = json.dumps([fx, fn, data])
-            packedData = bytes(packedData, "utf-8")
-            header = struct.pack(
-                b"!II", len(packedData), zlib.adler32(packedData) & 0xFFFFFFFF
+            # a batch job keeps the client busy until it reports its end
+            self.__batchRunning = fx.startswith("batch_")
+            self.__batchDoneEmitted = False
+
+            connection.write(
+                BackgroundProtocol.encodeMessage(
+                    b"JOB   ", fx, fn, data, self.__protocolOptions.get(lang, 0)
+                )
             )
-            connection.write(header)
-            connection.write(b"JOB   ")  # 6 character message type
-            connection.write(packedData)
+
+    def __batchJobFinished(self, fx, lang):
+        """
+        Private method to signal the end of a batch job exactly once.
+
+        @param fx function name of the service
+        @type str
+        @param lang language of the service
+        @type str
+        """
+        if not self.__batchDoneEmitted:
+            self.__batchDoneEmitted = True
+            self.batchJobDone.emit(fx, lang)
 
     def __receive(self, lang):
         """
@@ -187,9 +211,8 @@ class BackgroundService(QTcpServer):
 
         @param lang language of the incoming connection
         @type str
-        @exception RuntimeError raised if hashes don't match
         """
-        headerSize = struct.calcsize(b"!II")
+        headerSize = BackgroundProtocol.HeaderSize
 
         data = ""
         fx = ""
@@ -202,7 +225,9 @@ class BackgroundService(QTcpServer):
                 if time.monotonic() - now > 2.0:  # 2 seconds timeout
                     return
             header = connection.read(headerSize)
-            length, datahash = struct.unpack(b"!II", header)
+            length, checksum, flags, _messageType = BackgroundProtocol.decodeHeader(
+                header
+            )
 
             packedData = b""
             now = time.monotonic()
@@ -217,11 +242,9 @@ class BackgroundService(QTcpServer):
                     if time.monotonic() - now > 2.0:  # 2 seconds timeout
                         break
 
-            if zlib.adler32(packedData) & 0xFFFFFFFF != datahash:
-                raise RuntimeError("Hashes not equal")
-            packedData = packedData.decode("utf-8")
-            # "check" if is's a tuple of 3 values
-            fx, fn, data = json.loads(packedData)
+            fx, fn, data = BackgroundProtocol.decodePayload(
+                bytes(packedData), checksum, flags
+            )
 
             if fx == "INIT":
                 if data != "ok":
@@ -276,17 +299,29 @@ class BackgroundService(QTcpServer):
                                 " service."
                             ),
                         )
+                self.__batchRunning = False
                 if res != EricMessageBox.No:
                     self.isWorking = None
                     self.restartService(lang, forceKill=True)
                     return
+            elif fx == "CACHE_STATISTICS":
+                self.batchCacheStatistics.emit(
+                    fn.replace("batch_", ""), lang, data[0], data[1]
+                )
+            elif data == BackgroundProtocol.SourceResendReply:
+                self.sourceRequested.emit(fx, lang, fn)
             elif data == "Unknown service.":
                 callback = self.services.get((fx, lang))
                 if callback:
                     callback[3](fx, lang, fn, data)
             elif fx.startswith("batch_"):
                 mfx = fx.replace("batch_", "")
-                if data != "__DONE__":
+                if data == "__DONE__":
+                    # the worker pool of the client stays alive for the
+                    # next batch job
+                    self.__batchRunning = False
+                    self.__batchJobFinished(mfx, lang)
+                elif not self.__cancelled:
                     callback = self.services.get((mfx, lang))
                     if callback:
                         if isinstance(data, (list, tuple)):
@@ -294,24 +329,21 @@ class BackgroundService(QTcpServer):
                         elif isinstance(data, str):
                             callback[3](mfx, lang, fn, data)
                     if data == "Unknown batch service.":
-                        self.batchJobDone.emit(mfx, lang)
-                        self.__cancelled = True
-                else:
-                    self.batchJobDone.emit(mfx, lang)
-                    self.restartService(lang, forceKill=True)
+                        self.__batchRunning = False
+                        self.__batchJobFinished(mfx, lang)
             else:
                 callback = self.services.get((fx, lang))
                 if callback:
                     callback[2](fn, *data)
 
         if self.__cancelled and data != "__DONE__" and fx.startswith("batch_"):
-            # If it is a canceled batch job perform the batch done logic.
-            fx = fx.replace("batch_", "")
-            self.batchJobDone.emit(fx, lang)
-            self.restartService(lang, forceKill=True)
+            # If it is a canceled batch job perform the batch done logic. Late
+            # results are dropped until the client reports the end of the job.
+            self.__batchJobFinished(fx.replace("batch_", ""), lang)
 
-        self.isWorking = None
-        self.__processQueue()
+        if not self.__batchRunning:
+            self.isWorking = None
+            self.__processQueue()
 
     def preferencesOrProjectChanged(self):
         """
@@ -389,6 +421,24 @@ class BackgroundService(QTcpServer):
                 self.__queue.append(args)
         self.__processQueue()
 
+    def isRequestPending(self, fx, lang, fn):
+        """
+        Public method to check, if a service request is waiting in the queue.
+
+        A waiting request gets updated by a new request with the same function
+        name, language and filename (see enqueueRequest()).
+
+        @param fx function name of the service
+        @type str
+        @param lang language to connect to
+        @type str
+        @param fn filename for identification
+        @type str
+        @return flag indicating a waiting request
+        @rtype bool
+        """
+        return any(pendingArg[:3] == [fx, lang, fn] for pendingArg in self.__queue)
+
     def requestCancel(self, fx, lang):
         """
         Public method to ask a batch job to terminate.
@@ -409,9 +459,7 @@ class BackgroundService(QTcpServer):
         if connection is None:
             return
         else:
-            header = struct.pack(b"!II", 0, 0)
-            connection.write(header)
-            connection.write(b"CANCEL")  # 6 character message type
+            connection.write(BackgroundProtocol.HeaderStruct.pack(0, 0, 0, b"CANCEL"))
 
         self.__cancelled = True
 
@@ -471,13 +519,30 @@ class BackgroundService(QTcpServer):
         connection = self.nextPendingConnection()
         if not connection.waitForReadyRead(1000):
             return
-        lang = connection.read(64)
-        lang = lang.decode("utf-8")
+        lang, clientVersion = BackgroundProtocol.parseGreeting(connection.read(64))
+        if clientVersion < BackgroundProtocol.ProtocolVersion:
+            # client does not support the message framing of this service
+            connection.close()
+            return
+
+        options = 0
+        if Preferences.getUI("BackgroundServiceCompression"):
+            options |= BackgroundProtocol.OptionCompression
+        if Preferences.getUI("BackgroundServiceChecksums"):
+            options |= BackgroundProtocol.OptionChecksums
+        connection.write(
+            BackgroundProtocol.NegotiationStruct.pack(
+                BackgroundProtocol.ProtocolVersion, options
+            )
+        )
+        self.__protocolOptions[lang] = options
+
         # Avoid hanging of eric on shutdown
         if self.connections.get(lang):
             self.connections[lang].close()
         if self.isWorking == lang:
             self.isWorking = None
+            self.__batchRunning = False
         self.connections[lang] = connection
         connection.readyRead.connect(lambda: self.__receive(lang))
         connection.disconnected.connect(lambda: self.on_disconnectSocket(lang))
@@ -518,6 +583,7 @@ class BackgroundService(QTcpServer):
                     ),
                 )
             self.isWorking = None
+            self.__batchRunning = False
 
             res = EricMessageBox.yesNo(
                 None,
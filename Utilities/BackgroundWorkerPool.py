@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+# pylint: disable=C0103
+
+"""
+Module implementing a Qt free, long lived worker pool shared by the batch
+services of the background client.
+"""
+
+import contextlib
+import importlib
+import multiprocessing
+import queue
+import sys
+
+
+class BackgroundWorkerPool:
+    """
+    Class implementing a pool of pre-started worker processes for the batch
+    services of the background client.
+
+    The worker processes are started once and reused by all batch jobs. Tasks
+    are submitted in chunks of several files per message. A cancelled job is
+    abandoned by advancing the job generation, which makes the workers skip
+    the remaining tasks of that job without tearing down the pool.
+    """
+
+    MaxChunkSize = 16
+    ChunksPerProcess = 4
+
+    def __init__(self, maxProcesses=0):
+        """
+        Constructor
+
+        @param maxProcesses number of processes to be used (0 = number of
+            CPUs minus one) (defaults to 0)
+        @type int (optional)
+        """
+        if maxProcesses == 0:
+            # determine based on CPU count
+            try:
+                self.__numberOfProcesses = max(1, multiprocessing.cpu_count() - 1)
+            except NotImplementedError:
+                self.__numberOfProcesses = 1
+        else:
+            self.__numberOfProcesses = maxProcesses
+
+        self.__taskQueue = multiprocessing.Queue()
+        self.__doneQueue = multiprocessing.Queue()
+        self.__activeJob = multiprocessing.Value("l", 0)
+        self.__jobId = 0
+
+        self.__workers = [
+            multiprocessing.Process(
+                target=poolWorker,
+                args=(self.__taskQueue, self.__doneQueue, self.__activeJob),
+                daemon=True,
+            )
+            for _ in range(self.__numberOfProcesses)
+        ]
+        for worker in self.__workers:
+            worker.start()
+
+    def numberOfProcesses(self):
+        """
+        Public method to get the number of worker processes.
+
+        @return number of worker processes
+        @rtype int
+        """
+        return self.__numberOfProcesses
+
+    def preload(self, path, module):
+        """
+        Public method to ask the workers to import a service module in advance.
+
+        @param path path of the service module
+        @type str
+        @param module name of the service module
+        @type str
+        """
+        for _ in range(self.__numberOfProcesses):
+            self.__taskQueue.put(("PRELOAD", path, module))
+
+    def __chunkSize(self, tasksCount):
+        """
+        Private method to determine the number of tasks per message.
+
+        @param tasksCount total number of tasks of the job
+        @type int
+        @return number of tasks per message
+        @rtype int
+        """
+        return max(
+            1,
+            min(
+                BackgroundWorkerPool.MaxChunkSize,
+                tasksCount
+                // (self.__numberOfProcesses * BackgroundWorkerPool.ChunksPerProcess),
+            ),
+        )
+
+    def runBatch(self, taskFunction, argumentsList, send, fx, cancelled):
+        """
+        Public method to execute a batch job in the worker pool.
+
+        @param taskFunction tuple containing the path and name of the module and
+            the name of the function to be executed for each arguments tuple
+            (the function must return a tuple of file name and result)
+        @type tuple of (str, str, str)
+        @param argumentsList list of arguments tuples to be processed
+        @type list
+        @param send reference to send function
+        @type function
+        @param fx registered service name
+        @type str
+        @param cancelled reference to function checking for a cancellation
+        @type function
+        """
+        self.__jobId += 1
+        jobId = self.__jobId
+        with self.__activeJob.get_lock():
+            self.__activeJob.value = jobId
+
+        tasksCount = len(argumentsList)
+        chunkSize = self.__chunkSize(tasksCount)
+        for start in range(0, tasksCount, chunkSize):
+            self.__taskQueue.put(
+                (jobId, *taskFunction, argumentsList[start : start + chunkSize])
+            )
+
+        # Get and send results
+        resultsCount = 0
+        while resultsCount < tasksCount:
+            try:
+                resultJobId, filename, result = self.__doneQueue.get(timeout=0.5)
+            except queue.Empty:
+                # ignore empty queue, just check for a cancellation
+                if cancelled():
+                    break
+                continue
+
+            if resultJobId != jobId:
+                # stale result of an earlier, cancelled job
+                continue
+
+            send(fx, filename, result)
+            resultsCount += 1
+
+            if cancelled():
+                break
+
+        if resultsCount < tasksCount:
+            # job was cancelled; let the workers skip its remaining tasks
+            with self.__activeJob.get_lock():
+                self.__activeJob.value = 0
+
+    def shutdown(self):
+        """
+        Public method to stop all worker processes.
+        """
+        with self.__activeJob.get_lock():
+            self.__activeJob.value = 0
+
+        for _ in self.__workers:
+            self.__taskQueue.put("STOP")
+
+        for worker in self.__workers:
+            worker.join(2.0)
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+            worker.close()
+
+        self.__taskQueue.close()
+        self.__doneQueue.close()
+        self.__workers = []
+
+
+def poolWorker(inputQueue, outputQueue, activeJob):
+    """
+    Module function acting as a long lived parallel worker of the pool.
+
+    @param inputQueue input queue
+    @type multiprocessing.Queue
+    @param outputQueue output queue
+    @type multiprocessing.Queue
+    @param activeJob shared value containing the ID of the active job
+    @type multiprocessing.Value
+    """
+    functions = {}
+
+    for task in iter(inputQueue.get, "STOP"):
+        if task[0] == "PRELOAD":
+            with contextlib.suppress(Exception):
+                __importServiceModule(task[1], task[2])
+            continue
+
+        jobId, path, module, functionName, argumentsList = task
+        try:
+            function, error = functions[(module, functionName)]
+        except KeyError:
+            try:
+                function = getattr(__importServiceModule(path, module), functionName)
+                error = ""
+            except Exception as err:
+                function = None
+                error = str(err)
+            functions[(module, functionName)] = (function, error)
+
+        for arguments in argumentsList:
+            if activeJob.value != jobId:
+                # the job was cancelled, skip its remaining tasks
+                break
+
+            if function is None:
+                result = arguments[0], error
+            else:
+                try:
+                    result = function(arguments)
+                except Exception as err:
+                    result = arguments[0], str(err)
+            outputQueue.put((jobId, *result))
+
+
+def __importServiceModule(path, module):
+    """
+    Private module function to import a service module.
+
+    @param path path of the service module
+    @type str
+    @param module name of the service module
+    @type str
+    @return reference to the imported module
+    @rtype module
+    """
+    if path not in sys.path:
+        sys.path.insert(1, path)
+    return importlib.import_module(module)
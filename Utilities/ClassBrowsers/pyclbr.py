@@ -23,11 +23,15 @@ from eric7 import Utilities
 from eric7.EricWidgets.EricApplication import ericApp
 from eric7.SystemUtilities import FileSystemUtilities
 from eric7.Utilities import ClassBrowsers
+from eric7.Utilities.ParseResultCache import ParseResultCache, getParseResultCache
 
 from . import ClbrBaseClasses
 
 TABWIDTH = 4
 
+_CacheNamespace = "pyclbr"
+_CacheVersion = ParseResultCache.codeVersion(__file__, ClbrBaseClasses.__file__)
+
 SUPPORTED_TYPES = [ClassBrowsers.PY_SOURCE, ClassBrowsers.PTL_SOURCE]
 
 _getnext = QRegularExpression(
@@ -445,17 +449,35 @@ def readmodule_ex(module, searchPath=None, isTypeFile=False):
         # not Python source, can't do anything with this module
         return {}
 
+    if FileSystemUtilities.isRemoteFileName(file):
+        try:
+            src = fsInterface.readEncodedFile(file)[0]
+        except (OSError, UnicodeError):
+            # can't do anything with this module
+            return {}
+
+        return scan(src, file, module)
+
+    # results of local files are cached as a tuple of module name and
+    # dictionary
+    resultCache = getParseResultCache()
+    cached = resultCache.get(_CacheNamespace, _CacheVersion, file)
+    if cached is not None and cached[0] == module:
+        return cached[1]
+
     try:
-        src = (
-            fsInterface.readEncodedFile(file)[0]
-            if FileSystemUtilities.isRemoteFileName(file)
-            else Utilities.readEncodedFile(file)[0]
-        )
+        src = Utilities.readEncodedFile(file)[0]
     except (OSError, UnicodeError):
         # can't do anything with this module
         return {}
 
-    return scan(src, file, module)
+    cached = resultCache.get(_CacheNamespace, _CacheVersion, file, src)
+    if cached is not None and cached[0] == module:
+        return cached[1]
+
+    dictionary = scan(src, file, module)
+    resultCache.put(_CacheNamespace, _CacheVersion, file, src, (module, dictionary))
+    return dictionary
 
 
 def scan(src, file, module):
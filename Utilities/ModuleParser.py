@@ -14,6 +14,7 @@ Parse a Python module file.
 </ul>
 """
 
+import collections
 import contextlib
 import importlib.machinery
 import keyword
@@ -28,6 +29,7 @@ from PyQt6.QtCore import QRegularExpression
 from eric7 import Utilities
 from eric7.EricWidgets.EricApplication import ericApp
 from eric7.SystemUtilities import FileSystemUtilities
+from eric7.Utilities.ParseResultCache import ParseResultCache, getParseResultCache
 
 __all__ = [
     "Attribute",
@@ -386,7 +388,11 @@ _hashsub = re.compile(r"""^([ \t]*)#[ \t]?""", re.MULTILINE).sub
 
 _commentsub = re.compile(r"""#[^\n]*\n|#[^\n]*$""").sub
 
-_modules = {}  # cache of modules we've seen
+_modules = collections.OrderedDict()  # cache of modules we've seen
+_MaxCachedModules = 1000
+
+_CacheNamespace = "ModuleParser"
+_CacheVersion = ParseResultCache.codeVersion(__file__)
 
 
 class VisibilityBase:
@@ -470,13 +476,40 @@ class Module:
         self.from_imports = {}
         self.package = ".".join(name.split(".")[:-1])
         self.type = moduleType
-        if moduleType in [PY_SOURCE, PTL_SOURCE]:
+        self.__setScanner()
+
+    def __setScanner(self):
+        """
+        Private method to set the scanner function for the module type.
+        """
+        if self.type in [PY_SOURCE, PTL_SOURCE]:
             self._getnext = _py_getnext
-        elif moduleType == RB_SOURCE:
+        elif self.type == RB_SOURCE:
             self._getnext = _rb_getnext
         else:
             self._getnext = None
 
+    def __getstate__(self):
+        """
+        Special method to get the state of the object for pickling.
+
+        @return state of the object without the scanner function
+        @rtype dict
+        """
+        state = self.__dict__.copy()
+        del state["_getnext"]
+        return state
+
+    def __setstate__(self, state):
+        """
+        Special method to restore the state of an unpickled object.
+
+        @param state state of the object
+        @type dict
+        """
+        self.__dict__.update(state)
+        self.__setScanner()
+
     def addClass(self, name, _class):
         """
         Public method to add information about a class.
@@ -1726,13 +1759,19 @@ def readModule(
 
     if caching and modname in _modules:
         # we've seen this module before...
-        return _modules[modname]
+        mod = _modules[modname]
+        if mod.file is not None and not FileSystemUtilities.isRemoteFileName(mod.file):
+            # check, if the module file was changed since
+            mod = _getCachedModule(modname, mod.file, mod.type)
+        if mod is not None:
+            _cacheModule(modname, mod)
+            return mod
 
     if not ignoreBuiltinModules and module in sys.builtin_module_names:
         # this is a built-in module
         mod = Module(modname, None, None)
         if caching:
-            _modules[modname] = mod
+            _cacheModule(modname, mod)
         return mod
 
     if isRemoteFileName:
@@ -1775,25 +1814,85 @@ def readModule(
 
     if moduleType not in SUPPORTED_TYPES:
         # not supported source, can't do anything with this module
-        _modules[modname] = Module(modname, None, None)
-        return _modules[modname]
-
-    mod = Module(modname, file, moduleType)
-    with contextlib.suppress(UnicodeError, OSError):
-        src = (
-            ericApp()
-            .getObject("EricServer")
-            .getServiceInterface("FileSystem")
-            .readEncodedFile(file)[0]
-            if isRemoteFileName
-            else Utilities.readEncodedFile(file)[0]
-        )
-        mod.scan(src)
+        mod = Module(modname, None, None)
+        _cacheModule(modname, mod)
+        return mod
+
+    useResultCache = caching and not isRemoteFileName
+    mod = _getCachedModule(modname, file, moduleType) if useResultCache else None
+    if mod is None:
+        mod = Module(modname, file, moduleType)
+        with contextlib.suppress(UnicodeError, OSError):
+            src = (
+                ericApp()
+                .getObject("EricServer")
+                .getServiceInterface("FileSystem")
+                .readEncodedFile(file)[0]
+                if isRemoteFileName
+                else Utilities.readEncodedFile(file)[0]
+            )
+            cachedMod = (
+                _getCachedModule(modname, file, moduleType, src)
+                if useResultCache
+                else None
+            )
+            if cachedMod is None:
+                mod.scan(src)
+                if useResultCache:
+                    getParseResultCache().put(
+                        _CacheNamespace, _CacheVersion, file, src, mod
+                    )
+            else:
+                mod = cachedMod
     if caching:
-        _modules[modname] = mod
+        _cacheModule(modname, mod)
     return mod
 
 
+def _getCachedModule(modname, file, moduleType=None, source=None):
+    """
+    Protected function to get a valid parse result of a module file from the
+    parse result cache.
+
+    @param modname name of the module
+    @type str
+    @param file name of the module file
+    @type str
+    @param moduleType type of the module (None to accept any type) (defaults
+        to None)
+    @type int (optional)
+    @param source source text of the module file used to revalidate a cached
+        result of a touched file (defaults to None)
+    @type str (optional)
+    @return parse result of the module or None
+    @rtype Module or None
+    """
+    mod = getParseResultCache().get(_CacheNamespace, _CacheVersion, file, source)
+    if (
+        isinstance(mod, Module)
+        and mod.name == modname
+        and (moduleType is None or mod.type == moduleType)
+    ):
+        return mod
+
+    return None
+
+
+def _cacheModule(modname, mod):
+    """
+    Protected function to add a module to the cache of modules we've seen.
+
+    @param modname name of the module
+    @type str
+    @param mod reference to the parsed module
+    @type Module
+    """
+    _modules[modname] = mod
+    _modules.move_to_end(modname)
+    while len(_modules) > _MaxCachedModules:
+        _modules.popitem(last=False)
+
+
 def _indent(ws):
     """
     Protected function to determine the indent width of a whitespace string.
@@ -0,0 +1,430 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+
+"""
+Module implementing a persistent cache for the results of the source file
+parsers (module parser and class browsers).
+"""
+
+import atexit
+import collections
+import contextlib
+import hashlib
+import os
+import pickle  # secok
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+
+
+class ParseResultCache:
+    """
+    Class implementing a persistent cache for parse results.
+
+    Results are stored per parser namespace and file name. They are validated
+    by the modification time and size of the file. If these don't match, the
+    hash of the source text is used to revalidate an entry (e.g. after a file
+    was touched by a VCS operation without changing it).
+
+    The most recently used results are kept in memory. All results are stored
+    in a SQLite database as compressed pickles in order to be reused across
+    sessions. If the database exceeds its maximum size, the least recently used
+    entries are evicted.
+    """
+
+    DatabaseName = "parse_results.db"
+    MaxMemoryEntries = 500
+    MaxDiskSize = 64 * 1024 * 1024  # 64 MB
+    EvictionRatio = 0.8  # shrink the cache to 80% of the maximum size
+    FlushThreshold = 100  # number of pending changes triggering a write
+
+    def __init__(
+        self,
+        cacheDirectory="",
+        maxMemoryEntries=MaxMemoryEntries,
+        maxDiskSize=MaxDiskSize,
+    ):
+        """
+        Constructor
+
+        @param cacheDirectory path of the directory to store the cache database
+            (empty for a memory only cache) (defaults to "")
+        @type str (optional)
+        @param maxMemoryEntries maximum number of results kept in memory
+            (defaults to MaxMemoryEntries)
+        @type int (optional)
+        @param maxDiskSize maximum size of the stored results in bytes
+            (defaults to MaxDiskSize)
+        @type int (optional)
+        """
+        self.__maxMemoryEntries = maxMemoryEntries
+        self.__maxDiskSize = maxDiskSize
+
+        self.__lock = threading.RLock()
+        # ordered dictionary with a tuple of namespace and file name as key and
+        # a tuple of version, modification time, size, source hash and result
+        # as value; the least recently used entry comes first
+        self.__entries = collections.OrderedDict()
+        # dictionary with the changed keys as key and the packed entry or None
+        # for a removed entry as value
+        self.__pending = {}
+
+        self.hits = 0
+        self.misses = 0
+
+        self.__connection = None
+        if cacheDirectory:
+            try:
+                os.makedirs(cacheDirectory, exist_ok=True)
+                self.__connection = sqlite3.connect(
+                    os.path.join(cacheDirectory, ParseResultCache.DatabaseName),
+                    timeout=5.0,
+                    check_same_thread=False,
+                )
+                self.__connection.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    " namespace TEXT NOT NULL,"
+                    " filename TEXT NOT NULL,"
+                    " version TEXT NOT NULL,"
+                    " mtime INTEGER NOT NULL,"
+                    " size INTEGER NOT NULL,"
+                    " hash TEXT NOT NULL,"
+                    " data BLOB NOT NULL,"
+                    " accessed REAL NOT NULL,"
+                    " PRIMARY KEY (namespace, filename))"
+                )
+                self.__connection.execute(
+                    "CREATE INDEX IF NOT EXISTS results_accessed"
+                    " ON results (accessed)"
+                )
+                self.__connection.commit()
+            except (OSError, sqlite3.Error):
+                self.__connection = None
+
+    @classmethod
+    def codeVersion(cls, *filenames):
+        """
+        Class method to determine a version string for a parser.
+
+        The version is derived from the size and modification time of the
+        given parser source files and the interpreter version. This invalidates
+        the cached results automatically, whenever the parser gets updated.
+
+        @param filenames names of the source files of the parser
+        @type str
+        @return version string of the parser
+        @rtype str
+        """
+        versionHash = hashlib.sha1(sys.version.encode("utf-8"))  # secok
+        for filename in filenames:
+            with contextlib.suppress(OSError):
+                fileStat = os.stat(filename)
+                versionHash.update(
+                    "{0}:{1}:{2}".format(
+                        os.path.basename(filename),
+                        fileStat.st_size,
+                        fileStat.st_mtime_ns,
+                    ).encode("utf-8")
+                )
+        return versionHash.hexdigest()
+
+    @classmethod
+    def sourceHash(cls, source):
+        """
+        Class method to calculate the hash of a source text.
+
+        @param source source text
+        @type str
+        @return hash of the source text
+        @rtype str
+        """
+        return hashlib.sha1(source.encode("utf-8", "replace")).hexdigest()  # secok
+
+    def get(self, namespace, version, filename, source=None):
+        """
+        Public method to get the cached parse result of a file.
+
+        @param namespace name of the parser the result belongs to
+        @type str
+        @param version version string of the parser
+        @type str
+        @param filename name of the parsed file
+        @type str
+        @param source source text of the file used to revalidate an entry of a
+            file with a changed modification time (defaults to None)
+        @type str (optional)
+        @return cached parse result or None, if there is no valid result
+        @rtype Any
+        """
+        try:
+            fileStat = os.stat(filename)
+        except OSError:
+            return None
+
+        key = (namespace, filename)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                entry = self.__load(key)
+                if entry is None:
+                    self.misses += 1
+                    return None
+                self.__remember(key, entry)
+            else:
+                self.__entries.move_to_end(key)
+
+            entryVersion, mtime, size, sourceHash, result = entry
+            if entryVersion != version:
+                self.misses += 1
+                return None
+
+            if mtime != fileStat.st_mtime_ns or size != fileStat.st_size:
+                if source is None or sourceHash != ParseResultCache.sourceHash(source):
+                    self.misses += 1
+                    return None
+
+                # the file was touched without a change of its contents
+                self.__store(
+                    key,
+                    (
+                        version,
+                        fileStat.st_mtime_ns,
+                        fileStat.st_size,
+                        sourceHash,
+                        result,
+                    ),
+                )
+
+            self.hits += 1
+            return result
+
+    def put(self, namespace, version, filename, source, result):
+        """
+        Public method to store the parse result of a file.
+
+        @param namespace name of the parser the result belongs to
+        @type str
+        @param version version string of the parser
+        @type str
+        @param filename name of the parsed file
+        @type str
+        @param source parsed source text
+        @type str
+        @param result parse result to be cached (must be picklable)
+        @type Any
+        """
+        try:
+            fileStat = os.stat(filename)
+        except OSError:
+            return
+
+        with self.__lock:
+            self.__store(
+                (namespace, filename),
+                (
+                    version,
+                    fileStat.st_mtime_ns,
+                    fileStat.st_size,
+                    ParseResultCache.sourceHash(source),
+                    result,
+                ),
+            )
+
+    def remove(self, namespace, filename):
+        """
+        Public method to remove the cached parse result of a file.
+
+        @param namespace name of the parser the result belongs to
+        @type str
+        @param filename name of the parsed file
+        @type str
+        """
+        key = (namespace, filename)
+        with self.__lock:
+            self.__entries.pop(key, None)
+            if self.__connection is not None:
+                self.__pending[key] = None
+
+    def clear(self, namespace):
+        """
+        Public method to remove all cached results of a parser from memory.
+
+        Note: The stored results are still used, if they are valid.
+
+        @param namespace name of the parser
+        @type str
+        """
+        with self.__lock:
+            for key in [k for k in self.__entries if k[0] == namespace]:
+                del self.__entries[key]
+
+    def __remember(self, key, entry):
+        """
+        Private method to add an entry to the memory cache.
+
+        @param key key of the entry
+        @type tuple of (str, str)
+        @param entry cache entry
+        @type tuple of (str, int, int, str, Any)
+        """
+        self.__entries[key] = entry
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__maxMemoryEntries:
+            self.__entries.popitem(last=False)
+
+    def __store(self, key, entry):
+        """
+        Private method to add an entry to the memory cache and to schedule it
+        for writing to the database.
+
+        @param key key of the entry
+        @type tuple of (str, str)
+        @param entry cache entry
+        @type tuple of (str, int, int, str, Any)
+        """
+        self.__remember(key, entry)
+        if self.__connection is not None:
+            try:
+                self.__pending[key] = entry[:4] + (
+                    zlib.compress(pickle.dumps(entry[4], pickle.HIGHEST_PROTOCOL)),
+                )
+            except (pickle.PicklingError, TypeError, AttributeError):
+                # result cannot be stored
+                self.__pending[key] = None
+            if len(self.__pending) >= ParseResultCache.FlushThreshold:
+                self.flush()
+
+    def __load(self, key):
+        """
+        Private method to load an entry from the database.
+
+        @param key key of the entry
+        @type tuple of (str, str)
+        @return cache entry or None
+        @rtype tuple of (str, int, int, str, Any) or None
+        """
+        if self.__connection is None:
+            return None
+
+        try:
+            if key in self.__pending:
+                # entry was evicted from memory before being written
+                row = self.__pending[key]
+                if row is None:
+                    return None
+                return row[:4] + (pickle.loads(zlib.decompress(row[4])),)  # secok
+
+            row = self.__connection.execute(
+                "SELECT version, mtime, size, hash, data FROM results"
+                " WHERE namespace = ? AND filename = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+
+            self.__connection.execute(
+                "UPDATE results SET accessed = ? WHERE namespace = ? AND filename = ?",
+                (time.time(), *key),
+            )
+            return row[:4] + (pickle.loads(zlib.decompress(row[4])),)  # secok
+        except (sqlite3.Error, zlib.error, pickle.UnpicklingError, EOFError):
+            return None
+        except (AttributeError, ImportError, TypeError, ValueError):
+            # stored result doesn't fit the parser classes anymore
+            return None
+
+    def flush(self):
+        """
+        Public method to write pending changes and to evict the least recently
+        used entries, if the database exceeds its maximum size.
+        """
+        with self.__lock:
+            if self.__connection is None:
+                return
+
+            pending = self.__pending
+            self.__pending = {}
+            now = time.time()
+            try:
+                self.__connection.executemany(
+                    "DELETE FROM results WHERE namespace = ? AND filename = ?",
+                    [key for key, packed in pending.items() if packed is None],
+                )
+                self.__connection.executemany(
+                    "INSERT OR REPLACE INTO results (namespace, filename, version,"
+                    " mtime, size, hash, data, accessed)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (*key, *packed, now)
+                        for key, packed in pending.items()
+                        if packed is not None
+                    ],
+                )
+
+                (totalSize,) = self.__connection.execute(
+                    "SELECT COALESCE(SUM(LENGTH(data)), 0) FROM results"
+                ).fetchone()
+                if totalSize > self.__maxDiskSize:
+                    targetSize = int(
+                        self.__maxDiskSize * ParseResultCache.EvictionRatio
+                    )
+                    evictKeys = []
+                    for namespace, filename, size in self.__connection.execute(
+                        "SELECT namespace, filename, LENGTH(data) FROM results"
+                        " ORDER BY accessed"
+                    ):
+                        if totalSize <= targetSize:
+                            break
+                        evictKeys.append((namespace, filename))
+                        totalSize -= size
+                    self.__connection.executemany(
+                        "DELETE FROM results WHERE namespace = ? AND filename = ?",
+                        evictKeys,
+                    )
+                self.__connection.commit()
+            except sqlite3.Error:
+                pass
+
+    def close(self):
+        """
+        Public method to close the cache.
+        """
+        with self.__lock:
+            if self.__connection is not None:
+                self.flush()
+                with contextlib.suppress(sqlite3.Error):
+                    self.__connection.close()
+                self.__connection = None
+
+
+_parseResultCache = None
+
+
+def getParseResultCache():
+    """
+    Function to get the parse result cache shared by the parsers.
+
+    The cache is stored in the 'parse_cache' directory of the eric
+    configuration directory and is written when the program exits.
+
+    Note: Processes terminated without running the exit handlers (e.g. the
+    worker processes of a process pool) have to call flush() themselves.
+
+    @return reference to the parse result cache
+    @rtype ParseResultCache
+    """
+    global _parseResultCache
+
+    if _parseResultCache is None:
+        from eric7 import EricUtilities
+
+        _parseResultCache = ParseResultCache(
+            os.path.join(EricUtilities.getConfigDir(), "parse_cache")
+        )
+        atexit.register(_parseResultCache.close)
+
+    return _parseResultCache
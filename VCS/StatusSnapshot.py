@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+
+"""
+Module implementing the VCS status snapshot of a project.
+"""
+
+import contextlib
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class VcsStatusSnapshot(QObject):
+    """
+    Class implementing the VCS status snapshot of a project.
+
+    The snapshot is produced by the VCS status monitor thread and consumed by
+    the project browsers, the VCS status widget and the VCS dialogs. Consumers
+    are notified about the entries changed since the previous snapshot only.
+
+    The status of an entry is given by one of these flags:
+    <ul>
+        <li>"A" path was added but not yet committed</li>
+        <li>"M" path has local changes</li>
+        <li>"O" path was removed</li>
+        <li>"R" path was deleted and then re-added</li>
+        <li>"U" path needs an update</li>
+        <li>"Z" path contains a conflict</li>
+        <li>"?" path is not tracked</li>
+        <li>"!" path is missing</li>
+    </ul>
+    Entries back at normal are reported with a status of " " and are removed
+    from the snapshot.
+
+    @signal statesChanged(states:dict) emitted with a dictionary containing
+        the project relative path as key and the new status as value for all
+        entries changed by an update
+    """
+
+    statesChanged = pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        """
+        Constructor
+
+        @param parent reference to the parent object (defaults to None)
+        @type QObject (optional)
+        """
+        super().__init__(parent)
+
+        self.__states = {}
+        self.__generation = 0
+
+    def update(self, states):
+        """
+        Public method to replace the snapshot.
+
+        @param states dictionary containing the project relative path as key
+            and the status as value for all entries not at normal
+        @type dict
+        @return dictionary with the changed entries
+        @rtype dict
+        """
+        changes = {
+            name: status
+            for name, status in states.items()
+            if status and self.__states.get(name) != status
+        }
+        for name in self.__states:
+            if not states.get(name):
+                changes[name] = " "
+
+        if changes:
+            self.__states = {name: status for name, status in states.items() if status}
+            self.__generation += 1
+            self.statesChanged.emit(changes)
+
+        return changes
+
+    def reset(self):
+        """
+        Public method to reset all entries back to normal.
+        """
+        self.update({})
+
+    def forget(self, name):
+        """
+        Public method to forget the status of an entry, so that it gets
+        reported again by the next update.
+
+        @param name project relative path of the entry
+        @type str
+        """
+        with contextlib.suppress(KeyError):
+            del self.__states[name]
+
+    def states(self):
+        """
+        Public method to get all entries of the snapshot.
+
+        @return copy of the dictionary containing the project relative path as
+            key and the status as value
+        @rtype dict
+        """
+        return dict(self.__states)
+
+    def status(self, name):
+        """
+        Public method to get the status of an entry.
+
+        @param name project relative path of the entry
+        @type str
+        @return status of the entry (" " for an entry at normal)
+        @rtype str
+        """
+        return self.__states.get(name, " ")
+
+    def generation(self):
+        """
+        Public method to get the number of changing updates of the snapshot.
+
+        This allows consumers to check, if their view of the snapshot is
+        current.
+
+        @return generation of the snapshot
+        @rtype int
+        """
+        return self.__generation
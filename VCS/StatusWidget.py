@@ -7,10 +7,10 @@
 Module implementing a VCS Status widget for the sidebar/toolbar.
 """
 
-import contextlib
 import os
 
 from PyQt6.QtCore import QEvent, Qt, pyqtSlot
+from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QDialog,
@@ -228,7 +228,7 @@ class StatusWidget(QWidget):
         self.__project.projectPropertiesChanged.connect(self.__setProjectSpellCheckData)
         self.__project.vcsCommitted.connect(self.__committed)
         self.__project.vcsStatusMonitorInfo.connect(self.__setInfoText)
-        self.__project.vcsStatusMonitorAllData.connect(self.__processStatusData)
+        self.__project.vcsStatusMonitorData.connect(self.__processStatusData)
 
     def __initActionsMenu(self):
         """
@@ -402,9 +402,10 @@ class StatusWidget(QWidget):
         """
         Private slot to process the status data emitted by the project.
 
-        Each entry of the status data consists of a status flag and and the
-        path relative to the project directory starting with the third column.
-        The known status flags are:
+        Only the entries changed since the previous status check are
+        reported. Each entry of the status data consists of a status flag and
+        the path relative to the project directory starting with the third
+        column. The known status flags are:
         <ul>
             <li>"A" path was added but not yet committed</li>
             <li>"M" path has local changes</li>
@@ -417,41 +418,44 @@ class StatusWidget(QWidget):
             <li>" " path is back at normal</li>
         </ul>
 
-        @param data dictionary containing the status data
-        @type dict
+        @param data list of changed status entries
+        @type list of str
         """
-        # step 1: remember all currently checked entries
-        checkedEntries = [itm.text() for itm in self.__getCommitableItems()]
-        selectedEntries = [itm.text() for itm in self.__statusList.selectedItems()]
-        knownEntries = [
-            self.__statusList.item(row).text()
-            for row in range(self.__statusList.count())
-        ]
-
-        # step 2: clear the list and re-populate it with new data
-        self.__statusList.clear()
-
         block = self.__statusList.blockSignals(True)
-        for name, status in data.items():
-            if status:
+        for entry in data:
+            status = entry[0]
+            name = entry[2:]
+            items = self.__statusList.findItems(name, Qt.MatchFlag.MatchExactly)
+            itm = items[0] if items else None
+
+            if status == " ":
+                if itm is not None:
+                    self.__statusList.takeItem(self.__statusList.row(itm))
+                continue
+
+            if itm is None:
                 itm = QListWidgetItem(name, self.__statusList)
-                with contextlib.suppress(KeyError):
-                    itm.setToolTip(self.__statusTexts[status])
-                    itm.setIcon(EricPixmapCache.getIcon(self.__statusIcons[status]))
-                itm.setData(self.StatusDataRole, status)
-                if status in "AMOR":
-                    itm.setFlags(itm.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-                    if (
-                        name in checkedEntries
-                        or name not in knownEntries
-                        or name in self.__addedItemsText
-                    ):
-                        itm.setCheckState(Qt.CheckState.Checked)
-                    else:
-                        itm.setCheckState(Qt.CheckState.Unchecked)
-                else:
-                    itm.setFlags(itm.flags() & ~Qt.ItemFlag.ItemIsUserCheckable)
-                itm.setSelected(name in selectedEntries)
+                wasCheckable = False
+            else:
+                wasCheckable = bool(itm.flags() & Qt.ItemFlag.ItemIsUserCheckable)
+
+            itm.setToolTip(self.__statusTexts.get(status, ""))
+            itm.setIcon(
+                EricPixmapCache.getIcon(self.__statusIcons[status])
+                if status in self.__statusIcons
+                else QIcon()
+            )
+            itm.setData(self.StatusDataRole, status)
+            if status in "AMOR":
+                itm.setFlags(itm.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                if not wasCheckable:
+                    # new commitable entries are selected for commit
+                    itm.setCheckState(Qt.CheckState.Checked)
+                elif name in self.__addedItemsText:
+                    itm.setCheckState(Qt.CheckState.Checked)
+            else:
+                itm.setFlags(itm.flags() & ~Qt.ItemFlag.ItemIsUserCheckable)
+                itm.setData(Qt.ItemDataRole.CheckStateRole, None)
 
         self.__statusList.sortItems(Qt.SortOrder.AscendingOrder)
         self.__statusList.blockSignals(block)
@@ -29,6 +29,8 @@ from eric7 import Preferences
 from eric7.EricWidgets import EricMessageBox
 from eric7.EricWidgets.EricApplication import ericApp
 
+from .StatusSnapshot import VcsStatusSnapshot
+
 
 class VersionControlState(enum.Enum):
     """
@@ -49,8 +51,10 @@ class VersionControl(QObject):
 
     @signal committed() emitted after the commit action has completed
     @signal vcsStatusMonitorData(list of str) emitted to update the VCS status
+        with the entries changed since the previous status check
     @signal vcsStatusMonitorAllData(dict) emitted to signal all VCS status
-        (key is project relative file name, value is status)
+        after a status check found changes (key is project relative file name,
+        value is status)
     @signal vcsStatusMonitorStatus(str, str) emitted to signal the status of
         the monitoring thread (ok, nok, op, off) and a status message
     @signal vcsStatusMonitorInfo(str) emitted to signal some info of the
@@ -102,6 +106,7 @@ class VersionControl(QObject):
 
         self.statusMonitorThread = None
         self.vcsExecutionMutex = QMutex()
+        self.__statusSnapshot = VcsStatusSnapshot(self)
 
     def vcsShutdown(self):
         """
@@ -940,29 +945,35 @@ class VersionControl(QObject):
         self.vcsStatusMonitorStatus.emit(status, statusMsg)
         QCoreApplication.processEvents()
 
-    def __statusMonitorData(self, statusList):
-        """
-        Private method to receive the status monitor data update.
-
-        It simply re-emits the received status list.
-
-        @param statusList list of status records
-        @type list of str
-        """
-        self.vcsStatusMonitorData.emit(statusList)
-        QCoreApplication.processEvents()
-
     def __statusMonitorAllData(self, statusDict):
         """
         Private method to receive all status monitor data.
 
-        It simply re-emits the received status list.
+        The received data replaces the status snapshot. If this changed any
+        entry, the changed entries and all entries are re-emitted.
 
         @param statusDict dictionary of status records
         @type dict
         """
-        self.vcsStatusMonitorAllData.emit(statusDict)
-        QCoreApplication.processEvents()
+        changes = self.__statusSnapshot.update(statusDict)
+        if changes:
+            self.vcsStatusMonitorData.emit(
+                [
+                    "{0} {1}".format(status, name)
+                    for name, status in sorted(changes.items())
+                ]
+            )
+            self.vcsStatusMonitorAllData.emit(self.__statusSnapshot.states())
+            QCoreApplication.processEvents()
+
+    def getStatusSnapshot(self):
+        """
+        Public method to get the VCS status snapshot of the project.
+
+        @return reference to the status snapshot
+        @rtype VcsStatusSnapshot
+        """
+        return self.__statusSnapshot
 
     def __statusMonitorInfo(self, info):
         """
@@ -995,9 +1006,6 @@ class VersionControl(QObject):
                 vcsStatusMonitorInterval, project
             )
             if self.statusMonitorThread is not None:
-                self.statusMonitorThread.vcsStatusMonitorData.connect(
-                    self.__statusMonitorData, Qt.ConnectionType.QueuedConnection
-                )
                 self.statusMonitorThread.vcsStatusMonitorAllData.connect(
                     self.__statusMonitorAllData, Qt.ConnectionType.QueuedConnection
                 )
@@ -1018,10 +1026,6 @@ class VersionControl(QObject):
         Public method to stop the VCS status monitor thread.
         """
         if self.statusMonitorThread is not None:
-            self.__statusMonitorData(["--RESET--"])
-            self.statusMonitorThread.vcsStatusMonitorData.disconnect(
-                self.__statusMonitorData
-            )
             self.statusMonitorThread.vcsStatusMonitorAllData.disconnect(
                 self.__statusMonitorAllData
             )
@@ -1037,6 +1041,8 @@ class VersionControl(QObject):
                 self.statusMonitorThread.terminate()
                 self.statusMonitorThread.wait(10000)
             self.statusMonitorThread = None
+            # report all entries as back at normal
+            self.__statusMonitorAllData({})
             self.__statusMonitorStatus(
                 "off",
                 QCoreApplication.translate(
@@ -1126,6 +1132,9 @@ class VersionControl(QObject):
         """
         if self.statusMonitorThread is not None:
             self.statusMonitorThread.clearCachedState(name)
+            self.__statusSnapshot.forget(
+                self.statusMonitorThread.project.getRelativePath(name)
+            )
 
     def _createStatusMonitorThread(self, interval, project):  # noqa: U100
         """
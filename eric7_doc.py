@@ -13,24 +13,31 @@ This script can be used via the commandline as well.
 """
 
 import argparse
+import concurrent.futures
 import fnmatch
 import glob
+import hashlib
+import json
 import os
 import shutil
 import sys
 
 from eric7.__version__ import Version
-from eric7.DocumentationTools import TemplatesListsStyleCSS
+from eric7.DocumentationTools import ModuleDocumentor, TemplatesListsStyleCSS
 from eric7.DocumentationTools.Config import eric7docDefaultColors
 from eric7.DocumentationTools.IndexGenerator import IndexGenerator
-from eric7.DocumentationTools.ModuleDocumentor import ModuleDocument
+from eric7.DocumentationTools.ModuleDocumentor import ModuleDocument, ModuleDocumentInfo
 from eric7.DocumentationTools.QtHelpGenerator import QtHelpGenerator
 from eric7.SystemUtilities import FileSystemUtilities, OSUtilities
 from eric7.Utilities import ModuleParser
+from eric7.Utilities.ParseResultCache import ParseResultCache, getParseResultCache
 
 # list of supported filename extensions
 supportedExtensions = [".py", ".pyw", ".ptl", ".rb"]
 
+# name of the file storing the state of the last incremental run
+buildStateFile = ".eric7doc-state.json"
+
 
 def createArgumentParser():
     """
@@ -81,6 +88,20 @@ def createArgumentParser():
         action="store_true",
         help="Don't generate index files.",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip modules, whose source and options are unchanged since the last"
+        " run using the same output directory.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Use the given number of processes to generate the module documents"
+        " (0 = number of CPUs).",
+    )
     parser.add_argument(
         "-o",
         "--outdir",
@@ -222,6 +243,214 @@ def createArgumentParser():
     return parser
 
 
+def documentModule(file, basename, inpackage, outputDir, noempty, newline):
+    """
+    Function to parse a module and to write its documentation file.
+
+    Note: This function is executed by the worker processes, if multiple jobs
+    were requested.
+
+    @param file name of the module file
+    @type str
+    @param basename base name of the file hierarchy to be documented
+    @type str
+    @param inpackage flag indicating that the module is inside a package
+    @type bool
+    @param outputDir directory to write the documentation file to
+    @type str
+    @param noempty flag indicating to not write documentation files for empty
+        modules
+    @type bool
+    @param newline end of line character to be used (None for the default)
+    @type str
+    @return tuple containing the information of the module document (None, if
+        the module could not be parsed) and the name of the written
+        documentation file (empty, if no file was written)
+    @rtype tuple of (ModuleDocumentInfo, str)
+    @exception Exception raised to indicate an unexpected error
+    """
+    try:
+        print("Processing", file)
+        module = ModuleParser.readModule(
+            file,
+            basename=basename,
+            inpackage=inpackage,
+            extensions=supportedExtensions,
+        )
+        moduleDocument = ModuleDocument(module)
+        doc = moduleDocument.genDocument()
+    except OSError as v:
+        sys.stderr.write("{0} error: {1}\n".format(file, v.strerror))
+        return None, ""
+    except ImportError as v:
+        sys.stderr.write("{0} error: {1}\n".format(file, v))
+        return None, ""
+    except Exception as ex:
+        sys.stderr.write("{0} error while parsing: {1}\n".format(file, str(ex)))
+        raise
+
+    info = ModuleDocumentInfo.fromDocument(moduleDocument)
+    if (noempty or file.endswith("__init__.py")) and moduleDocument.isEmpty():
+        return info, ""
+
+    f = FileSystemUtilities.joinext(
+        os.path.join(outputDir, moduleDocument.name()), ".html"
+    )
+
+    # generate output
+    try:
+        with open(f, "w", encoding="utf-8", newline=newline) as out:
+            out.write(doc)
+    except OSError as v:
+        sys.stderr.write("{0} error: {1}\n".format(file, v.strerror))
+        f = ""
+    except Exception as ex:
+        sys.stderr.write("{0} error while writing: {1}\n".format(file, str(ex)))
+        raise
+    else:
+        sys.stdout.write("{0} ok\n".format(f))
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    return info, f
+
+
+def documentModuleJob(file, basename, inpackage, outputDir, noempty, newline):
+    """
+    Function to document a module in a worker process.
+
+    Note: The worker processes are terminated without running the exit
+    handlers. Therefore the parse results cached while documenting the module
+    are written before returning.
+
+    @param file name of the module file
+    @type str
+    @param basename base name of the file hierarchy to be documented
+    @type str
+    @param inpackage flag indicating that the module is inside a package
+    @type bool
+    @param outputDir directory to write the documentation file to
+    @type str
+    @param noempty flag indicating to not write documentation files for empty
+        modules
+    @type bool
+    @param newline end of line character to be used (None for the default)
+    @type str
+    @return tuple containing the information of the module document (None, if
+        the module could not be parsed) and the name of the written
+        documentation file (empty, if no file was written)
+    @rtype tuple of (ModuleDocumentInfo, str)
+    """
+    try:
+        return documentModule(file, basename, inpackage, outputDir, noempty, newline)
+    finally:
+        getParseResultCache().flush()
+
+
+def getSourceState(file, basename, inpackage):
+    """
+    Function to determine the state of a module file for an incremental run.
+
+    @param file name of the module file
+    @type str
+    @param basename base name of the file hierarchy to be documented
+    @type str
+    @param inpackage flag indicating that the module is inside a package
+    @type bool
+    @return dictionary containing the state of the module file
+    @rtype dict
+    """
+    try:
+        with open(file, "rb") as f:
+            source = f.read()
+    except OSError:
+        return {}
+
+    return {
+        "size": len(source),
+        "hash": hashlib.sha1(source).hexdigest(),  # secok
+        "basename": basename,
+        "inpackage": inpackage,
+    }
+
+
+def isUnchanged(entry, sourceState, outputDir):
+    """
+    Function to check, if a module was documented by the last incremental run
+    and is unchanged since.
+
+    @param entry state of the module file of the last run
+    @type dict
+    @param sourceState current state of the module file
+    @type dict
+    @param outputDir directory the documentation files are written to
+    @type str
+    @return flag indicating an unchanged module
+    @rtype bool
+    """
+    return (
+        entry is not None
+        and bool(sourceState)
+        and all(
+            entry.get(key) == sourceState[key]
+            for key in ("hash", "size", "basename", "inpackage")
+        )
+        and (
+            not entry["output"]
+            or (
+                os.path.dirname(entry["output"]) == outputDir
+                and os.path.exists(entry["output"])
+            )
+        )
+    )
+
+
+def loadBuildState(outputDir, buildOptions):
+    """
+    Function to load the state of the last incremental run.
+
+    @param outputDir directory the documentation files are written to
+    @type str
+    @param buildOptions dictionary containing the options influencing the
+        generated module documents
+    @type dict
+    @return dictionary containing the module file name as key and the state
+        of the module file as value (empty, if the options have changed)
+    @rtype dict
+    """
+    try:
+        with open(os.path.join(outputDir, buildStateFile), "r") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if state.get("options") != buildOptions:
+        return {}
+
+    return state.get("modules", {})
+
+
+def saveBuildState(outputDir, buildOptions, modules):
+    """
+    Function to save the state of an incremental run.
+
+    @param outputDir directory the documentation files are written to
+    @type str
+    @param buildOptions dictionary containing the options influencing the
+        generated module documents
+    @type dict
+    @param modules dictionary containing the module file name as key and the
+        state of the module file as value
+    @type dict
+    """
+    try:
+        with open(os.path.join(outputDir, buildStateFile), "w") as f:
+            json.dump({"options": buildOptions, "modules": modules}, f)
+    except OSError:
+        sys.stderr.write("The build state could not be saved.\n")
+
+
 def main():
     """
     Main entry point into the application.
@@ -350,6 +579,22 @@ def main():
     if startDir:
         os.chdir(os.path.abspath(startDir))
 
+    # options influencing the generated module documents
+    buildOptions = {
+        "version": Version,
+        "code": ParseResultCache.codeVersion(
+            ModuleParser.__file__,
+            ModuleDocumentor.__file__,
+            TemplatesListsStyleCSS.__file__,
+        ),
+        "noempty": noempty,
+        "newline": newline,
+        "extensions": supportedExtensions,
+    }
+
+    # list of tuples containing the file name, the base name and the package
+    # flag of the files to be documented
+    tasks = []
     for argsfile in args.file:
         if os.path.isdir(argsfile):
             if os.path.exists(
@@ -408,60 +653,71 @@ def main():
                 if skipIt:
                     continue
 
-                try:
-                    print("Processing", file)
-                    module = ModuleParser.readModule(
-                        file,
-                        basename=basename,
-                        inpackage=inpackage,
-                        extensions=supportedExtensions,
-                    )
-                    moduleDocument = ModuleDocument(module)
-                    doc = moduleDocument.genDocument()
-                except OSError as v:
-                    sys.stderr.write("{0} error: {1}\n".format(file, v[1]))
-                    continue
-                except ImportError as v:
-                    sys.stderr.write("{0} error: {1}\n".format(file, v))
-                    continue
-                except Exception as ex:
-                    sys.stderr.write(
-                        "{0} error while parsing: {1}\n".format(file, str(ex))
-                    )
-                    raise
+                tasks.append((file, basename, inpackage))
 
-                f = FileSystemUtilities.joinext(
-                    os.path.join(outputDir, moduleDocument.name()), ".html"
-                )
-
-                # remember for index file generation
-                indexGenerator.remember(file, moduleDocument, basename)
-
-                # remember for QtHelp generation
-                if qtHelpCreation:
-                    qtHelpGenerator.remember(file, moduleDocument, basename)
-
-                if (
-                    noempty or file.endswith("__init__.py")
-                ) and moduleDocument.isEmpty():
-                    continue
-
-                # generate output
-                try:
-                    with open(f, "w", encoding="utf-8", newline=newline) as out:
-                        out.write(doc)
-                except OSError as v:
-                    sys.stderr.write("{0} error: {1}\n".format(file, v[1]))
-                except Exception as ex:
-                    sys.stderr.write(
-                        "{0} error while writing: {1}\n".format(file, str(ex))
-                    )
-                    raise
-                else:
-                    sys.stdout.write("{0} ok\n".format(f))
-
-                sys.stdout.flush()
-                sys.stderr.flush()
+    # determine the modules to be documented
+    buildState = loadBuildState(outputDir, buildOptions) if args.incremental else {}
+    newBuildState = {}
+    results = [None] * len(tasks)
+    pending = []
+    for index, (file, fileBasename, inpackage) in enumerate(tasks):
+        sourceState = (
+            getSourceState(file, fileBasename, inpackage) if args.incremental else {}
+        )
+        entry = buildState.get(os.path.abspath(file))
+        if isUnchanged(entry, sourceState, outputDir):
+            sourceState["output"] = entry["output"]
+            sourceState["info"] = entry["info"]
+            newBuildState[os.path.abspath(file)] = sourceState
+            results[index] = (
+                ModuleDocumentInfo.fromDict(entry["info"]),
+                entry["output"],
+            )
+            sys.stdout.write("{0} unchanged\n".format(file))
+        else:
+            pending.append((index, sourceState))
+
+    # generate the module documents
+    arguments = [
+        (tasks[index][0], tasks[index][1], tasks[index][2], outputDir, noempty, newline)
+        for index, _sourceState in pending
+    ]
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    if jobs > 1 and len(arguments) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            for (index, _sourceState), result in zip(
+                pending,
+                executor.map(
+                    documentModuleJob,
+                    *zip(*arguments),
+                    chunksize=max(1, len(arguments) // (jobs * 8)),
+                ),
+            ):
+                results[index] = result
+    else:
+        for (index, _sourceState), moduleArguments in zip(pending, arguments):
+            results[index] = documentModule(*moduleArguments)
+
+    # remember the modules in their original order for the index generation
+    for (file, fileBasename, _inpackage), (info, _output) in zip(tasks, results):
+        if info is None:
+            continue
+
+        # remember for index file generation
+        indexGenerator.remember(file, info, fileBasename)
+
+        # remember for QtHelp generation
+        if qtHelpCreation:
+            qtHelpGenerator.remember(file, info, fileBasename)
+
+    if args.incremental:
+        for index, sourceState in pending:
+            info, output = results[index]
+            if info is not None:
+                sourceState["output"] = output
+                sourceState["info"] = info.toDict()
+                newBuildState[os.path.abspath(tasks[index][0])] = sourceState
+        saveBuildState(outputDir, buildOptions, newBuildState)
 
     sys.stdout.write("code documentation generated")
 
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+
+"""
+Script to measure the population of a large directory by the browser model.
+
+A directory with a configurable number of entries is created and shown by a
+sorted tree view as in the file browser. The script measures the population of
+the directory by BrowserModel.populateDirectoryItem(), the expansion of the
+directory in the view, the refresh of the directory and the determination of
+the parents of the entries of its subdirectories.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from PyQt6.QtWidgets import QApplication, QTreeView
+
+from eric7.EricCore import EricFileSystemWatcher
+from eric7.UI.BrowserModel import BrowserDirectoryItem, BrowserModel
+from eric7.UI.BrowserSortFilterProxyModel import BrowserSortFilterProxyModel
+
+
+def createDirectory(dirPath, entriesCount, dirsStep):
+    """
+    Function to create a directory with the given number of entries.
+
+    @param dirPath directory to create the entries in
+    @type str
+    @param entriesCount number of entries to be created
+    @type int
+    @param dirsStep step of the entries being directories containing a file
+    @type int
+    """
+    for number in range(entriesCount):
+        path = os.path.join(dirPath, "entry{0:06d}".format(number))
+        if number % dirsStep == 0:
+            os.mkdir(path)
+            path = os.path.join(path, "module")
+        with open(path + ".py", "w", encoding="utf-8") as f:
+            f.write("pass\n")
+
+
+def measure(app, title, function, *args):
+    """
+    Function to measure the execution of a function including the processing
+    of the resulting events.
+
+    @param app reference to the application object
+    @type QApplication
+    @param title title of the measurement
+    @type str
+    @param function function to be executed
+    @type function
+    @param *args arguments of the function
+    @type list
+    """
+    start = time.perf_counter()
+    function(*args)
+    app.processEvents()
+    print("{0:<32} {1:9.1f} ms".format(title, (time.perf_counter() - start) * 1000))
+
+
+def parentsOfChildren(model, directoryIndex):
+    """
+    Function to determine the parents of the first entries of all
+    subdirectories of a directory.
+
+    @param model reference to the browser model
+    @type BrowserModel
+    @param directoryIndex index of the directory
+    @type QModelIndex
+    """
+    for row in range(model.rowCount(directoryIndex)):
+        index = model.index(row, 0, directoryIndex)
+        if isinstance(model.item(index), BrowserDirectoryItem):
+            model.parent(model.index(0, 0, index))
+
+
+def benchmark(app, entriesCount, dirsStep):
+    """
+    Function to execute the measurements.
+
+    @param app reference to the application object
+    @type QApplication
+    @param entriesCount number of directory entries
+    @type int
+    @param dirsStep step of the entries being directories
+    @type int
+    """
+    with tempfile.TemporaryDirectory() as dirPath:
+        createDirectory(dirPath, entriesCount, dirsStep)
+
+        model = BrowserModel()
+        sortModel = BrowserSortFilterProxyModel()
+        sortModel.setSourceModel(model)
+        view = QTreeView()
+        view.setModel(sortModel)
+        view.setSortingEnabled(True)
+        view.show()
+
+        item = BrowserDirectoryItem(model.rootItem, dirPath)
+        model.addItem(item)
+        itemIndex = model.index(model.rowCount() - 1, 0)
+
+        measure(app, "populateDirectoryItem()", model.populateDirectoryItem, item)
+        print("{0:<32} {1:9d}".format("entries", model.rowCount(itemIndex)))
+        measure(
+            app, "expand sorted view", view.expand, sortModel.mapFromSource(itemIndex)
+        )
+        measure(app, "refresh expanded directory", model.refreshDirectory, itemIndex)
+        print("{0:<32} {1:9d}".format("entries", model.rowCount(itemIndex)))
+        measure(
+            app,
+            "parents of subdirectory entries",
+            parentsOfChildren,
+            model,
+            itemIndex,
+        )
+
+        # stop the monitoring thread before the directory is removed
+        EricFileSystemWatcher.instance().shutdown()
+
+
+def main():
+    """
+    Main entry point of the script.
+
+    @return exit code
+    @rtype int
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure the population of a large directory by the browser"
+        " model."
+    )
+    parser.add_argument(
+        "--entries",
+        type=int,
+        default=20000,
+        help="number of directory entries (default 20000)",
+    )
+    parser.add_argument(
+        "--dirs-step",
+        type=int,
+        default=20,
+        help="step of the entries being directories (default 20)",
+    )
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    benchmark(app, args.entries, args.dirs_step)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
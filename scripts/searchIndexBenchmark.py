@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Detlev Offenbach <detlev@die-offenbachs.de>
+#
+
+"""
+Script to measure the effect of the project search index on Find in Files.
+
+A synthetic directory tree is created and searched for a literal text once
+without the index, once while building the index and once using the stored
+index.
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+from eric7.Project.ProjectSearchIndex import ProjectSearchIndex
+from eric7.UI.FindFileSearchThread import FindFileSearchThread
+
+
+def createTree(rootPath, filesCount, hitsCount, searchText, seed=42):
+    """
+    Function to create a synthetic tree of Python source files.
+
+    @param rootPath directory to create the files in
+    @type str
+    @param filesCount number of files to be created
+    @type int
+    @param hitsCount number of files to contain the search text
+    @type int
+    @param searchText text to be put into some of the files
+    @type str
+    @param seed seed of the random number generator (defaults to 42)
+    @type int (optional)
+    @return list of the file names relative to the root directory
+    @rtype list of str
+    """
+    rand = random.Random(seed)
+    words = [
+        "".join(rand.choices("abcdefghijklmnopqrstuvwxyz_", k=rand.randint(3, 12)))
+        for _ in range(2000)
+    ]
+    hits = set(rand.sample(range(filesCount), min(hitsCount, filesCount)))
+
+    files = []
+    for number in range(filesCount):
+        fileName = os.path.join(
+            "package{0:03d}".format(number // 1000),
+            "module{0:02d}".format(number // 100 % 10),
+            "file{0:05d}.py".format(number),
+        )
+        lines = [
+            "{0} = {1}({2}, {3})\n".format(*rand.choices(words, k=4))
+            for _ in range(rand.randint(20, 80))
+        ]
+        if number in hits:
+            lines.insert(rand.randrange(len(lines)), "{0}()\n".format(searchText))
+
+        path = os.path.join(rootPath, fileName)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        files.append(fileName)
+
+    return files
+
+
+def search(files, rootPath, searchText, searchIndex=None):
+    """
+    Function to search the files for a literal text.
+
+    @param files list of file names relative to the root directory
+    @type list of str
+    @param rootPath root directory of the files
+    @type str
+    @param searchText literal text to search for
+    @type str
+    @param searchIndex reference to the search index to be used (defaults to
+        None)
+    @type ProjectSearchIndex (optional)
+    @return tuple containing the search time in seconds and the number of
+        files containing the text
+    @rtype tuple of (float, int)
+    """
+    found = []
+    thread = FindFileSearchThread(
+        files,
+        rootPath,
+        re.compile(re.escape(searchText)),
+        literal=searchText,
+        searchIndex=searchIndex,
+    )
+    thread.searchFinished.connect(lambda _occurrences, count: found.append(count))
+
+    start = time.perf_counter()
+    thread.run()  # search in the current thread
+    return time.perf_counter() - start, found[0]
+
+
+def main():
+    """
+    Main entry point of the script.
+
+    @return exit code
+    @rtype int
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure Find in Files with and without the project search"
+        " index on a synthetic directory tree."
+    )
+    parser.add_argument(
+        "--files", type=int, default=50000, help="number of files (default 50000)"
+    )
+    parser.add_argument(
+        "--hits",
+        type=int,
+        default=50,
+        help="number of files containing the search text (default 50)",
+    )
+    parser.add_argument(
+        "--text",
+        default="unusualIdentifier",
+        help="text to search for (default 'unusualIdentifier')",
+    )
+    parser.add_argument(
+        "--directory",
+        default="",
+        help="directory to create the tree in (default: temporary directory)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tempDir:
+        rootPath = args.directory or tempDir
+
+        start = time.perf_counter()
+        files = createTree(rootPath, args.files, args.hits, args.text)
+        print(
+            "created {0} files in {1:.1f} s".format(
+                len(files), time.perf_counter() - start
+            )
+        )
+
+        # the first search fills the operating system file cache
+        search(files, rootPath, args.text)
+
+        duration, count = search(files, rootPath, args.text)
+        print("unindexed search:     {0:7.3f} s, {1} files".format(duration, count))
+
+        databaseFile = os.path.join(tempDir, "benchmark.esi")
+        searchIndex = ProjectSearchIndex(databaseFile, rootPath)
+        searchIndex.load()
+        duration, count = search(files, rootPath, args.text, searchIndex)
+        start = time.perf_counter()
+        searchIndex.save()
+        print(
+            "indexing search:      {0:7.3f} s, {1} files (saved in {2:.3f} s)".format(
+                duration, count, time.perf_counter() - start
+            )
+        )
+
+        start = time.perf_counter()
+        searchIndex = ProjectSearchIndex(databaseFile, rootPath)
+        searchIndex.load()
+        loadDuration = time.perf_counter() - start
+        duration, count = search(files, rootPath, args.text, searchIndex)
+        print(
+            "indexed search:       {0:7.3f} s, {1} files (loaded in {2:.3f} s)".format(
+                duration, count, loadDuration
+            )
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())